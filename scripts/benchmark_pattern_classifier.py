@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""Benchmark the Meta Agent pattern classifier against the plain pattern loop.
+
+Runs every utterance of the intent coverage corpus through both the
+priority-ordered ``pattern.match`` loop and ``PatternClassifier``, checks
+that they pick the same pattern, and prints the time per utterance.
+
+Usage: python3 scripts/benchmark_pattern_classifier.py [--rounds N]
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+# Add src and tests to path
+ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT / "src"))
+sys.path.insert(0, str(ROOT / "tests"))
+
+from test_intent_coverage import (  # noqa: E402
+    EDGE_CASES,
+    create_meta_agent_with_hardcoded_patterns,
+    generate_test_cases_static,
+)
+
+from barnabeenet.agents.pattern_classifier import PatternClassifier  # noqa: E402
+
+
+def loop_match(agent, text):
+    """The classification loop MetaAgent used before PatternClassifier."""
+    for group, _, _ in agent.PATTERN_PRIORITY:
+        for pattern, sub_category in agent._compiled_patterns.get(group, []):
+            if pattern.match(text):
+                return group, sub_category, pattern.pattern
+    return None
+
+
+def classifier_match(classifier, text):
+    hit = classifier.match(text)
+    return (hit.group, hit.sub_category, hit.pattern.pattern) if hit else None
+
+
+def time_per_text(fn, texts, rounds):
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for text in texts:
+            fn(text)
+    return (time.perf_counter() - start) / (rounds * len(texts)) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=50, help="passes over the corpus")
+    args = parser.parse_args()
+
+    agent = asyncio.run(create_meta_agent_with_hardcoded_patterns())
+    groups = [(g, agent._compiled_patterns.get(g, [])) for g, _, _ in agent.PATTERN_PRIORITY]
+    classifier = PatternClassifier(groups)
+    # MetaAgent strips trailing punctuation before matching
+    texts = [case.text.rstrip(".!,;:") for case in generate_test_cases_static() + EDGE_CASES]
+    misses = [text for text in texts if loop_match(agent, text) is None]
+
+    mismatches = [
+        text for text in texts if loop_match(agent, text) != classifier_match(classifier, text)
+    ]
+    print(f"Patterns: {classifier.pattern_count}  Utterances: {len(texts)}")
+    print(f"Mismatches: {len(mismatches)}")
+    for text in mismatches:
+        print(f"  {text!r}")
+
+    for label, sample in (("all", texts), ("no match", misses)):
+        if not sample:
+            continue
+        loop_us = time_per_text(lambda t: loop_match(agent, t), sample, args.rounds)
+        new_us = time_per_text(lambda t: classifier_match(classifier, t), sample, args.rounds)
+        print(
+            f"{label:>9}: loop {loop_us:7.1f} us  classifier {new_us:7.1f} us"
+            f"  ({loop_us / new_us:.1f}x, {len(sample)} utterances)"
+        )
+
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1319,13 +1319,6 @@ If you cannot parse the request, respond with:
             on_complete=on_complete,
         )
 
-        if not timer:
-            return {
-                "response": "I couldn't create the timer. No timer entities available.",
-                "agent": self.name,
-                "success": False,
-            }
-
         # Add chained actions if any
         for chained in chained_actions:
             await timer_manager.add_chained_action(
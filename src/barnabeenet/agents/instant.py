@@ -2136,8 +2136,9 @@ class InstantAgent(Agent):
             at_home = []
             away = []
 
+            states = await ha_client.get_states(person_entities)
             for entity_id, name in person_entities.items():
-                state = await ha_client.get_state(entity_id)
+                state = states.get(entity_id)
                 if state:
                     if state.state == "home":
                         at_home.append(name)
@@ -2469,8 +2470,9 @@ class InstantAgent(Agent):
                 open_blinds = []
                 closed_count = 0
 
+                states = await ha_client.get_states(blind_entities)
                 for entity_id in blind_entities:
-                    state = await ha_client.get_state(entity_id)
+                    state = states.get(entity_id)
                     if state:
                         # Extract room name from entity_id
                         name = entity_id.replace("cover.blind_", "").replace("_", " ").title()
@@ -2540,8 +2542,9 @@ class InstantAgent(Agent):
 
             # No specific person - list all phones with battery data
             results = []
+            states = await ha_client.get_states(name_to_entity.values())
             for name, entity_id in name_to_entity.items():
-                state = await ha_client.get_state(entity_id)
+                state = states.get(entity_id)
                 if state and state.attributes:
                     battery = state.attributes.get("battery_level")
                     if battery is not None:
@@ -2662,8 +2665,9 @@ class InstantAgent(Agent):
             now = datetime.now()
             today_str = now.strftime("%Y-%m-%d")
 
+            states = await ha_client.get_states(calendar_ids)
             for cal_id in calendar_ids:
-                state = await ha_client.get_state(cal_id)
+                state = states.get(cal_id)
                 if state and state.attributes:
                     attrs = state.attributes
                     message = attrs.get("message", "")
@@ -2706,8 +2710,9 @@ class InstantAgent(Agent):
                     ("calendar.kidschores_calendar_xander", "Xander"),
                     ("calendar.kidschores_calendar_zachary", "Zachary"),
                 ]
+                states = await ha_client.get_states(cal_id for cal_id, _ in chore_calendars)
                 for cal_id, name in chore_calendars:
-                    state = await ha_client.get_state(cal_id)
+                    state = states.get(cal_id)
                     if state and state.attributes:
                         message = state.attributes.get("message", "")
                         if message:
@@ -1003,6 +1003,9 @@ class InteractionAgent(Agent):
     ) -> dict[str, Any]:
         """Generate response using LLM.
 
+        If ``user_ctx`` carries an ``on_partial_text`` coroutine callback, the
+        completion is streamed and each text delta is passed to it as it arrives.
+
         Returns:
             Dict with:
                 - text: Response text
@@ -1013,21 +1016,36 @@ class InteractionAgent(Agent):
         system_prompt = self._build_system_prompt(conv_ctx, user_ctx)
         messages = await self._build_messages(text, conv_ctx, system_prompt)
 
+        chat_kwargs: dict[str, Any] = {
+            "messages": messages,
+            "agent_type": "interaction",
+            "conversation_id": conv_ctx.conversation_id,
+            "user_input": text,
+            "speaker": conv_ctx.speaker,
+            "room": conv_ctx.room,
+            "injected_context": {
+                "time_of_day": conv_ctx.time_of_day,
+                "child_mode": conv_ctx.children_present,
+                "memory_count": len(conv_ctx.retrieved_memories),
+                "turn_count": len(conv_ctx.history),
+            },
+        }
+        # Stream partial text to the caller (e.g. TTS) while generation continues.
+        # Child-mode replies are truncated afterwards, so they are never streamed.
+        on_partial_text = user_ctx.get("on_partial_text")
+
         try:
-            response = await self._llm_client.chat(
-                messages=messages,
-                agent_type="interaction",
-                conversation_id=conv_ctx.conversation_id,
-                user_input=text,
-                speaker=conv_ctx.speaker,
-                room=conv_ctx.room,
-                injected_context={
-                    "time_of_day": conv_ctx.time_of_day,
-                    "child_mode": conv_ctx.children_present,
-                    "memory_count": len(conv_ctx.retrieved_memories),
-                    "turn_count": len(conv_ctx.history),
-                },
-            )
+            if on_partial_text is not None and not conv_ctx.children_present:
+                response = None
+                async for chunk in self._llm_client.chat_stream(**chat_kwargs):
+                    if chunk.response is not None:
+                        response = chunk.response
+                    elif chunk.text:
+                        await on_partial_text(chunk.text)
+                if response is None:
+                    raise RuntimeError("LLM stream ended without a final response")
+            else:
+                response = await self._llm_client.chat(**chat_kwargs)
 
             response_text = response.text.strip()
 
@@ -133,6 +133,7 @@ class MemoryConfig:
     # Retrieval settings
     max_retrieval_results: int = 10
     min_relevance_score: float = 0.3
+    secondary_query_weight: float = 0.85  # Score multiplier for MetaAgent secondary queries
 
     # Generation settings
     max_events_per_generation: int = 10
@@ -394,22 +395,38 @@ class MemoryAgent(Agent):
     async def _handle_retrieve(self, query: str, ctx: dict[str, Any]) -> dict[str, Any]:
         """Retrieve memories using semantic vector search."""
         # If explicit memory queries provided (from MetaAgent)
+        secondary_queries: list[str] = []
         memory_queries = ctx.get("memory_queries")
         if memory_queries and hasattr(memory_queries, "primary_query"):
             query = memory_queries.primary_query
+            secondary_queries = [
+                q for q in getattr(memory_queries, "secondary_queries", []) if q and q != query
+            ]
 
         # Use storage service for vector similarity search
         memory_type = ctx.get("memory_type")
         if isinstance(memory_type, MemoryType):
             memory_type = memory_type.value
 
-        results = await self._storage.search_memories(
-            query=query,
-            memory_type=memory_type,
-            participants=ctx.get("participants"),
-            max_results=ctx.get("max_results", self.config.max_retrieval_results),
-            min_score=self.config.min_relevance_score,
-        )
+        max_results = ctx.get("max_results", self.config.max_retrieval_results)
+        if secondary_queries:
+            # Score the whole query set in one batched search
+            results = await self._storage.search_memories_multi(
+                queries=[query, *secondary_queries],
+                weights=[1.0] + [self.config.secondary_query_weight] * len(secondary_queries),
+                memory_type=memory_type,
+                participants=ctx.get("participants"),
+                max_results=max_results,
+                min_score=self.config.min_relevance_score,
+            )
+        else:
+            results = await self._storage.search_memories(
+                query=query,
+                memory_type=memory_type,
+                participants=ctx.get("participants"),
+                max_results=max_results,
+                min_score=self.config.min_relevance_score,
+            )
 
         # Update access metadata for returned memories
         for stored_memory, _ in results:
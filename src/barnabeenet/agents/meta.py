@@ -17,11 +17,14 @@ from __future__ import annotations
 import logging
 import re
 import time
+from collections.abc import Sequence
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import TYPE_CHECKING, Any
 
 from barnabeenet.agents.base import Agent
+from barnabeenet.agents.pattern_classifier import PatternClassifier
+from barnabeenet.services.homeassistant.mentions import MENTION_AREA
 from barnabeenet.services.llm.openrouter import OpenRouterClient
 
 if TYPE_CHECKING:
@@ -161,6 +164,10 @@ class MetaAgentConfig:
     max_secondary_queries: int = 3
     memory_query_timeout_ms: int = 300
 
+    # Pattern diagnostics: run in a background worker instead of before matching
+    background_diagnostics: bool = True
+    diagnostics_hit_sample_rate: float = 0.05  # Share of pattern hits also diagnosed
+
 
 # Pattern definitions for fast classification
 INSTANT_PATTERNS: list[tuple[str, str]] = [
@@ -707,6 +714,8 @@ class MetaAgent(Agent):
         self._logic_registry = logic_registry
         self._compiled_patterns: dict[str, list[tuple[re.Pattern[str], str]]] = {}
         self._use_registry = False  # Will be set during init
+        self._pattern_classifier: PatternClassifier | None = None
+        self._classifier_sources: list[tuple[Sequence[tuple[re.Pattern[str], str]], int]] = []
         self._enable_diagnostics = enable_diagnostics
         self._enable_health_monitoring = enable_health_monitoring
         self._diagnostics_service = None
@@ -732,7 +741,14 @@ class MetaAgent(Agent):
                 from barnabeenet.services.logic_diagnostics import get_diagnostics_service
 
                 self._diagnostics_service = get_diagnostics_service()
-                logger.info("MetaAgent diagnostics enabled")
+                if self._config.background_diagnostics:
+                    self._diagnostics_service.configure_background(
+                        hit_sample_rate=self._config.diagnostics_hit_sample_rate
+                    )
+                logger.info(
+                    "MetaAgent diagnostics enabled (%s)",
+                    "background" if self._config.background_diagnostics else "inline",
+                )
             except Exception as e:
                 logger.debug("Diagnostics service not available: %s", e)
 
@@ -802,6 +818,7 @@ class MetaAgent(Agent):
                 "instant",
                 "gesture",
                 "self_improvement",
+                "conversation",
                 "action",
                 "memory",
                 "query",
@@ -810,6 +827,7 @@ class MetaAgent(Agent):
                 self._compiled_patterns[group_name] = [
                     (re.compile(p, re.IGNORECASE), c) for p, c in patterns
                 ]
+            self._pattern_classifier = None
             logger.info("MetaAgent patterns reloaded from LogicRegistry")
 
     async def shutdown(self) -> None:
@@ -942,10 +960,8 @@ class MetaAgent(Agent):
             urgency_level = UrgencyLevel.HIGH if len(urgency_matches) > 1 else UrgencyLevel.MEDIUM
 
         # Check for emergency keywords
-        for pattern, _ in self._compiled_patterns.get("emergency", []):
-            if pattern.search(text):
-                urgency_level = UrgencyLevel.EMERGENCY
-                break
+        if self._get_pattern_classifier().search_group("emergency", text):
+            urgency_level = UrgencyLevel.EMERGENCY
 
         # Detect stress indicators
         stress_matches = [w for w in self._config.stress_indicators if w in text_lower]
@@ -1033,6 +1049,24 @@ class MetaAgent(Agent):
         )
         return result
 
+    def _get_pattern_classifier(self) -> PatternClassifier:
+        """Return the compiled classifier, rebuilding it if the patterns changed.
+
+        Patterns are replaced wholesale on init, hot-reload and in tests, so
+        comparing the group lists by identity is enough to spot a change.
+        """
+        sources = [self._compiled_patterns.get(g, ()) for g, _, _ in self.PATTERN_PRIORITY]
+        if self._pattern_classifier is None or any(
+            new is not old or len(new) != count
+            for new, (old, count) in zip(sources, self._classifier_sources, strict=False)
+        ):
+            self._pattern_classifier = PatternClassifier(
+                (group, patterns)
+                for (group, _, _), patterns in zip(self.PATTERN_PRIORITY, sources, strict=True)
+            )
+            self._classifier_sources = [(patterns, len(patterns)) for patterns in sources]
+        return self._pattern_classifier
+
     def _pattern_match(self, text: str) -> ClassificationResult:
         """Pattern-based classification with priority ordering and diagnostics.
 
@@ -1040,14 +1074,19 @@ class MetaAgent(Agent):
         - How many patterns were checked
         - Which patterns almost matched (near misses)
         - Why patterns failed to match
+
+        In background diagnostics mode (the default) the diagnosis is queued
+        after matching and the near-miss fields are left empty; results land
+        in the diagnostics service history instead.
         """
         # Normalize text: strip trailing punctuation that STT often adds
         # This fixes issues where "tell me a joke." doesn't match "tell me a joke"
         normalized_text = text.rstrip(".!,;:")
-        
-        # Run diagnostics if available
+        background = self._config.background_diagnostics
+
+        # Inline diagnostics run every pattern before matching
         diag = None
-        if self._diagnostics_service:
+        if self._diagnostics_service and not background:
             diag = self._diagnostics_service.diagnose_pattern_match(
                 text=normalized_text,
                 compiled_patterns=self._compiled_patterns,
@@ -1057,25 +1096,42 @@ class MetaAgent(Agent):
         # Count patterns for result
         total_patterns = sum(len(p) for p in self._compiled_patterns.values())
 
-        # Check patterns in priority order
-        for pattern_group, intent, confidence in self.PATTERN_PRIORITY:
-            patterns = self._compiled_patterns.get(pattern_group, [])
-            for pattern, sub_category in patterns:
-                if pattern.match(normalized_text):
-                    result = ClassificationResult(
-                        intent=intent,
-                        confidence=confidence,
-                        sub_category=sub_category,
-                        matched_pattern=f"{pattern_group}:{sub_category or 'default'} → {pattern.pattern}",
-                        classification_method="pattern",
-                        patterns_checked=total_patterns,
-                    )
-                    if diag:
-                        result.diagnostics_summary = {
-                            "processing_time_ms": diag.processing_time_ms,
-                            "total_checked": diag.total_patterns_checked,
-                        }
-                    return result
+        # Check patterns in priority order (prefiltered, same first hit as a plain loop)
+        hit = self._get_pattern_classifier().match(normalized_text)
+
+        background_summary = None
+        if self._diagnostics_service and background:
+            queued = self._diagnostics_service.submit(
+                text=normalized_text,
+                compiled_patterns=self._compiled_patterns,
+                pattern_priority=self.PATTERN_PRIORITY,
+                matched=hit is not None,
+            )
+            background_summary = {"mode": "background", "queued": queued}
+
+        if hit is not None:
+            pattern_group, sub_category, pattern = hit.group, hit.sub_category, hit.pattern
+            intent, confidence = next(
+                (intent, confidence)
+                for group, intent, confidence in self.PATTERN_PRIORITY
+                if group == pattern_group
+            )
+            result = ClassificationResult(
+                intent=intent,
+                confidence=confidence,
+                sub_category=sub_category,
+                matched_pattern=f"{pattern_group}:{sub_category or 'default'} → {pattern.pattern}",
+                classification_method="pattern",
+                patterns_checked=total_patterns,
+            )
+            if diag:
+                result.diagnostics_summary = {
+                    "processing_time_ms": diag.processing_time_ms,
+                    "total_checked": diag.total_patterns_checked,
+                }
+            elif background_summary:
+                result.diagnostics_summary = background_summary
+            return result
 
         # No match - include diagnostic info about what almost worked
         result = ClassificationResult(
@@ -1102,6 +1158,8 @@ class MetaAgent(Agent):
                 "suggested_patterns": diag.suggested_patterns[:3],
                 "suggested_modifications": diag.suggested_modifications[:3],
             }
+        elif background_summary:
+            result.diagnostics_summary = background_summary
 
         return result
 
@@ -1136,11 +1194,20 @@ class MetaAgent(Agent):
 
         # Check if text mentions HA entities (device detection)
         entity_names = ha_context.get("entity_names", [])
-        if entity_names:
-            # Check if any entity name is mentioned in the text
-            mentioned_entities = [
-                name for name in entity_names if name.lower() in text_lower
-            ]
+        mention_detector = ha_context.get("mention_detector")
+        if entity_names or mention_detector is not None:
+            # Check if any entity name (or alias) is mentioned in the text
+            if mention_detector is not None:
+                # Single pass over the text instead of one scan per name
+                mentioned_entities = [
+                    mention.name
+                    for mention in mention_detector.find_all(text)
+                    if mention.kind != MENTION_AREA
+                ]
+            else:
+                mentioned_entities = [
+                    name for name in entity_names if name.lower() in text_lower
+                ]
             if mentioned_entities:
                 # If entity mentioned + command verb = ACTION
                 command_verbs = {
@@ -15,6 +15,7 @@ from __future__ import annotations
 import logging
 import time
 import uuid
+from collections.abc import Awaitable, Callable
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import TYPE_CHECKING, Any
@@ -35,8 +36,10 @@ import re
 
 from barnabeenet.services.activity_log import get_activity_logger
 from barnabeenet.services.llm.openrouter import OpenRouterClient
+from barnabeenet.services.memory.embedding import embedding_request_scope
 from barnabeenet.services.metrics_store import get_metrics_store
 from barnabeenet.services.pipeline_signals import PipelineLogger, SignalType
+from barnabeenet.services.post_response import get_post_response_queue
 
 logger = logging.getLogger(__name__)
 
@@ -89,6 +92,9 @@ class RequestContext:
     speaker: str | None = None
     room: str | None = None
 
+    # Receives LLM text deltas as they are generated (streaming TTS)
+    on_partial_text: Callable[[str], Awaitable[None]] | None = None
+
     # Timing
     started_at: datetime = field(default_factory=datetime.now)
     stage_timings: dict[str, float] = field(default_factory=dict)
@@ -212,6 +218,9 @@ class AgentOrchestrator:
     4. MemoryAgent: Store relevant facts from interaction
     5. Execute device actions via Home Assistant
     6. Return response for TTS
+
+    Memory generation, trace completion, latency metrics and audit logging
+    run on the post-response queue after the response is returned.
     """
 
     # Session state for undo/repeat (keyed by conversation_id)
@@ -542,6 +551,7 @@ class AgentOrchestrator:
         speaker: str | None = None,
         room: str | None = None,
         conversation_id: str | None = None,
+        on_partial_text: Callable[[str], Awaitable[None]] | None = None,
     ) -> dict[str, Any]:
         """Process a request through the full pipeline.
 
@@ -550,6 +560,9 @@ class AgentOrchestrator:
             speaker: Speaker ID if identified
             room: Room where request originated
             conversation_id: ID for conversation tracking
+            on_partial_text: Optional coroutine called with each LLM text delta
+                while a conversational reply is generated. The final response
+                text may still differ (e.g. after post-processing).
 
         Returns:
             Dict containing:
@@ -573,6 +586,7 @@ class AgentOrchestrator:
             room=room,
             conversation_id=derived_conversation_id,
             trace_id=f"trace_{uuid.uuid4().hex[:8]}",
+            on_partial_text=on_partial_text,
         )
 
         total_start = time.perf_counter()
@@ -609,19 +623,21 @@ class AgentOrchestrator:
         )
 
         try:
-            # Stage 1: Classification
-            await self._classify(ctx)
+            # Share query embeddings across the stages of this request
+            with embedding_request_scope():
+                # Stage 1: Classification
+                await self._classify(ctx)
 
-            # Stage 2: Memory retrieval (if enabled and needed)
-            if self.config.enable_memory_retrieval:
-                await self._retrieve_memories(ctx)
+                # Stage 2: Memory retrieval (if enabled and needed)
+                if self.config.enable_memory_retrieval:
+                    await self._retrieve_memories(ctx)
 
-            # Stage 3: Route to appropriate agent
-            await self._route_and_handle(ctx)
+                # Stage 3: Route to appropriate agent
+                await self._route_and_handle(ctx)
 
-            # Stage 4: Store memories (if enabled)
-            if self.config.enable_memory_storage:
-                await self._store_memories(ctx)
+                # Stage 4: Store memories (if enabled)
+                if self.config.enable_memory_storage:
+                    await self._store_memories(ctx)
 
         except Exception as e:
             logger.exception(f"Pipeline error: {e}")
@@ -641,15 +657,48 @@ class AgentOrchestrator:
         total_ms = (time.perf_counter() - total_start) * 1000
         ctx.stage_timings["total"] = total_ms
 
+        # Save session state for undo/repeat functionality
+        self._save_session_state(ctx)
+
+        response = self._build_response(ctx)
+        self._defer_post_response(ctx, total_ms, triggered_alert)
+        return response
+
+    # =========================================================================
+    # Post-response work
+    # =========================================================================
+
+    def register_post_response_handlers(self) -> None:
+        """Route the deferred work submitted by any orchestrator to this one.
+
+        Handlers are process-wide (spilled jobs can be replayed after a
+        restart), so only the shared orchestrator registers them: at app
+        startup, or when ``get_orchestrator()`` creates it lazily.
+        """
+        queue = get_post_response_queue()
+        queue.register("orchestrator.store_memories", self._run_store_memories)
+        queue.register("orchestrator.pipeline_trace", self._run_complete_pipeline_trace)
+        queue.register("orchestrator.activity_trace", self._run_complete_activity_trace)
+        queue.register("orchestrator.latency", self._run_record_latency)
+        queue.register("orchestrator.audit", self._run_log_to_audit)
+
+    def _defer_post_response(
+        self, ctx: RequestContext, total_ms: float, triggered_alert: bool
+    ) -> None:
+        """Queue trace completion, latency metrics and audit logging.
+
+        Payloads are built from ``ctx`` now; nothing here waits.
+        """
+        queue = get_post_response_queue()
+        agent_name = ctx.agent_response.get("_agent_name") if ctx.agent_response else None
+        intent_val = ctx.classification.intent.value if ctx.classification else None
+        error_info = ctx.agent_response.get("error") if ctx.agent_response else None
+
         # Complete pipeline trace
         if self._pipeline_logger:
-            agent_name = ctx.agent_response.get("_agent_name") if ctx.agent_response else None
-            intent_val = ctx.classification.intent.value if ctx.classification else None
             confidence = ctx.classification.confidence if ctx.classification else None
 
             # Extract error details from agent response
-            error_info = ctx.agent_response.get("error") if ctx.agent_response else None
-            has_error = error_info is not None
             error_str = None
             if error_info:
                 # Format error string with all relevant details
@@ -670,21 +719,23 @@ class AgentOrchestrator:
                     # error_info is a string
                     error_str = str(error_info)
 
-            await self._pipeline_logger.complete_trace(
-                trace_id=ctx.trace_id,
-                response_text=ctx.response_text,
-                response_type="tts",
-                success=not has_error,
-                error=error_str,
-                agent_used=agent_name,
-                intent=intent_val,
-                intent_confidence=confidence,
-                ha_actions=ctx.actions_taken if ctx.actions_taken else None,
-                memories_retrieved=ctx.retrieved_memories if ctx.retrieved_memories else None,
+            queue.submit(
+                "orchestrator.pipeline_trace",
+                {
+                    "trace_id": ctx.trace_id,
+                    "response_text": ctx.response_text,
+                    "response_type": "tts",
+                    "success": error_info is None,
+                    "error": error_str,
+                    "agent_used": agent_name,
+                    "intent": intent_val,
+                    "intent_confidence": confidence,
+                    "ha_actions": ctx.actions_taken if ctx.actions_taken else None,
+                    "memories_retrieved": ctx.retrieved_memories if ctx.retrieved_memories else None,
+                },
             )
 
         # Complete activity trace
-        error_info = ctx.agent_response.get("error") if ctx.agent_response else None
         error_str = None
         if error_info:
             if isinstance(error_info, dict):
@@ -695,46 +746,66 @@ class AgentOrchestrator:
                 # Simple string error
                 error_str = str(error_info)
 
-        await activity_logger.complete_trace(
-            trace_id=trace_id,
-            response=ctx.response_text,
-            success=error_info is None,
-            error=error_str,
+        queue.submit(
+            "orchestrator.activity_trace",
+            {
+                "trace_id": ctx.trace_id,
+                "response": ctx.response_text,
+                "success": error_info is None,
+                "error": error_str,
+            },
         )
 
         # Record pipeline latency for metrics graphs
-        try:
-            metrics_store = await get_metrics_store()
-            await metrics_store.record_latency(
-                "pipeline",
-                total_ms,
-                {"intent": ctx.classification.intent.value if ctx.classification else None},
+        samples: list[list[Any]] = [["pipeline", total_ms, {"intent": intent_val}]]
+        if "classification" in ctx.stage_timings:
+            samples.append(
+                ["llm", ctx.stage_timings["classification"], {"stage": "classification"}]
             )
-            if "classification" in ctx.stage_timings:
-                await metrics_store.record_latency(
-                    "llm", ctx.stage_timings["classification"], {"stage": "classification"}
-                )
-        except Exception as e:
-            logger.debug(f"Failed to record pipeline metrics: {e}")
+        queue.submit("orchestrator.latency", {"samples": samples})
 
         # Log to immutable audit log (all conversations, not just alerts)
-        agent_name = ctx.agent_response.get("_agent_name") if ctx.agent_response else "unknown"
-        intent_str = ctx.classification.intent.value if ctx.classification else "unknown"
-        await self._log_to_audit(
-            speaker=ctx.speaker,
-            room=ctx.room or "unknown",
-            user_text=ctx.text,
-            assistant_response=ctx.response_text,
-            intent=intent_str,
-            agent=agent_name,
-            conversation_id=ctx.conversation_id or "",
-            triggered_alert=triggered_alert,
+        queue.submit(
+            "orchestrator.audit",
+            {
+                "speaker": ctx.speaker,
+                "room": ctx.room or "unknown",
+                "user_text": ctx.text,
+                "assistant_response": ctx.response_text,
+                "intent": intent_val or "unknown",
+                "agent": agent_name or "unknown",
+                "conversation_id": ctx.conversation_id or "",
+                "triggered_alert": triggered_alert,
+            },
         )
 
-        # Save session state for undo/repeat functionality
-        self._save_session_state(ctx)
+    async def _run_complete_pipeline_trace(self, payload: dict[str, Any]) -> None:
+        if self._pipeline_logger:
+            await self._pipeline_logger.complete_trace(**payload)
+
+    async def _run_complete_activity_trace(self, payload: dict[str, Any]) -> None:
+        await get_activity_logger().complete_trace(**payload)
+
+    async def _run_record_latency(self, payload: dict[str, Any]) -> None:
+        metrics_store = await get_metrics_store()
+        for component, latency_ms, metadata in payload["samples"]:
+            await metrics_store.record_latency(component, latency_ms, metadata)
+
+    async def _run_log_to_audit(self, payload: dict[str, Any]) -> None:
+        await self._log_to_audit(**payload)
 
-        return self._build_response(ctx)
+    async def _run_store_memories(self, payload: dict[str, Any]) -> None:
+        if self._memory_agent is None:
+            # Replayed or late job before init / after shutdown
+            logger.warning("Memory agent not available, dropping memory generation job")
+            return
+        await self._memory_agent.handle_input(
+            "",
+            {
+                "operation": MemoryOperation.GENERATE,
+                "events": [payload["event"]],
+            },
+        )
 
     async def _classify(self, ctx: RequestContext) -> None:
         """Stage 1: Classify intent with MetaAgent (with HA context for better device detection)."""
@@ -751,6 +822,7 @@ class AgentOrchestrator:
                 "entity_names": ha_context.entity_names,
                 "entity_domains": ha_context.entity_domains,
                 "area_names": ha_context.area_names,
+                "mention_detector": ha_context.mention_detector,
             }
         except Exception as e:
             logger.debug("Could not get HA context for classification: %s", e)
@@ -870,22 +942,11 @@ class AgentOrchestrator:
             return None
 
         try:
-            import os
-
-            import redis.asyncio as aioredis
-
             from barnabeenet.services.profiles import PrivacyZone, get_profile_service
 
-            # Get Redis client for profile storage with timeout to prevent hanging
-            redis_url = os.getenv("REDIS_URL", "redis://localhost:6379")
-            redis_client = aioredis.from_url(
-                redis_url, decode_responses=True, socket_timeout=5.0, socket_connect_timeout=5.0
-            )
-
-            # Pass both Redis and HA client
-            profile_service = await get_profile_service(
-                redis_client=redis_client, ha_client=self._ha_client
-            )
+            # Profiles are served from the service's in-memory directory,
+            # backed by the app's shared Redis client
+            profile_service = await get_profile_service(ha_client=self._ha_client)
 
             # Map room to privacy zone
             # Private rooms (bedrooms, offices) get full private context
@@ -929,18 +990,8 @@ class AgentOrchestrator:
             List of profile summaries for mentioned family members
         """
         try:
-            import os
-
-            import redis.asyncio as aioredis
-
             from barnabeenet.services.profiles import PrivacyZone, get_profile_service
 
-            # Get Redis client for profile storage with timeout to prevent hanging
-            redis_url = os.getenv("REDIS_URL", "redis://localhost:6379")
-            redis_client = aioredis.from_url(
-                redis_url, decode_responses=True, socket_timeout=5.0, socket_connect_timeout=5.0
-            )
-
             # Get HA client for location lookups (may not be available)
             ha_client = self._ha_client
             if ha_client is None:
@@ -954,61 +1005,36 @@ class AgentOrchestrator:
                 except Exception:
                     pass  # HA client not available, location won't be included
 
-            # Pass both Redis and HA client for real-time location data
-            profile_service = await get_profile_service(
-                redis_client=redis_client, ha_client=ha_client
-            )
-
-            # Get all profiles
-            all_profiles = await profile_service.get_all_profiles()
-            if not all_profiles:
-                return None
+            profile_service = await get_profile_service(ha_client=ha_client)
 
-            # Find mentions in the text (case-insensitive)
-            text_lower = text.lower()
+            # Whole-word match on ID, full name, or first name via the name
+            # index, skipping the speaker (we already have their context)
             mentioned = []
+            for profile in await profile_service.find_mentioned_profiles(text, exclude=speaker):
+                # Get their profile context including location
+                context = await profile_service.get_profile_context(
+                    speaker_id=profile.member_id,
+                    conversation_participants=[profile.member_id],
+                    privacy_zone=PrivacyZone.COMMON_AREA_OCCUPIED,  # Only public info
+                )
 
-            for profile in all_profiles:
-                member_id = profile.member_id.lower()
-                name = profile.name.lower()
-                # Also check first name only for natural speech ("where is Elizabeth")
-                first_name = name.split()[0] if " " in name else name
-
-                # Skip the speaker (we already have their context)
-                if speaker and member_id == speaker.lower():
-                    continue
-
-                # Check if member is mentioned by ID, full name, or first name
-                # Use word boundary check for first name to avoid false positives
-                id_match = member_id in text_lower
-                name_match = name in text_lower
-                first_name_match = f" {first_name}" in f" {text_lower}"
-
-                if id_match or name_match or first_name_match:
-                    # Get their profile context including location
-                    context = await profile_service.get_profile_context(
-                        speaker_id=profile.member_id,
-                        conversation_participants=[profile.member_id],
-                        privacy_zone=PrivacyZone.COMMON_AREA_OCCUPIED,  # Only public info
-                    )
-
-                    # Create summary with location data
-                    profile_summary = {
-                        "member_id": profile.member_id,
-                        "name": profile.name,
-                        "relationship": profile.relationship_to_primary.value
-                        if hasattr(profile.relationship_to_primary, "value")
-                        else str(profile.relationship_to_primary),
-                        "communication_style": profile.public.communication_style,
-                        "interests": profile.public.interests,
-                        "preferences": profile.public.preferences,
-                    }
+                # Create summary with location data
+                profile_summary = {
+                    "member_id": profile.member_id,
+                    "name": profile.name,
+                    "relationship": profile.relationship_to_primary.value
+                    if hasattr(profile.relationship_to_primary, "value")
+                    else str(profile.relationship_to_primary),
+                    "communication_style": profile.public.communication_style,
+                    "interests": profile.public.interests,
+                    "preferences": profile.public.preferences,
+                }
 
-                    # Add location if available
-                    if context and context.location:
-                        profile_summary["location"] = context.location.model_dump()
+                # Add location if available
+                if context and context.location:
+                    profile_summary["location"] = context.location.model_dump()
 
-                    mentioned.append(profile_summary)
+                mentioned.append(profile_summary)
 
             return mentioned if mentioned else None
 
@@ -1044,6 +1070,8 @@ class AgentOrchestrator:
             else {},
             "sub_category": ctx.classification.sub_category if ctx.classification else None,
         }
+        if ctx.on_partial_text is not None:
+            agent_context["on_partial_text"] = ctx.on_partial_text
 
         # Add profile context if speaker is identified
         if ctx.speaker:
@@ -1369,7 +1397,7 @@ class AgentOrchestrator:
         logger.debug(f"Handled by {agent_name} agent")
 
     async def _store_memories(self, ctx: RequestContext) -> None:
-        """Stage 4: Store relevant facts from the interaction."""
+        """Stage 4: Queue storage of relevant facts from the interaction."""
         # Only store for conversation-type interactions
         if not ctx.classification:
             return
@@ -1381,8 +1409,6 @@ class AgentOrchestrator:
         ):
             return
 
-        start = time.perf_counter()
-
         # Create event for memory generation
         event = {
             "id": f"event_{ctx.request_id}",
@@ -1399,19 +1425,8 @@ class AgentOrchestrator:
             },
         }
 
-        # Generate memory from event (async, non-blocking for response)
-        try:
-            await self._memory_agent.handle_input(
-                "",
-                {
-                    "operation": MemoryOperation.GENERATE,
-                    "events": [event],
-                },
-            )
-        except Exception as e:
-            logger.warning(f"Memory storage failed: {e}")
-
-        ctx.stage_timings["memory_storage"] = (time.perf_counter() - start) * 1000
+        # Generate memory from event after the response has been returned
+        get_post_response_queue().submit("orchestrator.store_memories", {"event": event})
 
     async def _execute_ha_action(
         self, action_spec: dict[str, Any], ctx: RequestContext
@@ -1477,6 +1492,7 @@ class AgentOrchestrator:
         Returns:
             Dict with execution results for all entities
         """
+        from barnabeenet.services.homeassistant.context import get_ha_context_service
         from barnabeenet.services.homeassistant.smart_resolver import (
             FLOOR_ALIASES,
             SmartEntityResolver,
@@ -1485,6 +1501,11 @@ class AgentOrchestrator:
         # HA client is guaranteed to be connected at this point
         assert self._ha_client is not None
 
+        context_service = await get_ha_context_service(self._ha_client)
+        resolver = SmartEntityResolver(
+            self._ha_client, mention_detector=context_service.mention_detector
+        )
+
         # Get action details
         entity_name = action_spec.get("entity_name", "")  # device type like "lights", "blinds"
         target_area = action_spec.get("target_area")
@@ -1507,7 +1528,6 @@ class AgentOrchestrator:
         else:
             # Check if target_area is a floor reference
             target_area_lower = target_area.lower()
-            resolver = SmartEntityResolver(self._ha_client)
             floor_id = resolver.resolve_floor(target_area_lower)
 
             if floor_id:
@@ -1569,7 +1589,6 @@ class AgentOrchestrator:
 
         # Fallback: resolve individual entities and call each one
         logger.info("Falling back to entity-by-entity execution")
-        resolver = SmartEntityResolver(self._ha_client)
 
         # Build the query for the resolver
         if target_area:
@@ -2450,6 +2469,7 @@ def get_orchestrator() -> AgentOrchestrator:
     global _global_orchestrator
     if _global_orchestrator is None:
         _global_orchestrator = AgentOrchestrator()
+        _global_orchestrator.register_post_response_handlers()
     return _global_orchestrator
 
 
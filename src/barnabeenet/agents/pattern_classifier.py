@@ -0,0 +1,269 @@
+"""Compiled pattern classifier for the Meta Agent.
+
+The Meta Agent checks hundreds of regexes in priority order and takes the
+first ``match``. Most of them cannot possibly match a given utterance: an
+anchored ``^what time ...`` pattern needs the text to start with "w", and a
+``.*(fire|smoke|flames).*`` pattern needs one of those words somewhere in it.
+This module analyses each pattern once, when the patterns are (re)loaded:
+
+- First characters: the set of characters a match can start with. Patterns
+  are bucketed by first character, so only patterns that can start with the
+  utterance's first character are considered.
+- Required literals: alternatives of which any match must contain at least
+  one. The substring test is far cheaper than running a ``.*`` pattern that
+  backtracks over the whole utterance.
+
+Both filters only ever skip patterns that cannot match, so the first hit is
+the same as the plain loop's. Patterns the analysis does not understand are
+never skipped. Non-ASCII text bypasses the filters, since case-insensitive
+matching folds some non-ASCII characters onto ASCII letters.
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from re import _constants as sre_constants
+from re import _parser as sre_parse
+from typing import Any
+
+CompiledGroup = Sequence[tuple[re.Pattern[str], str]]
+
+# Shortest required literal worth testing for
+MIN_LITERAL_LENGTH = 2
+
+_ZERO_WIDTH = {sre_constants.AT, sre_constants.ASSERT, sre_constants.ASSERT_NOT}
+_REPEATS = {
+    sre_constants.MAX_REPEAT,
+    sre_constants.MIN_REPEAT,
+    getattr(sre_constants, "POSSESSIVE_REPEAT", sre_constants.MAX_REPEAT),
+}
+
+
+@dataclass(frozen=True, slots=True)
+class PatternMatch:
+    """The first pattern that matched, in priority order."""
+
+    group: str
+    sub_category: str
+    pattern: re.Pattern[str]
+
+
+@dataclass(frozen=True, slots=True)
+class _Entry:
+    pattern: re.Pattern[str]
+    sub_category: str
+    first_chars: frozenset[str] | None  # None: could start with anything
+    required: tuple[str, ...] | None  # None: no usable literal
+
+
+class PatternClassifier:
+    """Classify text against prioritized pattern groups.
+
+    Equivalent to looping over every group in priority order and calling
+    ``pattern.match`` on each pattern, returning the first hit.
+    """
+
+    def __init__(self, groups: Iterable[tuple[str, CompiledGroup]]) -> None:
+        """Analyse and bucket the patterns.
+
+        Args:
+            groups: (group name, [(compiled pattern, sub_category), ...]) in
+                priority order.
+        """
+        self._groups: list[tuple[str, list[_Entry]]] = [
+            (name, [_analyse(pattern, sub_category) for pattern, sub_category in patterns])
+            for name, patterns in groups
+        ]
+        self._by_name = dict(self._groups)
+
+        # First character -> [(group, entries that may start with it)]
+        chars = {c for _, entries in self._groups for e in entries for c in e.first_chars or ()}
+        self._buckets: dict[str, list[tuple[str, list[_Entry]]]] = {
+            char: [
+                (name, [e for e in entries if e.first_chars is None or char in e.first_chars])
+                for name, entries in self._groups
+            ]
+            for char in chars
+        }
+        # Text starting with a character no pattern lists: only unanalysed patterns
+        self._unbucketed = [
+            (name, [e for e in entries if e.first_chars is None]) for name, entries in self._groups
+        ]
+
+    @property
+    def pattern_count(self) -> int:
+        return sum(len(entries) for _, entries in self._groups)
+
+    def match(self, text: str) -> PatternMatch | None:
+        """Return the highest-priority pattern matching at the start of ``text``."""
+        if not text or not text.isascii():
+            return self._scan(self._groups, text, None)
+        first = text[0].lower()
+        groups = self._buckets.get(first, self._unbucketed)
+        return self._scan(groups, text, text.lower())
+
+    def search_group(self, name: str, text: str) -> bool:
+        """Whether any pattern in a group matches anywhere in ``text``."""
+        text_lower = text.lower() if text.isascii() else None
+        for entry in self._by_name.get(name, ()):
+            if text_lower is not None and not _has_required(entry, text_lower):
+                continue
+            if entry.pattern.search(text):
+                return True
+        return False
+
+    @staticmethod
+    def _scan(
+        groups: list[tuple[str, list[_Entry]]], text: str, text_lower: str | None
+    ) -> PatternMatch | None:
+        for name, entries in groups:
+            for entry in entries:
+                if text_lower is not None and not _has_required(entry, text_lower):
+                    continue
+                if entry.pattern.match(text):
+                    return PatternMatch(name, entry.sub_category, entry.pattern)
+        return None
+
+
+def _has_required(entry: _Entry, text_lower: str) -> bool:
+    required = entry.required
+    return required is None or any(literal in text_lower for literal in required)
+
+
+# =============================================================================
+# Pattern Analysis
+# =============================================================================
+
+
+def _analyse(pattern: re.Pattern[str], sub_category: str) -> _Entry:
+    first_chars: frozenset[str] | None = None
+    required: tuple[str, ...] | None = None
+    try:
+        parsed = sre_parse.parse(pattern.pattern, pattern.flags)
+        chars, nullable = _first_chars(list(parsed))
+        if chars is not None and not nullable:
+            first_chars = frozenset(chars)
+        required = _required_literals(list(parsed))
+    except Exception:  # noqa: BLE001 - unknown syntax: leave the pattern unfiltered
+        pass
+    return _Entry(pattern, sub_category, first_chars, required)
+
+
+def _first_chars(items: list[tuple[Any, Any]]) -> tuple[set[str] | None, bool]:
+    """Return (possible lowercase first characters, can match empty) for a sequence."""
+    chars: set[str] = set()
+    for op, av in items:
+        if op in _ZERO_WIDTH:
+            continue
+        if op is sre_constants.LITERAL:
+            char = chr(av)
+            if not char.isascii():
+                return None, False
+            chars.add(char.lower())
+            return chars, False
+        if op is sre_constants.IN:
+            in_chars = _charset(av)
+            if in_chars is None:
+                return None, False
+            return chars | in_chars, False
+        if op is sre_constants.SUBPATTERN:
+            _, add_flags, del_flags, sub = av
+            if add_flags or del_flags:
+                return None, False
+            sub_chars, nullable = _first_chars(list(sub))
+        elif op is sre_constants.BRANCH:
+            sub_chars, nullable = set(), False
+            for alternative in av[1]:
+                alt_chars, alt_nullable = _first_chars(list(alternative))
+                if alt_chars is None:
+                    return None, False
+                sub_chars |= alt_chars
+                nullable = nullable or alt_nullable
+        elif op in _REPEATS:
+            minimum, _, sub = av
+            sub_chars, nullable = _first_chars(list(sub))
+            nullable = nullable or minimum == 0
+        else:
+            return None, False
+        if sub_chars is None:
+            return None, False
+        chars |= sub_chars
+        if not nullable:
+            return chars, False
+    return chars, True
+
+
+_CATEGORY_CHARS = {
+    sre_constants.CATEGORY_DIGIT: "0123456789",
+    sre_constants.CATEGORY_SPACE: " \t\n\r\f\v",
+}
+
+
+def _charset(items: list[tuple[Any, Any]]) -> set[str] | None:
+    chars: set[str] = set()
+    for op, av in items:
+        if op is sre_constants.LITERAL:
+            chars.add(chr(av))
+        elif op is sre_constants.RANGE and av[1] - av[0] < 128:
+            chars.update(chr(c) for c in range(av[0], av[1] + 1))
+        elif op is sre_constants.CATEGORY and av in _CATEGORY_CHARS:
+            chars.update(_CATEGORY_CHARS[av])
+        else:  # NEGATE, \w, wide ranges
+            return None
+    if not all(c.isascii() for c in chars):
+        return None
+    return {c.lower() for c in chars}
+
+
+def _alternatives(op: Any, av: Any) -> tuple[str, ...] | None:
+    """Literals one of which an element's match must contain."""
+    if op is sre_constants.SUBPATTERN:
+        _, add_flags, del_flags, sub = av
+        if add_flags or del_flags:
+            return None
+        return _required_literals(list(sub))
+    if op is sre_constants.BRANCH:
+        # "(fire|can'?t get up)": each alternative must contribute a literal
+        literals: list[str] = []
+        for alternative in av[1]:
+            required = _required_literals(list(alternative))
+            if required is None:
+                return None
+            literals.extend(required)
+        return tuple(dict.fromkeys(literals))
+    if op is sre_constants.IN:
+        chars = _charset(av)
+        return tuple(chars) if chars else None
+    if op in _REPEATS and av[0] >= 1:
+        return _required_literals(list(av[2]))
+    return None
+
+
+def _required_literals(items: list[tuple[Any, Any]]) -> tuple[str, ...] | None:
+    """Pick the most selective set of literals one of which every match contains.
+
+    Candidates are runs of literal characters in the sequence and whatever
+    its mandatory groups require; the set whose shortest literal is longest
+    wins.
+    """
+    candidates: list[tuple[str, ...]] = []
+    run: list[str] = []
+    for op, av in items:
+        if op is sre_constants.LITERAL and chr(av).isascii():
+            run.append(chr(av).lower())
+            continue
+        if run:
+            candidates.append(("".join(run),))
+            run = []
+        alternatives = _alternatives(op, av)
+        if alternatives:
+            candidates.append(alternatives)
+    if run:
+        candidates.append(("".join(run),))
+
+    best = max(candidates, key=lambda c: min(len(lit) for lit in c), default=None)
+    if best is None or min(len(lit) for lit in best) < MIN_LITERAL_LENGTH:
+        return None
+    return best
@@ -43,10 +43,11 @@ async def get_activity_feed(
     types: str | None = Query(None, description="Comma-separated activity types"),
     level: ActivityLevel | None = None,
     source: str | None = None,
+    trace_id: str | None = None,
 ) -> ActivityResponse:
     """Get recent activity feed.
 
-    Supports filtering by type, level, and source.
+    Supports filtering by type, level, source, and trace ID.
     """
     activity_logger = get_activity_logger()
 
@@ -62,6 +63,7 @@ async def get_activity_feed(
         types=type_filter,
         level=level,
         source=source,
+        trace_id=trace_id,
     )
 
     return ActivityResponse(
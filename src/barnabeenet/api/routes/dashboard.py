@@ -323,6 +323,40 @@ async def get_dashboard_stats() -> DashboardStats:
     )
 
 
+class LLMCacheStats(BaseModel):
+    """LLM response cache counters."""
+
+    enabled: bool
+    backend: str = Field(description="'redis' or 'memory'")
+    entries: int
+    partitions: int = Field(description="Agent/model/temperature groups")
+    max_entries_per_partition: int
+    hits: int
+    exact_hits: int = Field(description="Normalized-text matches (no embedding needed)")
+    semantic_hits: int
+    misses: int
+    hit_rate: float
+    evictions: int
+    avg_lookup_ms: float
+    max_lookup_ms: float
+
+
+@router.get("/llm-cache", response_model=LLMCacheStats)
+async def get_llm_cache_stats() -> LLMCacheStats:
+    """Get LLM response cache hit/miss, latency and size counters."""
+    from barnabeenet.services.llm.cache import get_llm_cache
+
+    cache = get_llm_cache()
+    if cache is None:
+        raise HTTPException(status_code=503, detail="LLM cache not initialized")
+
+    stats = cache.get_stats()
+    stats["hit_rate"] = round(stats["hit_rate"], 4)
+    stats["avg_lookup_ms"] = round(stats["avg_lookup_ms"], 2)
+    stats["max_lookup_ms"] = round(stats["max_lookup_ms"], 2)
+    return LLMCacheStats(**stats)
+
+
 # =============================================================================
 # Request Trace Models & Endpoints
 # =============================================================================
@@ -587,7 +621,7 @@ async def get_component_metrics(
     """Get latency metrics for a component.
 
     Args:
-        component: Component name (stt, tts, llm, pipeline, memory, action)
+        component: Component name (stt, tts, tts_first_audio, llm, pipeline, memory, action)
         minutes: Time window in minutes (default 60, max 1440)
 
     Returns:
@@ -312,6 +312,7 @@ async def get_ha_client_with_request(request: Request) -> HomeAssistantClient |
             token=ha_token,
             timeout=10.0,
             verify_ssl=settings.homeassistant.verify_ssl,
+            state_max_age=settings.homeassistant.state_max_age_sec,
         )
 
     # Connect if not connected
@@ -398,6 +399,7 @@ async def get_ha_client() -> HomeAssistantClient | None:
             token=ha_token,
             timeout=10.0,
             verify_ssl=settings.homeassistant.verify_ssl,
+            state_max_age=settings.homeassistant.state_max_age_sec,
         )
 
     # Connect if not connected
@@ -11,11 +11,9 @@ Provides endpoints for:
 from __future__ import annotations
 
 import logging
-import os
 from datetime import UTC, datetime
 from typing import Any
 
-import redis.asyncio as redis
 from fastapi import APIRouter, HTTPException, Query
 from pydantic import BaseModel
 
@@ -108,13 +106,12 @@ async def _get_service(with_ha_client: bool = False) -> ProfileService:
     from barnabeenet.api.routes.homeassistant import get_ha_client as get_ha
 
     try:
-        redis_url = os.getenv("REDIS_URL", "redis://localhost:6379")
-        redis_client = redis.from_url(redis_url, decode_responses=True)
         ha_client = await get_ha() if with_ha_client else None
-        return await get_profile_service(redis_client, ha_client=ha_client)
     except Exception as e:
-        logger.warning(f"Could not connect to Redis: {e}")
-        return await get_profile_service(None)
+        logger.warning(f"Could not get Home Assistant client: {e}")
+        ha_client = None
+    # Uses the app's shared Redis client; no per-request connection
+    return await get_profile_service(ha_client=ha_client)
 
 
 def _format_diff_entry(entry: DiffEntry) -> dict[str, Any]:
@@ -37,11 +37,13 @@ class TimerStatusResponse(BaseModel):
     """Timer manager status response."""
 
     initialized: bool = Field(description="Whether timer manager is initialized")
-    callback_registered: bool = Field(description="Whether state change callback is registered")
-    pool_available: int = Field(description="Number of available timer entities")
-    pool_in_use: int = Field(description="Number of timer entities in use")
+    persistent: bool = Field(False, description="Whether timers are persisted to Redis")
+    mirror_to_ha: bool = Field(False, description="Whether timers are mirrored to HA timer helpers")
+    pool_available: int = Field(description="Number of free HA mirror entities")
+    pool_in_use: int = Field(description="Number of HA mirror entities in use")
     active_timers: int = Field(description="Number of active timers")
-    available_entities: list[str] = Field(description="List of available timer entity IDs")
+    available_entities: list[str] = Field(description="List of free HA mirror entity IDs")
+    engine: dict[str, Any] = Field(default_factory=dict, description="Timer engine statistics")
 
 
 class TimerInfo(BaseModel):
@@ -49,7 +51,7 @@ class TimerInfo(BaseModel):
 
     id: str
     timer_type: str
-    ha_timer_entity: str
+    ha_timer_entity: str | None = None
     label: str
     duration_seconds: float
     remaining_seconds: float
@@ -106,15 +108,14 @@ class CancelTimerResponse(BaseModel):
 async def get_timer_status() -> TimerStatusResponse:
     """Get timer manager status.
 
-    Returns information about the timer manager state, pool availability,
-    and active timers count.
+    Returns information about the timer manager state, timer engine, HA
+    mirror pool availability, and active timers count.
     """
     timer_manager = get_timer_manager_sync()
 
     if timer_manager is None:
         return TimerStatusResponse(
             initialized=False,
-            callback_registered=False,
             pool_available=0,
             pool_in_use=0,
             active_timers=0,
@@ -124,11 +125,13 @@ async def get_timer_status() -> TimerStatusResponse:
     status = timer_manager.get_status()
     return TimerStatusResponse(
         initialized=status["initialized"],
-        callback_registered=status["callback_registered"],
+        persistent=status["persistent"],
+        mirror_to_ha=status["mirror_to_ha"],
         pool_available=status["pool_available"],
         pool_in_use=status["pool_in_use"],
         active_timers=status["active_timers"],
         available_entities=status["available_entities"],
+        engine=status["engine"],
     )
 
 
@@ -248,12 +251,6 @@ async def create_timer(request: CreateTimerRequest) -> CreateTimerResponse:
         on_complete=request.on_complete,
     )
 
-    if timer is None:
-        return CreateTimerResponse(
-            success=False,
-            message="No timer entities available",
-        )
-
     return CreateTimerResponse(
         success=True,
         timer=TimerInfo(
@@ -432,9 +429,6 @@ async def test_timer_action(entity_id: str, action: str = "turn_off", delay_seco
         },
     )
 
-    if timer is None:
-        return {"success": False, "message": "No timer entities available"}
-
     return {
         "success": True,
         "timer_id": timer.id,
@@ -4,9 +4,11 @@ from __future__ import annotations
 
 import base64
 import time
+from collections.abc import AsyncIterator
 
 import structlog
 from fastapi import APIRouter, HTTPException, UploadFile, WebSocket, WebSocketDisconnect
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
 from barnabeenet.config import get_settings
@@ -24,48 +26,27 @@ from barnabeenet.models.schemas import (
     VoicePipelineRequest,
     VoicePipelineResponse,
 )
+from barnabeenet.services.inference_executor import get_inference_executor
+from barnabeenet.services.metrics_store import get_metrics_store
+from barnabeenet.services.model_pool import get_model_pool
 from barnabeenet.services.stt import get_distil_whisper_class
-from barnabeenet.services.tts import KokoroTTS
+from barnabeenet.services.tts import KokoroTTS, TTSAudioChunk
 from barnabeenet.services.voice_pipeline import VoicePipelineService
 
 router = APIRouter()
 logger = structlog.get_logger()
 
-# Service instances (initialized lazily)
-_stt_service = None  # Will be DistilWhisperSTT if available
-_tts_service: KokoroTTS | None = None
-
 
 async def get_stt_service():
-    """Get or create the STT service instance."""
-    global _stt_service
-    if _stt_service is None:
-        DistilWhisperSTT = get_distil_whisper_class()
-        if DistilWhisperSTT is None:
-            raise RuntimeError("STT service not available: numpy import failed")
-        settings = get_settings()
-        _stt_service = DistilWhisperSTT(
-            model_size=settings.stt.whisper_model,
-            device=settings.stt.whisper_device,
-            compute_type=settings.stt.whisper_compute_type,
-        )
-    if not _stt_service.is_available():
-        await _stt_service.initialize()
-    return _stt_service
+    """Get the resident STT service from the model pool."""
+    if get_distil_whisper_class() is None:
+        raise RuntimeError("STT service not available: numpy import failed")
+    return await get_model_pool().get_stt()
 
 
 async def get_tts_service() -> KokoroTTS:
-    """Get or create the TTS service instance."""
-    global _tts_service
-    if _tts_service is None:
-        settings = get_settings()
-        _tts_service = KokoroTTS(
-            voice=settings.tts.voice,
-            speed=settings.tts.speed,
-        )
-    if not _tts_service.is_available():
-        await _tts_service.initialize()
-    return _tts_service
+    """Get the resident TTS service from the model pool."""
+    return await get_model_pool().get_tts()
 
 
 # =============================================================================
@@ -142,23 +123,20 @@ async def transcribe(request: TranscribeRequest) -> TranscribeResponse:
 
 async def _transcribe_gpu(audio_bytes: bytes, language: str) -> tuple[str, float]:
     """Transcribe using GPU worker (Parakeet on Man-of-war)."""
-    import httpx
-
     settings = get_settings()
     url = f"http://{settings.stt.gpu_worker_host}:{settings.stt.gpu_worker_port}/transcribe"
 
-    async with httpx.AsyncClient() as client:
-        response = await client.post(
-            url,
-            json={
-                "audio_base64": base64.b64encode(audio_bytes).decode(),
-                "language": language,
-            },
-            timeout=settings.performance.stt_timeout_ms / 1000,
-        )
-        response.raise_for_status()
-        data = response.json()
-        return data["text"], data.get("confidence", 1.0)
+    response = await get_model_pool().http_client.post(
+        url,
+        json={
+            "audio_base64": base64.b64encode(audio_bytes).decode(),
+            "language": language,
+        },
+        timeout=settings.performance.stt_timeout_ms / 1000,
+    )
+    response.raise_for_status()
+    data = response.json()
+    return data["text"], data.get("confidence", 1.0)
 
 
 async def _transcribe_cpu(audio_bytes: bytes, language: str) -> tuple[str, float]:
@@ -223,6 +201,148 @@ async def _synthesize_kokoro(
     return result["audio_bytes"], result["sample_rate"], result["duration_ms"]
 
 
+# =============================================================================
+# Streaming TTS
+# =============================================================================
+
+
+async def _stream_speech(
+    text: str,
+    voice: str | None,
+    speed: float | None,
+) -> AsyncIterator[TTSAudioChunk]:
+    """Stream Kokoro audio per sentence, recording time to first audio."""
+    start = time.perf_counter()
+    tts = await get_tts_service()
+
+    first = True
+    async for chunk in tts.synthesize_stream(text=text, voice=voice, speed=speed):
+        if first:
+            first = False
+            first_audio_ms = (time.perf_counter() - start) * 1000
+            try:
+                store = await get_metrics_store()
+                await store.record_latency(
+                    "tts_first_audio",
+                    first_audio_ms,
+                    {"text_length": len(text), "voice": voice or tts.voice},
+                )
+            except Exception as e:
+                logger.debug("Failed to record first-audio latency", error=str(e))
+        yield chunk
+
+
+@router.post("/synthesize/stream")
+async def synthesize_stream(request: SynthesizeRequest) -> StreamingResponse:
+    """Synthesize speech as a chunked stream of raw PCM.
+
+    Audio is 16-bit signed little-endian mono PCM at the rate given in the
+    X-Sample-Rate header, sent sentence by sentence as it renders.
+    ``output_format`` is ignored: streamed audio is always PCM.
+    """
+    chunks = _stream_speech(request.text, request.voice, request.speed)
+
+    # Render the first sentence before responding so errors (e.g. a busy
+    # TTS lane) still map to a proper status code
+    first = await anext(chunks, None)
+    sample_rate = first.sample_rate if first else get_settings().audio.output_sample_rate
+
+    async def body() -> AsyncIterator[bytes]:
+        if first is None:
+            return
+        yield first.pcm
+        async for chunk in chunks:
+            yield chunk.pcm
+
+    return StreamingResponse(
+        body(),
+        media_type=f"audio/L16; rate={sample_rate}; channels=1",
+        headers={"X-Sample-Rate": str(sample_rate)},
+    )
+
+
+@router.websocket("/ws/synthesize")
+async def websocket_synthesize(websocket: WebSocket) -> None:
+    """WebSocket endpoint for streaming speech synthesis.
+
+    Messages from client:
+    - {"type": "synthesize", "text": "...", "voice": "bm_fable", "speed": 1.0}
+    - {"type": "end"} to close the session
+
+    Messages from server:
+    - {"type": "ready", "format": "pcm_s16le", "channels": 1}
+    - {"type": "audio", "index": 0, "text": "...", "sample_rate": 24000, "duration_ms": ...}
+      followed by one binary frame with that sentence's PCM
+    - {"type": "complete", "chunks": 3, "time_to_first_audio_ms": ..., "total_ms": ...}
+    - {"type": "error", "message": "..."}
+    """
+    import json
+
+    await websocket.accept()
+    await websocket.send_json({"type": "ready", "format": "pcm_s16le", "channels": 1})
+
+    try:
+        while True:
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                break
+            if "text" not in message or message["text"] is None:
+                continue
+
+            data = json.loads(message["text"])
+            msg_type = data.get("type", "")
+            if msg_type == "end":
+                break
+            if msg_type != "synthesize" or not data.get("text"):
+                await websocket.send_json({"type": "error", "message": "Expected synthesize text"})
+                continue
+
+            start = time.perf_counter()
+            first_audio_ms: float | None = None
+            count = 0
+            try:
+                async for chunk in _stream_speech(
+                    data["text"], data.get("voice"), data.get("speed")
+                ):
+                    if first_audio_ms is None:
+                        first_audio_ms = (time.perf_counter() - start) * 1000
+                    await websocket.send_json(
+                        {
+                            "type": "audio",
+                            "index": chunk.index,
+                            "text": chunk.text,
+                            "sample_rate": chunk.sample_rate,
+                            "duration_ms": chunk.duration_ms,
+                        }
+                    )
+                    await websocket.send_bytes(chunk.pcm)
+                    count += 1
+            except WebSocketDisconnect:
+                raise
+            except Exception as e:
+                logger.error("Streaming synthesis failed", error=str(e))
+                await websocket.send_json({"type": "error", "message": str(e)})
+                continue
+
+            await websocket.send_json(
+                {
+                    "type": "complete",
+                    "chunks": count,
+                    "time_to_first_audio_ms": first_audio_ms,
+                    "total_ms": (time.perf_counter() - start) * 1000,
+                }
+            )
+
+    except WebSocketDisconnect:
+        pass
+    except Exception as e:
+        logger.error("WebSocket synthesis error", error=str(e))
+        try:
+            await websocket.send_json({"type": "error", "message": f"Server error: {str(e)}"})
+        except Exception:
+            pass
+
+
 # =============================================================================
 # Full Voice Pipeline
 # =============================================================================
@@ -519,7 +639,7 @@ async def quick_audio_input(
     from barnabeenet.agents.orchestrator import get_orchestrator
     from barnabeenet.models.stt_modes import STTEngine as STTEngineEnum
     from barnabeenet.models.stt_modes import STTMode as STTModeEnum
-    from barnabeenet.services.stt.router import STTRouter
+    from barnabeenet.services.stt.router import get_stt_router
 
     start_time = time.perf_counter()
 
@@ -539,22 +659,15 @@ async def quick_audio_input(
 
     # Transcribe
     settings = get_settings()
-    stt_router = STTRouter(
-        gpu_worker_url=f"http://{settings.stt.gpu_worker_host}:{settings.stt.gpu_worker_port}",
+    stt_router = await get_stt_router()
+    stt_result = await stt_router.transcribe(
+        audio_data=audio_data,
+        sample_rate=settings.audio.input_sample_rate,
+        language="en",
+        engine=stt_engine,
+        mode=stt_mode,
     )
 
-    try:
-        await stt_router.initialize()
-        stt_result = await stt_router.transcribe(
-            audio_data=audio_data,
-            sample_rate=settings.audio.input_sample_rate,
-            language="en",
-            engine=stt_engine,
-            mode=stt_mode,
-        )
-    finally:
-        await stt_router.shutdown()
-
     # Process through orchestrator
     orchestrator = get_orchestrator()
     ai_result = await orchestrator.process(
@@ -716,17 +829,14 @@ async def websocket_transcribe(websocket: WebSocket) -> None:
     import json
 
     from barnabeenet.models.stt_modes import STTEngine as STTEngineEnum
-    from barnabeenet.services.stt.router import STTRouter
+    from barnabeenet.services.stt.router import get_stt_router
 
     await websocket.accept()
 
     settings = get_settings()
-    stt_router = STTRouter(
-        gpu_worker_url=f"http://{settings.stt.gpu_worker_host}:{settings.stt.gpu_worker_port}",
-    )
 
     try:
-        await stt_router.initialize()
+        stt_router = await get_stt_router()
 
         # Send ready message
         await websocket.send_json(
@@ -844,8 +954,6 @@ async def websocket_transcribe(websocket: WebSocket) -> None:
             )
         except Exception:
             pass
-    finally:
-        await stt_router.shutdown()
 
 
 # =============================================================================
@@ -862,22 +970,16 @@ async def get_stt_status() -> dict:
     - azure (cloud): Good for mobile/remote
     - whisper (CPU): Always available fallback
     """
-    from barnabeenet.services.stt.router import STTRouter
+    from barnabeenet.services.stt.router import get_stt_router
 
     settings = get_settings()
-    stt_router = STTRouter(
-        gpu_worker_url=f"http://{settings.stt.gpu_worker_host}:{settings.stt.gpu_worker_port}",
-    )
+    stt_router = await get_stt_router()
 
-    try:
-        await stt_router.initialize()
-        status = stt_router.get_status()
-
-        return {
-            "status": "ok",
-            "default_mode": settings.stt.default_mode,
-            "default_engine": settings.stt.default_engine,
-            **status,
-        }
-    finally:
-        await stt_router.shutdown()
+    return {
+        "status": "ok",
+        "default_mode": settings.stt.default_mode,
+        "default_engine": settings.stt.default_engine,
+        **stt_router.get_status(),
+        "model_pool": get_model_pool().get_status(),
+        "inference": get_inference_executor().get_status(),
+    }
@@ -7,6 +7,7 @@ Uses Redis Streams XREAD for efficient pub/sub style consumption.
 from __future__ import annotations
 
 import asyncio
+import itertools
 import json
 import logging
 from typing import TYPE_CHECKING, Any
@@ -15,6 +16,12 @@ from fastapi import APIRouter, WebSocket, WebSocketDisconnect
 from pydantic import BaseModel
 
 from barnabeenet.services.activity_log import Activity, get_activity_logger
+from barnabeenet.services.fanout import (
+    DEFAULT_TICK_SEC,
+    FanoutBus,
+    FanoutSubscriber,
+    encode,
+)
 from barnabeenet.services.llm.signals import get_signal_logger
 
 if TYPE_CHECKING:
@@ -24,6 +31,8 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(tags=["WebSocket"])
 
+_connection_ids = itertools.count(1)
+
 
 # =============================================================================
 # Connection Manager
@@ -33,12 +42,15 @@ router = APIRouter(tags=["WebSocket"])
 class ConnectionManager:
     """Manages active WebSocket connections.
 
-    Handles connection lifecycle, broadcasting, and filtering.
+    Handles connection lifecycle, broadcasting, and filtering. Broadcasts go
+    through a FanoutBus, so a slow client never delays the broadcaster.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, tick: float = DEFAULT_TICK_SEC) -> None:
         self._connections: list[WebSocket] = []
         self._connection_filters: dict[WebSocket, dict[str, Any]] = {}
+        self._bus = FanoutBus(tick=tick)
+        self._subscribers: dict[WebSocket, FanoutSubscriber] = {}
 
     async def connect(
         self,
@@ -49,6 +61,14 @@ class ConnectionManager:
         await websocket.accept()
         self._connections.append(websocket)
         self._connection_filters[websocket] = filters or {}
+        self._subscribers[websocket] = self._bus.add(
+            websocket.send_text,
+            name=f"activity-{next(_connection_ids)}",
+            accepts=lambda message: self._should_send(
+                message, self._connection_filters.get(websocket, {})
+            ),
+            on_close=lambda _subscriber: self.disconnect(websocket),
+        )
         logger.info(
             "WebSocket connected. Total connections: %d",
             len(self._connections),
@@ -60,6 +80,9 @@ class ConnectionManager:
             self._connections.remove(websocket)
         if websocket in self._connection_filters:
             del self._connection_filters[websocket]
+        subscriber = self._subscribers.pop(websocket, None)
+        if subscriber is not None:
+            self._bus.remove(subscriber)
         logger.info(
             "WebSocket disconnected. Total connections: %d",
             len(self._connections),
@@ -74,21 +97,25 @@ class ConnectionManager:
         self._connection_filters[websocket] = filters
 
     async def broadcast(self, message: dict[str, Any]) -> None:
-        """Send message to all connected clients (with filtering)."""
-        disconnected = []
-        for websocket in self._connections:
-            try:
-                # Apply filters
-                filters = self._connection_filters.get(websocket, {})
-                if self._should_send(message, filters):
-                    await websocket.send_json(message)
-            except Exception as e:
-                logger.warning("Failed to send to WebSocket: %s", e)
-                disconnected.append(websocket)
+        """Queue message for all connected clients (with filtering); never waits on them."""
+        self._bus.publish(message)
+
+    def send_to(self, websocket: WebSocket, message: dict[str, Any]) -> bool:
+        """Queue a message for one connection, in order with its broadcasts.
 
-        # Clean up disconnected clients
-        for ws in disconnected:
-            self.disconnect(ws)
+        Returns:
+            False if the connection is gone.
+        """
+        subscriber = self._subscribers.get(websocket)
+        return subscriber is not None and subscriber.offer(encode(message))
+
+    async def flush(self) -> None:
+        """Wait until every queued message has been sent."""
+        await self._bus.flush()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Per-connection queue depth, drops and lag."""
+        return self._bus.get_stats()
 
     def _should_send(self, message: dict[str, Any], filters: dict[str, Any]) -> bool:
         """Check if message passes the client's filters."""
@@ -178,7 +205,8 @@ async def websocket_activity_stream(websocket: WebSocket) -> None:
 
     try:
         # Send initial status
-        await websocket.send_json(
+        manager.send_to(
+            websocket,
             {
                 "type": "status",
                 "data": {
@@ -186,7 +214,7 @@ async def websocket_activity_stream(websocket: WebSocket) -> None:
                     "connections": manager.connection_count,
                     "filters": filters,
                 },
-            }
+            },
         )
 
         # Handle incoming messages (filter updates, pings)
@@ -202,21 +230,20 @@ async def websocket_activity_stream(websocket: WebSocket) -> None:
                     # Update filters
                     new_filters = message.get("data", {})
                     manager.set_filters(websocket, new_filters)
-                    await websocket.send_json(
+                    manager.send_to(
+                        websocket,
                         {
                             "type": "status",
                             "data": {"filters_updated": True, "filters": new_filters},
-                        }
+                        },
                     )
 
                 elif message.get("type") == "ping":
-                    await websocket.send_json({"type": "pong", "data": {}})
+                    manager.send_to(websocket, {"type": "pong", "data": {}})
 
             except TimeoutError:
-                # Send heartbeat ping
-                try:
-                    await websocket.send_json({"type": "ping", "data": {}})
-                except Exception:
+                # Send heartbeat ping (fails once the connection has dropped)
+                if not manager.send_to(websocket, {"type": "ping", "data": {}}):
                     break
 
     except WebSocketDisconnect:
@@ -374,12 +401,17 @@ class DashboardConnectionManager:
     - Metrics updates
     - Test results
     - System status
+
+    Messages are queued per connection through a FanoutBus and written in
+    frames every ``tick`` seconds, so producers never wait on browsers.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, tick: float = DEFAULT_TICK_SEC) -> None:
         self._connections: list[WebSocket] = []
         self._heartbeat_interval = 30.0
         self._subscribed = False
+        self._bus = FanoutBus(tick=tick)
+        self._subscribers: dict[WebSocket, FanoutSubscriber] = {}
 
     def _subscribe_to_activities(self) -> None:
         """Subscribe to activity logger updates."""
@@ -392,11 +424,11 @@ class DashboardConnectionManager:
         except Exception as e:
             logger.warning(f"Failed to subscribe to activity logger: {e}")
 
-    async def _on_activity(self, activity: Activity) -> None:
-        """Handle incoming activity from the logger."""
+    def _on_activity(self, activity: Activity) -> None:
+        """Handle incoming activity from the logger (queues, never waits)."""
         if not self._connections:
             return
-        await self.broadcast(
+        self._publish(
             "activity",
             {
                 "id": activity.id,
@@ -415,6 +447,11 @@ class DashboardConnectionManager:
         """Accept a new dashboard WebSocket connection."""
         await websocket.accept()
         self._connections.append(websocket)
+        self._subscribers[websocket] = self._bus.add(
+            websocket.send_text,
+            name=f"dashboard-{next(_connection_ids)}",
+            on_close=lambda _subscriber: self.disconnect(websocket),
+        )
         self._subscribe_to_activities()
         logger.info(
             "Dashboard WebSocket connected. Total: %d",
@@ -425,34 +462,47 @@ class DashboardConnectionManager:
         """Remove a dashboard WebSocket connection."""
         if websocket in self._connections:
             self._connections.remove(websocket)
+        subscriber = self._subscribers.pop(websocket, None)
+        if subscriber is not None:
+            self._bus.remove(subscriber)
         logger.info(
             "Dashboard WebSocket disconnected. Total: %d",
             len(self._connections),
         )
 
-    async def broadcast(self, message_type: str, data: dict[str, Any]) -> None:
-        """Broadcast message to all dashboard connections."""
-        message = {"type": message_type, "data": data}
-        disconnected = []
+    def _publish(
+        self, message_type: str, data: dict[str, Any], coalesce_key: str | None = None
+    ) -> None:
+        self._bus.publish({"type": message_type, "data": data}, coalesce_key)
 
-        for ws in self._connections:
-            try:
-                await ws.send_json(message)
-            except Exception as e:
-                logger.warning("Dashboard broadcast failed: %s", e)
-                disconnected.append(ws)
+    async def broadcast(
+        self, message_type: str, data: dict[str, Any], coalesce_key: str | None = None
+    ) -> None:
+        """Broadcast message to all dashboard connections (queued, never waits).
 
-        for ws in disconnected:
-            self.disconnect(ws)
+        Args:
+            message_type: Message type (activity, metrics, test_result, ...)
+            data: Message payload
+            coalesce_key: If set, replaces a still-unsent message with the
+                same key for slow connections instead of queueing another
+        """
+        self._publish(message_type, data, coalesce_key)
 
     async def send_to(self, websocket: WebSocket, message_type: str, data: dict[str, Any]) -> None:
-        """Send message to a specific connection."""
-        try:
-            await websocket.send_json({"type": message_type, "data": data})
-        except Exception as e:
-            logger.warning("Dashboard send failed: %s", e)
+        """Send message to a specific connection (in order with broadcasts)."""
+        subscriber = self._subscribers.get(websocket)
+        if subscriber is None or not subscriber.offer(encode({"type": message_type, "data": data})):
+            logger.warning("Dashboard send failed: connection closed")
             self.disconnect(websocket)
 
+    async def flush(self) -> None:
+        """Wait until every queued message has been sent."""
+        await self._bus.flush()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Per-connection queue depth, drops and lag."""
+        return self._bus.get_stats()
+
     @property
     def connection_count(self) -> int:
         """Get number of active dashboard connections."""
@@ -579,10 +629,19 @@ async def broadcast_activity(activity: dict[str, Any]) -> None:
 
 
 async def broadcast_metrics(metrics: dict[str, Any]) -> None:
-    """Broadcast metrics update to all dashboard connections."""
-    await dashboard_manager.broadcast("metrics", metrics)
+    """Broadcast metrics update to all dashboard connections (latest wins if queued)."""
+    await dashboard_manager.broadcast("metrics", metrics, coalesce_key="metrics")
 
 
 async def broadcast_test_result(result: dict[str, Any]) -> None:
     """Broadcast test result to all dashboard connections."""
     await dashboard_manager.broadcast("test_result", result)
+
+
+@router.get("/ws/stats")
+async def websocket_stats() -> dict[str, Any]:
+    """Per-connection send queue depth, drops and lag for both WebSocket feeds."""
+    return {
+        "activity": manager.get_stats(),
+        "dashboard": dashboard_manager.get_stats(),
+    }
@@ -49,6 +49,7 @@ class STTSettings(BaseSettings):
     whisper_device: str = "cpu"
     whisper_compute_type: str = "int8"
     whisper_beam_size: int = 1
+    whisper_memory_mb: int = 500  # Resident footprint estimate for the model pool
 
     # GPU Worker settings (Parakeet on Man-of-war via Windows port forward)
     gpu_worker_host: str = "192.168.86.61"
@@ -58,6 +59,10 @@ class STTSettings(BaseSettings):
 
     # Streaming settings
     streaming_chunk_ms: int = 100  # Chunk size for streaming mode
+    streaming_partial_interval_ms: int = 500  # Audio between partial hypotheses
+    streaming_endpoint_silence_ms: int = 600  # Trailing silence that ends an utterance
+    streaming_min_speech_ms: int = 200  # Shorter voiced bursts are dropped as noise
+    streaming_max_utterance_ms: int = 15000  # Longer utterances are finalized early
 
 
 class TTSSettings(BaseSettings):
@@ -69,6 +74,7 @@ class TTSSettings(BaseSettings):
     voice: str = "bm_fable"
     speed: float = 1.0
     sample_rate: int = 24000
+    kokoro_memory_mb: int = 400  # Resident footprint estimate for the model pool
 
 
 class AudioSettings(BaseSettings):
@@ -94,9 +100,15 @@ class PerformanceSettings(BaseSettings):
 
     model_config = SettingsConfigDict(env_prefix="PERF_")
 
-    # Concurrency limits
+    # Concurrency limits (in-flight inference calls per model before rejecting)
     max_concurrent_stt: int = 4
     max_concurrent_tts: int = 4
+    max_concurrent_embeddings: int = 64
+
+    # Inference worker threads per model (concurrent model calls)
+    inference_stt_workers: int = 1
+    inference_tts_workers: int = 1
+    inference_embedding_workers: int = 1
 
     # Timeouts
     stt_timeout_ms: int = 5000
@@ -105,6 +117,15 @@ class PerformanceSettings(BaseSettings):
     # Caching
     tts_cache_max_size: int = 100
 
+    # Resident voice model pool
+    model_pool_budget_mb: int = 2048
+    preload_voice_models: bool = True  # Load + warm up STT/TTS at startup
+
+    # Activity log history
+    activity_log_capacity: int = 5000
+    activity_log_spill: bool = False  # Keep history across restarts in data_dir
+    activity_log_spill_slot_bytes: int = 4096
+
 
 class LLMSettings(BaseSettings):
     """LLM/OpenRouter settings for agent system."""
@@ -155,6 +176,9 @@ class HomeAssistantSettings(BaseSettings):
 
     # Entity refresh
     refresh_interval_sec: int = 300  # Refresh entity registry every 5 minutes
+    # Entity states are mirrored in memory; without the event stream a
+    # snapshot older than this is refreshed before answering state queries
+    state_max_age_sec: float = 30.0
 
     # Enabled features
     enabled: bool = True
@@ -21,6 +21,7 @@ from fastapi.staticfiles import StaticFiles
 from barnabeenet import __version__
 from barnabeenet.config import get_settings
 from barnabeenet.models.schemas import ErrorDetail, ErrorResponse
+from barnabeenet.services.inference_executor import InferenceBusyError
 
 if TYPE_CHECKING:
     from collections.abc import AsyncGenerator
@@ -115,6 +116,16 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
 
     init_metrics(version=__version__, env=settings.env)
 
+    # Activity log history (optionally restored from a memory-mapped spill file)
+    from barnabeenet.services.activity_log import init_activity_logger
+
+    perf = settings.performance
+    init_activity_logger(
+        max_activities=perf.activity_log_capacity,
+        spill_path=settings.data_dir / "activity_log.ring" if perf.activity_log_spill else None,
+        spill_slot_bytes=perf.activity_log_spill_slot_bytes,
+    )
+
     # Initialize Redis connections
     try:
         import redis.asyncio as redis
@@ -144,10 +155,10 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         manager = get_activity_config_manager()
         await manager.load_redis_overrides(app_state.redis_client)
 
-        # Initialize LLM response cache
+        # Initialize LLM response cache (embeddings are stored as raw bytes)
         from barnabeenet.services.llm.cache import init_llm_cache
 
-        await init_llm_cache(redis_client=app_state.redis_client, enabled=True)
+        await init_llm_cache(redis_client=app_state.redis_client_binary, enabled=True)
         logger.info("LLM response cache initialized")
     except Exception as e:
         logger.error("Redis connection failed", error=str(e))
@@ -161,6 +172,11 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         except Exception as cache_error:
             logger.warning("LLM cache initialization failed", error=str(cache_error))
 
+    # Post-response work queue (spills to a Redis Stream when Redis is up)
+    from barnabeenet.services.post_response import init_post_response_queue
+
+    post_response_queue = init_post_response_queue(redis_client=app_state.redis_client)
+
     # Initialize Pipeline Logger for dashboard
     try:
         from barnabeenet.services.pipeline_signals import init_pipeline_logger
@@ -179,6 +195,8 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         await app_state.orchestrator.init()
         # Set as global orchestrator so get_orchestrator() returns this instance
         orchestrator_module._global_orchestrator = app_state.orchestrator
+        # Deferred work (including replayed jobs) runs on this one instance
+        app_state.orchestrator.register_post_response_handlers()
         # Make orchestrator available on app.state for dependency injection
         app.state.orchestrator = app_state.orchestrator
         logger.info("Agent Orchestrator initialized (set as global)")
@@ -186,11 +204,18 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         logger.error("Orchestrator initialization failed", error=str(e))
         # Continue - orchestrator will init lazily on first request
 
-    # Initialize Memory Storage
+    # Start draining spilled post-response work (handlers are registered by now)
     try:
-        from barnabeenet.services.memory.storage import MemoryStorage
+        await post_response_queue.start()
+    except Exception as e:
+        logger.error("Post-response queue start failed", error=str(e))
 
-        app_state.memory_storage = MemoryStorage(
+    # Initialize Memory Storage (the same instance MemoryAgent uses, so API
+    # writes are visible to its resident search index)
+    try:
+        from barnabeenet.services.memory.storage import get_memory_storage
+
+        app_state.memory_storage = get_memory_storage(
             redis_client=getattr(app_state, "redis_client_binary", None)
         )
         await app_state.memory_storage.init()
@@ -211,16 +236,20 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
                 app_state.orchestrator.set_ha_client(ha_client)
                 logger.info("Set HA client on orchestrator for entity resolution")
 
-            # Ensure WebSocket subscription is started for timer events
+            # Ensure the WebSocket subscription feeds the state mirror and registries
             if not ha_client.is_subscribed:
                 await ha_client.subscribe_to_events()
                 logger.info("Started HA WebSocket event subscription")
 
-            app_state.timer_manager = await init_timer_manager(ha_client)
+            app_state.timer_manager = await init_timer_manager(
+                ha_client, redis_client=app_state.redis_client
+            )
             if app_state.timer_manager:
+                status = app_state.timer_manager.get_status()
                 logger.info(
-                    "Timer Manager initialized with %d timer entities",
-                    len(app_state.timer_manager._pool.available),
+                    "Timer Manager initialized",
+                    active_timers=status["active_timers"],
+                    mirror_entities=status["pool_available"],
                 )
             else:
                 logger.warning("Timer Manager initialization returned None")
@@ -243,6 +272,13 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     except Exception as e:
         logger.warning("Device capabilities sync failed", error=str(e))
 
+    # Load and warm up resident STT/TTS models in the background
+    if settings.performance.preload_voice_models:
+        from barnabeenet.services.model_pool import get_model_pool
+
+        app_state._model_preload_task = asyncio.create_task(get_model_pool().preload())
+        logger.info("Voice model preload started")
+
     # Start GPU worker health check task
     app_state._health_check_task = asyncio.create_task(_gpu_worker_health_check_loop())
 
@@ -277,6 +313,32 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     except Exception as e:
         logger.warning("Signal streamer shutdown error", error=str(e))
 
+    # Finish or spill deferred post-response work
+    try:
+        from barnabeenet.services.post_response import get_post_response_queue
+
+        await get_post_response_queue().shutdown()
+    except Exception as e:
+        logger.warning("Post-response queue shutdown error", error=str(e))
+
+    # Stop the timer engine (persisted timers resume on next start)
+    try:
+        from barnabeenet.services.timers import get_timer_manager_sync
+
+        timer_manager = get_timer_manager_sync()
+        if timer_manager:
+            await timer_manager.shutdown()
+    except Exception as e:
+        logger.warning("Timer manager shutdown error", error=str(e))
+
+    # Stop listening for profile changes from other workers
+    try:
+        from barnabeenet.services.profiles import shutdown_profile_service
+
+        await shutdown_profile_service()
+    except Exception as e:
+        logger.warning("Profile service shutdown error", error=str(e))
+
     # Shutdown orchestrator
     if app_state.orchestrator:
         await app_state.orchestrator.shutdown()
@@ -297,6 +359,37 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         except asyncio.CancelledError:
             pass
 
+    # Release shared STT router and resident voice models
+    preload_task = getattr(app_state, "_model_preload_task", None)
+    if preload_task and not preload_task.done():
+        preload_task.cancel()
+    try:
+        from barnabeenet.services.inference_executor import get_inference_executor
+        from barnabeenet.services.model_pool import get_model_pool
+        from barnabeenet.services.stt.router import shutdown_stt_router
+
+        await shutdown_stt_router()
+        await get_model_pool().shutdown()
+        get_inference_executor().shutdown()
+    except Exception as e:
+        logger.warning("Voice model pool shutdown error", error=str(e))
+
+    # Flush batched telemetry before Redis goes away
+    try:
+        from barnabeenet.services.telemetry_writer import shutdown_telemetry_writers
+
+        await shutdown_telemetry_writers()
+    except Exception as e:
+        logger.warning("Telemetry writer shutdown error", error=str(e))
+
+    # Flush activity history to its spill file
+    try:
+        from barnabeenet.services.activity_log import get_activity_logger
+
+        get_activity_logger().close()
+    except Exception as e:
+        logger.warning("Activity log shutdown error", error=str(e))
+
     # Close Redis connection
     if app_state.redis_client:
         await app_state.redis_client.close()
@@ -410,6 +503,21 @@ def create_app() -> FastAPI:
         response.headers["X-Process-Time-Ms"] = f"{elapsed_ms:.2f}"
         return response
 
+    # Saturated model inference: shed load instead of queueing without bound
+    @app.exception_handler(InferenceBusyError)
+    async def inference_busy_handler(request: Request, exc: InferenceBusyError):
+        return JSONResponse(
+            status_code=503,
+            headers={"Retry-After": "1"},
+            content=ErrorResponse(
+                error=ErrorDetail(
+                    code="INFERENCE_BUSY",
+                    message="Model is busy, retry shortly",
+                    details={"model": exc.lane, "max_pending": exc.max_pending},
+                )
+            ).model_dump(mode="json"),
+        )
+
     # Global exception handler
     @app.exception_handler(Exception)
     async def global_exception_handler(request: Request, exc: Exception):
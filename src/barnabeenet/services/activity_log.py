@@ -16,11 +16,14 @@ import logging
 from collections.abc import Callable
 from datetime import UTC, datetime
 from enum import Enum
+from pathlib import Path
 from typing import Any
 from uuid import uuid4
 
 from pydantic import BaseModel, Field
 
+from barnabeenet.services.activity_store import DEFAULT_SLOT_BYTES, ActivityRing, ActivitySpill
+
 logger = logging.getLogger(__name__)
 
 
@@ -180,14 +183,28 @@ class ActivityLogger:
     Maintains recent activity buffer and conversation traces.
     """
 
-    def __init__(self, max_activities: int = 5000, max_traces: int = 100) -> None:
-        self._activities: list[Activity] = []
+    def __init__(
+        self,
+        max_activities: int = 5000,
+        max_traces: int = 100,
+        spill_path: Path | None = None,
+        spill_slot_bytes: int = DEFAULT_SLOT_BYTES,
+    ) -> None:
+        spill = None
+        if spill_path is not None:
+            try:
+                spill = ActivitySpill(spill_path, max(1, max_activities), spill_slot_bytes)
+            except Exception as e:
+                logger.warning(f"Activity spill unavailable ({spill_path}): {e}")
+        self._activities = ActivityRing(max_activities, spill=spill)
         self._traces: dict[str, ConversationTrace] = {}
         self._max_activities = max_activities
         self._max_traces = max_traces
         self._subscribers: list[Callable[[Activity], Any]] = []
         self._trace_subscribers: list[Callable[[ConversationTrace], Any]] = []
         self._lock = asyncio.Lock()
+        # Async subscriber calls still running (held so they aren't collected)
+        self._pending: set[asyncio.Task[Any]] = set()
 
     def subscribe(self, callback: Callable[[Activity], Any]) -> None:
         """Subscribe to activity updates."""
@@ -202,22 +219,34 @@ class ActivityLogger:
         """Subscribe to trace updates."""
         self._trace_subscribers.append(callback)
 
+    def _dispatch(self, callbacks: list[Callable[[Any], Any]], item: Any, kind: str) -> None:
+        """Hand an item to subscribers without waiting on any of them.
+
+        Sync callbacks run inline; coroutine callbacks are scheduled as tasks
+        so a slow consumer never holds up the component that logged.
+        """
+        for callback in list(callbacks):
+            try:
+                result = callback(item)
+            except Exception as e:
+                logger.error(f"{kind} subscriber error: {e}")
+                continue
+            if asyncio.iscoroutine(result):
+                task = asyncio.ensure_future(result)
+                self._pending.add(task)
+                task.add_done_callback(lambda t, kind=kind: self._subscriber_done(t, kind))
+
+    def _subscriber_done(self, task: asyncio.Task[Any], kind: str) -> None:
+        self._pending.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.error(f"{kind} subscriber error: {task.exception()}")
+
     async def log(self, activity: Activity) -> None:
         """Log an activity and broadcast to subscribers."""
-        async with self._lock:
-            self._activities.append(activity)
-            if len(self._activities) > self._max_activities:
-                self._activities = self._activities[-self._max_activities :]
+        self._activities.append(activity)
 
         # Broadcast to subscribers
-        for callback in self._subscribers:
-            try:
-                if asyncio.iscoroutinefunction(callback):
-                    await callback(activity)
-                else:
-                    callback(activity)
-            except Exception as e:
-                logger.error(f"Activity subscriber error: {e}")
+        self._dispatch(self._subscribers, activity, "Activity")
 
         # Also log to standard logger for debugging
         log_level = getattr(logging, activity.level.value.upper(), logging.INFO)
@@ -339,14 +368,7 @@ class ActivityLogger:
         )
 
         # Broadcast trace update
-        for callback in self._trace_subscribers:
-            try:
-                if asyncio.iscoroutinefunction(callback):
-                    await callback(trace)
-                else:
-                    callback(trace)
-            except Exception as e:
-                logger.error(f"Trace subscriber error: {e}")
+        self._dispatch(self._trace_subscribers, trace, "Trace")
 
         return step
 
@@ -402,18 +424,20 @@ class ActivityLogger:
         types: list[ActivityType] | None = None,
         level: ActivityLevel | None = None,
         source: str | None = None,
+        trace_id: str | None = None,
     ) -> list[Activity]:
-        """Get recent activities with optional filtering."""
-        activities = self._activities.copy()
+        """Get recent activities (most recent first) with optional filtering."""
+        return self._activities.recent(
+            limit=limit, types=types, level=level, source=source, trace_id=trace_id
+        )
 
-        if types:
-            activities = [a for a in activities if a.type in types]
-        if level:
-            activities = [a for a in activities if a.level == level]
-        if source:
-            activities = [a for a in activities if a.source == source]
+    def get_storage_stats(self) -> dict[str, Any]:
+        """Activity buffer size, index cardinality and spill details."""
+        return self._activities.get_stats()
 
-        return activities[-limit:][::-1]  # Most recent first
+    def close(self) -> None:
+        """Flush and close the activity spill file, if any."""
+        self._activities.close()
 
 
 # Global instance
@@ -428,6 +452,31 @@ def get_activity_logger() -> ActivityLogger:
     return _activity_logger
 
 
+def init_activity_logger(
+    max_activities: int = 5000,
+    spill_path: Path | None = None,
+    spill_slot_bytes: int = DEFAULT_SLOT_BYTES,
+) -> ActivityLogger:
+    """Create the global activity logger, restoring history from ``spill_path``.
+
+    Subscribers of a previously created logger are carried over.
+    """
+    global _activity_logger
+    new_logger = ActivityLogger(
+        max_activities=max_activities,
+        spill_path=spill_path,
+        spill_slot_bytes=spill_slot_bytes,
+    )
+    if _activity_logger is not None:
+        new_logger._subscribers.extend(_activity_logger._subscribers)
+        new_logger._trace_subscribers.extend(_activity_logger._trace_subscribers)
+        for activity in reversed(_activity_logger.get_recent_activities(limit=max_activities)):
+            new_logger._activities.append(activity)
+        _activity_logger.close()
+    _activity_logger = new_logger
+    return _activity_logger
+
+
 async def log_activity(
     type: ActivityType,
     source: str,
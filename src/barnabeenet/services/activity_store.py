@@ -0,0 +1,291 @@
+"""Fixed-capacity, indexed storage for the activity log.
+
+ActivityRing keeps the most recent activities in a preallocated ring of
+slots. Every activity gets an increasing sequence number; its slot is
+``seq % capacity``. Secondary indexes map each type, level, source and
+trace_id to a deque of sequence numbers (oldest first), so:
+
+- Appending never copies the buffer; evicting an entry pops its sequence
+  number off the front of each of its index deques.
+- Filtered reads walk the smallest matching index from the newest end and
+  stop after ``limit`` hits, instead of copying and scanning everything.
+
+ActivitySpill optionally mirrors the ring into a memory-mapped file with
+the same slot layout, so recent history survives a restart without Redis.
+"""
+
+from __future__ import annotations
+
+import heapq
+import logging
+import mmap
+import struct
+from collections import deque
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from barnabeenet.services.activity_log import Activity, ActivityLevel, ActivityType
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SLOT_BYTES = 4096
+
+# Fields with a secondary index
+INDEXED_FIELDS = ("type", "level", "source", "trace_id")
+
+
+def _index_keys(activity: Activity) -> Iterator[tuple[str, str]]:
+    yield "type", activity.type.value
+    yield "level", activity.level.value
+    yield "source", activity.source
+    if activity.trace_id:
+        yield "trace_id", activity.trace_id
+
+
+class ActivitySpill:
+    """Memory-mapped copy of the activity ring.
+
+    File layout: a header (magic, capacity, slot size, next sequence number)
+    followed by ``capacity`` fixed-size slots of (sequence number, length,
+    JSON). A file written with a different capacity or slot size is reset.
+    """
+
+    MAGIC = b"BNACTRG1"
+    HEADER = struct.Struct("<8sIIQ")  # magic, capacity, slot_bytes, next_seq
+    SLOT = struct.Struct("<QI")  # seq, payload length
+
+    def __init__(self, path: Path, capacity: int, slot_bytes: int = DEFAULT_SLOT_BYTES) -> None:
+        """Open (or create) the spill file.
+
+        Args:
+            path: File to map.
+            capacity: Number of slots; must match the ring's capacity.
+            slot_bytes: Bytes per slot. Larger activities are trimmed.
+        """
+        self.path = path
+        self.capacity = capacity
+        self.slot_bytes = max(slot_bytes, self.SLOT.size + 64)
+        self._max_payload = self.slot_bytes - self.SLOT.size
+        self._size = self.HEADER.size + capacity * self.slot_bytes
+        self._trimmed = 0
+        self._skipped = 0
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fresh = not path.exists() or path.stat().st_size != self._size
+        self._file = open(path, "w+b" if fresh else "r+b")  # noqa: SIM115
+        if fresh:
+            self._file.truncate(self._size)
+        self._map = mmap.mmap(self._file.fileno(), self._size)
+
+        magic, stored_capacity, stored_slot, next_seq = self.HEADER.unpack_from(self._map, 0)
+        if (magic, stored_capacity, stored_slot) != (self.MAGIC, capacity, self.slot_bytes):
+            if not fresh:
+                logger.info("Activity spill %s has a different layout; starting empty", path)
+            self._map[:] = bytes(self._size)
+            next_seq = 0
+            self._write_header(0)
+        self.next_seq: int = next_seq
+
+    def _write_header(self, next_seq: int) -> None:
+        self.HEADER.pack_into(self._map, 0, self.MAGIC, self.capacity, self.slot_bytes, next_seq)
+
+    def _offset(self, seq: int) -> int:
+        return self.HEADER.size + (seq % self.capacity) * self.slot_bytes
+
+    def _encode(self, activity: Activity) -> bytes | None:
+        payload = activity.model_dump_json().encode()
+        if len(payload) <= self._max_payload:
+            return payload
+        # Keep the entry readable on the dashboard: drop structured data,
+        # then shorten the detail text
+        self._trimmed += 1
+        trimmed = activity.model_copy(update={"data": {}})
+        payload = trimmed.model_dump_json().encode()
+        if len(payload) > self._max_payload and trimmed.detail:
+            excess = len(payload) - self._max_payload
+            detail = trimmed.detail.encode()[: max(0, len(trimmed.detail.encode()) - excess - 3)]
+            trimmed.detail = detail.decode(errors="ignore") + "..."
+            payload = trimmed.model_dump_json().encode()
+        return payload if len(payload) <= self._max_payload else None
+
+    def write(self, seq: int, activity: Activity) -> None:
+        """Store an activity in its slot and advance the header."""
+        payload = self._encode(activity)
+        offset = self._offset(seq)
+        if payload is None:
+            self._skipped += 1
+            payload = b""
+        self.SLOT.pack_into(self._map, offset, seq, len(payload))
+        start = offset + self.SLOT.size
+        self._map[start : start + len(payload)] = payload
+        self.next_seq = seq + 1
+        self._write_header(self.next_seq)
+
+    def load(self) -> list[tuple[int, Activity]]:
+        """Read back the stored activities, oldest first."""
+        from barnabeenet.services.activity_log import Activity
+
+        entries: list[tuple[int, Activity]] = []
+        for seq in range(max(0, self.next_seq - self.capacity), self.next_seq):
+            offset = self._offset(seq)
+            stored_seq, length = self.SLOT.unpack_from(self._map, offset)
+            if stored_seq != seq or not 0 < length <= self._max_payload:
+                continue
+            start = offset + self.SLOT.size
+            try:
+                entries.append((seq, Activity.model_validate_json(self._map[start : start + length])))
+            except Exception as e:
+                logger.debug("Skipping unreadable activity spill slot %d: %s", seq, e)
+        return entries
+
+    def flush(self) -> None:
+        """Ask the OS to write dirty pages to disk."""
+        self._map.flush()
+
+    def close(self) -> None:
+        """Flush and unmap the file."""
+        if self._map.closed:
+            return
+        self._map.flush()
+        self._map.close()
+        self._file.close()
+
+    def get_stats(self) -> dict[str, int | str]:
+        """File path, slot size and trimming counters."""
+        return {
+            "path": str(self.path),
+            "slot_bytes": self.slot_bytes,
+            "trimmed": self._trimmed,
+            "skipped": self._skipped,
+        }
+
+
+class ActivityRing:
+    """Fixed-capacity activity buffer with secondary indexes."""
+
+    def __init__(self, capacity: int, spill: ActivitySpill | None = None) -> None:
+        """Initialize the ring, restoring from ``spill`` if given.
+
+        Args:
+            capacity: Most activities kept; the oldest is evicted beyond it.
+            spill: Optional memory-mapped copy written on every append.
+        """
+        self._capacity = max(1, capacity)
+        self._slots: list[Activity | None] = [None] * self._capacity
+        self._next_seq = 0
+        self._indexes: dict[str, dict[str, deque[int]]] = {f: {} for f in INDEXED_FIELDS}
+        self._spill = spill
+
+        if spill is not None:
+            for seq, activity in spill.load():
+                self._store(seq, activity)
+            self._next_seq = spill.next_seq
+
+    @property
+    def capacity(self) -> int:
+        """Maximum number of activities kept."""
+        return self._capacity
+
+    def __len__(self) -> int:
+        return min(self._next_seq, self._capacity)
+
+    def append(self, activity: Activity) -> None:
+        """Add an activity, evicting the oldest once full."""
+        seq = self._next_seq
+        self._next_seq += 1
+        self._store(seq, activity)
+        if self._spill is not None:
+            try:
+                self._spill.write(seq, activity)
+            except Exception as e:
+                logger.warning("Activity spill write failed: %s", e)
+
+    def _store(self, seq: int, activity: Activity) -> None:
+        slot = seq % self._capacity
+        evicted = self._slots[slot]
+        if evicted is not None:
+            self._unindex(evicted, seq - self._capacity)
+        self._slots[slot] = activity
+        for field, key in _index_keys(activity):
+            self._indexes[field].setdefault(key, deque()).append(seq)
+
+    def _unindex(self, activity: Activity, seq: int) -> None:
+        for field, key in _index_keys(activity):
+            index = self._indexes[field]
+            seqs = index.get(key)
+            # Evictions are oldest-first, so the evicted seq is at the front
+            if seqs and seqs[0] == seq:
+                seqs.popleft()
+                if not seqs:
+                    del index[key]
+
+    def recent(
+        self,
+        limit: int = 100,
+        types: list[ActivityType] | None = None,
+        level: ActivityLevel | None = None,
+        source: str | None = None,
+        trace_id: str | None = None,
+    ) -> list[Activity]:
+        """Most recent activities first, matching every given filter."""
+        candidates: list[tuple[int, Iterable[int]]] = []
+        if types:
+            type_seqs = [self._indexes["type"].get(t.value) for t in types]
+            present = [s for s in type_seqs if s]
+            candidates.append(
+                (
+                    sum(len(s) for s in present),
+                    heapq.merge(*(reversed(s) for s in present), reverse=True),
+                )
+            )
+        for field, key in (
+            ("level", level.value if level else None),
+            ("source", source),
+            ("trace_id", trace_id),
+        ):
+            if key:
+                seqs = self._indexes[field].get(key) or deque()
+                candidates.append((len(seqs), reversed(seqs)))
+
+        if candidates:
+            # Walk the most selective index; check the other filters per entry
+            size, seqs = min(candidates, key=lambda c: c[0])
+            if size == 0:
+                return []
+        else:
+            seqs = range(self._next_seq - 1, self._next_seq - 1 - len(self), -1)
+
+        type_values = {t.value for t in types} if types else None
+        results: list[Activity] = []
+        for seq in seqs:
+            activity = self._slots[seq % self._capacity]
+            if activity is None:
+                continue
+            if type_values is not None and activity.type.value not in type_values:
+                continue
+            if level and activity.level != level:
+                continue
+            if source and activity.source != source:
+                continue
+            if trace_id and activity.trace_id != trace_id:
+                continue
+            results.append(activity)
+            if len(results) >= limit:
+                break
+        return results
+
+    def close(self) -> None:
+        """Flush and close the spill file, if any."""
+        if self._spill is not None:
+            self._spill.close()
+
+    def get_stats(self) -> dict[str, object]:
+        """Size, capacity, index cardinality and spill details."""
+        return {
+            "size": len(self),
+            "capacity": self._capacity,
+            "indexed_keys": {f: len(i) for f, i in self._indexes.items()},
+            "spill": self._spill.get_stats() if self._spill is not None else None,
+        }
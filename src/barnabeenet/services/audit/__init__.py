@@ -1,5 +1,5 @@
 """Audit logging services for BarnabeeNet."""
 
-from barnabeenet.services.audit.log import AuditLog, AuditLogEntry
+from barnabeenet.services.audit.log import AuditLog, AuditLogEntry, AuditSearchPage
 
-__all__ = ["AuditLog", "AuditLogEntry"]
+__all__ = ["AuditLog", "AuditLogEntry", "AuditSearchPage"]
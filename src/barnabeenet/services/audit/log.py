@@ -11,14 +11,24 @@ Key features:
 - Indexes for efficient searching by speaker, room, date, and content
 - Alerts are flagged for quick identification of concerning conversations
 
+Search intersects the filter index sets with the chronological sorted set
+inside Redis (ZINTERSTORE), reads one page in time order, and loads the
+page with a single MGET. Text queries use an inverted token index: one set
+of entry IDs per word in the user text and assistant response, and every
+query word must match. A query with no indexable words (a single letter,
+punctuation) falls back to a substring match. Results are paged with an
+opaque cursor.
+
 The audit log is separate from regular memory storage - it's a complete
 record even if a user says "forget this conversation".
 """
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
+import re
 import uuid
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
@@ -33,6 +43,26 @@ logger = logging.getLogger(__name__)
 AUDIT_LOG_PREFIX = "barnabeenet:audit:log:"
 AUDIT_INDEX_PREFIX = "barnabeenet:audit:index:"
 AUDIT_ALERTS_KEY = "barnabeenet:audit:alerts"
+AUDIT_CHRONOLOGICAL_KEY = f"{AUDIT_INDEX_PREFIX}chronological"
+AUDIT_TOKEN_PREFIX = f"{AUDIT_INDEX_PREFIX}token:"
+AUDIT_TEXT_INDEX_READY_KEY = f"{AUDIT_INDEX_PREFIX}text:ready"
+
+# Most IDs read from an index (and loaded with one MGET) per round trip
+SEARCH_BATCH_SIZE = 200
+
+# Lifetime of a search's intersected sorted set (deleted when the search ends)
+SEARCH_TEMP_TTL_SECONDS = 30
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+(?:'[a-z]+)?")
+
+
+def _tokenize(text: str) -> set[str]:
+    """Split text into lowercase words for the token index."""
+    return {token for token in _TOKEN_PATTERN.findall(text.lower()) if len(token) > 1}
+
+
+def _decode(value: str | bytes) -> str:
+    return value.decode() if isinstance(value, bytes) else value
 
 
 @dataclass
@@ -75,7 +105,7 @@ class AuditLogEntry:
         }
 
     @classmethod
-    def from_dict(cls, data: dict[str, Any]) -> "AuditLogEntry":
+    def from_dict(cls, data: dict[str, Any]) -> AuditLogEntry:
         """Create from dict (for Redis deserialization)."""
         timestamp = data.get("timestamp")
         if isinstance(timestamp, str):
@@ -104,6 +134,14 @@ class AuditLogEntry:
         )
 
 
+@dataclass
+class AuditSearchPage:
+    """One page of audit log search results."""
+
+    entries: list[AuditLogEntry]
+    next_cursor: str | None = None  # Pass back to search_page() for the next page
+
+
 class AuditLog:
     """Immutable append-only audit log for all conversations.
 
@@ -123,17 +161,25 @@ class AuditLog:
 
         # Super user search (sees everything)
         results = await audit_log.search("dinner", include_deleted=True)
+
+        # Combined filters, one page at a time
+        page = await audit_log.search_page("dinner", speaker="emma", room="kitchen", limit=20)
+        page = await audit_log.search_page(
+            "dinner", speaker="emma", room="kitchen", limit=20, cursor=page.next_cursor
+        )
     """
 
-    def __init__(self, redis_client: "redis.Redis | None" = None) -> None:
+    def __init__(self, redis_client: redis.Redis | None = None) -> None:
         """Initialize the audit log.
 
         Args:
             redis_client: Redis client for storage. If None, attempts to get from app_state.
         """
         self._redis_client = redis_client
+        self._text_index_ready = False
+        self._text_index_lock = asyncio.Lock()
 
-    async def _get_redis(self) -> "redis.Redis | None":
+    async def _get_redis(self) -> redis.Redis | None:
         """Get Redis client, initializing from app_state if needed."""
         if self._redis_client is not None:
             return self._redis_client
@@ -165,51 +211,20 @@ class AuditLog:
             return False
 
         try:
-            # Store the entry
-            entry_key = f"{AUDIT_LOG_PREFIX}{entry.entry_id}"
-            entry_data = json.dumps(entry.to_dict())
-            await redis_client.set(entry_key, entry_data)
-
-            # Add to chronological index (sorted set by timestamp)
             timestamp_score = entry.timestamp.timestamp()
-            await redis_client.zadd(
-                f"{AUDIT_INDEX_PREFIX}chronological",
-                {entry.entry_id: timestamp_score}
-            )
-
-            # Add to speaker index if known
-            if entry.speaker:
-                await redis_client.sadd(
-                    f"{AUDIT_INDEX_PREFIX}speaker:{entry.speaker.lower()}",
-                    entry.entry_id
-                )
-
-            # Add to room index
-            await redis_client.sadd(
-                f"{AUDIT_INDEX_PREFIX}room:{entry.room.lower()}",
-                entry.entry_id
-            )
-
-            # Add to conversation index
-            if entry.conversation_id:
-                await redis_client.sadd(
-                    f"{AUDIT_INDEX_PREFIX}conversation:{entry.conversation_id}",
-                    entry.entry_id
-                )
+
+            # Entry and all of its indexes are written in one transaction
+            pipe = redis_client.pipeline()
+            pipe.set(f"{AUDIT_LOG_PREFIX}{entry.entry_id}", json.dumps(entry.to_dict()))
+            pipe.zadd(AUDIT_CHRONOLOGICAL_KEY, {entry.entry_id: timestamp_score})
+            for index_key in self._index_keys(entry):
+                pipe.sadd(index_key, entry.entry_id)
 
             # Add to alerts set if triggered
             if entry.triggered_alert:
-                await redis_client.zadd(
-                    AUDIT_ALERTS_KEY,
-                    {entry.entry_id: timestamp_score}
-                )
+                pipe.zadd(AUDIT_ALERTS_KEY, {entry.entry_id: timestamp_score})
 
-            # Index by date for daily browsing
-            date_str = entry.timestamp.strftime("%Y-%m-%d")
-            await redis_client.sadd(
-                f"{AUDIT_INDEX_PREFIX}date:{date_str}",
-                entry.entry_id
-            )
+            await pipe.execute()
 
             logger.debug(f"Logged audit entry: {entry.entry_id}")
             return True
@@ -218,6 +233,70 @@ class AuditLog:
             logger.error(f"Failed to log audit entry: {e}")
             return False
 
+    @staticmethod
+    def _index_keys(entry: AuditLogEntry) -> list[str]:
+        """Index sets an entry belongs to (speaker, room, conversation, date, words)."""
+        keys = [
+            f"{AUDIT_INDEX_PREFIX}room:{entry.room.lower()}",
+            # Index by date for daily browsing
+            f"{AUDIT_INDEX_PREFIX}date:{entry.timestamp.strftime('%Y-%m-%d')}",
+        ]
+        if entry.speaker:
+            keys.append(f"{AUDIT_INDEX_PREFIX}speaker:{entry.speaker.lower()}")
+        if entry.conversation_id:
+            keys.append(f"{AUDIT_INDEX_PREFIX}conversation:{entry.conversation_id}")
+        tokens = _tokenize(entry.user_text) | _tokenize(entry.assistant_response)
+        keys.extend(f"{AUDIT_TOKEN_PREFIX}{token}" for token in sorted(tokens))
+        return keys
+
+    async def _ensure_text_index(self, redis_client: redis.Redis) -> None:
+        """Token-index entries logged before the token index existed (once)."""
+        if self._text_index_ready:
+            return
+        async with self._text_index_lock:
+            if self._text_index_ready:
+                return
+            if not await redis_client.exists(AUDIT_TEXT_INDEX_READY_KEY):
+                indexed = 0
+                start = 0
+                while True:
+                    ids = await redis_client.zrange(
+                        AUDIT_CHRONOLOGICAL_KEY, start, start + SEARCH_BATCH_SIZE - 1
+                    )
+                    if not ids:
+                        break
+                    start += len(ids)
+                    pipe = redis_client.pipeline(transaction=False)
+                    for entry in await self._load_entries(redis_client, [_decode(i) for i in ids]):
+                        if entry is None:
+                            continue
+                        tokens = _tokenize(entry.user_text) | _tokenize(entry.assistant_response)
+                        for token in tokens:
+                            pipe.sadd(f"{AUDIT_TOKEN_PREFIX}{token}", entry.entry_id)
+                        indexed += 1
+                    await pipe.execute()
+                await redis_client.set(AUDIT_TEXT_INDEX_READY_KEY, "1")
+                logger.info(f"Built audit text index for {indexed} entries")
+            self._text_index_ready = True
+
+    async def _load_entries(
+        self, redis_client: redis.Redis, entry_ids: list[str]
+    ) -> list[AuditLogEntry | None]:
+        """Load entries with one MGET, in the order given (None if missing)."""
+        if not entry_ids:
+            return []
+        raw = await redis_client.mget([f"{AUDIT_LOG_PREFIX}{entry_id}" for entry_id in entry_ids])
+        entries: list[AuditLogEntry | None] = []
+        for entry_id, entry_data in zip(entry_ids, raw, strict=True):
+            entry = None
+            if entry_data:
+                try:
+                    entry = AuditLogEntry.from_dict(json.loads(entry_data))
+                except (ValueError, TypeError) as e:
+                    logger.warning(f"Skipping unreadable audit entry {entry_id}: {e}")
+            entries.append(entry)
+        return entries
+
     async def mark_as_deleted(self, entry_id: str) -> bool:
         """Mark an entry as deleted (but don't actually delete it).
 
@@ -289,90 +368,172 @@ class AuditLog:
         conversation_id: str | None = None,
         include_deleted: bool = False,
         limit: int = 100,
+        since: datetime | None = None,
+        until: datetime | None = None,
     ) -> list[AuditLogEntry]:
         """Search the audit log.
 
         Args:
-            query: Text to search for in user_text/assistant_response
+            query: Words that must all appear in user_text/assistant_response
             speaker: Filter by speaker
             room: Filter by room
             date: Filter by date (YYYY-MM-DD format)
             conversation_id: Filter by conversation
             include_deleted: If True, include "deleted" entries (super user mode)
             limit: Maximum number of results
+            since: Only entries at or after this time
+            until: Only entries at or before this time
 
         Returns:
             List of matching audit log entries, newest first
         """
-        redis_client = await self._get_redis()
-        if not redis_client:
-            return []
-
-        try:
-            # Get candidate entry IDs based on filters
-            entry_ids: set[str] = set()
-
-            if speaker:
-                ids = await redis_client.smembers(
-                    f"{AUDIT_INDEX_PREFIX}speaker:{speaker.lower()}"
-                )
-                entry_ids = {id.decode() if isinstance(id, bytes) else id for id in ids}
-            elif room:
-                ids = await redis_client.smembers(
-                    f"{AUDIT_INDEX_PREFIX}room:{room.lower()}"
-                )
-                entry_ids = {id.decode() if isinstance(id, bytes) else id for id in ids}
-            elif date:
-                ids = await redis_client.smembers(
-                    f"{AUDIT_INDEX_PREFIX}date:{date}"
-                )
-                entry_ids = {id.decode() if isinstance(id, bytes) else id for id in ids}
-            elif conversation_id:
-                ids = await redis_client.smembers(
-                    f"{AUDIT_INDEX_PREFIX}conversation:{conversation_id}"
-                )
-                entry_ids = {id.decode() if isinstance(id, bytes) else id for id in ids}
-            else:
-                # Get recent entries from chronological index
-                ids = await redis_client.zrevrange(
-                    f"{AUDIT_INDEX_PREFIX}chronological",
-                    0,
-                    limit * 2  # Get more to account for filtering
-                )
-                entry_ids = {id.decode() if isinstance(id, bytes) else id for id in ids}
-
-            # Load entries and filter
-            results: list[AuditLogEntry] = []
-            for entry_id in entry_ids:
-                entry = await self.get_entry(entry_id)
-                if not entry:
-                    continue
+        page = await self.search_page(
+            query=query,
+            speaker=speaker,
+            room=room,
+            date=date,
+            conversation_id=conversation_id,
+            include_deleted=include_deleted,
+            limit=limit,
+            since=since,
+            until=until,
+        )
+        return page.entries
 
-                # Skip deleted entries unless super user mode
-                if entry.was_deleted and not include_deleted:
-                    continue
+    async def search_page(
+        self,
+        query: str | None = None,
+        speaker: str | None = None,
+        room: str | None = None,
+        date: str | None = None,
+        conversation_id: str | None = None,
+        include_deleted: bool = False,
+        limit: int = 100,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        cursor: str | None = None,
+    ) -> AuditSearchPage:
+        """Search the audit log one page at a time.
 
-                # Text search filter
-                if query:
-                    query_lower = query.lower()
-                    if (
-                        query_lower not in entry.user_text.lower()
-                        and query_lower not in entry.assistant_response.lower()
-                    ):
-                        continue
+        All filters are combined (AND). Takes the same arguments as
+        ``search()``, plus the cursor returned with the previous page.
 
-                results.append(entry)
+        Returns:
+            Up to ``limit`` entries, newest first, and the cursor for the
+            next page (None once there are no more results)
+        """
+        redis_client = await self._get_redis()
+        if not redis_client or limit <= 0:
+            return AuditSearchPage(entries=[])
 
-                if len(results) >= limit:
-                    break
+        try:
+            filter_keys: list[str] = []
+            if speaker:
+                filter_keys.append(f"{AUDIT_INDEX_PREFIX}speaker:{speaker.lower()}")
+            if room:
+                filter_keys.append(f"{AUDIT_INDEX_PREFIX}room:{room.lower()}")
+            if date:
+                filter_keys.append(f"{AUDIT_INDEX_PREFIX}date:{date}")
+            if conversation_id:
+                filter_keys.append(f"{AUDIT_INDEX_PREFIX}conversation:{conversation_id}")
+            # Queries with no indexable words are matched as substrings
+            substring: str | None = None
+            if query:
+                tokens = _tokenize(query)
+                if tokens:
+                    await self._ensure_text_index(redis_client)
+                    filter_keys.extend(f"{AUDIT_TOKEN_PREFIX}{token}" for token in sorted(tokens))
+                else:
+                    substring = query.lower()
+
+            # Cursor: the last score read and how many IDs with that score were read
+            max_score: float = until.timestamp() if until else float("inf")
+            min_score: float = since.timestamp() if since else float("-inf")
+            seen_at_max = 0
+            if cursor:
+                score, _, seen = cursor.partition(":")
+                max_score, seen_at_max = float(score), int(seen)
 
-            # Sort by timestamp descending
-            results.sort(key=lambda e: e.timestamp, reverse=True)
-            return results[:limit]
+            results: list[AuditLogEntry] = []
+            exhausted = False
+            source_key = AUDIT_CHRONOLOGICAL_KEY
+            if filter_keys:
+                source_key = await self._intersect(redis_client, filter_keys)
+            try:
+                while len(results) < limit:
+                    count = min(SEARCH_BATCH_SIZE, limit - len(results))
+                    batch = await self._read_index(
+                        redis_client, source_key, max_score, min_score, seen_at_max, count
+                    )
+                    entries = await self._load_entries(redis_client, [i for i, _ in batch])
+
+                    for (_, score), entry in zip(batch, entries, strict=True):
+                        if score == max_score:
+                            seen_at_max += 1
+                        else:
+                            max_score, seen_at_max = score, 1
+
+                        if entry is None:
+                            continue
+                        # Skip deleted entries unless super user mode
+                        if entry.was_deleted and not include_deleted:
+                            continue
+                        if (
+                            substring is not None
+                            and substring not in entry.user_text.lower()
+                            and substring not in entry.assistant_response.lower()
+                        ):
+                            continue
+                        results.append(entry)
+
+                    if len(batch) < count:
+                        exhausted = True
+                        break
+            finally:
+                if source_key != AUDIT_CHRONOLOGICAL_KEY:
+                    await redis_client.delete(source_key)
+
+            next_cursor = None if exhausted else f"{max_score!r}:{seen_at_max}"
+            return AuditSearchPage(entries=results, next_cursor=next_cursor)
 
         except Exception as e:
             logger.error(f"Failed to search audit log: {e}")
-            return []
+            return AuditSearchPage(entries=[])
+
+    async def _intersect(self, redis_client: redis.Redis, filter_keys: list[str]) -> str:
+        """Intersect the filters with the timeline once per search.
+
+        Returns a temporary sorted set keyed by timestamp. It expires on its
+        own if the search dies before deleting it.
+        """
+        # Weight 0 keeps the chronological score
+        temp_key = f"{AUDIT_INDEX_PREFIX}search:{uuid.uuid4().hex}"
+        weights = {AUDIT_CHRONOLOGICAL_KEY: 1, **dict.fromkeys(filter_keys, 0)}
+        pipe = redis_client.pipeline()
+        pipe.zinterstore(temp_key, weights, aggregate="SUM")
+        pipe.expire(temp_key, SEARCH_TEMP_TTL_SECONDS)
+        await pipe.execute()
+        return temp_key
+
+    async def _read_index(
+        self,
+        redis_client: redis.Redis,
+        source_key: str,
+        max_score: float,
+        min_score: float,
+        offset: int,
+        count: int,
+    ) -> list[tuple[str, float]]:
+        """Read (entry_id, timestamp) pairs from a sorted set, newest first."""
+        rows = await redis_client.zrevrangebyscore(
+            source_key,
+            max_score,
+            min_score,
+            start=offset,
+            num=count,
+            withscores=True,
+        )
+        return [(_decode(entry_id), float(score)) for entry_id, score in rows]
 
     async def get_alerts(
         self,
@@ -395,17 +556,13 @@ class AuditLog:
         try:
             # Get alert entry IDs, newest first
             entry_ids = await redis_client.zrevrange(AUDIT_ALERTS_KEY, 0, limit - 1)
+            entries = await self._load_entries(redis_client, [_decode(i) for i in entry_ids])
 
-            results: list[AuditLogEntry] = []
-            for entry_id in entry_ids:
-                if isinstance(entry_id, bytes):
-                    entry_id = entry_id.decode()
-                entry = await self.get_entry(entry_id)
-                if entry:
-                    if entry.was_deleted and not include_deleted:
-                        continue
-                    results.append(entry)
-
+            results = [
+                entry
+                for entry in entries
+                if entry and (include_deleted or not entry.was_deleted)
+            ]
             return results
 
         except Exception as e:
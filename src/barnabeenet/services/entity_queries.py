@@ -24,8 +24,11 @@ from datetime import datetime
 from enum import Enum
 from typing import TYPE_CHECKING, Any
 
+from barnabeenet.services.homeassistant.state_mirror import NUMERIC_BATTERY
+
 if TYPE_CHECKING:
     from barnabeenet.services.homeassistant.client import HomeAssistantClient
+    from barnabeenet.services.homeassistant.state_mirror import StateMirror
     from barnabeenet.services.homeassistant.topology import HATopologyService
 
 logger = logging.getLogger(__name__)
@@ -589,36 +592,27 @@ async def _execute_domain_list_query(
     if not domains:
         return "I'm not sure which type of device you're asking about."
 
-    # Get entities matching the domains
-    entities = []
-    for domain in domains:
-        entities.extend(ha_client._entity_registry.get_by_domain(domain))
-
-    # Filter by floor if specified
-    if query.floor and topology_service:
-        area_ids = topology_service.resolve_floor(query.floor)
-        if area_ids:
-            entities = [e for e in entities if e.area_id in area_ids]
-
-    # Filter by area if specified
-    if query.area:
-        area = ha_client.find_area_by_name(query.area)
-        if area:
-            entities = [e for e in entities if e.area_id == area.id]
+    # Entities matching the domains and location (index intersection)
+    mirror = await ha_client.fresh_state_mirror()
+    entity_ids = _select_entities(mirror, domains, query, ha_client, topology_service)
 
-    if not entities:
+    if not entity_ids:
         location_str = _format_location(query.area, query.floor)
         domain_str = _format_domain_plural(domains[0]) if domains else "devices"
         return f"I couldn't find any {domain_str}{location_str}."
 
-    # Get current states and filter
+    # Narrow to the requested states
     matching_entities = []
-    for entity in entities:
-        state = await ha_client.get_state(entity.entity_id)
-        if state and query.state_filter:
-            expected_states = STATE_MAPPING.get(query.state_filter, [query.state_filter])
-            if state.state.lower() in expected_states:
-                matching_entities.append((entity, state))
+    if query.state_filter:
+        expected_states = STATE_MAPPING.get(query.state_filter, [query.state_filter])
+        matching_ids = entity_ids & _select_entities(
+            mirror, domains, query, ha_client, topology_service, expected_states
+        )
+        matching_entities = [
+            (_friendly_name(ha_client, mirror, entity_id), mirror.get(entity_id))
+            for entity_id in matching_ids
+        ]
+        matching_entities.sort(key=lambda item: item[0])
 
     location_str = _format_location(query.area, query.floor)
     domain_str = _format_domain_plural(domains[0]) if domains else "devices"
@@ -631,10 +625,10 @@ async def _execute_domain_list_query(
     # Format response
     count = len(matching_entities)
     if count == 1:
-        entity, state = matching_entities[0]
-        return f"Yes, {entity.friendly_name} is {state.state}{location_str}."
+        name, state = matching_entities[0]
+        return f"Yes, {name} is {state.state}{location_str}."
 
-    names = [e.friendly_name for e, _ in matching_entities[:5]]
+    names = [name for name, _ in matching_entities[:5]]
     names_str = ", ".join(names)
     if count > 5:
         names_str += f" and {count - 5} more"
@@ -662,42 +656,27 @@ async def _execute_count_query(
     if not domains:
         return "I'm not sure which type of device you're asking about."
 
-    # Get entities matching the domains
-    entities = []
-    for domain in domains:
-        entities.extend(ha_client._entity_registry.get_by_domain(domain))
-
-    # Filter by floor if specified
-    if query.floor and topology_service:
-        area_ids = topology_service.resolve_floor(query.floor)
-        if area_ids:
-            entities = [e for e in entities if e.area_id in area_ids]
-
-    # Filter by area if specified
-    if query.area:
-        area = ha_client.find_area_by_name(query.area)
-        if area:
-            entities = [e for e in entities if e.area_id == area.id]
+    # Entities matching the domains and location (index intersection)
+    mirror = await ha_client.fresh_state_mirror()
+    entity_ids = _select_entities(mirror, domains, query, ha_client, topology_service)
 
     location_str = _format_location(query.area, query.floor)
     domain_str = _format_domain_plural(domains[0]) if domains else "devices"
 
-    if not entities:
+    if not entity_ids:
         return f"You don't have any {domain_str}{location_str}."
 
     # If no state filter, just count total
     if not query.state_filter:
-        count = len(entities)
+        count = len(entity_ids)
         return f"You have {count} {domain_str}{location_str}."
 
-    # Get current states and filter
-    matching_count = 0
-    for entity in entities:
-        state = await ha_client.get_state(entity.entity_id)
-        if state and query.state_filter:
-            expected_states = STATE_MAPPING.get(query.state_filter, [query.state_filter])
-            if state.state.lower() in expected_states:
-                matching_count += 1
+    # Narrow to the requested states
+    expected_states = STATE_MAPPING.get(query.state_filter, [query.state_filter])
+    matching_count = len(
+        entity_ids
+        & _select_entities(mirror, domains, query, ha_client, topology_service, expected_states)
+    )
 
     if matching_count == 0:
         return f"No {domain_str} are {query.state_filter}{location_str}."
@@ -719,43 +698,22 @@ async def _execute_attribute_query(query: EntityQuery, ha_client: HomeAssistantC
 
 async def _get_low_battery_devices(ha_client: HomeAssistantClient, threshold: int = 20) -> str:
     """Get devices with low battery."""
-    low_battery = []
-
-    # Check all sensor entities for battery level
-    sensors = ha_client._entity_registry.get_by_domain("sensor")
-    for entity in sensors:
-        # Look for battery sensors (device_class: battery or entity_id contains battery)
-        if entity.device_class == "battery" or "battery" in entity.entity_id.lower():
-            state = await ha_client.get_state(entity.entity_id)
-            if state:
-                try:
-                    level = float(state.state)
-                    if level < threshold:
-                        low_battery.append((entity.friendly_name, int(level)))
-                except (ValueError, TypeError):
-                    pass
-
-    # Also check attributes of other entities for battery_level
-    for entity in ha_client._entity_registry.all():
-        if entity.state and entity.state.attributes:
-            battery_level = entity.state.attributes.get("battery_level")
-            if battery_level is not None:
-                try:
-                    level = float(battery_level)
-                    if level < threshold:
-                        # Avoid duplicates
-                        name = entity.friendly_name
-                        if not any(n == name for n, _ in low_battery):
-                            low_battery.append((name, int(level)))
-                except (ValueError, TypeError):
-                    pass
+    low_battery: list[tuple[str, int]] = []
+    seen_names: set[str] = set()
+
+    # Battery sensor states and battery_level attributes share one sorted
+    # index, so this is a range scan returning lowest levels first
+    mirror = await ha_client.fresh_state_mirror()
+    for entity_id, level in mirror.numeric(NUMERIC_BATTERY).below(threshold):
+        # Avoid duplicates
+        name = _friendly_name(ha_client, mirror, entity_id)
+        if name not in seen_names:
+            seen_names.add(name)
+            low_battery.append((name, int(level)))
 
     if not low_battery:
         return "All your devices have good battery levels."
 
-    # Sort by battery level (lowest first)
-    low_battery.sort(key=lambda x: x[1])
-
     if len(low_battery) == 1:
         name, level = low_battery[0]
         return f"1 device has low battery: {name} ({level}%)."
@@ -772,8 +730,10 @@ async def _get_unavailable_devices(ha_client: HomeAssistantClient) -> str:
     """Get unavailable devices."""
     unavailable = []
 
-    for entity in ha_client._entity_registry.all():
-        state = await ha_client.get_state(entity.entity_id)
+    entities = list(ha_client._entity_registry.all())
+    states = await ha_client.get_states(e.entity_id for e in entities)
+    for entity in entities:
+        state = states.get(entity.entity_id)
         if state and state.is_unavailable:
             unavailable.append(entity.friendly_name)
 
@@ -790,6 +750,45 @@ async def _get_unavailable_devices(ha_client: HomeAssistantClient) -> str:
     return f"{len(unavailable)} devices are unavailable: {details_str}."
 
 
+def _select_entities(
+    mirror: StateMirror,
+    domains: list[str],
+    query: EntityQuery,
+    ha_client: HomeAssistantClient,
+    topology_service: HATopologyService | None = None,
+    states: list[str] | None = None,
+) -> set[str]:
+    """Entity IDs in the given domains (and states) at the query's location."""
+    entity_ids: set[str] = set()
+    for domain in domains:
+        entity_ids |= mirror.with_state(domain, *states) if states else mirror.in_domain(domain)
+
+    # Filter by floor if specified
+    if query.floor and topology_service:
+        area_ids = topology_service.resolve_floor(query.floor)
+        if area_ids:
+            entity_ids &= mirror.in_areas(area_ids)
+
+    # Filter by area if specified
+    if query.area:
+        area = ha_client.find_area_by_name(query.area)
+        if area:
+            entity_ids &= mirror.in_area(area.id)
+
+    return entity_ids
+
+
+def _friendly_name(ha_client: HomeAssistantClient, mirror: StateMirror, entity_id: str) -> str:
+    """Friendly name from the registry, falling back to the mirrored state."""
+    entity = ha_client._entity_registry.get(entity_id)
+    if entity:
+        return entity.friendly_name
+    state = mirror.get(entity_id)
+    if state:
+        return state.attributes.get("friendly_name", entity_id)
+    return entity_id
+
+
 def _format_location(area: str | None, floor: str | None) -> str:
     """Format location string for responses."""
     if floor:
@@ -857,26 +856,19 @@ async def _execute_sensor_value_query(
     }
     device_class = type_to_device_class.get(sensor_type, sensor_type)
 
-    # Find matching sensors
-    sensors = ha_client._entity_registry.get_by_domain("sensor")
+    # Find matching sensors (device_class ∩ sensor domain ∩ location)
+    mirror = await ha_client.fresh_state_mirror()
+    entity_ids = mirror.with_device_class(device_class) & _select_entities(
+        mirror, ["sensor"], query, ha_client, topology_service
+    )
     matching = []
 
-    for entity in sensors:
-        if entity.device_class == device_class:
-            # Filter by area if specified
-            if query.area:
-                area = ha_client.find_area_by_name(query.area)
-                if area and entity.area_id != area.id:
-                    continue
-            if query.floor and topology_service:
-                area_ids = topology_service.resolve_floor(query.floor)
-                if area_ids and entity.area_id not in area_ids:
-                    continue
-
-            state = await ha_client.get_state(entity.entity_id)
-            if state and state.state not in ("unknown", "unavailable"):
-                unit = state.attributes.get("unit_of_measurement", "")
-                matching.append((entity.friendly_name, state.state, unit))
+    for entity_id in entity_ids:
+        state = mirror.get(entity_id)
+        if state and state.state not in ("unknown", "unavailable"):
+            unit = state.attributes.get("unit_of_measurement", "")
+            matching.append((_friendly_name(ha_client, mirror, entity_id), state.state, unit))
+    matching.sort()
 
     if not matching:
         location_str = _format_location(query.area, query.floor)
@@ -974,15 +966,15 @@ async def _execute_security_query(query: EntityQuery, ha_client: HomeAssistantCl
 
 async def _check_locks(ha_client: HomeAssistantClient) -> str:
     """Check status of all locks."""
-    locks = ha_client._entity_registry.get_by_domain("lock")
+    mirror = await ha_client.fresh_state_mirror()
+    locks = mirror.in_domain("lock")
     if not locks:
         return "No locks found."
 
-    unlocked = []
-    for entity in locks:
-        state = await ha_client.get_state(entity.entity_id)
-        if state and state.state == "unlocked":
-            unlocked.append(entity.friendly_name)
+    unlocked = sorted(
+        _friendly_name(ha_client, mirror, entity_id)
+        for entity_id in mirror.with_state("lock", "unlocked")
+    )
 
     if not unlocked:
         return f"All {len(locks)} door(s) are locked."
@@ -994,17 +986,17 @@ async def _check_locks(ha_client: HomeAssistantClient) -> str:
 
 async def _check_doors(ha_client: HomeAssistantClient) -> str:
     """Check status of door sensors."""
-    sensors = ha_client._entity_registry.get_by_domain("binary_sensor")
-    door_sensors = [e for e in sensors if e.device_class == "door" or "door" in e.entity_id.lower()]
+    mirror = await ha_client.fresh_state_mirror()
+    door_sensors = _binary_sensors_of_class(mirror, "door")
 
     if not door_sensors:
         return "No door sensors found."
 
-    open_doors = []
-    for entity in door_sensors:
-        state = await ha_client.get_state(entity.entity_id)
-        if state and state.state == "on":  # on = open for door sensors
-            open_doors.append(entity.friendly_name)
+    # on = open for door sensors
+    open_doors = sorted(
+        _friendly_name(ha_client, mirror, entity_id)
+        for entity_id in door_sensors & mirror.with_state("binary_sensor", "on")
+    )
 
     if not open_doors:
         return f"All {len(door_sensors)} doors are closed."
@@ -1016,17 +1008,17 @@ async def _check_doors(ha_client: HomeAssistantClient) -> str:
 
 async def _check_windows(ha_client: HomeAssistantClient) -> str:
     """Check status of window sensors."""
-    sensors = ha_client._entity_registry.get_by_domain("binary_sensor")
-    window_sensors = [e for e in sensors if e.device_class == "window" or "window" in e.entity_id.lower()]
+    mirror = await ha_client.fresh_state_mirror()
+    window_sensors = _binary_sensors_of_class(mirror, "window")
 
     if not window_sensors:
         return "No window sensors found."
 
-    open_windows = []
-    for entity in window_sensors:
-        state = await ha_client.get_state(entity.entity_id)
-        if state and state.state == "on":  # on = open for window sensors
-            open_windows.append(entity.friendly_name)
+    # on = open for window sensors
+    open_windows = sorted(
+        _friendly_name(ha_client, mirror, entity_id)
+        for entity_id in window_sensors & mirror.with_state("binary_sensor", "on")
+    )
 
     if not open_windows:
         return f"All {len(window_sensors)} windows are closed."
@@ -1036,6 +1028,13 @@ async def _check_windows(ha_client: HomeAssistantClient) -> str:
         return f"{len(open_windows)} windows are open: {', '.join(open_windows)}."
 
 
+def _binary_sensors_of_class(mirror: StateMirror, device_class: str) -> set[str]:
+    """Binary sensors with a device_class, or named after it (e.g. "front_door")."""
+    return mirror.in_domain("binary_sensor") & (
+        mirror.with_device_class(device_class) | mirror.named(device_class)
+    )
+
+
 async def _check_garage(ha_client: HomeAssistantClient) -> str:
     """Check garage door status."""
     covers = ha_client._entity_registry.get_by_domain("cover")
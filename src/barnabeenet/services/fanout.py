@@ -0,0 +1,325 @@
+"""Non-blocking pub/sub fan-out for dashboard WebSockets.
+
+Publishers hand a message to a FanoutBus, which serializes it once and
+offers the JSON text to every subscriber's bounded send queue. Each
+subscriber has its own sender task that drains the queue every ``tick``
+seconds and writes the pending messages as one frame, so a slow browser
+tab only ever delays itself.
+
+When a subscriber falls behind:
+- Messages published with a ``coalesce_key`` replace a still-queued message
+  with the same key (e.g. the latest metrics snapshot wins).
+- Once the queue is full, the oldest queued message is dropped.
+
+Frames carrying a single message are the message itself. Frames carrying
+several are ``{"type": "batch", "data": [message, ...]}``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TICK_SEC = 0.05
+DEFAULT_MAX_QUEUE = 256
+DEFAULT_MAX_BATCH = 50
+
+SendText = Callable[[str], Awaitable[Any]]
+MessageFilter = Callable[[dict[str, Any]], bool]
+
+
+def encode(message: dict[str, Any]) -> str:
+    """Serialize a message the way every subscriber receives it."""
+    return json.dumps(message, separators=(",", ":"), default=str)
+
+
+@dataclass
+class _Pending:
+    """A serialized message waiting in a subscriber queue."""
+
+    raw: str
+    key: str | None
+    enqueued_at: float
+
+
+class FanoutSubscriber:
+    """One consumer: a bounded send queue drained by its own sender task."""
+
+    def __init__(
+        self,
+        send_text: SendText,
+        name: str = "",
+        accepts: MessageFilter | None = None,
+        on_close: Callable[[FanoutSubscriber], Any] | None = None,
+        tick: float = DEFAULT_TICK_SEC,
+        max_queue: int = DEFAULT_MAX_QUEUE,
+        max_batch: int = DEFAULT_MAX_BATCH,
+    ) -> None:
+        """Initialize the subscriber (the sender task starts on first message).
+
+        Args:
+            send_text: Coroutine that writes one text frame to the consumer.
+            name: Label used in stats and logs.
+            accepts: Optional predicate; messages it rejects are not queued.
+            on_close: Called once if a send fails and the subscriber closes.
+            tick: Seconds to collect messages before writing a frame.
+            max_queue: Queued messages beyond which the oldest is dropped.
+            max_batch: Most messages written in one frame.
+        """
+        self.name = name
+        self.accepts = accepts
+        self._send_text = send_text
+        self._on_close = on_close
+        self._tick = tick
+        self._max_queue = max(1, max_queue)
+        self._max_batch = max(1, max_batch)
+
+        self._queue: deque[_Pending] = deque()
+        self._by_key: dict[str, _Pending] = {}
+        self._wakeup: asyncio.Event | None = None
+        self._idle: asyncio.Event | None = None
+        self._task: asyncio.Task[None] | None = None
+        self._closed = False
+
+        self._sent = 0
+        self._frames = 0
+        self._dropped = 0
+        self._coalesced = 0
+        self._last_send_ms = 0.0
+        self._last_lag_ms = 0.0
+
+    @property
+    def closed(self) -> bool:
+        """Whether a send failed or the subscriber was closed."""
+        return self._closed
+
+    @property
+    def pending(self) -> int:
+        """Messages waiting to be sent."""
+        return len(self._queue)
+
+    def offer(self, raw: str, coalesce_key: str | None = None) -> bool:
+        """Queue a serialized message without waiting.
+
+        Returns:
+            False if the subscriber is closed.
+        """
+        if self._closed:
+            return False
+
+        now = time.monotonic()
+        if coalesce_key is not None:
+            queued = self._by_key.get(coalesce_key)
+            if queued is not None:
+                # Newest content, original place (and age) in the queue
+                queued.raw = raw
+                self._coalesced += 1
+                return True
+
+        item = _Pending(raw=raw, key=coalesce_key, enqueued_at=now)
+        self._queue.append(item)
+        if coalesce_key is not None:
+            self._by_key[coalesce_key] = item
+
+        while len(self._queue) > self._max_queue:
+            self._forget(self._queue.popleft())
+            self._dropped += 1
+
+        self._ensure_task().set()
+        return True
+
+    def _forget(self, item: _Pending) -> None:
+        if item.key is not None and self._by_key.get(item.key) is item:
+            del self._by_key[item.key]
+
+    def _ensure_task(self) -> asyncio.Event:
+        if self._wakeup is None or self._task is None or self._task.done():
+            self._wakeup = asyncio.Event()
+            self._idle = asyncio.Event()
+            self._task = asyncio.get_running_loop().create_task(self._run(self._wakeup))
+        if self._idle is not None:
+            self._idle.clear()
+        return self._wakeup
+
+    async def _run(self, wakeup: asyncio.Event) -> None:
+        while True:
+            if not self._queue:
+                if self._idle is not None:
+                    self._idle.set()
+                await wakeup.wait()
+                wakeup.clear()
+                if self._tick > 0:
+                    await asyncio.sleep(self._tick)
+
+            batch: list[_Pending] = []
+            while self._queue and len(batch) < self._max_batch:
+                item = self._queue.popleft()
+                self._forget(item)
+                batch.append(item)
+            if not batch:
+                continue
+
+            if len(batch) == 1:
+                frame = batch[0].raw
+            else:
+                frame = '{"type":"batch","data":[' + ",".join(i.raw for i in batch) + "]}"
+
+            start = time.monotonic()
+            try:
+                await self._send_text(frame)
+            except Exception as e:
+                logger.warning("Fan-out send to %s failed: %s", self.name or "subscriber", e)
+                await self._fail()
+                return
+
+            self._last_send_ms = (time.monotonic() - start) * 1000
+            self._last_lag_ms = (start - batch[0].enqueued_at) * 1000
+            self._sent += len(batch)
+            self._frames += 1
+
+    async def _fail(self) -> None:
+        self._closed = True
+        self._dropped += len(self._queue)
+        self._queue.clear()
+        self._by_key.clear()
+        if self._idle is not None:
+            self._idle.set()
+        if self._on_close is not None:
+            try:
+                result = self._on_close(self)
+                if asyncio.iscoroutine(result):
+                    await result
+            except Exception as e:
+                logger.warning("Fan-out close handler error: %s", e)
+
+    async def flush(self) -> None:
+        """Wait until everything queued so far has been sent (or dropped)."""
+        if self._idle is not None and self._task is not None and not self._task.done():
+            await self._idle.wait()
+
+    def close(self) -> None:
+        """Stop the sender task, discarding anything still queued."""
+        self._closed = True
+        try:
+            current = asyncio.current_task()
+        except RuntimeError:
+            current = None
+        if self._task is not None and self._task is not current:
+            self._task.cancel()
+        self._task = None
+        self._queue.clear()
+        self._by_key.clear()
+        if self._idle is not None:
+            self._idle.set()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Queue depth, throughput and lag for this subscriber."""
+        oldest_ms = (time.monotonic() - self._queue[0].enqueued_at) * 1000 if self._queue else 0.0
+        return {
+            "name": self.name,
+            "pending": len(self._queue),
+            "sent": self._sent,
+            "frames": self._frames,
+            "dropped": self._dropped,
+            "coalesced": self._coalesced,
+            "lag_ms": oldest_ms,  # Age of the oldest unsent message
+            "last_lag_ms": self._last_lag_ms,  # Queue wait of the last frame sent
+            "last_send_ms": self._last_send_ms,
+            "closed": self._closed,
+        }
+
+
+class FanoutBus:
+    """Serialize-once fan-out to a set of non-blocking subscribers."""
+
+    def __init__(
+        self,
+        tick: float = DEFAULT_TICK_SEC,
+        max_queue: int = DEFAULT_MAX_QUEUE,
+        max_batch: int = DEFAULT_MAX_BATCH,
+    ) -> None:
+        """Initialize the bus.
+
+        Args:
+            tick: Seconds each subscriber collects messages before a frame.
+            max_queue: Per-subscriber queue bound (oldest dropped beyond it).
+            max_batch: Most messages per frame.
+        """
+        self._tick = tick
+        self._max_queue = max_queue
+        self._max_batch = max_batch
+        self._subscribers: list[FanoutSubscriber] = []
+        self._published = 0
+
+    def add(
+        self,
+        send_text: SendText,
+        name: str = "",
+        accepts: MessageFilter | None = None,
+        on_close: Callable[[FanoutSubscriber], Any] | None = None,
+    ) -> FanoutSubscriber:
+        """Add a subscriber that receives frames through ``send_text``."""
+        subscriber = FanoutSubscriber(
+            send_text,
+            name=name,
+            accepts=accepts,
+            on_close=on_close,
+            tick=self._tick,
+            max_queue=self._max_queue,
+            max_batch=self._max_batch,
+        )
+        self._subscribers.append(subscriber)
+        return subscriber
+
+    def remove(self, subscriber: FanoutSubscriber) -> None:
+        """Remove a subscriber and stop its sender task."""
+        if subscriber in self._subscribers:
+            self._subscribers.remove(subscriber)
+        subscriber.close()
+
+    def publish(self, message: dict[str, Any], coalesce_key: str | None = None) -> int:
+        """Offer a message to every accepting subscriber; never waits.
+
+        Returns:
+            Number of subscribers it was queued for.
+        """
+        self._published += 1
+        raw: str | None = None
+        delivered = 0
+        for subscriber in list(self._subscribers):
+            if subscriber.closed:
+                continue
+            if subscriber.accepts is not None and not subscriber.accepts(message):
+                continue
+            if raw is None:
+                raw = encode(message)
+            if subscriber.offer(raw, coalesce_key):
+                delivered += 1
+        return delivered
+
+    async def flush(self) -> None:
+        """Wait until every subscriber has sent what is queued."""
+        for subscriber in list(self._subscribers):
+            await subscriber.flush()
+
+    @property
+    def subscriber_count(self) -> int:
+        """Number of subscribers."""
+        return len(self._subscribers)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Per-subscriber queue depth, drops and lag."""
+        subscribers = [s.get_stats() for s in self._subscribers]
+        return {
+            "published": self._published,
+            "subscribers": subscribers,
+            "max_lag_ms": max((s["lag_ms"] for s in subscribers), default=0.0),
+        }
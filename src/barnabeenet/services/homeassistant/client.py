@@ -4,9 +4,10 @@ Async client for communicating with Home Assistant's REST API and WebSocket API.
 Handles:
 - Authentication via long-lived access token
 - Service calls (turn_on, turn_off, etc.)
-- State retrieval
+- State retrieval (served from a live in-memory mirror when possible)
 - Entity discovery
-- Device/Area/Automation/Integration registries (via WebSocket)
+- Device/Area/Automation/Integration registries (via one shared WebSocket)
+- Incremental registry sync from *_registry_updated events
 - Error log fetching
 - Event subscriptions (via WebSocket)
 """
@@ -14,18 +15,15 @@ Handles:
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
 import re
 from collections import deque
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Any
 
 import httpx
-import websockets
-from websockets.exceptions import WebSocketException
 
 from barnabeenet.services.homeassistant.entities import Entity, EntityRegistry, EntityState
 from barnabeenet.services.homeassistant.models import (
@@ -36,16 +34,24 @@ from barnabeenet.services.homeassistant.models import (
     HADataSnapshot,
     Integration,
     LogEntry,
+    RegistryUpdate,
     StateChangeEvent,
 )
+from barnabeenet.services.homeassistant.state_mirror import DEFAULT_MAX_AGE_SEC, StateMirror
+from barnabeenet.services.homeassistant.websocket import (
+    HAAuthenticationError,
+    HAWebSocketSession,
+)
 
 logger = logging.getLogger(__name__)
 
-
-class HAAuthenticationError(Exception):
-    """Raised when Home Assistant authentication fails (invalid token)."""
-
-    pass
+# Registry change events applied incrementally (event type -> registry name)
+REGISTRY_EVENTS: dict[str, str] = {
+    "entity_registry_updated": "entity",
+    "device_registry_updated": "device",
+    "area_registry_updated": "area",
+    "floor_registry_updated": "floor",
+}
 
 
 @dataclass
@@ -83,6 +89,7 @@ class HomeAssistantClient:
         token: str,
         timeout: float = 10.0,
         verify_ssl: bool = True,
+        state_max_age: float = DEFAULT_MAX_AGE_SEC,
     ) -> None:
         """Initialize the Home Assistant client.
 
@@ -91,6 +98,8 @@ class HomeAssistantClient:
             token: Long-lived access token for authentication
             timeout: Request timeout in seconds
             verify_ssl: Whether to verify SSL certificates
+            state_max_age: Seconds a state snapshot is trusted while the
+                event stream is down
         """
         self._url = url.rstrip("/")
         self._token = token
@@ -113,6 +122,21 @@ class HomeAssistantClient:
         self._event_callbacks: list[Callable[[StateChangeEvent], None]] = []
         self._ws_connected: bool = False
 
+        # Registry sync: deltas from *_registry_updated events, applied in order
+        self._registry_callbacks: list[Callable[[RegistryUpdate], None]] = []
+        self._registry_sync_lock = asyncio.Lock()
+        self._registry_tasks: set[asyncio.Task[None]] = set()
+        self._registry_resync_needed = False
+
+        # One WebSocket for registry commands and event subscriptions
+        self._ws_session = HAWebSocketSession(self._url, token)
+        self._ws_session.add_connect_listener(self._on_ws_connected)
+        self._ws_session.add_disconnect_listener(self._on_ws_disconnected)
+
+        # Entity states: one bulk snapshot kept current by state_changed events
+        self._state_mirror = StateMirror(max_age=state_max_age)
+        self._state_refresh_lock = asyncio.Lock()
+
     @property
     def url(self) -> str:
         """Get the Home Assistant URL."""
@@ -185,6 +209,11 @@ class HomeAssistantClient:
         """Get the integrations registry."""
         return self._integrations
 
+    @property
+    def state_mirror(self) -> StateMirror:
+        """Get the in-memory entity state mirror."""
+        return self._state_mirror
+
     @property
     def snapshot(self) -> HADataSnapshot:
         """Get the current data snapshot summary."""
@@ -217,6 +246,11 @@ class HomeAssistantClient:
         """Check if subscribed to state change events."""
         return self._ws_connected and self._event_task is not None
 
+    @property
+    def registry_sync_live(self) -> bool:
+        """Whether registry changes are currently arriving as events."""
+        return self.is_subscribed and self._ws_session.is_subscribed(self._handle_registry_event)
+
     def add_state_change_callback(self, callback: Callable[[StateChangeEvent], None]) -> None:
         """Add a callback to be called when state changes occur."""
         self._event_callbacks.append(callback)
@@ -226,6 +260,15 @@ class HomeAssistantClient:
         if callback in self._event_callbacks:
             self._event_callbacks.remove(callback)
 
+    def add_registry_callback(self, callback: Callable[[RegistryUpdate], None]) -> None:
+        """Add a callback to be called after a registry change has been applied."""
+        self._registry_callbacks.append(callback)
+
+    def remove_registry_callback(self, callback: Callable[[RegistryUpdate], None]) -> None:
+        """Remove a registry change callback."""
+        if callback in self._registry_callbacks:
+            self._registry_callbacks.remove(callback)
+
     async def __aenter__(self) -> HomeAssistantClient:
         """Async context manager entry."""
         await self.connect()
@@ -254,6 +297,8 @@ class HomeAssistantClient:
                     await self._client.aclose()
                     self._client = None
                     self._token = new_token
+                    self._ws_session.token = new_token
+                    await self._ws_session.close()
             except Exception:
                 pass  # Continue with existing client if we can't check
 
@@ -302,6 +347,7 @@ class HomeAssistantClient:
         """Close the HTTP client and event subscription."""
         # Stop event subscription
         await self.unsubscribe_from_events()
+        await self._ws_session.close()
 
         if self._client:
             await self._client.aclose()
@@ -411,17 +457,30 @@ class HomeAssistantClient:
         Returns:
             Number of entities loaded.
         """
+        return await self._load_entities() or 0
+
+    async def _load_entities(self, require_registry: bool = False) -> int | None:
+        """Load entities as in ``refresh_entities``; None if the fetch failed.
+
+        With ``require_registry``, a failed entity registry list also counts
+        as a failure and the current entities are kept.
+        """
         if not self._client:
-            return 0
+            return None
 
         try:
             # Get entity states from REST API
+            since_version = self._state_mirror.version
             response = await self._client.get("/api/states")
             response.raise_for_status()
             states = response.json()
+            self._state_mirror.load_snapshot(states, since_version)
 
             # Try to get entity registry from WebSocket for area assignments
             entity_registry_data = await self._ws_command("config/entity_registry/list")
+            if entity_registry_data is None and require_registry:
+                logger.warning("Entity registry not available; keeping current entities")
+                return None
             entity_registry_map: dict[str, dict[str, Any]] = {}
             if entity_registry_data:
                 for entry in entity_registry_data:
@@ -432,7 +491,7 @@ class HomeAssistantClient:
                     "Loaded %d entity registry entries via WebSocket", len(entity_registry_map)
                 )
 
-            self._entity_registry.clear()
+            entities: list[Entity] = []
             for state_data in states:
                 entity = self._parse_entity(state_data)
 
@@ -443,7 +502,14 @@ class HomeAssistantClient:
                     entity.area_id = registry_entry.get("area_id")
                     entity.device_id = registry_entry.get("device_id")
 
-                self._entity_registry.add(entity)
+                entities.append(entity)
+
+            # Built off to the side and swapped in, never empty mid-refresh
+            self._entity_registry.replace_all(entities)
+
+            self._state_mirror.assign_areas(
+                {e.entity_id: e.area_id for e in self._entity_registry.all()}
+            )
 
             logger.info("Loaded %d entities from Home Assistant", len(self._entity_registry))
             self._snapshot.entities_count = len(self._entity_registry)
@@ -452,18 +518,42 @@ class HomeAssistantClient:
 
         except httpx.RequestError as e:
             logger.error("Failed to refresh entities: %s", e)
+            return None
+
+    async def refresh_states(self) -> int:
+        """Reload the state mirror from one bulk ``/api/states`` request.
+
+        Concurrent callers share a single request.
+
+        Returns:
+            Number of entity states mirrored (0 if the request failed).
+        """
+        if not self._client:
             return 0
 
+        snapshots = self._state_mirror.snapshots
+        async with self._state_refresh_lock:
+            # Another caller's snapshot landed while we waited for the lock
+            if self._state_mirror.snapshots != snapshots:
+                return len(self._state_mirror)
+
+            try:
+                since_version = self._state_mirror.version
+                response = await self._client.get("/api/states")
+                response.raise_for_status()
+                count = self._state_mirror.load_snapshot(response.json(), since_version)
+            except httpx.HTTPError as e:
+                logger.error("Failed to refresh entity states: %s", e)
+                return 0
+
+        logger.debug("State mirror loaded %d entities", count)
+        return count
+
     async def _ws_command(self, command_type: str) -> list[dict[str, Any]] | None:
         """Execute a WebSocket command and return the result.
 
-        Home Assistant's WebSocket API flow:
-        1. Connect to ws://host:port/api/websocket
-        2. Receive {"type": "auth_required"}
-        3. Send {"type": "auth", "access_token": "token"}
-        4. Receive {"type": "auth_ok"} or {"type": "auth_invalid"}
-        5. Send command with {"id": 1, "type": "command_type"}
-        6. Receive {"id": 1, "type": "result", "success": true, "result": [...]}
+        Commands share one persistent, authenticated connection (opened on
+        first use) and may run concurrently; see ``HAWebSocketSession``.
 
         Args:
             command_type: The WebSocket command type (e.g., "config/device_registry/list")
@@ -471,61 +561,14 @@ class HomeAssistantClient:
         Returns:
             List of results or None if failed.
         """
-        # Convert HTTP URL to WebSocket URL
-        ws_url = self._url.replace("http://", "ws://").replace("https://", "wss://")
-        ws_url = f"{ws_url}/api/websocket"
-
         try:
-            # Add timeout to prevent hanging - 10 seconds should be enough for most commands
-            # Use wait_for for Python 3.10+ compatibility
-            async def _ws_connect_and_command():
-                async with websockets.connect(ws_url) as ws:
-                    # Step 1: Wait for auth_required
-                    msg = json.loads(await ws.recv())
-                    if msg.get("type") != "auth_required":
-                        logger.error("Unexpected WebSocket message: %s", msg)
-                        return None
-
-                    # Step 2: Send auth
-                    await ws.send(json.dumps({"type": "auth", "access_token": self._token}))
-
-                    # Step 3: Wait for auth response
-                    msg = json.loads(await ws.recv())
-                    if msg.get("type") == "auth_invalid":
-                        logger.error("WebSocket auth failed: %s", msg.get("message"))
-                        return None
-                    if msg.get("type") != "auth_ok":
-                        logger.error("Unexpected auth response: %s", msg)
-                        return None
-
-                    logger.debug("WebSocket authenticated successfully")
-
-                    # Step 4: Send command
-                    await ws.send(json.dumps({"id": 1, "type": command_type}))
-
-                    # Step 5: Wait for result
-                    msg = json.loads(await ws.recv())
-                    if msg.get("type") == "result" and msg.get("success"):
-                        return msg.get("result", [])
-                    else:
-                        logger.error("WebSocket command failed: %s", msg)
-                        return None
-
-            # Execute with timeout
-            return await asyncio.wait_for(_ws_connect_and_command(), timeout=10.0)
-
+            result = await self._ws_session.command(command_type)
+            return result if result is not None else []
         except asyncio.TimeoutError:
-            logger.warning("WebSocket command %s timed out after 10 seconds", command_type)
-            return None
-        except WebSocketException as e:
-            logger.warning("WebSocket error for %s: %s", command_type, e)
-            # If it's a "message too big" error, that's expected for large entity registries
-            # The REST API fallback should handle this
-            if "message too big" in str(e).lower() or "1009" in str(e):
-                logger.info("WebSocket message too large for %s - will use REST API fallback", command_type)
+            logger.warning("WebSocket command %s timed out", command_type)
             return None
         except Exception as e:
-            logger.warning("WebSocket connection failed for %s: %s", command_type, e)
+            logger.warning("WebSocket command %s failed: %s", command_type, e)
             return None
 
     async def refresh_devices(self) -> int:
@@ -537,6 +580,10 @@ class HomeAssistantClient:
         Returns:
             Number of devices loaded.
         """
+        return await self._load_devices() or 0
+
+    async def _load_devices(self) -> int | None:
+        """Load devices as in ``refresh_devices``; None if the fetch failed."""
         # Try WebSocket API first (required for newer HA versions)
         devices_data = await self._ws_command("config/device_registry/list")
 
@@ -551,12 +598,13 @@ class HomeAssistantClient:
 
         if devices_data is None:
             logger.warning("Device registry not available via WebSocket or REST API")
-            return 0
+            return None
 
-        self._devices.clear()
+        devices: dict[str, Device] = {}
         for device_data in devices_data:
             device = self._parse_device(device_data)
-            self._devices[device.id] = device
+            devices[device.id] = device
+        self._devices = devices
 
         logger.info("Loaded %d devices from Home Assistant", len(self._devices))
         self._snapshot.devices_count = len(self._devices)
@@ -572,6 +620,10 @@ class HomeAssistantClient:
         Returns:
             Number of areas loaded.
         """
+        return await self._load_areas() or 0
+
+    async def _load_areas(self) -> int | None:
+        """Load areas as in ``refresh_areas``; None if the fetch failed."""
         # Try WebSocket API first (required for newer HA versions)
         areas_data = await self._ws_command("config/area_registry/list")
 
@@ -586,12 +638,14 @@ class HomeAssistantClient:
 
         if areas_data is None:
             logger.warning("Area registry not available via WebSocket or REST API")
-            return 0
+            return None
 
-        self._areas.clear()
+        areas: dict[str, Area] = {}
         for area_data in areas_data:
             area = self._parse_area(area_data)
-            self._areas[area.id] = area
+            areas[area.id] = area
+        self._areas = areas
+        self._state_mirror.assign_floors({a.id: a.floor_id for a in self._areas.values()})
 
         logger.info("Loaded %d areas from Home Assistant", len(self._areas))
         self._snapshot.areas_count = len(self._areas)
@@ -668,11 +722,14 @@ class HomeAssistantClient:
         Returns:
             HADataSnapshot with counts and timestamps.
         """
-        await self.refresh_entities()
-        await self.refresh_devices()
-        await self.refresh_areas()
-        await self.refresh_automations()
-        await self.refresh_integrations()
+        # Registry commands are multiplexed over the one WebSocket connection
+        await asyncio.gather(
+            self.refresh_entities(),
+            self.refresh_devices(),
+            self.refresh_areas(),
+            self.refresh_automations(),
+            self.refresh_integrations(),
+        )
         return self._snapshot
 
     async def get_error_log(self, max_lines: int = 500) -> list[LogEntry]:
@@ -855,12 +912,17 @@ class HomeAssistantClient:
     async def get_state(self, entity_id: str) -> EntityState | None:
         """Get the current state of an entity.
 
+        Answered from the state mirror while it is live; otherwise fetched
+        over REST.
+
         Args:
             entity_id: The entity ID (e.g., "light.living_room")
 
         Returns:
             EntityState or None if not found.
         """
+        if self._state_mirror.live:
+            return self._state_mirror.get(entity_id)
         if not self._client:
             return None
 
@@ -869,17 +931,35 @@ class HomeAssistantClient:
             if response.status_code == 404:
                 return None
             response.raise_for_status()
-            data = response.json()
-            return EntityState(
-                state=data.get("state", "unknown"),
-                attributes=data.get("attributes", {}),
-                last_changed=data.get("last_changed"),
-                last_updated=data.get("last_updated"),
-            )
+            return EntityState.from_api(response.json())
         except httpx.RequestError as e:
             logger.error("Failed to get state for %s: %s", entity_id, e)
             return None
 
+    async def get_states(self, entity_ids: Iterable[str]) -> dict[str, EntityState]:
+        """Get the current states of many entities at once.
+
+        Served from the state mirror, which is re-snapshotted first (one
+        request for all entities) if it is stale.
+
+        Args:
+            entity_ids: Entity IDs to look up
+
+        Returns:
+            Mapping of entity_id to EntityState; unknown entities are omitted.
+        """
+        mirror = await self.fresh_state_mirror()
+        return mirror.get_many(entity_ids)
+
+    async def fresh_state_mirror(self) -> StateMirror:
+        """Get the state mirror, re-snapshotting it first if it is stale.
+
+        Use this to query the mirror's indexes directly.
+        """
+        if not self._state_mirror.is_fresh():
+            await self.refresh_states()
+        return self._state_mirror
+
     async def call_service(
         self,
         service: str,
@@ -1198,20 +1278,15 @@ class HomeAssistantClient:
         Returns:
             EntityState or None if not found
         """
+        if self._state_mirror.live:
+            return self._state_mirror.get(entity_id)
         if not self._client:
             return None
 
         try:
             response = await self._client.get(f"/api/states/{entity_id}")
             if response.status_code == 200:
-                state_data = response.json()
-                from barnabeenet.services.homeassistant.entities import EntityState
-                return EntityState(
-                    state=state_data.get("state", "unknown"),
-                    attributes=state_data.get("attributes", {}),
-                    last_changed=state_data.get("last_changed"),
-                    last_updated=state_data.get("last_updated"),
-                )
+                return EntityState.from_api(response.json())
         except Exception as e:
             logger.debug("Failed to load state for %s: %s", entity_id, e)
 
@@ -1265,17 +1340,23 @@ class HomeAssistantClient:
             except asyncio.CancelledError:
                 pass
             self._event_task = None
+            self._ws_session.unsubscribe(self._handle_event)
+            self._ws_session.unsubscribe(self._handle_registry_event)
+            self._registry_resync_needed = False
             self._ws_connected = False
+            self._state_mirror.stream_disconnected()
             logger.info("Stopped Home Assistant event subscription")
 
     def update_token(self, new_token: str) -> None:
         """Update the access token (used when token is refreshed via dashboard)."""
         self._token = new_token
+        self._ws_session.token = new_token
         logger.info("HA access token updated")
 
     async def reconnect_events(self) -> None:
         """Reconnect event subscription (call after updating token)."""
         await self.unsubscribe_from_events()
+        await self._ws_session.close()
         await self.subscribe_to_events()
 
     async def _event_subscription_loop(self) -> None:
@@ -1320,56 +1401,174 @@ class HomeAssistantClient:
             reconnect_delay = min(reconnect_delay * 2, max_reconnect_delay)
 
     async def _run_event_subscription(self) -> None:
-        """Run the WebSocket event subscription."""
-        # Build WebSocket URL
-        ws_url = self._url.replace("http://", "ws://").replace("https://", "wss://")
-        ws_url = f"{ws_url}/api/websocket"
-
-        logger.debug("Connecting to HA WebSocket at %s", ws_url)
-
-        async with websockets.connect(ws_url) as ws:
-            # Step 1: Receive auth_required
-            msg = json.loads(await ws.recv())
-            if msg.get("type") != "auth_required":
-                raise RuntimeError(f"Expected auth_required, got: {msg.get('type')}")
-
-            # Step 2: Send auth
-            await ws.send(json.dumps({"type": "auth", "access_token": self._token}))
-
-            # Step 3: Receive auth result
-            msg = json.loads(await ws.recv())
-            if msg.get("type") == "auth_invalid":
-                raise HAAuthenticationError(msg.get("message", "Invalid access token"))
-            if msg.get("type") != "auth_ok":
-                raise RuntimeError(f"Auth failed: {msg}")
-
-            logger.info("WebSocket authenticated with Home Assistant")
-
-            # Step 4: Subscribe to state_changed events
-            await ws.send(
-                json.dumps({"id": 1, "type": "subscribe_events", "event_type": "state_changed"})
+        """Run the WebSocket event subscription until the connection drops."""
+        if not self._ws_session.is_subscribed(self._handle_event):
+            await self._ws_session.subscribe(
+                {"type": "subscribe_events", "event_type": "state_changed"}, self._handle_event
             )
+            for event_type in REGISTRY_EVENTS:
+                await self._ws_session.subscribe(
+                    {"type": "subscribe_events", "event_type": event_type},
+                    self._handle_registry_event,
+                )
+            # Subscribed on a connection that registry commands already opened
+            if self._ws_session.connected:
+                await self._on_ws_connected()
+        # Connecting (re)subscribes and snapshots states via _on_ws_connected
+        await self._ws_session.connect()
+        await self._ws_session.wait_closed()
+
+    async def _on_ws_connected(self) -> None:
+        """Snapshot all states once the event subscription is (re)established."""
+        if self._event_task is None:
+            return
+        logger.info("Subscribed to Home Assistant state_changed events")
+        self._ws_connected = True
+        # Events are already flowing, so nothing that changes after this
+        # request is missed; events applied meanwhile win over the snapshot.
+        self._state_mirror.stream_connected()
+        await self.refresh_states()
+
+        # Registry changes made while disconnected were missed
+        if self._registry_resync_needed:
+            self._registry_resync_needed = False
+            self._schedule_registry_task(self._resync_registries())
+
+    async def _on_ws_disconnected(self) -> None:
+        if self._event_task is not None:
+            self._registry_resync_needed = True
+        self._ws_connected = False
+        self._state_mirror.stream_disconnected()
 
-            # Step 5: Receive subscription confirmation
-            msg = json.loads(await ws.recv())
-            if not msg.get("success"):
-                raise RuntimeError(f"Failed to subscribe to events: {msg}")
-
-            logger.info("Subscribed to Home Assistant state_changed events")
-            self._ws_connected = True
-
-            # Step 6: Listen for events
-            async for raw_msg in ws:
-                try:
-                    msg = json.loads(raw_msg)
-                    if msg.get("type") == "event":
-                        event_data = msg.get("event", {})
-                        if event_data.get("event_type") == "state_changed":
-                            await self._handle_state_change(event_data.get("data", {}))
-                except json.JSONDecodeError:
-                    logger.warning("Invalid JSON from WebSocket: %s", raw_msg[:100])
-                except Exception as e:
-                    logger.warning("Error processing event: %s", e)
+    async def _handle_event(self, event: dict[str, Any]) -> None:
+        """Route an event from the state_changed subscription."""
+        if event.get("event_type") == "state_changed":
+            await self._handle_state_change(event.get("data", {}))
+
+    # =========================================================================
+    # Registry Sync
+    # =========================================================================
+
+    async def _handle_registry_event(self, event: dict[str, Any]) -> None:
+        """Queue a ``*_registry_updated`` event for in-order application.
+
+        Runs on the WebSocket reader, so commands are issued from a task.
+        """
+        registry = REGISTRY_EVENTS.get(event.get("event_type", ""))
+        if registry:
+            self._schedule_registry_task(self._apply_registry_event(registry, event.get("data", {})))
+
+    def _schedule_registry_task(self, coro: Any) -> None:
+        # Held in _registry_tasks until done so it is not garbage-collected
+        task = asyncio.create_task(coro)
+        self._registry_tasks.add(task)
+        task.add_done_callback(self._registry_task_done)
+
+    def _registry_task_done(self, task: asyncio.Task[None]) -> None:
+        self._registry_tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.error("Registry sync task failed", exc_info=task.exception())
+
+    async def _apply_registry_event(self, registry: str, data: dict[str, Any]) -> None:
+        """Apply one registry delta in place, then notify registry callbacks."""
+        action = data.get("action", "update")
+        async with self._registry_sync_lock:
+            try:
+                if registry == "entity":
+                    update = await self._apply_entity_registry_event(action, data)
+                elif registry == "device":
+                    device_id = data.get("device_id")
+                    if action == "remove":
+                        self._devices.pop(device_id, None)
+                    else:
+                        # No single-device get command; the device list is small
+                        await self.refresh_devices()
+                    update = RegistryUpdate(registry, action, device_id)
+                elif registry == "area":
+                    area_id = data.get("area_id")
+                    if action == "remove":
+                        self._areas.pop(area_id, None)
+                    else:
+                        await self.refresh_areas()
+                    update = RegistryUpdate(registry, action, area_id)
+                else:
+                    # Floors are owned by HATopologyService
+                    update = RegistryUpdate(registry, action, data.get("floor_id"))
+            except Exception as e:
+                logger.warning("Failed to apply %s registry update: %s", registry, e)
+                return
+
+            if update is not None:
+                self._notify_registry_callbacks(update)
+
+    async def _apply_entity_registry_event(
+        self, action: str, data: dict[str, Any]
+    ) -> RegistryUpdate | None:
+        entity_id = data.get("entity_id")
+        if not entity_id:
+            return None
+
+        if action == "remove":
+            self._entity_registry.remove(entity_id)
+            self._state_mirror.assign_area(entity_id, None)
+            return RegistryUpdate("entity", action, entity_id)
+
+        entry = await self._ws_session.command("config/entity_registry/get", entity_id=entity_id)
+        old_entity_id = data.get("old_entity_id")
+        existing = self._entity_registry.get(entity_id)
+        if old_entity_id and old_entity_id != entity_id:
+            existing = existing or self._entity_registry.get(old_entity_id)
+            self._entity_registry.remove(old_entity_id)
+            self._state_mirror.assign_area(old_entity_id, None)
+
+        state = self._state_mirror.get(entity_id) or (existing.state if existing else None)
+        friendly_name = (
+            entry.get("name")
+            or (state.attributes.get("friendly_name") if state else None)
+            or entry.get("original_name")
+            or (existing.friendly_name if existing else entity_id)
+        )
+        entity = Entity(
+            entity_id=entity_id,
+            domain=entity_id.split(".")[0] if "." in entity_id else "unknown",
+            friendly_name=friendly_name,
+            device_class=(
+                entry.get("device_class")
+                or entry.get("original_device_class")
+                or (existing.device_class if existing else None)
+            ),
+            area_id=entry.get("area_id"),
+            device_id=entry.get("device_id"),
+            state=state,
+        )
+        self._entity_registry.add(entity)
+        self._state_mirror.assign_area(entity_id, entity.area_id)
+        return RegistryUpdate("entity", action, entity_id, entry=entry, old_item_id=old_entity_id)
+
+    async def _resync_registries(self) -> None:
+        """Rebuild all registries after events may have been missed."""
+        async with self._registry_sync_lock:
+            try:
+                results = await asyncio.gather(
+                    self._load_entities(require_registry=True),
+                    self._load_devices(),
+                    self._load_areas(),
+                )
+            except Exception:
+                logger.exception("Failed to resync Home Assistant registries")
+                results = [None]
+            if None in results:
+                logger.warning("Home Assistant registry resync incomplete; retrying on reconnect")
+                self._registry_resync_needed = True
+                return
+            self._notify_registry_callbacks(RegistryUpdate("all", "resync"))
+
+    def _notify_registry_callbacks(self, update: RegistryUpdate) -> None:
+        for callback in self._registry_callbacks:
+            try:
+                callback(update)
+            except Exception as e:
+                logger.warning("Registry callback error: %s", e)
 
     async def _handle_state_change(self, data: dict[str, Any]) -> None:
         """Process a state_changed event from Home Assistant."""
@@ -1396,6 +1595,8 @@ class HomeAssistantClient:
         # Add to rolling buffer
         self._state_changes.appendleft(event)
 
+        self._state_mirror.apply_event(entity_id, data.get("new_state"))
+
         # Update entity state in registry if we have it
         entity = self._entity_registry.get(entity_id)
         if entity and new_state:
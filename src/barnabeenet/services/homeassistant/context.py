@@ -9,7 +9,8 @@ Design principles:
 - Cache entity names/domains (lightweight, changes infrequently)
 - Don't cache entity states (heavy, changes frequently)
 - Load states only when needed (just-in-time)
-- Refresh entity metadata periodically (every 5 minutes)
+- Keep entity metadata in sync from registry update events, falling back
+  to a periodic refresh (every 5 minutes) while events are unavailable
 """
 
 from __future__ import annotations
@@ -22,6 +23,14 @@ from datetime import datetime, timedelta
 from typing import Any
 
 from barnabeenet.services.homeassistant.client import HomeAssistantClient
+from barnabeenet.services.homeassistant.entities import Entity, EntityState, TrigramIndex
+from barnabeenet.services.homeassistant.mentions import (
+    MENTION_ALIAS,
+    MENTION_AREA,
+    MENTION_ENTITY,
+    MentionDetector,
+)
+from barnabeenet.services.homeassistant.models import RegistryUpdate
 
 logger = logging.getLogger(__name__)
 
@@ -48,6 +57,7 @@ class HAContext:
         default_factory=dict
     )  # domain -> [entity_ids]
     area_names: list[str] = field(default_factory=list)  # All area names
+    mention_detector: MentionDetector | None = None  # Finds the above in text
 
     # For Action Agent (device control) - loaded just-in-time
     entity_states: dict[str, Any] = field(default_factory=dict)  # entity_id -> state
@@ -73,10 +83,19 @@ class HAContextService:
         """
         self._ha_client = ha_client
         self._entity_metadata: dict[str, EntityMetadata] = {}  # entity_id -> metadata
+        self._name_index = TrigramIndex()  # entity_id -> friendly name + aliases
+        self._name_order: dict[str, int] = {}  # entity_id -> position in _entity_metadata
+        self._mention_detector = MentionDetector()
+        self._meta_entity_names: list[str] = []
+        self._meta_entity_domains: dict[str, list[str]] = {}
+        self._metadata_fingerprint: int | None = None
         self._area_names: list[str] = []
         self._last_refresh: datetime | None = None
         self._refresh_interval = timedelta(minutes=5)  # Refresh metadata every 5 min
         self._refresh_lock = asyncio.Lock()
+        self._synced_client: HomeAssistantClient | None = None
+        if ha_client is not None:
+            self._attach_client(ha_client)
 
     async def get_ha_client(self) -> HomeAssistantClient | None:
         """Get or fetch HA client."""
@@ -87,6 +106,8 @@ class HAContextService:
             from barnabeenet.api.routes.homeassistant import get_ha_client
 
             self._ha_client = await get_ha_client()
+            if self._ha_client is not None:
+                self._attach_client(self._ha_client)
             return self._ha_client
         except Exception as e:
             logger.warning("Could not get HA client: %s", e)
@@ -111,11 +132,14 @@ class HAContextService:
             return len(self._entity_metadata)
 
         try:
-            # Check if refresh is needed
+            # Check if refresh is needed (registry events keep the cache current)
             if (
                 not force
                 and self._last_refresh
-                and datetime.now() - self._last_refresh < self._refresh_interval
+                and (
+                    datetime.now() - self._last_refresh < self._refresh_interval
+                    or (self._ha_client is not None and self._ha_client.registry_sync_live)
+                )
             ):
                 return len(self._entity_metadata)
 
@@ -128,22 +152,24 @@ class HAContextService:
                 if not ha_client.connected:
                     await ha_client.connect()
 
-                # Get entity registry via WebSocket (lightweight, no states)
-                # Note: For very large registries (>1000 entities), WebSocket may fail with "message too big"
-                # In that case, we'll use refresh_entities() which uses REST API
-                # If the registry already has entities from REST API, we can use those instead
+                # Get entity and area registries via WebSocket (lightweight, no states).
+                # Both commands run concurrently over the client's shared connection.
+                # If the entity registry can't be fetched but the registry already has
+                # entities from the REST API, we can use those instead
                 registry_already_has_entities = len(list(ha_client._entity_registry.all())) > 0
 
-                entity_registry_data = await ha_client._ws_command("config/entity_registry/list")
+                entity_registry_data, area_registry_data = await asyncio.gather(
+                    ha_client._ws_command("config/entity_registry/list"),
+                    ha_client._ws_command("config/area_registry/list"),
+                )
                 if not entity_registry_data:
                     logger.warning("No entity registry data from HA WebSocket - entity registry may be too large")
                     # If registry already has entities from REST API, populate metadata from those
                     if registry_already_has_entities:
                         logger.info("Using existing entity registry from REST API (WebSocket failed)")
                         # Populate metadata from existing registry
-                        self._entity_metadata.clear()
-                        for entity in ha_client._entity_registry.all():
-                            self._entity_metadata[entity.entity_id] = EntityMetadata(
+                        self._entity_metadata = {
+                            entity.entity_id: EntityMetadata(
                                 entity_id=entity.entity_id,
                                 domain=entity.domain,
                                 friendly_name=entity.friendly_name,
@@ -151,9 +177,10 @@ class HAContextService:
                                 device_id=entity.device_id,
                                 aliases=[],
                             )
+                            for entity in ha_client._entity_registry.all()
+                        }
                         logger.info("Populated %d entities from existing registry", len(self._entity_metadata))
-                        # Still try to get areas
-                        area_registry_data = await ha_client._ws_command("config/area_registry/list")
+                        # Still use the areas
                         if area_registry_data:
                             area_map: dict[str, str] = {}
                             for area in area_registry_data:
@@ -162,6 +189,7 @@ class HAContextService:
                                 if area_id and name:
                                     area_map[area_id] = name
                             self._area_names = list(area_map.values())
+                        self._index_metadata()
                         self._last_refresh = datetime.now()
                         return len(self._entity_metadata)
                     # No existing entities and WebSocket failed
@@ -171,8 +199,7 @@ class HAContextService:
                     # If we have existing metadata, keep it
                     return len(self._entity_metadata)
 
-                # Get area registry
-                area_registry_data = await ha_client._ws_command("config/area_registry/list")
+                # Map area registry
                 area_map: dict[str, str] = {}
                 if area_registry_data:
                     for area in area_registry_data:
@@ -181,50 +208,26 @@ class HAContextService:
                         if area_id and name:
                             area_map[area_id] = name
 
-                # Build metadata cache (no states!)
-                self._entity_metadata.clear()
+                # Build metadata cache (no states!) off to the side, then swap it in
+                metadata: dict[str, EntityMetadata] = {}
                 for entry in entity_registry_data:
-                    entity_id = entry.get("entity_id")
-                    if not entity_id:
-                        continue
-
-                    domain = entity_id.split(".")[0] if "." in entity_id else "unknown"
-                    friendly_name = entry.get("name") or entity_id
-                    area_id = entry.get("area_id")
-                    device_id = entry.get("device_id")
-                    aliases = entry.get("aliases", [])
-
-                    self._entity_metadata[entity_id] = EntityMetadata(
-                        entity_id=entity_id,
-                        domain=domain,
-                        friendly_name=friendly_name,
-                        area_id=area_id,
-                        device_id=device_id,
-                        aliases=aliases,
+                    meta = self._metadata_from_entry(entry)
+                    if meta is not None:
+                        metadata[meta.entity_id] = meta
+                self._entity_metadata = metadata
+
+                # Also populate HA client's EntityRegistry with metadata (for resolve_entity compatibility).
+                # Entities already known keep their state and device_class.
+                if ha_client and ha_client._entity_registry is not None:
+                    registry = ha_client._entity_registry
+                    ha_client._entity_registry.replace_all(
+                        self._entity_from_metadata(meta, registry.get(meta.entity_id))
+                        for meta in self._entity_metadata.values()
                     )
 
-                # Also populate HA client's EntityRegistry with metadata (for resolve_entity compatibility)
-                # This allows existing code to work, but without loading states
-                if ha_client and ha_client._entity_registry:
-                    from barnabeenet.services.homeassistant.entities import Entity, EntityState
-
-                    # Clear existing registry
-                    ha_client._entity_registry.clear()
-
-                    # Add entities with metadata only (no state)
-                    for meta in self._entity_metadata.values():
-                        entity = Entity(
-                            entity_id=meta.entity_id,
-                            domain=meta.domain,
-                            friendly_name=meta.friendly_name,
-                            area_id=meta.area_id,
-                            device_id=meta.device_id,
-                            state=EntityState(state="unknown"),  # Placeholder - state loaded just-in-time
-                        )
-                        ha_client._entity_registry.add(entity)
-
                 # Build area names list
                 self._area_names = list(area_map.values())
+                self._index_metadata()
 
                 self._last_refresh = datetime.now()
                 entity_count = len(self._entity_metadata)
@@ -263,22 +266,13 @@ class HAContextService:
         This helps Meta Agent understand if a request is about devices.
         """
         await self.refresh_metadata()
-
-        # Build entity names list
-        entity_names = [meta.friendly_name for meta in self._entity_metadata.values()]
-
-        # Build domain -> entity_ids mapping
-        entity_domains: dict[str, list[str]] = {}
-        for entity_id, meta in self._entity_metadata.items():
-            domain = meta.domain
-            if domain not in entity_domains:
-                entity_domains[domain] = []
-            entity_domains[domain].append(entity_id)
+        self._ensure_indexed()
 
         return HAContext(
-            entity_names=entity_names,
-            entity_domains=entity_domains,
+            entity_names=self._meta_entity_names,
+            entity_domains=self._meta_entity_domains,
             area_names=self._area_names,
+            mention_detector=self._mention_detector,
         )
 
     async def get_context_for_action_agent(
@@ -310,20 +304,13 @@ class HAContextService:
             entity_states: dict[str, Any] = {}
 
             if entity_ids:
-                # Load states for specific entities only (just-in-time)
-                for entity_id in entity_ids:
-                    try:
-                        if not ha_client._client:
-                            continue
-                        response = await ha_client._client.get(f"/api/states/{entity_id}")
-                        if response.status_code == 200:
-                            state_data = response.json()
-                            entity_states[entity_id] = {
-                                "state": state_data.get("state"),
-                                "attributes": state_data.get("attributes", {}),
-                            }
-                    except Exception as e:
-                        logger.debug("Failed to load state for %s: %s", entity_id, e)
+                # Read states for specific entities only from the state mirror
+                states = await ha_client.get_states(entity_ids)
+                for entity_id, state in states.items():
+                    entity_states[entity_id] = {
+                        "state": state.state,
+                        "attributes": state.attributes,
+                    }
             # Note: We don't load all states as fallback - that defeats the purpose of just-in-time loading
 
             # Build entity details from metadata
@@ -370,16 +357,16 @@ class HAContextService:
         """
         await self.refresh_metadata()
 
-        # Extract entity mentions from query (simple keyword matching)
+        # Extract entity mentions (friendly names or aliases) from the query
         mentioned_entities: list[str] = []
         if query:
-            query_lower = query.lower()
-            for entity_id, meta in self._entity_metadata.items():
-                # Check if friendly name or alias is mentioned
-                if meta.friendly_name.lower() in query_lower:
-                    mentioned_entities.append(entity_id)
-                elif any(alias.lower() in query_lower for alias in meta.aliases):
-                    mentioned_entities.append(entity_id)
+            mentioned_entities = list(
+                dict.fromkeys(
+                    mention.target
+                    for mention in self.mention_detector.find_all(query)
+                    if mention.kind != MENTION_AREA
+                )
+            )
 
         # Load states just-in-time for mentioned entities
         entity_states: dict[str, Any] = {}
@@ -388,22 +375,20 @@ class HAContextService:
         if mentioned_entities:
             ha_client = await self.get_ha_client()
             if ha_client and ha_client.connected:
-                for entity_id in mentioned_entities:
-                    if entity_id in self._entity_metadata:
-                        entity_details[entity_id] = self._entity_metadata[entity_id]
-
-                        # Load state just-in-time
-                        try:
-                            if ha_client._client:
-                                response = await ha_client._client.get(f"/api/states/{entity_id}")
-                                if response.status_code == 200:
-                                    state_data = response.json()
-                                    entity_states[entity_id] = {
-                                        "state": state_data.get("state"),
-                                        "attributes": state_data.get("attributes", {}),
-                                    }
-                        except Exception:
-                            pass
+                known = [e for e in mentioned_entities if e in self._entity_metadata]
+                for entity_id in known:
+                    entity_details[entity_id] = self._entity_metadata[entity_id]
+
+                # Load states just-in-time from the state mirror
+                try:
+                    states = await ha_client.get_states(known)
+                except Exception:
+                    states = {}
+                for entity_id, state in states.items():
+                    entity_states[entity_id] = {
+                        "state": state.state,
+                        "attributes": state.attributes,
+                    }
 
         return HAContext(
             entity_names=[meta.friendly_name for meta in self._entity_metadata.values()],
@@ -420,6 +405,79 @@ class HAContextService:
             entity_details=entity_details,
         )
 
+    # =========================================================================
+    # Registry Sync
+    # =========================================================================
+
+    def _attach_client(self, ha_client: HomeAssistantClient) -> None:
+        """Follow the client's registry updates (once per client)."""
+        if self._synced_client is ha_client:
+            return
+        if self._synced_client is not None:
+            self._synced_client.remove_registry_callback(self._on_registry_update)
+        ha_client.add_registry_callback(self._on_registry_update)
+        self._synced_client = ha_client
+
+    def _on_registry_update(self, update: RegistryUpdate) -> None:
+        """Apply a registry delta to the metadata cache in place."""
+        if update.registry == "entity" and update.item_id:
+            if update.old_item_id:
+                self._entity_metadata.pop(update.old_item_id, None)
+            if update.action == "remove":
+                self._entity_metadata.pop(update.item_id, None)
+            elif update.entry is not None:
+                meta = self._metadata_from_entry(update.entry)
+                if meta is not None:
+                    self._entity_metadata[meta.entity_id] = meta
+        elif update.registry == "area" and self._synced_client is not None:
+            self._area_names = [area.name for area in self._synced_client.areas.values()]
+        elif update.registry == "all":
+            # Events were missed; rebuild on next access
+            self._last_refresh = None
+            return
+        else:
+            return
+        self._index_metadata()
+
+    def _metadata_from_entry(self, entry: dict[str, Any]) -> EntityMetadata | None:
+        """Build metadata from an entity registry entry."""
+        entity_id = entry.get("entity_id")
+        if not entity_id:
+            return None
+
+        # Registry entries only carry a name when the user set one
+        existing = None
+        if self._ha_client is not None:
+            existing = self._ha_client._entity_registry.get(entity_id)
+        friendly_name = (
+            entry.get("name")
+            or (existing.friendly_name if existing else None)
+            or entry.get("original_name")
+            or entity_id
+        )
+        return EntityMetadata(
+            entity_id=entity_id,
+            domain=entity_id.split(".")[0] if "." in entity_id else "unknown",
+            friendly_name=friendly_name,
+            area_id=entry.get("area_id"),
+            device_id=entry.get("device_id"),
+            aliases=entry.get("aliases", []),
+        )
+
+    @staticmethod
+    def _entity_from_metadata(meta: EntityMetadata, existing: Entity | None) -> Entity:
+        """Registry entity for metadata, keeping a known entity's state."""
+        return Entity(
+            entity_id=meta.entity_id,
+            domain=meta.domain,
+            friendly_name=meta.friendly_name,
+            device_class=existing.device_class if existing else None,
+            area_id=meta.area_id,
+            device_id=meta.device_id,
+            # Placeholder if unknown - state loaded just-in-time
+            state=existing.state if existing else EntityState(state="unknown"),
+        )
+
     def get_entity_metadata(self, entity_id: str) -> EntityMetadata | None:
         """Get metadata for a specific entity (from cache, no API call)."""
         return self._entity_metadata.get(entity_id)
@@ -429,7 +487,17 @@ class HAContextService:
         results: list[EntityMetadata] = []
         name_lower = name.lower()
 
-        for meta in self._entity_metadata.values():
+        self._ensure_indexed()
+        candidate_ids = self._name_index.candidates(name_lower)
+        if candidate_ids is None:
+            candidates = list(self._entity_metadata.values())
+        else:
+            candidates = [
+                self._entity_metadata[eid]
+                for eid in sorted(candidate_ids, key=self._name_order.__getitem__)
+            ]
+
+        for meta in candidates:
             if domain and meta.domain != domain:
                 continue
 
@@ -442,6 +510,62 @@ class HAContextService:
 
         return results
 
+    @property
+    def mention_detector(self) -> MentionDetector:
+        """Detector for entity names, aliases and area names in text."""
+        self._ensure_indexed()
+        return self._mention_detector
+
+    def _ensure_indexed(self) -> None:
+        # Catches metadata set without a refresh (e.g. tests, mock mode)
+        if len(self._name_order) != len(self._entity_metadata):
+            self._index_metadata()
+
+    def _index_metadata(self) -> None:
+        """Rebuild lookups derived from the metadata cache if it changed.
+
+        Covers the name index, the mention detector and the Meta Agent's
+        entity name/domain lists, which otherwise would be rebuilt per request.
+        """
+        fingerprint = hash(
+            (
+                tuple(
+                    (eid, meta.domain, meta.friendly_name, tuple(meta.aliases))
+                    for eid, meta in self._entity_metadata.items()
+                ),
+                tuple(self._area_names),
+            )
+        )
+        if fingerprint == self._metadata_fingerprint and len(self._name_order) == len(
+            self._entity_metadata
+        ):
+            return
+        self._metadata_fingerprint = fingerprint
+
+        self._name_index.clear()
+        self._name_order.clear()
+        entity_domains: dict[str, list[str]] = {}
+        names: list[tuple[str, str, str]] = []
+        for position, (entity_id, meta) in enumerate(self._entity_metadata.items()):
+            self._name_order[entity_id] = position
+            self._name_index.add(
+                entity_id,
+                [meta.friendly_name.lower(), *(alias.lower() for alias in meta.aliases)],
+            )
+            entity_domains.setdefault(meta.domain, []).append(entity_id)
+            names.append((meta.friendly_name, MENTION_ENTITY, entity_id))
+            names.extend((alias, MENTION_ALIAS, entity_id) for alias in meta.aliases)
+        names.extend((area, MENTION_AREA, area) for area in self._area_names)
+
+        self._mention_detector = MentionDetector(names)
+        self._meta_entity_names = [meta.friendly_name for meta in self._entity_metadata.values()]
+        self._meta_entity_domains = entity_domains
+        logger.debug(
+            "Indexed HA metadata: %d entities, %d mention patterns",
+            len(self._entity_metadata),
+            len(self._mention_detector),
+        )
+
     async def resolve_entity_with_state(
         self, name: str, domain: str | None = None
     ) -> dict[str, Any] | None:
@@ -508,6 +632,7 @@ async def get_ha_context_service(
 
     elif ha_client and _context_service._ha_client is None:
         _context_service._ha_client = ha_client
+        _context_service._attach_client(ha_client)
 
     return _context_service
 
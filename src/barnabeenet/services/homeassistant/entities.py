@@ -10,8 +10,10 @@ from __future__ import annotations
 
 import logging
 import re
-from collections.abc import Iterator
+from collections import Counter
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Any
 
 logger = logging.getLogger(__name__)
@@ -26,6 +28,16 @@ class EntityState:
     last_changed: str | None = None
     last_updated: str | None = None
 
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> EntityState:
+        """Build from a Home Assistant state object (REST or WebSocket)."""
+        return cls(
+            state=data.get("state", "unknown"),
+            attributes=data.get("attributes", {}),
+            last_changed=data.get("last_changed"),
+            last_updated=data.get("last_updated"),
+        )
+
     @property
     def is_on(self) -> bool:
         """Check if entity is in 'on' state."""
@@ -53,6 +65,7 @@ class Entity:
     area_id: str | None = None
     device_id: str | None = None
     state: EntityState | None = None
+    _match_key: _NameKey | None = field(default=None, init=False, repr=False, compare=False)
 
     @property
     def name(self) -> str:
@@ -108,73 +121,201 @@ class Entity:
         Returns:
             Match score from 0.0 to 1.0
         """
-        query_lower = query.lower().strip()
-        name_lower = self.friendly_name.lower()
-        entity_id_lower = self.entity_id.lower()
+        return _score_name(self._name_key(), _parse_query(query))
 
-        # Exact match = perfect score
-        if query_lower == name_lower or query_lower == entity_id_lower:
-            return 1.0
+    def _name_key(self) -> _NameKey:
+        """Return the normalized name forms, rebuilding them if the names changed."""
+        key = self._match_key
+        if (
+            key is None
+            or key.entity_id != self.entity_id
+            or key.friendly_name != self.friendly_name
+        ):
+            key = self._match_key = _NameKey.build(self.entity_id, self.friendly_name)
+        return key
 
-        # Name starts with query = high score
-        if name_lower.startswith(query_lower):
-            return 0.9
 
-        # Query is a whole word in name = good score
-        pattern = rf"\b{re.escape(query_lower)}\b"
-        if re.search(pattern, name_lower):
-            return 0.8
+# =============================================================================
+# Name Matching
+# =============================================================================
 
-        # Query appears in name = moderate score
-        if query_lower in name_lower:
-            return 0.5 + (len(query_lower) / len(name_lower)) * 0.3
-
-        # Check if all query words appear in name (allows words in between)
-        # "office light" matches "Office Switch Light" because both words present
-        query_words = query_lower.split()
-        if len(query_words) > 1:
-            name_words = name_lower.split()
-            name_words_set = set(name_words)
-            matching_words = sum(1 for w in query_words if w in name_words_set)
-            if matching_words == len(query_words):
-                # All words match - score based on name conciseness
-                # Prefer "Office Switch Light" (3 words) over "Office Door Status Light" (4 words)
-                # when matching "office light" (2 words)
-                base_score = 0.7
-                # Bonus for shorter names (fewer extra words)
-                name_word_count = len(name_words)
-                extra_words = name_word_count - len(query_words)
-                # Penalize extra words: 0 extra = +0.15, 1 extra = +0.1, 2+ extra = +0.05
-                conciseness_bonus = max(0.05, 0.15 - extra_words * 0.05)
-                return min(0.85, base_score + conciseness_bonus)
-            elif matching_words >= len(query_words) - 1:
-                # Most words match - moderate score
-                return 0.4 + (matching_words / len(query_words)) * 0.2
-
-        # Check entity_id for matches (e.g., switch.office_switch_light)
-        entity_name_part = (
-            entity_id_lower.split(".")[-1] if "." in entity_id_lower else entity_id_lower
+
+@dataclass(frozen=True, slots=True)
+class _NameKey:
+    """Normalized forms of an entity's names, computed once per name change."""
+
+    entity_id: str
+    friendly_name: str
+    name_lower: str
+    entity_id_lower: str
+    name_word_count: int
+    name_words: frozenset[str]
+    id_part: str  # entity_id without the domain, e.g. "office_switch_light"
+    id_words: frozenset[str]
+
+    @classmethod
+    def build(cls, entity_id: str, friendly_name: str) -> _NameKey:
+        name_lower = friendly_name.lower()
+        entity_id_lower = entity_id.lower()
+        name_words = name_lower.split()
+        id_part = entity_id_lower.split(".")[-1] if "." in entity_id_lower else entity_id_lower
+        return cls(
+            entity_id=entity_id,
+            friendly_name=friendly_name,
+            name_lower=name_lower,
+            entity_id_lower=entity_id_lower,
+            name_word_count=len(name_words),
+            name_words=frozenset(name_words),
+            id_part=id_part,
+            id_words=frozenset(id_part.replace("_", " ").split()),
         )
-        if query_lower in entity_name_part:
-            return 0.4 + (len(query_lower) / len(entity_name_part)) * 0.2
 
-        # Check if query words appear in entity_id
-        if len(query_words) > 1:
-            entity_words = set(entity_name_part.replace("_", " ").split())
-            matching_words = sum(1 for w in query_words if w in entity_words)
-            if matching_words == len(query_words):
-                return 0.6
-            elif matching_words > 0:
-                return 0.3 + (matching_words / len(query_words)) * 0.2
 
-        # Also check if query matches entity_id part as a phrase (e.g., "office switch" matches "office_switch")
-        # This handles cases where user says "office switch" but entity is "light.office_switch"
-        query_phrase = query_lower.replace(" ", "_")
-        if query_phrase in entity_name_part or entity_name_part in query_phrase:
-            # Good match if query phrase appears in entity_id
-            return 0.65
+@dataclass(frozen=True, slots=True)
+class _NameQuery:
+    """A parsed name query, shared by every entity it is scored against."""
+
+    text: str
+    words: tuple[str, ...]
+    phrase: str  # text with spaces as underscores, to match entity_id parts
+    word_pattern: re.Pattern[str]
+
+
+@lru_cache(maxsize=1024)
+def _parse_query(query: str) -> _NameQuery:
+    text = query.lower().strip()
+    return _NameQuery(
+        text=text,
+        words=tuple(text.split()),
+        phrase=text.replace(" ", "_"),
+        word_pattern=re.compile(rf"\b{re.escape(text)}\b"),
+    )
+
+
+def _score_name(key: _NameKey, query: _NameQuery) -> float:
+    """Score how well an entity's names match a query (0.0 to 1.0)."""
+    query_lower = query.text
+    name_lower = key.name_lower
+
+    # Exact match = perfect score
+    if query_lower == name_lower or query_lower == key.entity_id_lower:
+        return 1.0
+
+    # Name starts with query = high score
+    if name_lower.startswith(query_lower):
+        return 0.9
+
+    # Query is a whole word in name = good score
+    if query.word_pattern.search(name_lower):
+        return 0.8
+
+    # Query appears in name = moderate score
+    if query_lower in name_lower:
+        return 0.5 + (len(query_lower) / len(name_lower)) * 0.3
+
+    # Check if all query words appear in name (allows words in between)
+    # "office light" matches "Office Switch Light" because both words present
+    query_words = query.words
+    if len(query_words) > 1:
+        matching_words = sum(1 for w in query_words if w in key.name_words)
+        if matching_words == len(query_words):
+            # All words match - score based on name conciseness
+            # Prefer "Office Switch Light" (3 words) over "Office Door Status Light" (4 words)
+            # when matching "office light" (2 words)
+            base_score = 0.7
+            # Penalize extra words: 0 extra = +0.15, 1 extra = +0.1, 2+ extra = +0.05
+            extra_words = key.name_word_count - len(query_words)
+            conciseness_bonus = max(0.05, 0.15 - extra_words * 0.05)
+            return min(0.85, base_score + conciseness_bonus)
+        elif matching_words >= len(query_words) - 1:
+            # Most words match - moderate score
+            return 0.4 + (matching_words / len(query_words)) * 0.2
+
+    # Check entity_id for matches (e.g., switch.office_switch_light)
+    entity_name_part = key.id_part
+    if query_lower in entity_name_part:
+        return 0.4 + (len(query_lower) / len(entity_name_part)) * 0.2
+
+    # Check if query words appear in entity_id
+    if len(query_words) > 1:
+        matching_words = sum(1 for w in query_words if w in key.id_words)
+        if matching_words == len(query_words):
+            return 0.6
+        elif matching_words > 0:
+            return 0.3 + (matching_words / len(query_words)) * 0.2
+
+    # Also check if query matches entity_id part as a phrase (e.g., "office switch" matches "office_switch")
+    # This handles cases where user says "office switch" but entity is "light.office_switch"
+    if query.phrase in entity_name_part or entity_name_part in query.phrase:
+        return 0.65
+
+    return 0.0
+
+
+def _trigrams(text: str) -> set[str]:
+    return {text[i : i + 3] for i in range(len(text) - 2)}
+
+
+class TrigramIndex:
+    """Substring lookup over short strings using a trigram inverted index.
+
+    Each key is indexed by the trigrams of one or more texts. ``candidates``
+    returns every key whose texts contain all trigrams of a substring: a
+    superset of the true matches, so callers verify what it returns.
+    """
+
+    def __init__(self) -> None:
+        self._postings: dict[str, set[str]] = {}
+        self._grams: dict[str, set[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._grams)
+
+    def add(self, key: str, texts: Iterable[str]) -> None:
+        """Index (or re-index) a key under the given texts."""
+        self.remove(key)
+        grams: set[str] = set()
+        for text in texts:
+            grams |= _trigrams(text)
+        self._grams[key] = grams
+        for gram in grams:
+            self._postings.setdefault(gram, set()).add(key)
+
+    def remove(self, key: str) -> None:
+        """Drop a key from the index."""
+        for gram in self._grams.pop(key, ()):
+            keys = self._postings[gram]
+            keys.discard(key)
+            if not keys:
+                del self._postings[gram]
 
-        return 0.0
+    def clear(self) -> None:
+        """Drop all keys."""
+        self._postings.clear()
+        self._grams.clear()
+
+    def candidates(self, substring: str) -> set[str] | None:
+        """Return keys that may contain ``substring``.
+
+        Returns:
+            Candidate keys, or None if the substring is too short to narrow
+            the search (callers should scan everything).
+        """
+        if len(substring) < 3:
+            return None
+        postings: list[set[str]] = []
+        for gram in _trigrams(substring):
+            keys = self._postings.get(gram)
+            if not keys:
+                return set()
+            postings.append(keys)
+        postings.sort(key=len)
+        result = set(postings[0])
+        for keys in postings[1:]:
+            result &= keys
+            if not result:
+                break
+        return result
 
 
 class EntityRegistry:
@@ -185,6 +326,10 @@ class EntityRegistry:
     - friendly name (fuzzy matching)
     - domain
     - area/room
+
+    Name lookups go through an index kept up to date by ``add``/``remove``,
+    so only entities that can score above zero are scored. Entities whose
+    names change must be re-added to be re-indexed.
     """
 
     def __init__(self) -> None:
@@ -192,25 +337,48 @@ class EntityRegistry:
         self._by_domain: dict[str, list[str]] = {}
         self._by_area: dict[str, list[str]] = {}
 
+        # Name index
+        self._order: dict[str, int] = {}  # entity_id -> insertion order, for stable ranking
+        self._next_order = 0
+        self._indexed_keys: dict[str, _NameKey] = {}
+        self._by_id_lower: dict[str, set[str]] = {}
+        self._by_id_part: dict[str, set[str]] = {}
+        self._id_part_lengths: Counter[int] = Counter()
+        self._by_token: dict[str, set[str]] = {}
+        self._trigrams = TrigramIndex()
+
     def __len__(self) -> int:
         return len(self._entities)
 
     def add(self, entity: Entity) -> None:
-        """Add an entity to the registry."""
-        self._entities[entity.entity_id] = entity
+        """Add an entity to the registry, replacing any with the same entity_id."""
+        entity_id = entity.entity_id
+        previous = self._entities.get(entity_id)
+        if previous is not None:
+            self._unindex_name(entity_id)
+            if previous.domain != entity.domain:
+                self._discard(self._by_domain, previous.domain, entity_id)
+            if previous.area_id and previous.area_id != entity.area_id:
+                self._discard(self._by_area, previous.area_id, entity_id)
+        else:
+            self._order[entity_id] = self._next_order
+            self._next_order += 1
+
+        self._entities[entity_id] = entity
+        self._index_name(entity)
 
         # Index by domain
         if entity.domain not in self._by_domain:
             self._by_domain[entity.domain] = []
-        if entity.entity_id not in self._by_domain[entity.domain]:
-            self._by_domain[entity.domain].append(entity.entity_id)
+        if entity_id not in self._by_domain[entity.domain]:
+            self._by_domain[entity.domain].append(entity_id)
 
         # Index by area
         if entity.area_id:
             if entity.area_id not in self._by_area:
                 self._by_area[entity.area_id] = []
-            if entity.entity_id not in self._by_area[entity.area_id]:
-                self._by_area[entity.area_id].append(entity.entity_id)
+            if entity_id not in self._by_area[entity.area_id]:
+                self._by_area[entity.area_id].append(entity_id)
 
     def remove(self, entity_id: str) -> bool:
         """Remove an entity from the registry.
@@ -222,18 +390,16 @@ class EntityRegistry:
             return False
 
         entity = self._entities.pop(entity_id)
+        self._order.pop(entity_id, None)
+        self._unindex_name(entity_id)
 
         # Remove from domain index
         if entity.domain in self._by_domain:
-            self._by_domain[entity.domain] = [
-                eid for eid in self._by_domain[entity.domain] if eid != entity_id
-            ]
+            self._discard(self._by_domain, entity.domain, entity_id)
 
         # Remove from area index
         if entity.area_id and entity.area_id in self._by_area:
-            self._by_area[entity.area_id] = [
-                eid for eid in self._by_area[entity.area_id] if eid != entity_id
-            ]
+            self._discard(self._by_area, entity.area_id, entity_id)
 
         return True
 
@@ -242,6 +408,24 @@ class EntityRegistry:
         self._entities.clear()
         self._by_domain.clear()
         self._by_area.clear()
+        self._order.clear()
+        self._indexed_keys.clear()
+        self._by_id_lower.clear()
+        self._by_id_part.clear()
+        self._id_part_lengths.clear()
+        self._by_token.clear()
+        self._trigrams.clear()
+
+    def replace_all(self, entities: Iterable[Entity]) -> None:
+        """Replace the registry contents in one step.
+
+        The new contents are indexed off to the side and swapped in, so
+        readers never see an empty or partially built registry.
+        """
+        fresh = EntityRegistry()
+        for entity in entities:
+            fresh.add(entity)
+        self.__dict__.update(fresh.__dict__)
 
     def get(self, entity_id: str) -> Entity | None:
         """Get entity by exact entity_id."""
@@ -276,13 +460,10 @@ class EntityRegistry:
             return self._entities[name]
 
         # Search for best match
-        candidates = self.get_by_domain(domain) if domain else list(self._entities.values())
-
         best_match: Entity | None = None
         best_score = 0.0
 
-        for entity in candidates:
-            score = entity.match_score(name)
+        for score, entity in self._scored_matches(name, domain=domain):
             if score > best_score:
                 best_score = score
                 best_match = entity
@@ -311,27 +492,111 @@ class EntityRegistry:
         Returns:
             List of matching entities, sorted by relevance.
         """
-        # Start with all entities or domain-filtered
-        if domain:
+        scored = list(self._scored_matches(query, domain=domain, area=area))
+        scored.sort(key=lambda x: x[0], reverse=True)
+        return [entity for _, entity in scored[:limit]]
+
+    # =========================================================================
+    # Name Index
+    # =========================================================================
+
+    def _scored_matches(
+        self,
+        query: str,
+        domain: str | None = None,
+        area: str | None = None,
+    ) -> Iterator[tuple[float, Entity]]:
+        """Yield (score, entity) for every entity scoring above zero, in registry order."""
+        parsed = _parse_query(query)
+        candidate_ids = self._name_candidates(parsed)
+
+        candidates: Iterable[Entity]
+        if candidate_ids is not None:
+            candidates = [
+                self._entities[eid] for eid in sorted(candidate_ids, key=self._order.__getitem__)
+            ]
+        elif domain:
             candidates = self.get_by_domain(domain)
         elif area:
             candidates = self.get_by_area(area)
         else:
             candidates = list(self._entities.values())
 
-        # Apply area filter if domain was used
-        if domain and area:
-            candidates = [e for e in candidates if e.area_id == area]
-
-        # Score and sort
-        scored: list[tuple[float, Entity]] = []
         for entity in candidates:
-            score = entity.match_score(query)
+            if domain and entity.domain != domain:
+                continue
+            if area and entity.area_id != area:
+                continue
+            score = _score_name(entity._name_key(), parsed)
             if score > 0.0:
-                scored.append((score, entity))
+                yield score, entity
 
-        scored.sort(key=lambda x: x[0], reverse=True)
-        return [entity for _, entity in scored[:limit]]
+    def _name_candidates(self, query: _NameQuery) -> set[str] | None:
+        """Collect entity_ids that can score above zero for a query.
+
+        Each non-zero branch of ``_score_name`` needs either the query (or its
+        underscore phrase) inside a name, a shared word, an exact entity_id,
+        or the entity_id part inside the phrase; each has an index here.
+
+        Returns:
+            Candidate entity_ids, or None when the query is too short to
+            narrow the search.
+        """
+        text = query.text
+        phrase = query.phrase
+        found = self._trigrams.candidates(text)
+        if found is None:
+            return None
+        if phrase != text:
+            found |= self._trigrams.candidates(phrase) or set()
+        found |= self._by_id_lower.get(text, set())
+
+        if len(query.words) > 1:
+            for word in query.words:
+                found |= self._by_token.get(word, set())
+
+        # entity_id parts contained in the phrase ("kitchen" in "kitchen_light_please")
+        for length in self._id_part_lengths:
+            for i in range(len(phrase) - length + 1):
+                found |= self._by_id_part.get(phrase[i : i + length], set())
+
+        return found
+
+    def _index_name(self, entity: Entity) -> None:
+        entity_id = entity.entity_id
+        key = entity._name_key()
+        self._indexed_keys[entity_id] = key
+        self._by_id_lower.setdefault(key.entity_id_lower, set()).add(entity_id)
+        self._by_id_part.setdefault(key.id_part, set()).add(entity_id)
+        self._id_part_lengths[len(key.id_part)] += 1
+        for token in key.name_words | key.id_words:
+            self._by_token.setdefault(token, set()).add(entity_id)
+        self._trigrams.add(entity_id, (key.name_lower, key.id_part))
+
+    def _unindex_name(self, entity_id: str) -> None:
+        key = self._indexed_keys.pop(entity_id, None)
+        if key is None:
+            return
+        self._discard_id(self._by_id_lower, key.entity_id_lower, entity_id)
+        self._discard_id(self._by_id_part, key.id_part, entity_id)
+        self._id_part_lengths[len(key.id_part)] -= 1
+        if not self._id_part_lengths[len(key.id_part)]:
+            del self._id_part_lengths[len(key.id_part)]
+        for token in key.name_words | key.id_words:
+            self._discard_id(self._by_token, token, entity_id)
+        self._trigrams.remove(entity_id)
+
+    @staticmethod
+    def _discard(index: dict[str, list[str]], bucket: str, entity_id: str) -> None:
+        index[bucket] = [eid for eid in index.get(bucket, []) if eid != entity_id]
+
+    @staticmethod
+    def _discard_id(index: dict[str, set[str]], bucket: str, entity_id: str) -> None:
+        ids = index.get(bucket)
+        if ids is not None:
+            ids.discard(entity_id)
+            if not ids:
+                del index[bucket]
 
     @property
     def domains(self) -> list[str]:
@@ -0,0 +1,150 @@
+"""Entity and area mention detection.
+
+Finds every known entity name, alias and area name in an utterance in a
+single pass over the text, using an Aho-Corasick automaton compiled from
+the HA metadata cache. The automaton is rebuilt only when the metadata
+changes, so per-request cost is linear in the utterance length rather than
+in the number of entities.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+MENTION_ENTITY = "entity"
+MENTION_ALIAS = "alias"
+MENTION_AREA = "area"
+
+
+@dataclass(frozen=True, slots=True)
+class Mention:
+    """A known name found in text.
+
+    ``start``/``end`` index into the lowercased text, which matches the
+    original for everything but a few non-ASCII characters.
+    """
+
+    start: int
+    end: int
+    name: str  # Name as registered (original casing)
+    kind: str  # MENTION_ENTITY, MENTION_ALIAS or MENTION_AREA
+    target: str  # entity_id for entities/aliases, area_id (or name) for areas
+
+    @property
+    def length(self) -> int:
+        return self.end - self.start
+
+
+class MentionDetector:
+    """Multi-pattern matcher over entity names, aliases and area names.
+
+    Patterns are matched case-insensitively. A name shared by several
+    targets (two entities both called "Lamp") yields one mention per target.
+    """
+
+    def __init__(self, names: Iterable[tuple[str, str, str]] = ()) -> None:
+        """Compile the automaton.
+
+        Args:
+            names: (name, kind, target) triples to detect.
+        """
+        # Trie: per-node transitions, failure links and matched pattern ids
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._out: list[list[int]] = [[]]
+        self._patterns: list[tuple[int, list[tuple[str, str, str]]]] = []
+        self._pattern_ids: dict[str, int] = {}
+
+        for name, kind, target in names:
+            self._add(name, kind, target)
+        self._link()
+
+    def __len__(self) -> int:
+        return len(self._patterns)
+
+    def _add(self, name: str, kind: str, target: str) -> None:
+        pattern = name.lower().strip()
+        if not pattern:
+            return
+        pattern_id = self._pattern_ids.get(pattern)
+        if pattern_id is None:
+            node = 0
+            for char in pattern:
+                next_node = self._goto[node].get(char)
+                if next_node is None:
+                    next_node = len(self._goto)
+                    self._goto[node][char] = next_node
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append([])
+                node = next_node
+            pattern_id = len(self._patterns)
+            self._pattern_ids[pattern] = pattern_id
+            self._patterns.append((len(pattern), []))
+            self._out[node].append(pattern_id)
+        entry = (name, kind, target)
+        payloads = self._patterns[pattern_id][1]
+        if entry not in payloads:
+            payloads.append(entry)
+
+    def _link(self) -> None:
+        """Compute failure links breadth-first and merge suffix outputs."""
+        queue: deque[int] = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, child in self._goto[node].items():
+                queue.append(child)
+                fallback = self._fail[node]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                link = self._goto[fallback].get(char, 0)
+                self._fail[child] = link
+                self._out[child] = self._out[child] + self._out[self._fail[child]]
+
+    def find_all(self, text: str, whole_words: bool = False) -> list[Mention]:
+        """Return every mention in ``text``, ordered by start then longest first.
+
+        Args:
+            text: Text to scan.
+            whole_words: Only report names not embedded in a longer word
+                ("hall" does not match inside "hallway").
+        """
+        if not self._patterns:
+            return []
+        text_lower = text.lower()
+        mentions: list[Mention] = []
+        node = 0
+        for index, char in enumerate(text_lower):
+            while node and char not in self._goto[node]:
+                node = self._fail[node]
+            node = self._goto[node].get(char, 0)
+            for pattern_id in self._out[node]:
+                length, payloads = self._patterns[pattern_id]
+                start = index + 1 - length
+                if whole_words and not _at_word_bounds(text_lower, start, index + 1):
+                    continue
+                for name, kind, target in payloads:
+                    mentions.append(Mention(start, index + 1, name, kind, target))
+        mentions.sort(key=lambda m: (m.start, -m.length))
+        return mentions
+
+    def longest(
+        self, text: str, kinds: Iterable[str] | None = None, whole_words: bool = True
+    ) -> Mention | None:
+        """Return the longest mention of the given kinds (earliest on ties)."""
+        allowed = set(kinds) if kinds is not None else None
+        best: Mention | None = None
+        for mention in self.find_all(text, whole_words=whole_words):
+            if allowed is not None and mention.kind not in allowed:
+                continue
+            if best is None or mention.length > best.length:
+                best = mention
+        return best
+
+
+def _at_word_bounds(text: str, start: int, end: int) -> bool:
+    return (start == 0 or not text[start - 1].isalnum()) and (
+        end == len(text) or not text[end].isalnum()
+    )
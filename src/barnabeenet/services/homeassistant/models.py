@@ -5,6 +5,7 @@ Extended models for comprehensive HA integration:
 - Areas (rooms/zones)
 - Automations (automation states and configs)
 - Integrations (config entries)
+- Registry update notifications
 """
 
 from __future__ import annotations
@@ -210,6 +211,21 @@ class StateChangeEvent:
         }
 
 
+@dataclass
+class RegistryUpdate:
+    """A change to one of Home Assistant's registries.
+
+    Produced from ``*_registry_updated`` events after the client has
+    applied the change to its own registries.
+    """
+
+    registry: str  # "entity", "device", "area", "floor", or "all" after a resync
+    action: str  # "create", "update", "remove" ("resync" for registry="all")
+    item_id: str | None = None  # entity_id / device_id / area_id / floor_id
+    entry: dict[str, Any] | None = None  # Full registry entry (entity create/update)
+    old_item_id: str | None = None  # Previous entity_id when an entity was renamed
+
+
 @dataclass
 class HADataSnapshot:
     """Complete snapshot of Home Assistant data.
@@ -15,6 +15,14 @@ import re
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
+from barnabeenet.services.homeassistant.mentions import (
+    MENTION_ALIAS,
+    MENTION_AREA,
+    MENTION_ENTITY,
+    Mention,
+    MentionDetector,
+)
+
 if TYPE_CHECKING:
     from barnabeenet.services.homeassistant.client import HomeAssistantClient
     from barnabeenet.services.homeassistant.entities import Entity
@@ -184,8 +192,13 @@ class SmartEntityResolver:
     - Cross-domain matching
     """
 
-    def __init__(self, ha_client: HomeAssistantClient) -> None:
+    def __init__(
+        self,
+        ha_client: HomeAssistantClient,
+        mention_detector: MentionDetector | None = None,
+    ) -> None:
         self._ha = ha_client
+        self._mentions = mention_detector or MentionDetector()
         self._area_lookup: dict[str, str] = {}  # alias -> area_id
         self._floor_lookup: dict[str, str] = {}  # alias -> floor_id
         self._init_lookups()
@@ -222,6 +235,13 @@ class SmartEntityResolver:
         if area_id:
             return self._ha.get_area(area_id)
 
+        # Area name mentioned within a longer phrase - "the living room please"
+        mention = self._mentions.longest(text, kinds=(MENTION_AREA,))
+        if mention:
+            area = self._ha.find_area_by_name(mention.name)
+            if area:
+                return area
+
         # Try partial matching - "girls room" in "girls_room"
         for area in self._ha.areas.values():
             if text_lower in area.name.lower() or text_lower in area.id.lower():
@@ -233,6 +253,10 @@ class SmartEntityResolver:
 
         return None
 
+    def find_mentions(self, text: str) -> list[Mention]:
+        """Find known entity names, aliases and area names in text (whole words)."""
+        return self._mentions.find_all(text, whole_words=True)
+
     def resolve_floor(self, text: str) -> str | None:
         """Resolve a text phrase to a floor ID."""
         text_lower = text.lower().strip()
@@ -589,6 +613,13 @@ class SmartEntityResolver:
             if entity:
                 candidates.append((entity.match_score(entity_name), entity))
 
+        if not candidates:
+            # Entity named inside a longer phrase - "the kitchen lamp by the window"
+            mention = self._mentions.longest(entity_name, kinds=(MENTION_ENTITY, MENTION_ALIAS))
+            entity = self._ha.entities.get(mention.target) if mention else None
+            if entity:
+                candidates.append((entity.match_score(mention.name), entity))
+
         if candidates:
             candidates.sort(key=lambda x: x[0], reverse=True)
             best_entity = candidates[0][1]
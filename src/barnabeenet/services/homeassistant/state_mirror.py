@@ -0,0 +1,416 @@
+"""In-memory mirror of Home Assistant entity states.
+
+Loaded from a single ``/api/states`` snapshot and kept current by the
+``state_changed`` WebSocket stream, so state lookups are dictionary reads
+instead of one REST round-trip per entity.
+
+Freshness:
+- While the event stream is connected (and was connected before the last
+  snapshot was requested), the mirror is *live*: every change reaches it.
+- Otherwise it is only as fresh as its last snapshot. Callers re-snapshot
+  once it is older than ``max_age`` seconds.
+
+Indexes: the mirror maintains secondary indexes that are updated with
+every applied change, so filters like "open doors upstairs" or "batteries
+below 20%" are set intersections and range scans rather than domain scans:
+- (domain, state) and device_class, derived from the states themselves
+- the words of each entity's object id (``binary_sensor.front_door`` ->
+  "front", "door"), for name-based fallbacks
+- area and floor, from registry assignments pushed in by the client
+- sorted numeric indexes for battery levels and numeric sensor values
+
+Ordering: events can arrive while a snapshot request is in flight. Each
+entity keeps the state with the newest ``last_updated`` (a state seen
+again with the same timestamp is not a change), and entities
+changed by an event during the request are not dropped just because the
+(older) snapshot lacks them.
+"""
+
+from __future__ import annotations
+
+import bisect
+import time
+from collections.abc import Iterable, Iterator
+from typing import Any
+
+from barnabeenet.services.homeassistant.entities import EntityState
+
+# Snapshot age after which a non-live mirror is refreshed before use
+DEFAULT_MAX_AGE_SEC = 30.0
+
+# Numeric index names
+NUMERIC_BATTERY = "battery"
+NUMERIC_SENSOR = "sensor"
+
+
+class NumericIndex:
+    """Sorted (value, entity_id) index supporting range queries."""
+
+    def __init__(self) -> None:
+        """Initialize an empty index."""
+        self._entries: list[tuple[float, str]] = []
+        self._values: dict[str, float] = {}
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def get(self, entity_id: str) -> float | None:
+        """Return an entity's indexed value."""
+        return self._values.get(entity_id)
+
+    def set(self, entity_id: str, value: float | None) -> None:
+        """Index (or, with None, unindex) an entity's value."""
+        previous = self._values.get(entity_id)
+        if previous == value:
+            return
+        if previous is not None:
+            i = bisect.bisect_left(self._entries, (previous, entity_id))
+            del self._entries[i]
+            del self._values[entity_id]
+        if value is not None:
+            bisect.insort(self._entries, (value, entity_id))
+            self._values[entity_id] = value
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._entries.clear()
+        self._values.clear()
+
+    def below(self, threshold: float) -> list[tuple[str, float]]:
+        """Entities with value < threshold, lowest first."""
+        end = bisect.bisect_left(self._entries, (threshold, ""))
+        return [(e, v) for v, e in self._entries[:end]]
+
+    def at_least(self, threshold: float) -> list[tuple[str, float]]:
+        """Entities with value >= threshold, lowest first."""
+        start = bisect.bisect_left(self._entries, (threshold, ""))
+        return [(e, v) for v, e in self._entries[start:]]
+
+
+class StateMirror:
+    """Authoritative entity_id -> EntityState map with versioning."""
+
+    def __init__(self, max_age: float = DEFAULT_MAX_AGE_SEC) -> None:
+        """Initialize an empty mirror.
+
+        Args:
+            max_age: Seconds a snapshot stays fresh without the event stream
+        """
+        self.max_age = max_age
+        self._states: dict[str, EntityState] = {}
+        self._versions: dict[str, int] = {}  # entity_id -> version of last change
+        self._version = 0
+        self._snapshot_at: float | None = None  # time.monotonic() of last snapshot
+        self._snapshots = 0
+        self._stream_connected = False
+        self._live = False
+
+        # Secondary indexes
+        self._by_domain: dict[str, set[str]] = {}
+        self._by_domain_state: dict[tuple[str, str], set[str]] = {}
+        self._by_device_class: dict[str, set[str]] = {}
+        self._by_name_word: dict[str, set[str]] = {}
+        self._by_area: dict[str, set[str]] = {}
+        self._entity_area: dict[str, str] = {}
+        self._area_floor: dict[str, str] = {}
+        self._numeric: dict[str, NumericIndex] = {
+            NUMERIC_BATTERY: NumericIndex(),
+            NUMERIC_SENSOR: NumericIndex(),
+        }
+
+    def __len__(self) -> int:
+        return len(self._states)
+
+    def __contains__(self, entity_id: object) -> bool:
+        return entity_id in self._states
+
+    # =========================================================================
+    # Freshness
+    # =========================================================================
+
+    @property
+    def version(self) -> int:
+        """Counter bumped on every applied change (snapshot entries included)."""
+        return self._version
+
+    @property
+    def snapshots(self) -> int:
+        """Number of snapshots loaded so far."""
+        return self._snapshots
+
+    @property
+    def loaded(self) -> bool:
+        """Whether at least one snapshot has been loaded."""
+        return self._snapshot_at is not None
+
+    @property
+    def live(self) -> bool:
+        """Whether the mirror is receiving every change from the event stream."""
+        return self._live
+
+    @property
+    def age(self) -> float | None:
+        """Seconds since the last snapshot, or None if never loaded."""
+        if self._snapshot_at is None:
+            return None
+        return time.monotonic() - self._snapshot_at
+
+    def is_fresh(self) -> bool:
+        """Whether reads can be served without a new snapshot."""
+        if self._live:
+            return True
+        age = self.age
+        return age is not None and age < self.max_age
+
+    def stream_connected(self) -> None:
+        """Record that the event stream is subscribed.
+
+        The mirror only becomes live with the next snapshot, since changes
+        made before the subscription started were not seen.
+        """
+        self._stream_connected = True
+
+    def stream_disconnected(self) -> None:
+        """Record that the event stream dropped; changes may now be missed."""
+        self._stream_connected = False
+        self._live = False
+
+    # =========================================================================
+    # Updates
+    # =========================================================================
+
+    def load_snapshot(self, states: Iterable[dict[str, Any]], since_version: int) -> int:
+        """Replace the mirror with a bulk ``/api/states`` response.
+
+        Args:
+            states: State objects as returned by ``/api/states``
+            since_version: ``version`` when the snapshot was requested; entities
+                changed after that are newer than the snapshot and kept.
+
+        Returns:
+            Number of entities in the mirror.
+        """
+        seen: set[str] = set()
+        for data in states:
+            entity_id = data.get("entity_id")
+            if not entity_id:
+                continue
+            seen.add(entity_id)
+            self._apply(entity_id, data)
+
+        for entity_id in [e for e in self._states if e not in seen]:
+            if self._versions.get(entity_id, 0) <= since_version:
+                self._remove(entity_id)
+
+        self._snapshot_at = time.monotonic()
+        self._snapshots += 1
+        self._live = self._stream_connected
+        return len(self._states)
+
+    def apply_event(self, entity_id: str, new_state: dict[str, Any] | None) -> bool:
+        """Apply a ``state_changed`` event.
+
+        Args:
+            entity_id: Entity that changed
+            new_state: The event's ``new_state`` (None when the entity was removed)
+
+        Returns:
+            True if the mirror changed.
+        """
+        if not entity_id:
+            return False
+        if not new_state:
+            return self._remove(entity_id)
+        return self._apply(entity_id, new_state)
+
+    def assign_areas(self, entity_areas: dict[str, str | None]) -> None:
+        """Replace the entity -> area assignments (from the entity registry)."""
+        self._by_area.clear()
+        self._entity_area = {e: a for e, a in entity_areas.items() if a}
+        for entity_id, area_id in self._entity_area.items():
+            self._by_area.setdefault(area_id, set()).add(entity_id)
+
+    def assign_area(self, entity_id: str, area_id: str | None) -> None:
+        """Move one entity to an area (None removes its assignment)."""
+        previous = self._entity_area.pop(entity_id, None)
+        if previous:
+            _discard(self._by_area, previous, entity_id)
+        if area_id:
+            self._entity_area[entity_id] = area_id
+            self._by_area.setdefault(area_id, set()).add(entity_id)
+
+    def assign_floors(self, area_floors: dict[str, str | None]) -> None:
+        """Replace the area -> floor assignments (from the area registry)."""
+        self._area_floor = {a: f for a, f in area_floors.items() if f}
+
+    def clear(self) -> None:
+        """Drop all states; the mirror must be re-snapshotted before use."""
+        self._states.clear()
+        self._versions.clear()
+        self._by_domain.clear()
+        self._by_domain_state.clear()
+        self._by_device_class.clear()
+        self._by_name_word.clear()
+        for index in self._numeric.values():
+            index.clear()
+        self._snapshot_at = None
+        self._live = False
+
+    def _apply(self, entity_id: str, data: dict[str, Any]) -> bool:
+        state = EntityState.from_api(data)
+        current = self._states.get(entity_id)
+        if current is not None and not _supersedes(state.last_updated, current.last_updated):
+            return False
+        self._version += 1
+        if current is not None:
+            self._unindex(entity_id, current)
+        else:
+            for word in _name_words(entity_id):
+                self._by_name_word.setdefault(word, set()).add(entity_id)
+        self._states[entity_id] = state
+        self._versions[entity_id] = self._version
+        self._index(entity_id, state)
+        return True
+
+    def _remove(self, entity_id: str) -> bool:
+        current = self._states.pop(entity_id, None)
+        if current is None:
+            return False
+        self._version += 1
+        self._versions[entity_id] = self._version
+        self._unindex(entity_id, current)
+        for word in _name_words(entity_id):
+            _discard(self._by_name_word, word, entity_id)
+        return True
+
+    def _index(self, entity_id: str, state: EntityState) -> None:
+        domain = _domain(entity_id)
+        self._by_domain.setdefault(domain, set()).add(entity_id)
+        self._by_domain_state.setdefault((domain, state.state.lower()), set()).add(entity_id)
+        device_class = state.attributes.get("device_class")
+        if device_class:
+            self._by_device_class.setdefault(device_class, set()).add(entity_id)
+        self._numeric[NUMERIC_BATTERY].set(entity_id, _battery_level(entity_id, state))
+        if domain == "sensor":
+            self._numeric[NUMERIC_SENSOR].set(entity_id, _as_number(state.state))
+
+    def _unindex(self, entity_id: str, state: EntityState) -> None:
+        domain = _domain(entity_id)
+        _discard(self._by_domain, domain, entity_id)
+        _discard(self._by_domain_state, (domain, state.state.lower()), entity_id)
+        device_class = state.attributes.get("device_class")
+        if device_class:
+            _discard(self._by_device_class, device_class, entity_id)
+        for index in self._numeric.values():
+            index.set(entity_id, None)
+
+    # =========================================================================
+    # Reads
+    # =========================================================================
+
+    def get(self, entity_id: str) -> EntityState | None:
+        """Return an entity's mirrored state."""
+        return self._states.get(entity_id)
+
+    def get_many(self, entity_ids: Iterable[str]) -> dict[str, EntityState]:
+        """Return mirrored states for the given entities (missing ones omitted)."""
+        states = self._states
+        return {e: states[e] for e in entity_ids if e in states}
+
+    def entity_version(self, entity_id: str) -> int:
+        """Version at which an entity last changed (0 if never seen)."""
+        return self._versions.get(entity_id, 0)
+
+    def items(self) -> Iterator[tuple[str, EntityState]]:
+        """Iterate over (entity_id, state) pairs."""
+        return iter(list(self._states.items()))
+
+    # =========================================================================
+    # Index lookups (returned sets are copies and safe to combine)
+    # =========================================================================
+
+    def in_domain(self, domain: str) -> set[str]:
+        """Entities in a domain."""
+        return set(self._by_domain.get(domain, ()))
+
+    def with_state(self, domain: str, *states: str) -> set[str]:
+        """Entities in a domain whose state is any of ``states`` (case-insensitive)."""
+        result: set[str] = set()
+        for state in states:
+            result |= self._by_domain_state.get((domain, state.lower()), set())
+        return result
+
+    def with_device_class(self, device_class: str) -> set[str]:
+        """Entities reporting a device_class attribute."""
+        return set(self._by_device_class.get(device_class, ()))
+
+    def named(self, word: str) -> set[str]:
+        """Entities with ``word`` as a word of their object id (case-insensitive)."""
+        return set(self._by_name_word.get(word.lower(), ()))
+
+    def in_area(self, area_id: str) -> set[str]:
+        """Entities assigned to an area."""
+        return set(self._by_area.get(area_id, ()))
+
+    def in_areas(self, area_ids: Iterable[str]) -> set[str]:
+        """Entities assigned to any of the given areas."""
+        result: set[str] = set()
+        for area_id in area_ids:
+            result |= self._by_area.get(area_id, set())
+        return result
+
+    def in_floor(self, floor_id: str) -> set[str]:
+        """Entities in areas on a floor."""
+        return self.in_areas(a for a, f in self._area_floor.items() if f == floor_id)
+
+    def area_of(self, entity_id: str) -> str | None:
+        """Area an entity is assigned to."""
+        return self._entity_area.get(entity_id)
+
+    def numeric(self, name: str) -> NumericIndex:
+        """Sorted numeric index (``NUMERIC_BATTERY`` or ``NUMERIC_SENSOR``)."""
+        return self._numeric[name]
+
+
+def _domain(entity_id: str) -> str:
+    return entity_id.split(".", 1)[0] if "." in entity_id else "unknown"
+
+
+def _name_words(entity_id: str) -> set[str]:
+    return set(entity_id.split(".", 1)[-1].lower().split("_")) - {""}
+
+
+def _discard(index: dict[Any, set[str]], key: Any, entity_id: str) -> None:
+    members = index.get(key)
+    if members is not None:
+        members.discard(entity_id)
+        if not members:
+            del index[key]
+
+
+def _as_number(value: Any) -> float | None:
+    if isinstance(value, bool):
+        return None
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return None
+    return number if number == number else None  # drop NaN
+
+
+def _battery_level(entity_id: str, state: EntityState) -> float | None:
+    # Battery sensors (device_class battery, or named so) report the level as
+    # their state; other entities may carry a battery_level attribute
+    if entity_id.startswith("sensor.") and (
+        state.attributes.get("device_class") == "battery" or "battery" in entity_id.lower()
+    ):
+        return _as_number(state.state)
+    return _as_number(state.attributes.get("battery_level"))
+
+
+def _supersedes(candidate: str | None, current: str | None) -> bool:
+    # HA serializes last_updated as UTC isoformat, so strings compare in time
+    # order; an equal timestamp is the same state seen twice
+    if candidate is None or current is None:
+        return True
+    return candidate > current
@@ -8,7 +8,8 @@ Key features:
 - Loads area registry with floor associations
 - Supports natural language floor terms ("downstairs", "upstairs", "first floor")
 - Bidirectional mappings for fast lookups
-- Periodic refresh to stay in sync with HA
+- Refreshes on area/floor registry update events, with periodic refresh as
+  a fallback while those events are unavailable
 """
 
 from __future__ import annotations
@@ -21,6 +22,7 @@ from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
     from barnabeenet.services.homeassistant.client import HomeAssistantClient
+    from barnabeenet.services.homeassistant.models import RegistryUpdate
 
 logger = logging.getLogger(__name__)
 
@@ -191,6 +193,9 @@ class HATopologyService:
         self._topology = HATopology()
         self._refresh_task: asyncio.Task[None] | None = None
         self._refresh_interval: int = 300  # 5 minutes
+        self._event_refresh_task: asyncio.Task[None] | None = None
+        self._refresh_pending = False
+        ha_client.add_registry_callback(self._on_registry_update)
 
     @property
     def topology(self) -> HATopology:
@@ -249,7 +254,7 @@ class HATopologyService:
                 logger.warning("No floor data returned from HA")
                 return
 
-            self._topology.floors.clear()
+            floors: dict[str, Floor] = {}
             for entry in floor_data:
                 floor_id = entry.get("floor_id", "")
                 if not floor_id:
@@ -262,7 +267,8 @@ class HATopologyService:
                     aliases=entry.get("aliases", []),
                     icon=entry.get("icon"),
                 )
-                self._topology.floors[floor_id] = floor
+                floors[floor_id] = floor
+            self._topology.floors = floors
 
             logger.debug("Loaded %d floors from HA", len(self._topology.floors))
 
@@ -273,27 +279,32 @@ class HATopologyService:
 
     def _build_area_mappings(self) -> None:
         """Build area-to-floor and floor-to-areas mappings from HA client data."""
-        self._topology.area_to_floor.clear()
-        self._topology.floor_to_areas.clear()
-        self._topology.area_name_to_id.clear()
+        # Built off to the side and swapped in, so lookups never see a partial map
+        area_to_floor: dict[str, str] = {}
+        floor_to_areas: dict[str, list[str]] = {}
+        area_name_to_id: dict[str, str] = {}
 
         # Get areas from HA client
         for area_id, area in self._ha.areas.items():
             # Build name lookup (normalize for matching)
             normalized_name = area.name.lower().strip()
-            self._topology.area_name_to_id[normalized_name] = area_id
+            area_name_to_id[normalized_name] = area_id
             # Also add the ID itself
-            self._topology.area_name_to_id[area_id.lower()] = area_id
+            area_name_to_id[area_id.lower()] = area_id
             # Add aliases
             for alias in area.aliases:
-                self._topology.area_name_to_id[alias.lower().strip()] = area_id
+                area_name_to_id[alias.lower().strip()] = area_id
 
             # Map area to floor
             if area.floor_id:
-                self._topology.area_to_floor[area_id] = area.floor_id
-                if area.floor_id not in self._topology.floor_to_areas:
-                    self._topology.floor_to_areas[area.floor_id] = []
-                self._topology.floor_to_areas[area.floor_id].append(area_id)
+                area_to_floor[area_id] = area.floor_id
+                if area.floor_id not in floor_to_areas:
+                    floor_to_areas[area.floor_id] = []
+                floor_to_areas[area.floor_id].append(area_id)
+
+        self._topology.area_to_floor = area_to_floor
+        self._topology.floor_to_areas = floor_to_areas
+        self._topology.area_name_to_id = area_name_to_id
 
         logger.debug(
             "Built mappings: %d area names, %d area-floor associations",
@@ -444,11 +455,30 @@ class HATopologyService:
             self._refresh_task = None
             logger.info("Stopped periodic topology refresh")
 
+    def _on_registry_update(self, update: RegistryUpdate) -> None:
+        """Refresh topology when areas or floors change."""
+        if update.registry not in ("area", "floor", "all"):
+            return
+        self._refresh_pending = True
+        if self._event_refresh_task is None or self._event_refresh_task.done():
+            self._event_refresh_task = asyncio.create_task(self._refresh_while_pending())
+
+    async def _refresh_while_pending(self) -> None:
+        # Coalesces bursts of events; one arriving mid-refresh triggers another
+        while self._refresh_pending:
+            self._refresh_pending = False
+            await self.refresh()
+
     async def _periodic_refresh_loop(self) -> None:
-        """Background loop for periodic topology refresh."""
+        """Background loop for periodic topology refresh.
+
+        Skipped while registry update events keep the topology current.
+        """
         while True:
             try:
                 await asyncio.sleep(self._refresh_interval)
+                if self._ha.registry_sync_live:
+                    continue
                 await self.refresh()
             except asyncio.CancelledError:
                 break
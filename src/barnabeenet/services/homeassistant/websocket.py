@@ -0,0 +1,326 @@
+"""Persistent, multiplexed WebSocket session for Home Assistant.
+
+One authenticated connection carries both commands and event
+subscriptions, instead of a fresh socket (and auth handshake) per
+registry command plus a second socket for events.
+
+Home Assistant's WebSocket API flow:
+1. Connect to ws://host:port/api/websocket
+2. Receive {"type": "auth_required"}
+3. Send {"type": "auth", "access_token": "token"}
+4. Receive {"type": "auth_ok"} or {"type": "auth_invalid"}
+5. Send commands with increasing ids: {"id": N, "type": "command_type", ...}
+6. Receive {"id": N, "type": "result", ...} or {"id": N, "type": "event", ...}
+
+Multiplexing: every command gets a fresh id and a future; the reader task
+resolves futures as results arrive, so any number of commands can be in
+flight at once. Subscriptions are remembered and re-sent automatically
+whenever the connection is re-established.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import json
+import logging
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any
+
+import websockets
+from websockets.exceptions import ConnectionClosed
+
+logger = logging.getLogger(__name__)
+
+# Registries on large installs exceed websockets' 1 MiB default (close code 1009)
+DEFAULT_MAX_MESSAGE_SIZE = 64 * 1024 * 1024
+
+# Seconds to wait for a command result
+DEFAULT_COMMAND_TIMEOUT = 10.0
+
+EventHandler = Callable[[dict[str, Any]], Awaitable[None]]
+ConnectionListener = Callable[[], Awaitable[None]]
+
+
+class HAAuthenticationError(Exception):
+    """Raised when Home Assistant authentication fails (invalid token)."""
+
+    pass
+
+
+class HACommandError(Exception):
+    """Raised when Home Assistant returns an unsuccessful command result."""
+
+    pass
+
+
+@dataclass
+class _Subscription:
+    """A subscription that is re-established on every connect."""
+
+    message: dict[str, Any]
+    handler: EventHandler
+    id: int | None = None  # Message id on the current connection
+
+
+class HAWebSocketSession:
+    """Long-lived, authenticated Home Assistant WebSocket connection.
+
+    Example:
+        session = HAWebSocketSession(url, token)
+        areas, devices = await asyncio.gather(
+            session.command("config/area_registry/list"),
+            session.command("config/device_registry/list"),
+        )
+        await session.subscribe({"type": "subscribe_events", "event_type": "state_changed"}, on_event)
+    """
+
+    def __init__(
+        self,
+        url: str,
+        token: str,
+        max_size: int | None = DEFAULT_MAX_MESSAGE_SIZE,
+        command_timeout: float = DEFAULT_COMMAND_TIMEOUT,
+    ) -> None:
+        """Initialize the session (no connection is made until first use).
+
+        Args:
+            url: Home Assistant base URL (http:// or https://)
+            token: Long-lived access token
+            max_size: Maximum incoming message size in bytes (None = unlimited)
+            command_timeout: Seconds to wait for a command result
+        """
+        ws_url = url.rstrip("/").replace("http://", "ws://").replace("https://", "wss://")
+        self._ws_url = f"{ws_url}/api/websocket"
+        self.token = token
+        self._max_size = max_size
+        self._command_timeout = command_timeout
+
+        self._ws: Any = None
+        self._reader_task: asyncio.Task[None] | None = None
+        self._connect_lock = asyncio.Lock()
+        self._ids = itertools.count(1)
+        self._pending: dict[int, asyncio.Future[Any]] = {}
+        self._subscriptions: list[_Subscription] = []
+        self._closed: asyncio.Event = asyncio.Event()
+        self._closed.set()
+        self._on_connect: list[ConnectionListener] = []
+        self._on_disconnect: list[ConnectionListener] = []
+
+    @property
+    def connected(self) -> bool:
+        """Whether the connection is open and authenticated."""
+        return self._ws is not None
+
+    def add_connect_listener(self, listener: ConnectionListener) -> None:
+        """Call ``listener`` after each (re)connect, once subscriptions are restored."""
+        self._on_connect.append(listener)
+
+    def add_disconnect_listener(self, listener: ConnectionListener) -> None:
+        """Call ``listener`` whenever the connection drops or is closed."""
+        self._on_disconnect.append(listener)
+
+    # =========================================================================
+    # Connection
+    # =========================================================================
+
+    async def connect(self) -> None:
+        """Open and authenticate the connection if it is not already open.
+
+        Raises:
+            HAAuthenticationError: If the token is rejected
+            RuntimeError: On an unexpected handshake message
+        """
+        async with self._connect_lock:
+            if self._ws is not None:
+                return
+
+            ws = await websockets.connect(self._ws_url, max_size=self._max_size)
+            try:
+                msg = json.loads(await ws.recv())
+                if msg.get("type") != "auth_required":
+                    raise RuntimeError(f"Expected auth_required, got: {msg.get('type')}")
+
+                await ws.send(json.dumps({"type": "auth", "access_token": self.token}))
+
+                msg = json.loads(await ws.recv())
+                if msg.get("type") == "auth_invalid":
+                    raise HAAuthenticationError(msg.get("message", "Invalid access token"))
+                if msg.get("type") != "auth_ok":
+                    raise RuntimeError(f"Auth failed: {msg}")
+            except BaseException:
+                await ws.close()
+                raise
+
+            logger.info("WebSocket authenticated with Home Assistant")
+            self._ws = ws
+            self._closed.clear()
+            self._reader_task = asyncio.create_task(self._read_loop(ws))
+
+            # Restore subscriptions on the new connection
+            try:
+                for subscription in self._subscriptions:
+                    await self._send_subscription(subscription)
+            except BaseException:
+                await self.close()
+                raise
+
+        for listener in self._on_connect:
+            try:
+                await listener()
+            except Exception as e:
+                logger.warning("WebSocket connect listener error: %s", e)
+
+    async def close(self) -> None:
+        """Close the connection. Subscriptions are kept for the next connect."""
+        ws = self._ws
+        if ws is None:
+            return
+        await ws.close()
+        if self._reader_task is not None:
+            try:
+                await self._reader_task
+            except asyncio.CancelledError:
+                pass
+
+    async def wait_closed(self) -> None:
+        """Wait until the current connection drops or is closed."""
+        await self._closed.wait()
+
+    # =========================================================================
+    # Commands and subscriptions
+    # =========================================================================
+
+    async def command(
+        self, command_type: str, timeout: float | None = None, **payload: Any
+    ) -> Any:
+        """Send a command and return its result, connecting first if needed.
+
+        Args:
+            command_type: Command type (e.g., "config/device_registry/list")
+            timeout: Seconds to wait for the result (default: command_timeout)
+            **payload: Extra command fields
+
+        Returns:
+            The command's ``result`` field.
+
+        Raises:
+            HACommandError: If Home Assistant reports failure
+            asyncio.TimeoutError: If no result arrives in time
+            ConnectionError: If the connection drops before the result arrives
+        """
+        await self.connect()
+        return await self._request(
+            {"type": command_type, **payload},
+            self._command_timeout if timeout is None else timeout,
+        )
+
+    async def subscribe(self, message: dict[str, Any], handler: EventHandler) -> None:
+        """Subscribe (now and after every reconnect) and route events to ``handler``.
+
+        Handlers run on the reader task, in arrival order, so they must not
+        await commands on this session.
+
+        Args:
+            message: Subscription command, e.g. {"type": "subscribe_events", ...}
+            handler: Coroutine called with each event payload
+        """
+        subscription = _Subscription(message=message, handler=handler)
+        self._subscriptions.append(subscription)
+        if self._ws is not None:
+            await self._send_subscription(subscription)
+
+    def is_subscribed(self, handler: EventHandler) -> bool:
+        """Whether any subscription routes events to ``handler``."""
+        return any(s.handler == handler for s in self._subscriptions)
+
+    def unsubscribe(self, handler: EventHandler) -> None:
+        """Stop re-establishing subscriptions routed to ``handler``.
+
+        Events already subscribed on the current connection are dropped
+        from now on; Home Assistant stops sending them on the next connect.
+        """
+        self._subscriptions = [s for s in self._subscriptions if s.handler != handler]
+
+    async def _send_subscription(self, subscription: _Subscription) -> None:
+        subscription.id = next(self._ids)
+        await self._request(subscription.message, self._command_timeout, subscription.id)
+
+    async def _request(
+        self, message: dict[str, Any], timeout: float, msg_id: int | None = None
+    ) -> Any:
+        ws = self._ws
+        if ws is None:
+            raise ConnectionError("Home Assistant WebSocket is not connected")
+
+        msg_id = next(self._ids) if msg_id is None else msg_id
+        future: asyncio.Future[Any] = asyncio.get_running_loop().create_future()
+        self._pending[msg_id] = future
+        try:
+            await ws.send(json.dumps({**message, "id": msg_id}))
+            return await asyncio.wait_for(future, timeout=timeout)
+        finally:
+            self._pending.pop(msg_id, None)
+
+    # =========================================================================
+    # Reader
+    # =========================================================================
+
+    async def _read_loop(self, ws: Any) -> None:
+        try:
+            async for raw_msg in ws:
+                try:
+                    msg = json.loads(raw_msg)
+                except json.JSONDecodeError:
+                    logger.warning("Invalid JSON from WebSocket: %s", raw_msg[:100])
+                    continue
+                await self._dispatch(msg)
+        except ConnectionClosed as e:
+            logger.info("Home Assistant WebSocket closed: %s", e)
+        except Exception as e:
+            logger.warning("Home Assistant WebSocket reader error: %s", e)
+        finally:
+            await self._connection_lost(ws)
+
+    async def _dispatch(self, msg: dict[str, Any]) -> None:
+        msg_type = msg.get("type")
+        msg_id = msg.get("id")
+
+        if msg_type == "result":
+            future = self._pending.get(msg_id)
+            if future is None or future.done():
+                return
+            if msg.get("success"):
+                future.set_result(msg.get("result"))
+            else:
+                future.set_exception(HACommandError(str(msg.get("error", msg))))
+        elif msg_type == "event":
+            for subscription in self._subscriptions:
+                if subscription.id == msg_id:
+                    try:
+                        await subscription.handler(msg.get("event", {}))
+                    except Exception as e:
+                        logger.warning("Error processing event: %s", e)
+                    break
+
+    async def _connection_lost(self, ws: Any) -> None:
+        if self._ws is not ws:
+            return
+        self._ws = None
+        self._reader_task = None
+        for subscription in self._subscriptions:
+            subscription.id = None
+
+        error = ConnectionError("Home Assistant WebSocket connection closed")
+        for future in self._pending.values():
+            if not future.done():
+                future.set_exception(error)
+        self._pending.clear()
+        self._closed.set()
+
+        for listener in self._on_disconnect:
+            try:
+                await listener()
+            except Exception as e:
+                logger.warning("WebSocket disconnect listener error: %s", e)
@@ -0,0 +1,193 @@
+"""Inference Executor - Runs blocking model inference off the event loop.
+
+Distil-Whisper, Kokoro and sentence-transformers inference are synchronous
+CPU-bound calls. Running them directly in a coroutine stalls every other
+request, WebSocket and background task for the duration of the call.
+
+Each model family gets its own lane: a small thread pool whose size is the
+concurrency cap for that model, plus a bound on in-flight work (running and
+queued). When a lane is full new work is rejected with InferenceBusyError
+instead of queueing without limit, so callers can shed load (HTTP 503).
+
+Queue wait (submit -> start) and compute time are exported separately via
+services/metrics.py so saturation is visible apart from slow inference.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, TypeVar
+
+import structlog
+
+from barnabeenet.config import get_settings
+from barnabeenet.services.metrics import (
+    record_inference,
+    record_inference_rejected,
+    update_inference_queue_depth,
+)
+
+logger = structlog.get_logger()
+
+T = TypeVar("T")
+
+STT_LANE = "stt"
+TTS_LANE = "tts"
+EMBEDDING_LANE = "embedding"
+
+
+class InferenceBusyError(RuntimeError):
+    """Raised when an inference lane has no room for more work."""
+
+    def __init__(self, lane: str, max_pending: int) -> None:
+        super().__init__(f"Inference lane '{lane}' is busy ({max_pending} requests in flight)")
+        self.lane = lane
+        self.max_pending = max_pending
+
+
+@dataclass
+class InferenceLane:
+    """Bounded worker pool for one model family."""
+
+    name: str
+    workers: int
+    max_pending: int
+    pending: int = 0
+    completed: int = 0
+    rejected: int = 0
+    total_wait_ms: float = 0.0
+    total_compute_ms: float = 0.0
+    pool: ThreadPoolExecutor | None = None
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+    def get_pool(self) -> ThreadPoolExecutor:
+        if self.pool is None:
+            self.pool = ThreadPoolExecutor(
+                max_workers=self.workers, thread_name_prefix=f"inference-{self.name}"
+            )
+        return self.pool
+
+
+class InferenceExecutor:
+    """Per-model bounded thread pools for blocking inference calls."""
+
+    def __init__(self) -> None:
+        """Initialize lanes from performance settings."""
+        perf = get_settings().performance
+        self._lanes: dict[str, InferenceLane] = {}
+        self.add_lane(STT_LANE, perf.inference_stt_workers, perf.max_concurrent_stt)
+        self.add_lane(TTS_LANE, perf.inference_tts_workers, perf.max_concurrent_tts)
+        self.add_lane(
+            EMBEDDING_LANE, perf.inference_embedding_workers, perf.max_concurrent_embeddings
+        )
+
+    def add_lane(self, name: str, workers: int, max_pending: int) -> None:
+        """Register (or replace) a lane.
+
+        Args:
+            name: Lane key passed to ``run``.
+            workers: Maximum concurrent inferences for this model.
+            max_pending: Maximum running plus queued calls before rejecting.
+        """
+        workers = max(1, workers)
+        self._lanes[name] = InferenceLane(
+            name=name, workers=workers, max_pending=max(workers, max_pending)
+        )
+
+    async def run(self, lane: str, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Run a blocking call on a lane's worker threads.
+
+        Args:
+            lane: Lane name (``stt``, ``tts`` or ``embedding``).
+            fn: Synchronous callable to run.
+            *args: Positional arguments for ``fn``.
+            **kwargs: Keyword arguments for ``fn``.
+
+        Returns:
+            The value returned by ``fn``.
+
+        Raises:
+            KeyError: If the lane is not registered.
+            InferenceBusyError: If the lane already has ``max_pending`` calls.
+        """
+        slot = self._lanes[lane]
+        with slot.lock:
+            if slot.pending >= slot.max_pending:
+                slot.rejected += 1
+                record_inference_rejected(lane)
+                logger.warning("Inference lane full, rejecting", lane=lane, pending=slot.pending)
+                raise InferenceBusyError(lane, slot.max_pending)
+            slot.pending += 1
+            update_inference_queue_depth(lane, slot.pending)
+
+        submitted = time.perf_counter()
+
+        def call() -> T:
+            started = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                finished = time.perf_counter()
+                wait_s = started - submitted
+                compute_s = finished - started
+                with slot.lock:
+                    slot.completed += 1
+                    slot.total_wait_ms += wait_s * 1000
+                    slot.total_compute_ms += compute_s * 1000
+                record_inference(lane, wait_s, compute_s)
+
+        try:
+            future: Future[T] = slot.get_pool().submit(call)
+        except Exception:
+            self._release(slot)
+            raise
+        # Release on completion, not on await: a cancelled caller does not stop the thread
+        future.add_done_callback(lambda _: self._release(slot))
+        return await asyncio.wrap_future(future)
+
+    @staticmethod
+    def _release(slot: InferenceLane) -> None:
+        with slot.lock:
+            slot.pending -= 1
+            update_inference_queue_depth(slot.name, slot.pending)
+
+    def get_status(self) -> dict[str, Any]:
+        """Get per-lane load and timing statistics."""
+        status = {}
+        for slot in self._lanes.values():
+            completed = slot.completed or 1
+            status[slot.name] = {
+                "workers": slot.workers,
+                "max_pending": slot.max_pending,
+                "pending": slot.pending,
+                "completed": slot.completed,
+                "rejected": slot.rejected,
+                "avg_wait_ms": slot.total_wait_ms / completed,
+                "avg_compute_ms": slot.total_compute_ms / completed,
+            }
+        return status
+
+    def shutdown(self) -> None:
+        """Stop worker threads. Lanes restart their pools on next use."""
+        for slot in self._lanes.values():
+            if slot.pool is not None:
+                slot.pool.shutdown(wait=False, cancel_futures=True)
+                slot.pool = None
+        logger.info("Inference executor shut down")
+
+
+# Global singleton
+_inference_executor: InferenceExecutor | None = None
+
+
+def get_inference_executor() -> InferenceExecutor:
+    """Get the global inference executor instance."""
+    global _inference_executor
+    if _inference_executor is None:
+        _inference_executor = InferenceExecutor()
+    return _inference_executor
@@ -2,6 +2,17 @@
 
 Caches LLM responses based on semantic similarity to avoid redundant API calls.
 Uses embeddings to match similar queries and return cached responses when appropriate.
+
+Entries are grouped into partitions by (agent type, model, temperature).
+Each partition keeps its query embeddings resident in a MemoryVectorIndex,
+so a lookup is one matrix-vector product over that partition instead of a
+Redis SCAN plus a GET and JSON decode per entry. Redis is write-through
+storage that survives restarts: entry metadata is stored as JSON and the
+embedding as raw float32 bytes under a separate key.
+
+Ahead of the semantic lookup, an exact-match tier maps normalized query
+text to its entry, so repeated commands are answered without running the
+embedding model at all.
 """
 
 from __future__ import annotations
@@ -10,12 +21,19 @@ import hashlib
 import json
 import logging
 import time
+from collections import OrderedDict
 from datetime import UTC, datetime, timedelta
 from typing import TYPE_CHECKING, Any
 
 import numpy as np
 
-from barnabeenet.services.memory.embedding import EmbeddingService, get_embedding_service
+from barnabeenet.services.memory.embedding import (
+    EmbeddingService,
+    get_embedding_service,
+    normalize_query_text,
+)
+from barnabeenet.services.memory.vector_index import MemoryVectorIndex
+from barnabeenet.services.metrics import record_cache_lookup
 
 if TYPE_CHECKING:
     import redis.asyncio as redis
@@ -29,7 +47,12 @@ CACHE_EMBEDDING_PREFIX = "barnabeenet:llm_cache_emb:"
 CACHE_TTL_FACTUAL_HOURS = 24  # Factual queries (time, date, status)
 CACHE_TTL_CONVERSATIONAL_HOURS = 1  # Conversational queries
 SEMANTIC_SIMILARITY_THRESHOLD = 0.95  # Cosine similarity threshold for cache hits
-MAX_CACHE_ENTRIES = 10000  # Maximum cache entries per agent type
+MAX_CACHE_ENTRIES = 10000  # Maximum cache entries per agent/model/temperature partition
+MAX_MEMORY_ENTRIES = 1000  # Per-partition limit when there is no Redis backend
+EVICTION_SAMPLE_SIZE = 8  # Least-recently-used entries considered for LFU eviction
+LOAD_BATCH_SIZE = 200  # Keys fetched per pipeline when loading from Redis
+
+PartitionKey = tuple[str, str, str]
 
 
 class LLMCacheEntry:
@@ -46,6 +69,8 @@ class LLMCacheEntry:
         created_at: datetime | None = None,
         hit_count: int = 0,
         last_accessed: datetime | None = None,
+        expires_at: datetime | None = None,
+        query_key: str | None = None,
     ):
         self.response_text = response_text
         self.model = model
@@ -56,37 +81,113 @@ class LLMCacheEntry:
         self.created_at = created_at or datetime.now(UTC)
         self.hit_count = hit_count
         self.last_accessed = last_accessed or datetime.now(UTC)
+        self.expires_at = expires_at
+        self.query_key = query_key  # Normalized query text for exact matches
+
+    def is_expired(self, now: datetime | None = None) -> bool:
+        """Whether the entry's TTL has passed."""
+        return self.expires_at is not None and (now or datetime.now(UTC)) >= self.expires_at
 
     def to_dict(self) -> dict[str, Any]:
-        """Convert to dictionary for storage."""
+        """Convert to dictionary for storage.
+
+        The embedding is not included; it is stored separately as raw bytes.
+        """
         return {
             "response_text": self.response_text,
             "model": self.model,
             "input_tokens": self.input_tokens,
             "output_tokens": self.output_tokens,
             "cost_usd": self.cost_usd,
-            "embedding": self.embedding.tolist(),  # Convert numpy array to list
             "created_at": self.created_at.isoformat(),
             "hit_count": self.hit_count,
             "last_accessed": self.last_accessed.isoformat(),
+            "query_key": self.query_key,
         }
 
     @classmethod
-    def from_dict(cls, data: dict[str, Any]) -> LLMCacheEntry:
-        """Create from dictionary."""
+    def from_dict(
+        cls,
+        data: dict[str, Any],
+        embedding: NDArray[np.float32] | None = None,
+        expires_at: datetime | None = None,
+    ) -> LLMCacheEntry:
+        """Create from dictionary.
+
+        Args:
+            data: Stored entry fields.
+            embedding: Query embedding. Falls back to a JSON ``embedding``
+                list for entries written before embeddings were stored as bytes.
+            expires_at: When the entry expires, if known.
+        """
+        if embedding is None:
+            embedding = np.array(data["embedding"], dtype=np.float32)
         return cls(
             response_text=data["response_text"],
             model=data["model"],
             input_tokens=data["input_tokens"],
             output_tokens=data["output_tokens"],
             cost_usd=data["cost_usd"],
-            embedding=np.array(data["embedding"], dtype=np.float32),
+            embedding=embedding,
             created_at=datetime.fromisoformat(data["created_at"]),
             hit_count=data.get("hit_count", 0),
             last_accessed=datetime.fromisoformat(data["last_accessed"]),
+            expires_at=expires_at,
+            query_key=data.get("query_key"),
         )
 
 
+class _CachePartition:
+    """Resident entries and embedding matrix for one agent/model/temperature."""
+
+    def __init__(self) -> None:
+        self.index = MemoryVectorIndex(initial_capacity=64)
+        # Ordered least- to most-recently used
+        self.entries: OrderedDict[str, LLMCacheEntry] = OrderedDict()
+        # Normalized query text -> cache key
+        self.exact: dict[str, str] = {}
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def add(self, cache_key: str, entry: LLMCacheEntry) -> None:
+        self.index.add(cache_key, entry.embedding, memory_type="llm_cache")
+        self.entries[cache_key] = entry
+        self.entries.move_to_end(cache_key)
+        if entry.query_key:
+            self.exact[entry.query_key] = cache_key
+
+    def remove(self, cache_key: str) -> None:
+        self.index.remove(cache_key)
+        entry = self.entries.pop(cache_key, None)
+        if entry is not None and entry.query_key and self.exact.get(entry.query_key) == cache_key:
+            del self.exact[entry.query_key]
+
+    def touch(self, cache_key: str) -> LLMCacheEntry | None:
+        """Record a hit on an entry, dropping it instead if it has expired."""
+        entry = self.entries[cache_key]
+        now = datetime.now(UTC)
+        if entry.is_expired(now):
+            # Redis expires its copy on its own
+            self.remove(cache_key)
+            return None
+
+        # Access stats are kept resident; the stored record is not rewritten per hit
+        entry.hit_count += 1
+        entry.last_accessed = now
+        self.entries.move_to_end(cache_key)
+        return entry
+
+    def eviction_candidate(self) -> str:
+        """Pick the least-frequently hit of the least-recently used entries."""
+        candidates = []
+        for cache_key, entry in self.entries.items():
+            candidates.append((entry.hit_count, len(candidates), cache_key))
+            if len(candidates) >= EVICTION_SAMPLE_SIZE:
+                break
+        return min(candidates)[2]
+
+
 class LLMResponseCache:
     """Cache for LLM responses with semantic similarity matching.
 
@@ -106,7 +207,8 @@ class LLMResponseCache:
         """Initialize the cache.
 
         Args:
-            redis_client: Optional Redis client for persistent caching.
+            redis_client: Optional Redis client for persistent caching. Must not
+                use decode_responses, since embeddings are stored as raw bytes.
             embedding_service: Optional embedding service for semantic matching.
             enabled: Whether caching is enabled.
         """
@@ -115,10 +217,16 @@ class LLMResponseCache:
         self._enabled = enabled
         self._use_redis = False
 
-        # In-memory fallback cache (LRU-style, limited size)
-        self._memory_cache: dict[str, LLMCacheEntry] = {}
-        self._memory_cache_embeddings: dict[str, NDArray[np.float32]] = {}
-        self._max_memory_entries = 1000
+        self._partitions: dict[PartitionKey, _CachePartition] = {}
+        self._max_entries = MAX_MEMORY_ENTRIES
+
+        # Counters for the dashboard
+        self._exact_hits = 0
+        self._semantic_hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._lookup_ms_total = 0.0
+        self._lookup_ms_max = 0.0
 
     async def init(self) -> None:
         """Initialize the cache."""
@@ -136,6 +244,7 @@ class LLMResponseCache:
             try:
                 await self._redis.ping()
                 self._use_redis = True
+                self._max_entries = MAX_CACHE_ENTRIES
                 logger.info("LLM response cache using Redis backend")
             except Exception as e:
                 logger.warning(f"Redis not available for LLM cache, using in-memory: {e}")
@@ -143,6 +252,12 @@ class LLMResponseCache:
         else:
             logger.info("LLM response cache using in-memory fallback")
 
+        if self._use_redis:
+            try:
+                await self._load_from_redis()
+            except Exception as e:
+                logger.warning(f"Failed to load LLM cache from Redis: {e}")
+
     def _generate_cache_key(
         self,
         agent_type: str,
@@ -160,6 +275,21 @@ class LLMResponseCache:
         temp_key = f"{temperature:.1f}"
         return f"{agent_type}:{model}:{temp_key}:{embedding_hash}"
 
+    @staticmethod
+    def _partition_key(agent_type: str, model: str, temperature: float) -> PartitionKey:
+        return (agent_type, model, f"{temperature:.1f}")
+
+    @staticmethod
+    def _partition_key_from_cache_key(cache_key: str) -> PartitionKey:
+        """Recover (agent_type, model, temp_key) from a cache key.
+
+        Model names may contain colons (e.g. ":free" variants), so the
+        temperature and hash are split off the right first.
+        """
+        prefix, temp_key, _ = cache_key.rsplit(":", 2)
+        agent_type, model = prefix.split(":", 1)
+        return (agent_type, model, temp_key)
+
     def _is_factual_query(self, query_text: str) -> bool:
         """Determine if a query is factual (time, date, status) vs conversational.
 
@@ -202,105 +332,59 @@ class LLMResponseCache:
         if not self._enabled:
             return None
 
+        start = time.perf_counter()
+        partition = self._partitions.get(self._partition_key(agent_type, model, temperature))
+        if not partition:
+            # Nothing cached for this agent/model/temperature: skip embedding
+            self._record_lookup(start, "miss")
+            return None
+
+        # Exact-match tier: no embedding needed
+        cache_key = partition.exact.get(normalize_query_text(query_text))
+        cached = partition.touch(cache_key) if cache_key else None
+        if cached:
+            self._record_lookup(start, "exact_hit")
+            logger.debug(
+                "LLM cache exact hit: agent_type=%s model=%s hit_count=%d",
+                agent_type,
+                model,
+                cached.hit_count,
+            )
+            return cached
+
         try:
             # Generate embedding for query
             query_embedding = await self._embedding_service.embed(query_text)
-
-            # Search for similar cached entries
-            if self._use_redis and self._redis:
-                cached = await self._search_redis_cache(
-                    query_embedding, agent_type, model, temperature
-                )
-            else:
-                cached = await self._search_memory_cache(
-                    query_embedding, agent_type, model, temperature
-                )
-
-            if cached:
-                # Update access stats
-                cached.hit_count += 1
-                cached.last_accessed = datetime.now(UTC)
-                await self._update_cache_entry(cached, agent_type, model, temperature, query_embedding)
-                logger.debug(
-                    "LLM cache hit",
-                    agent_type=agent_type,
-                    model=model,
-                    hit_count=cached.hit_count,
-                )
-                return cached
-
-            return None
-
+            matches = partition.index.search(query_embedding, 1, SEMANTIC_SIMILARITY_THRESHOLD)
         except Exception as e:
             logger.warning(f"LLM cache lookup failed: {e}")
             return None
 
-    async def _search_redis_cache(
-        self,
-        query_embedding: NDArray[np.float32],
-        agent_type: str,
-        model: str,
-        temperature: float,
-    ) -> LLMCacheEntry | None:
-        """Search Redis cache for similar entries."""
-        # Get all cache keys for this agent/model/temp combination
-        pattern = f"{CACHE_PREFIX}{agent_type}:{model}:{temperature:.1f}:*"
-        cursor = 0
-        best_match: tuple[LLMCacheEntry, float] | None = None
-
-        while True:
-            cursor, keys = await self._redis.scan(cursor, match=pattern, count=100)
-            if not keys:
-                if cursor == 0:
-                    break
-                continue
-
-            # Load entries and compare embeddings
-            for key in keys:
-                try:
-                    entry_data = await self._redis.get(key)
-                    if not entry_data:
-                        continue
-
-                    entry = LLMCacheEntry.from_dict(json.loads(entry_data))
-                    # Compute similarity
-                    similarity = np.dot(query_embedding, entry.embedding)  # Both normalized
-                    if similarity >= SEMANTIC_SIMILARITY_THRESHOLD:
-                        if best_match is None or similarity > best_match[1]:
-                            best_match = (entry, similarity)
-
-                except Exception as e:
-                    logger.debug(f"Error loading cache entry {key}: {e}")
-                    continue
-
-            if cursor == 0:
-                break
-
-        return best_match[0] if best_match else None
-
-    async def _search_memory_cache(
-        self,
-        query_embedding: NDArray[np.float32],
-        agent_type: str,
-        model: str,
-        temperature: float,
-    ) -> LLMCacheEntry | None:
-        """Search in-memory cache for similar entries."""
-        best_match: tuple[LLMCacheEntry, float] | None = None
-        temp_key = f"{temperature:.1f}"
-
-        for key, entry in self._memory_cache.items():
-            # Check if agent/model/temp match
-            if not key.startswith(f"{agent_type}:{model}:{temp_key}:"):
-                continue
-
-            # Compute similarity
-            similarity = np.dot(query_embedding, entry.embedding)
-            if similarity >= SEMANTIC_SIMILARITY_THRESHOLD:
-                if best_match is None or similarity > best_match[1]:
-                    best_match = (entry, similarity)
+        cached = partition.touch(matches[0][0]) if matches else None
+        if cached is None:
+            self._record_lookup(start, "miss")
+            return None
 
-        return best_match[0] if best_match else None
+        self._record_lookup(start, "semantic_hit")
+        logger.debug(
+            "LLM cache hit: agent_type=%s model=%s hit_count=%d",
+            agent_type,
+            model,
+            cached.hit_count,
+        )
+        return cached
+
+    def _record_lookup(self, start: float, result: str) -> None:
+        latency_ms = (time.perf_counter() - start) * 1000
+        if result == "exact_hit":
+            self._exact_hits += 1
+        elif result == "semantic_hit":
+            self._semantic_hits += 1
+        else:
+            self._misses += 1
+        self._lookup_ms_total += latency_ms
+        self._lookup_ms_max = max(self._lookup_ms_max, latency_ms)
+        record_cache_lookup("llm_response", result)
 
     async def set(
         self,
@@ -344,74 +428,149 @@ class LLMResponseCache:
                 output_tokens=output_tokens,
                 cost_usd=cost_usd,
                 embedding=query_embedding,
+                expires_at=datetime.now(UTC) + timedelta(hours=ttl_hours),
+                query_key=normalize_query_text(query_text),
             )
 
             # Generate cache key
             cache_key = self._generate_cache_key(agent_type, model, temperature, query_embedding)
+            evicted = self._store_resident(
+                self._partition_key(agent_type, model, temperature), cache_key, entry
+            )
 
-            # Store in cache
             if self._use_redis and self._redis:
-                await self._store_redis_entry(cache_key, entry, ttl_hours)
-            else:
-                await self._store_memory_entry(cache_key, entry)
+                await self._store_redis_entry(cache_key, entry, ttl_hours, evicted)
 
             logger.debug(
-                "LLM response cached",
-                agent_type=agent_type,
-                model=model,
-                ttl_hours=ttl_hours,
+                "LLM response cached: agent_type=%s model=%s ttl_hours=%d",
+                agent_type,
+                model,
+                ttl_hours,
             )
 
         except Exception as e:
             logger.warning(f"Failed to cache LLM response: {e}")
 
+    def _store_resident(
+        self, partition_key: PartitionKey, cache_key: str, entry: LLMCacheEntry
+    ) -> list[str]:
+        """Add an entry to its partition, evicting to stay within the limit.
+
+        Expired entries are dropped first; if the partition is still full,
+        the least-frequently hit of the least-recently used entries goes.
+
+        Returns:
+            Cache keys that were evicted.
+        """
+        partition = self._partitions.get(partition_key)
+        if partition is None:
+            partition = self._partitions[partition_key] = _CachePartition()
+
+        evicted: list[str] = []
+        if cache_key not in partition.entries and len(partition) >= self._max_entries:
+            now = datetime.now(UTC)
+            for key in [k for k, e in partition.entries.items() if e.is_expired(now)]:
+                partition.remove(key)
+                evicted.append(key)
+            while len(partition) >= self._max_entries:
+                key = partition.eviction_candidate()
+                partition.remove(key)
+                evicted.append(key)
+            self._evictions += len(evicted)
+
+        partition.add(cache_key, entry)
+        return evicted
+
     async def _store_redis_entry(
-        self, cache_key: str, entry: LLMCacheEntry, ttl_hours: int
+        self,
+        cache_key: str,
+        entry: LLMCacheEntry,
+        ttl_hours: int,
+        evicted: list[str] | None = None,
     ) -> None:
-        """Store entry in Redis."""
-        full_key = f"{CACHE_PREFIX}{cache_key}"
+        """Store entry in Redis and delete evicted entries in one round-trip."""
         ttl_seconds = ttl_hours * 3600
 
-        entry_data = json.dumps(entry.to_dict())
-        await self._redis.setex(full_key, ttl_seconds, entry_data)
-
-    async def _store_memory_entry(self, cache_key: str, entry: LLMCacheEntry) -> None:
-        """Store entry in memory cache with LRU eviction."""
-        # Evict oldest if at capacity
-        if len(self._memory_cache) >= self._max_memory_entries:
-            # Remove oldest accessed entry
-            oldest_key = min(
-                self._memory_cache.keys(),
-                key=lambda k: self._memory_cache[k].last_accessed,
+        pipe = self._redis.pipeline()
+        pipe.setex(f"{CACHE_PREFIX}{cache_key}", ttl_seconds, json.dumps(entry.to_dict()))
+        pipe.setex(
+            f"{CACHE_EMBEDDING_PREFIX}{cache_key}",
+            ttl_seconds,
+            np.asarray(entry.embedding, dtype=np.float32).tobytes(),
+        )
+        if evicted:
+            pipe.delete(
+                *[f"{CACHE_PREFIX}{k}" for k in evicted],
+                *[f"{CACHE_EMBEDDING_PREFIX}{k}" for k in evicted],
             )
-            del self._memory_cache[oldest_key]
-            self._memory_cache_embeddings.pop(oldest_key, None)
+        await pipe.execute()
 
-        self._memory_cache[cache_key] = entry
-        self._memory_cache_embeddings[cache_key] = entry.embedding
+    async def _load_from_redis(self) -> None:
+        """Rebuild the resident partitions from Redis (once, at startup)."""
+        start = time.perf_counter()
+        keys: list[str] = []
+        cursor = 0
+        while True:
+            cursor, batch = await self._redis.scan(cursor, match=f"{CACHE_PREFIX}*", count=500)
+            keys.extend(k.decode("utf-8") if isinstance(k, bytes) else k for k in batch)
+            if cursor == 0:
+                break
 
-    async def _update_cache_entry(
-        self,
-        entry: LLMCacheEntry,
-        agent_type: str,
-        model: str,
-        temperature: float,
-        query_embedding: NDArray[np.float32],
-    ) -> None:
-        """Update cache entry with new access stats."""
-        cache_key = self._generate_cache_key(agent_type, model, temperature, query_embedding)
+        now = datetime.now(UTC)
+        loaded = 0
+        for i in range(0, len(keys), LOAD_BATCH_SIZE):
+            batch = keys[i : i + LOAD_BATCH_SIZE]
+            cache_keys = [k[len(CACHE_PREFIX) :] for k in batch]
+            pipe = self._redis.pipeline()
+            pipe.mget(batch)
+            pipe.mget([f"{CACHE_EMBEDDING_PREFIX}{k}" for k in cache_keys])
+            for key in batch:
+                pipe.ttl(key)
+            results = await pipe.execute()
+            values, embeddings, ttls = results[0], results[1], results[2:]
+
+            for cache_key, data, emb_bytes, ttl in zip(
+                cache_keys, values, embeddings, ttls, strict=True
+            ):
+                if not data:
+                    continue
+                try:
+                    embedding = (
+                        np.frombuffer(emb_bytes, dtype=np.float32) if emb_bytes else None
+                    )
+                    expires_at = now + timedelta(seconds=ttl) if ttl and ttl > 0 else None
+                    entry = LLMCacheEntry.from_dict(json.loads(data), embedding, expires_at)
+                    self._store_resident(
+                        self._partition_key_from_cache_key(cache_key), cache_key, entry
+                    )
+                    loaded += 1
+                except Exception as e:
+                    logger.debug(f"Error loading cache entry {cache_key}: {e}")
 
-        if self._use_redis and self._redis:
-            full_key = f"{CACHE_PREFIX}{cache_key}"
-            # Get current TTL and preserve it
-            ttl = await self._redis.ttl(full_key)
-            if ttl > 0:
-                entry_data = json.dumps(entry.to_dict())
-                await self._redis.setex(full_key, ttl, entry_data)
-        else:
-            # Update in-memory entry
-            if cache_key in self._memory_cache:
-                self._memory_cache[cache_key] = entry
+        logger.info(
+            f"LLM cache loaded {loaded} entries into {len(self._partitions)} partitions "
+            f"in {(time.perf_counter() - start) * 1000:.1f}ms"
+        )
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get hit/miss, latency and size counters for the dashboard."""
+        hits = self._exact_hits + self._semantic_hits
+        lookups = hits + self._misses
+        return {
+            "enabled": self._enabled,
+            "backend": "redis" if self._use_redis else "memory",
+            "entries": sum(len(p) for p in self._partitions.values()),
+            "partitions": len(self._partitions),
+            "max_entries_per_partition": self._max_entries,
+            "hits": hits,
+            "exact_hits": self._exact_hits,
+            "semantic_hits": self._semantic_hits,
+            "misses": self._misses,
+            "hit_rate": hits / lookups if lookups else 0.0,
+            "evictions": self._evictions,
+            "avg_lookup_ms": self._lookup_ms_total / lookups if lookups else 0.0,
+            "max_lookup_ms": self._lookup_ms_max,
+        }
 
     async def clear(self, agent_type: str | None = None) -> None:
         """Clear cache entries.
@@ -419,29 +578,23 @@ class LLMResponseCache:
         Args:
             agent_type: Optional agent type to clear. If None, clears all.
         """
-        if agent_type:
-            pattern = f"{CACHE_PREFIX}{agent_type}:*"
-        else:
-            pattern = f"{CACHE_PREFIX}*"
+        for key in [k for k in self._partitions if not agent_type or k[0] == agent_type]:
+            del self._partitions[key]
 
         if self._use_redis and self._redis:
-            cursor = 0
-            while True:
-                cursor, keys = await self._redis.scan(cursor, match=pattern, count=100)
-                if keys:
-                    await self._redis.delete(*keys)
-                if cursor == 0:
-                    break
-        else:
-            # Clear from memory cache
-            keys_to_delete = [
-                k for k in self._memory_cache.keys() if not agent_type or k.startswith(f"{agent_type}:")
-            ]
-            for k in keys_to_delete:
-                del self._memory_cache[k]
-                self._memory_cache_embeddings.pop(k, None)
-
-        logger.info(f"LLM cache cleared", agent_type=agent_type or "all")
+            suffix = f"{agent_type}:*" if agent_type else "*"
+            for prefix in (CACHE_PREFIX, CACHE_EMBEDDING_PREFIX):
+                cursor = 0
+                while True:
+                    cursor, keys = await self._redis.scan(
+                        cursor, match=f"{prefix}{suffix}", count=100
+                    )
+                    if keys:
+                        await self._redis.delete(*keys)
+                    if cursor == 0:
+                        break
+
+        logger.info("LLM cache cleared: agent_type=%s", agent_type or "all")
 
 
 # Global cache instance
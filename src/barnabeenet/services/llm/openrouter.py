@@ -8,6 +8,7 @@ from __future__ import annotations
 
 import logging
 import time
+from collections.abc import AsyncIterator
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Any
 
@@ -16,6 +17,7 @@ from pydantic import BaseModel
 
 from barnabeenet.services.llm.cache import get_llm_cache
 from barnabeenet.services.llm.signals import LLMSignal, get_signal_logger
+from barnabeenet.services.llm.streaming import StreamResult, stream_ollama_chat, stream_openai_chat
 
 if TYPE_CHECKING:
     from barnabeenet.config import LLMSettings
@@ -138,6 +140,17 @@ class ChatResponse(BaseModel):
     latency_ms: float
 
 
+class ChatStreamChunk(BaseModel):
+    """One item from a streamed chat completion.
+
+    Intermediate chunks carry a text delta; the final chunk carries the
+    complete response.
+    """
+
+    text: str = ""
+    response: ChatResponse | None = None
+
+
 class OpenRouterClient:
     """OpenRouter API client with full signal logging.
 
@@ -310,142 +323,35 @@ class OpenRouterClient:
         if self._client is None:
             await self.init()
 
-        # Get config: activity-based (preferred) or agent-based (legacy)
-        if activity:
-            from barnabeenet.services.llm.activities import get_activity_config
-
-            activity_config = get_activity_config(activity)
-            actual_model = model or activity_config.model
-            actual_temp = temperature if temperature is not None else activity_config.temperature
-            actual_max_tokens = max_tokens or activity_config.max_tokens
-            config_top_p = activity_config.top_p
-            config_freq_penalty = activity_config.frequency_penalty
-            config_pres_penalty = activity_config.presence_penalty
-        else:
-            # Map agent_type to default activity for backward compatibility
-            # This ensures dashboard config applies even if agent doesn't pass activity
-            from barnabeenet.services.llm.activities import get_activity_config
-
-            agent_to_activity = {
-                "meta": "meta.classify_intent",
-                "instant": "instant.fallback",
-                "action": "action.parse_intent",
-                "interaction": "interaction.respond",
-                "memory": "memory.generate",
-            }
-            mapped_activity = agent_to_activity.get(agent_type)
-            if mapped_activity:
-                activity_config = get_activity_config(mapped_activity)
-                actual_model = model or activity_config.model
-                actual_temp = (
-                    temperature if temperature is not None else activity_config.temperature
-                )
-                actual_max_tokens = max_tokens or activity_config.max_tokens
-                config_top_p = activity_config.top_p
-                config_freq_penalty = activity_config.frequency_penalty
-                config_pres_penalty = activity_config.presence_penalty
-            else:
-                # Unknown agent type - use legacy config
-                config = self._get_model_config(agent_type)
-                actual_model = model or config.model
-                actual_temp = temperature if temperature is not None else config.temperature
-                actual_max_tokens = max_tokens or config.max_tokens
-                config_top_p = config.top_p
-                config_freq_penalty = config.frequency_penalty
-                config_pres_penalty = config.presence_penalty
-
-        # Normalize messages to dicts
-        msg_dicts = []
-        extracted_system = system_prompt
-        for msg in messages:
-            if isinstance(msg, ChatMessage):
-                msg_dict = {"role": msg.role, "content": msg.content}
-            else:
-                msg_dict = msg
-            if msg_dict["role"] == "system" and extracted_system is None:
-                extracted_system = msg_dict["content"]
-            msg_dicts.append(msg_dict)
-
-        # Create signal for logging (include activity if specified)
-        signal = LLMSignal(
-            agent_type=activity or agent_type,  # Use activity for more granular tracking
-            model=actual_model,
-            temperature=actual_temp,
-            max_tokens=actual_max_tokens,
-            system_prompt=extracted_system,
-            messages=msg_dicts,
+        signal, payload = self._prepare_chat(
+            messages,
+            agent_type,
+            activity=activity,
             conversation_id=conversation_id,
             trace_id=trace_id,
             user_input=user_input,
             speaker=speaker,
             room=room,
-            injected_context=injected_context or {},
-            started_at=datetime.now(UTC),
+            injected_context=injected_context,
+            model=model,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            system_prompt=system_prompt,
         )
-
-        # Build request payload
-        payload: dict[str, Any] = {
-            "model": actual_model,
-            "messages": msg_dicts,
-            "temperature": actual_temp,
-            "max_tokens": actual_max_tokens,
-        }
-        if config_top_p is not None:
-            payload["top_p"] = config_top_p
-        if config_freq_penalty is not None:
-            payload["frequency_penalty"] = config_freq_penalty
-        if config_pres_penalty is not None:
-            payload["presence_penalty"] = config_pres_penalty
+        msg_dicts = payload["messages"]
+        actual_model = payload["model"]
+        actual_temp = payload["temperature"]
+        actual_max_tokens = payload["max_tokens"]
 
         start_time = time.perf_counter()
 
         # Check cache first
         cache_key_text = user_input or (msg_dicts[-1].get("content", "") if msg_dicts else "")
-        cached_response = None
         if self._cache and cache_key_text:
-            cached_entry = await self._cache.get(
-                query_text=cache_key_text,
-                agent_type=activity or agent_type,
-                model=actual_model,
-                temperature=actual_temp,
+            cached_response = await self._get_cached(
+                signal, cache_key_text, activity or agent_type, start_time
             )
-            if cached_entry:
-                # Return cached response
-                latency_ms = (time.perf_counter() - start_time) * 1000
-                cached_response = ChatResponse(
-                    text=cached_entry.response_text,
-                    model=cached_entry.model,
-                    input_tokens=cached_entry.input_tokens,
-                    output_tokens=cached_entry.output_tokens,
-                    total_tokens=cached_entry.input_tokens + cached_entry.output_tokens,
-                    finish_reason="cache_hit",
-                    cost_usd=0.0,  # Cached responses cost nothing
-                    latency_ms=latency_ms,
-                )
-
-                # Update signal with cached response
-                signal.completed_at = datetime.now(UTC)
-                signal.response_text = cached_entry.response_text
-                signal.response_tokens = cached_entry.output_tokens
-                signal.finish_reason = "cache_hit"
-                signal.input_tokens = cached_entry.input_tokens
-                signal.output_tokens = cached_entry.output_tokens
-                signal.total_tokens = cached_entry.input_tokens + cached_entry.output_tokens
-                signal.cost_usd = 0.0
-                signal.latency_ms = latency_ms
-                signal.success = True
-                signal.cached = True
-
-                # Log signal for dashboard
-                await self._signal_logger.log_signal(signal)
-
-                logger.debug(
-                    "LLM cache hit",
-                    agent_type=activity or agent_type,
-                    model=actual_model,
-                    latency_ms=f"{latency_ms:.2f}",
-                )
-
+            if cached_response:
                 return cached_response
 
         try:
@@ -570,6 +476,307 @@ class OpenRouterClient:
             logger.error("OpenRouter unexpected error: %s", e)
             raise
 
+    async def chat_stream(
+        self,
+        messages: list[ChatMessage] | list[dict[str, str]],
+        agent_type: str = "interaction",
+        *,
+        activity: str | None = None,
+        conversation_id: str | None = None,
+        trace_id: str | None = None,
+        user_input: str | None = None,
+        speaker: str | None = None,
+        room: str | None = None,
+        injected_context: dict[str, Any] | None = None,
+        model: str | None = None,
+        temperature: float | None = None,
+        max_tokens: int | None = None,
+        system_prompt: str | None = None,
+    ) -> AsyncIterator[ChatStreamChunk]:
+        """Stream a chat completion, yielding text as it is generated.
+
+        Takes the same arguments as chat(). Yields a chunk with ``text`` set
+        for each delta, then a final chunk whose ``response`` holds the full
+        ChatResponse. A cache hit is yielded as a single delta. The signal
+        records time to first token, and the final text is cached as usual.
+        """
+        if self._client is None:
+            await self.init()
+
+        signal, payload = self._prepare_chat(
+            messages,
+            agent_type,
+            activity=activity,
+            conversation_id=conversation_id,
+            trace_id=trace_id,
+            user_input=user_input,
+            speaker=speaker,
+            room=room,
+            injected_context=injected_context,
+            model=model,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            system_prompt=system_prompt,
+        )
+        signal.streamed = True
+        msg_dicts = payload["messages"]
+        actual_model = payload["model"]
+        actual_temp = payload["temperature"]
+        is_local = actual_model.startswith("ollama/")
+
+        start_time = time.perf_counter()
+
+        cache_key_text = user_input or (msg_dicts[-1].get("content", "") if msg_dicts else "")
+        if self._cache and cache_key_text:
+            cached_response = await self._get_cached(
+                signal, cache_key_text, activity or agent_type, start_time
+            )
+            if cached_response:
+                signal.time_to_first_token_ms = cached_response.latency_ms
+                yield ChatStreamChunk(text=cached_response.text)
+                yield ChatStreamChunk(response=cached_response)
+                return
+
+        result = StreamResult(started_at=start_time)
+        try:
+            if is_local:
+                deltas = stream_ollama_chat(
+                    self._ollama_client,
+                    {
+                        "model": actual_model.replace("ollama/", ""),
+                        "messages": msg_dicts,
+                        "options": {
+                            "temperature": actual_temp,
+                            "num_predict": payload["max_tokens"],
+                        },
+                    },
+                    result,
+                )
+            else:
+                deltas = stream_openai_chat(self._client, "/chat/completions", payload, result)
+            async for delta in deltas:
+                if signal.time_to_first_token_ms is None:
+                    signal.time_to_first_token_ms = result.first_token_ms
+                yield ChatStreamChunk(text=delta)
+        except Exception as e:
+            signal.completed_at = datetime.now(UTC)
+            signal.error = str(e)
+            if isinstance(e, httpx.HTTPStatusError):
+                signal.error_type = "http_error"
+            elif isinstance(e, httpx.RequestError):
+                signal.error_type = "request_error"
+            else:
+                signal.error_type = type(e).__name__
+            signal.success = False
+            await self._signal_logger.log_signal(signal)
+            logger.error("OpenRouter streaming error: %s", e)
+            raise
+
+        latency_ms = result.elapsed_ms
+        input_tokens = result.input_tokens
+        output_tokens = result.output_tokens
+        cost_usd = (
+            0.0 if is_local else self._estimate_cost(actual_model, input_tokens, output_tokens)
+        )
+
+        signal.completed_at = datetime.now(UTC)
+        signal.response_text = result.text
+        signal.response_tokens = output_tokens
+        signal.finish_reason = result.finish_reason
+        signal.input_tokens = input_tokens
+        signal.output_tokens = output_tokens
+        signal.total_tokens = input_tokens + output_tokens
+        signal.cost_usd = cost_usd
+        signal.latency_ms = latency_ms
+        signal.success = True
+        await self._signal_logger.log_signal(signal)
+
+        # Cache the complete response, not the partial deltas
+        if self._cache and cache_key_text and result.text:
+            await self._cache.set(
+                query_text=cache_key_text,
+                response_text=result.text,
+                agent_type=activity or agent_type,
+                model=actual_model,
+                temperature=actual_temp,
+                input_tokens=input_tokens,
+                output_tokens=output_tokens,
+                cost_usd=cost_usd,
+            )
+
+        yield ChatStreamChunk(
+            response=ChatResponse(
+                text=result.text,
+                model=f"ollama/{result.model}" if is_local and result.model else actual_model,
+                input_tokens=input_tokens,
+                output_tokens=output_tokens,
+                total_tokens=input_tokens + output_tokens,
+                finish_reason=result.finish_reason,
+                cost_usd=cost_usd,
+                latency_ms=latency_ms,
+            )
+        )
+
+    def _prepare_chat(
+        self,
+        messages: list[ChatMessage] | list[dict[str, str]],
+        agent_type: str,
+        *,
+        activity: str | None,
+        conversation_id: str | None,
+        trace_id: str | None,
+        user_input: str | None,
+        speaker: str | None,
+        room: str | None,
+        injected_context: dict[str, Any] | None,
+        model: str | None,
+        temperature: float | None,
+        max_tokens: int | None,
+        system_prompt: str | None,
+    ) -> tuple[LLMSignal, dict[str, Any]]:
+        """Resolve model config and build the signal and request payload."""
+        # Get config: activity-based (preferred) or agent-based (legacy)
+        if activity:
+            from barnabeenet.services.llm.activities import get_activity_config
+
+            activity_config = get_activity_config(activity)
+            actual_model = model or activity_config.model
+            actual_temp = temperature if temperature is not None else activity_config.temperature
+            actual_max_tokens = max_tokens or activity_config.max_tokens
+            config_top_p = activity_config.top_p
+            config_freq_penalty = activity_config.frequency_penalty
+            config_pres_penalty = activity_config.presence_penalty
+        else:
+            # Map agent_type to default activity for backward compatibility
+            # This ensures dashboard config applies even if agent doesn't pass activity
+            from barnabeenet.services.llm.activities import get_activity_config
+
+            agent_to_activity = {
+                "meta": "meta.classify_intent",
+                "instant": "instant.fallback",
+                "action": "action.parse_intent",
+                "interaction": "interaction.respond",
+                "memory": "memory.generate",
+            }
+            mapped_activity = agent_to_activity.get(agent_type)
+            if mapped_activity:
+                activity_config = get_activity_config(mapped_activity)
+                actual_model = model or activity_config.model
+                actual_temp = (
+                    temperature if temperature is not None else activity_config.temperature
+                )
+                actual_max_tokens = max_tokens or activity_config.max_tokens
+                config_top_p = activity_config.top_p
+                config_freq_penalty = activity_config.frequency_penalty
+                config_pres_penalty = activity_config.presence_penalty
+            else:
+                # Unknown agent type - use legacy config
+                config = self._get_model_config(agent_type)
+                actual_model = model or config.model
+                actual_temp = temperature if temperature is not None else config.temperature
+                actual_max_tokens = max_tokens or config.max_tokens
+                config_top_p = config.top_p
+                config_freq_penalty = config.frequency_penalty
+                config_pres_penalty = config.presence_penalty
+
+        # Normalize messages to dicts
+        msg_dicts = []
+        extracted_system = system_prompt
+        for msg in messages:
+            if isinstance(msg, ChatMessage):
+                msg_dict = {"role": msg.role, "content": msg.content}
+            else:
+                msg_dict = msg
+            if msg_dict["role"] == "system" and extracted_system is None:
+                extracted_system = msg_dict["content"]
+            msg_dicts.append(msg_dict)
+
+        # Create signal for logging (include activity if specified)
+        signal = LLMSignal(
+            agent_type=activity or agent_type,  # Use activity for more granular tracking
+            model=actual_model,
+            temperature=actual_temp,
+            max_tokens=actual_max_tokens,
+            system_prompt=extracted_system,
+            messages=msg_dicts,
+            conversation_id=conversation_id,
+            trace_id=trace_id,
+            user_input=user_input,
+            speaker=speaker,
+            room=room,
+            injected_context=injected_context or {},
+            started_at=datetime.now(UTC),
+        )
+
+        # Build request payload
+        payload: dict[str, Any] = {
+            "model": actual_model,
+            "messages": msg_dicts,
+            "temperature": actual_temp,
+            "max_tokens": actual_max_tokens,
+        }
+        if config_top_p is not None:
+            payload["top_p"] = config_top_p
+        if config_freq_penalty is not None:
+            payload["frequency_penalty"] = config_freq_penalty
+        if config_pres_penalty is not None:
+            payload["presence_penalty"] = config_pres_penalty
+
+        return signal, payload
+
+    async def _get_cached(
+        self,
+        signal: LLMSignal,
+        cache_key_text: str,
+        cache_agent_type: str,
+        start_time: float,
+    ) -> ChatResponse | None:
+        """Look up a cached response, logging the signal on a hit."""
+        cached_entry = await self._cache.get(
+            query_text=cache_key_text,
+            agent_type=cache_agent_type,
+            model=signal.model,
+            temperature=signal.temperature,
+        )
+        if not cached_entry:
+            return None
+
+        latency_ms = (time.perf_counter() - start_time) * 1000
+        cached_response = ChatResponse(
+            text=cached_entry.response_text,
+            model=cached_entry.model,
+            input_tokens=cached_entry.input_tokens,
+            output_tokens=cached_entry.output_tokens,
+            total_tokens=cached_entry.input_tokens + cached_entry.output_tokens,
+            finish_reason="cache_hit",
+            cost_usd=0.0,  # Cached responses cost nothing
+            latency_ms=latency_ms,
+        )
+
+        # Update signal with cached response
+        signal.completed_at = datetime.now(UTC)
+        signal.response_text = cached_entry.response_text
+        signal.response_tokens = cached_entry.output_tokens
+        signal.finish_reason = "cache_hit"
+        signal.input_tokens = cached_entry.input_tokens
+        signal.output_tokens = cached_entry.output_tokens
+        signal.total_tokens = cached_entry.input_tokens + cached_entry.output_tokens
+        signal.cost_usd = 0.0
+        signal.latency_ms = latency_ms
+        signal.success = True
+        signal.cached = True
+
+        # Log signal for dashboard
+        await self._signal_logger.log_signal(signal)
+
+        logger.debug(
+            "LLM cache hit: agent_type=%s model=%s latency_ms=%.2f",
+            cache_agent_type,
+            signal.model,
+            latency_ms,
+        )
+        return cached_response
+
     async def simple_chat(
         self,
         user_message: str,
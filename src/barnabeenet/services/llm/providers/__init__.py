@@ -27,6 +27,7 @@ Usage:
 from .base import (
     ChatMessage,
     ChatResponse,
+    ChatStreamChunk,
     LLMProvider,
     ModelConfig,
     ProviderConfig,
@@ -36,6 +37,7 @@ from .factory import create_provider, create_provider_from_config, get_available
 __all__ = [
     "ChatMessage",
     "ChatResponse",
+    "ChatStreamChunk",
     "LLMProvider",
     "ModelConfig",
     "ProviderConfig",
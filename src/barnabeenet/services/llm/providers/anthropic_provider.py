@@ -8,13 +8,17 @@ from __future__ import annotations
 
 import logging
 import time
+from collections.abc import AsyncIterator
 from typing import Any
 
 import httpx
 
+from barnabeenet.services.llm.streaming import StreamResult, stream_anthropic_messages
+
 from .base import (
     BaseLLMProvider,
     ChatResponse,
+    ChatStreamChunk,
     ProviderConfig,
     ProviderType,
 )
@@ -96,33 +100,8 @@ class AnthropicProvider(BaseLLMProvider):
         if self._client is None:
             await self.init()
 
-        # Strip provider prefix if present
-        clean_model = model.replace("anthropic/", "")
-
-        # Anthropic separates system from messages
-        system_prompt = None
-        user_messages = []
-        for msg in messages:
-            if msg["role"] == "system":
-                system_prompt = msg["content"]
-            else:
-                user_messages.append(msg)
-
-        payload: dict[str, Any] = {
-            "model": clean_model,
-            "messages": user_messages,
-            "max_tokens": max_tokens,
-            "temperature": temperature,
-        }
-
-        if system_prompt:
-            payload["system"] = system_prompt
-
-        # Add optional parameters
-        if "top_p" in kwargs and kwargs["top_p"] is not None:
-            payload["top_p"] = kwargs["top_p"]
-        if "stop" in kwargs and kwargs["stop"] is not None:
-            payload["stop_sequences"] = kwargs["stop"]
+        payload = self._build_payload(messages, model, temperature, max_tokens, **kwargs)
+        clean_model = payload["model"]
 
         start_time = time.perf_counter()
 
@@ -155,3 +134,72 @@ class AnthropicProvider(BaseLLMProvider):
             latency_ms=latency_ms,
             raw_response=data,
         )
+
+    async def _do_chat_stream(
+        self,
+        messages: list[dict[str, str]],
+        model: str,
+        temperature: float,
+        max_tokens: int,
+        **kwargs: Any,
+    ) -> AsyncIterator[ChatStreamChunk]:
+        """Stream Anthropic messages API call via SSE."""
+        if self._client is None:
+            await self.init()
+
+        payload = self._build_payload(messages, model, temperature, max_tokens, **kwargs)
+        clean_model = payload["model"]
+        result = StreamResult()
+        async for delta in stream_anthropic_messages(self._client, payload, result):
+            yield ChatStreamChunk(text=delta)
+
+        yield ChatStreamChunk(
+            response=ChatResponse(
+                text=result.text,
+                model=result.model or clean_model,
+                provider="anthropic",
+                input_tokens=result.input_tokens,
+                output_tokens=result.output_tokens,
+                total_tokens=result.input_tokens + result.output_tokens,
+                finish_reason=result.finish_reason,
+                cost_usd=self._estimate_cost(
+                    clean_model, result.input_tokens, result.output_tokens
+                ),
+                latency_ms=result.elapsed_ms,
+            )
+        )
+
+    @staticmethod
+    def _build_payload(
+        messages: list[dict[str, str]],
+        model: str,
+        temperature: float,
+        max_tokens: int,
+        **kwargs: Any,
+    ) -> dict[str, Any]:
+        # Anthropic separates system from messages
+        system_prompt = None
+        user_messages = []
+        for msg in messages:
+            if msg["role"] == "system":
+                system_prompt = msg["content"]
+            else:
+                user_messages.append(msg)
+
+        # Strip provider prefix if present
+        payload: dict[str, Any] = {
+            "model": model.replace("anthropic/", ""),
+            "messages": user_messages,
+            "max_tokens": max_tokens,
+            "temperature": temperature,
+        }
+
+        if system_prompt:
+            payload["system"] = system_prompt
+
+        # Add optional parameters
+        if "top_p" in kwargs and kwargs["top_p"] is not None:
+            payload["top_p"] = kwargs["top_p"]
+        if "stop" in kwargs and kwargs["stop"] is not None:
+            payload["stop_sequences"] = kwargs["stop"]
+        return payload
@@ -7,6 +7,7 @@ from __future__ import annotations
 
 import logging
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from enum import Enum
@@ -16,6 +17,7 @@ from pydantic import BaseModel
 
 if TYPE_CHECKING:
     from barnabeenet.config import LLMSettings
+    from barnabeenet.services.llm.signals import LLMSignal
 
 logger = logging.getLogger(__name__)
 
@@ -58,6 +60,16 @@ class ChatResponse(BaseModel):
     raw_response: dict[str, Any] | None = None
 
 
+class ChatStreamChunk(BaseModel):
+    """One piece of a streamed chat completion.
+
+    Text chunks carry ``text``; the last chunk carries the complete ``response``.
+    """
+
+    text: str = ""
+    response: ChatResponse | None = None
+
+
 class ModelConfig(BaseModel):
     """Configuration for a specific model."""
 
@@ -225,6 +237,25 @@ class LLMProvider(Protocol):
         """
         ...
 
+    def chat_stream(
+        self,
+        messages: list[ChatMessage] | list[dict[str, str]],
+        agent_type: str = "interaction",
+        *,
+        signal_context: SignalContext | None = None,
+        model: str | None = None,
+        temperature: float | None = None,
+        max_tokens: int | None = None,
+        system_prompt: str | None = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[ChatStreamChunk]:
+        """Stream a chat completion as text deltas.
+
+        Same arguments as ``chat``. Yields text chunks as they are generated,
+        then a final chunk whose ``response`` holds the complete ChatResponse.
+        """
+        ...
+
     def get_model_config(self, agent_type: str) -> ModelConfig:
         """Get model configuration for an agent type."""
         ...
@@ -281,6 +312,30 @@ class BaseLLMProvider(ABC):
         """
         ...
 
+    async def _do_chat_stream(
+        self,
+        messages: list[dict[str, str]],
+        model: str,
+        temperature: float,
+        max_tokens: int,
+        **kwargs: Any,
+    ) -> AsyncIterator[ChatStreamChunk]:
+        """Execute a streaming chat API call.
+
+        Providers with a streaming API override this. The default makes one
+        blocking call and yields its text as a single chunk.
+        """
+        response = await self._do_chat(
+            messages=messages,
+            model=model,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            **kwargs,
+        )
+        if response.text:
+            yield ChatStreamChunk(text=response.text)
+        yield ChatStreamChunk(response=response)
+
     async def chat(
         self,
         messages: list[ChatMessage] | list[dict[str, str]],
@@ -304,6 +359,97 @@ class BaseLLMProvider(ABC):
         if not self._initialized:
             await self.init()
 
+        msg_dicts, signal, call_params = self._prepare_call(
+            messages,
+            agent_type,
+            signal_context=signal_context,
+            model=model,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            system_prompt=system_prompt,
+        )
+
+        # Execute the call
+        try:
+            response = await self._do_chat(messages=msg_dicts, **call_params, **kwargs)
+            self._record_response(signal, response)
+
+        except Exception as e:
+            signal.error = str(e)
+            signal.success = False
+            signal.completed_at = datetime.now(UTC)
+            logger.error(f"LLM call failed: {e}")
+            raise
+        finally:
+            await self._log_signal(signal)
+
+        return response
+
+    async def chat_stream(
+        self,
+        messages: list[ChatMessage] | list[dict[str, str]],
+        agent_type: str = "interaction",
+        *,
+        signal_context: SignalContext | None = None,
+        model: str | None = None,
+        temperature: float | None = None,
+        max_tokens: int | None = None,
+        system_prompt: str | None = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[ChatStreamChunk]:
+        """Stream a chat completion with logging.
+
+        Yields text chunks as they arrive and a final chunk carrying the
+        complete ChatResponse. The signal records time to first token.
+        """
+        if not self._initialized:
+            await self.init()
+
+        msg_dicts, signal, call_params = self._prepare_call(
+            messages,
+            agent_type,
+            signal_context=signal_context,
+            model=model,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            system_prompt=system_prompt,
+        )
+        signal.streamed = True
+        start = datetime.now(UTC)
+
+        try:
+            async for chunk in self._do_chat_stream(messages=msg_dicts, **call_params, **kwargs):
+                if chunk.text and signal.time_to_first_token_ms is None:
+                    elapsed = datetime.now(UTC) - start
+                    signal.time_to_first_token_ms = elapsed.total_seconds() * 1000
+                if chunk.response is not None:
+                    self._record_response(signal, chunk.response)
+                yield chunk
+        except Exception as e:
+            signal.error = str(e)
+            signal.success = False
+            signal.completed_at = datetime.now(UTC)
+            logger.error(f"LLM stream failed: {e}")
+            raise
+        finally:
+            await self._log_signal(signal)
+
+    def _prepare_call(
+        self,
+        messages: list[ChatMessage] | list[dict[str, str]],
+        agent_type: str,
+        *,
+        signal_context: SignalContext | None,
+        model: str | None,
+        temperature: float | None,
+        max_tokens: int | None,
+        system_prompt: str | None,
+    ) -> tuple[list[dict[str, str]], LLMSignal, dict[str, Any]]:
+        """Resolve config, normalize messages and build the signal for a call.
+
+        Returns:
+            Tuple of (message dicts, signal, model/temperature/max_tokens params).
+        """
         # Resolve config
         config = self.get_model_config(agent_type)
         actual_model = model or config.model
@@ -322,7 +468,7 @@ class BaseLLMProvider(ABC):
             msg_dicts.append(msg_dict)
 
         # Import signal logging here to avoid circular imports
-        from barnabeenet.services.llm.signals import LLMSignal, get_signal_logger
+        from barnabeenet.services.llm.signals import LLMSignal
 
         # Build signal for logging
         extracted_system = system_prompt
@@ -347,36 +493,27 @@ class BaseLLMProvider(ABC):
             started_at=signal_context.started_at if signal_context else datetime.now(UTC),
         )
 
-        # Execute the call
-        try:
-            response = await self._do_chat(
-                messages=msg_dicts,
-                model=actual_model,
-                temperature=actual_temp,
-                max_tokens=actual_max_tokens,
-                **kwargs,
-            )
-
-            # Update signal with response
-            signal.response_text = response.text
-            signal.completed_at = datetime.now(UTC)
-            signal.latency_ms = response.latency_ms
-            signal.input_tokens = response.input_tokens
-            signal.output_tokens = response.output_tokens
-            signal.total_tokens = response.total_tokens
-            signal.cost_usd = response.cost_usd
-            signal.finish_reason = response.finish_reason
-            signal.success = True
-
-        except Exception as e:
-            signal.error = str(e)
-            signal.success = False
-            signal.completed_at = datetime.now(UTC)
-            logger.error(f"LLM call failed: {e}")
-            raise
-        finally:
-            # Log signal
-            signal_logger = get_signal_logger()
-            await signal_logger.log(signal)
-
-        return response
+        call_params = {
+            "model": actual_model,
+            "temperature": actual_temp,
+            "max_tokens": actual_max_tokens,
+        }
+        return msg_dicts, signal, call_params
+
+    @staticmethod
+    def _record_response(signal: LLMSignal, response: ChatResponse) -> None:
+        signal.response_text = response.text
+        signal.completed_at = datetime.now(UTC)
+        signal.latency_ms = response.latency_ms
+        signal.input_tokens = response.input_tokens
+        signal.output_tokens = response.output_tokens
+        signal.total_tokens = response.total_tokens
+        signal.cost_usd = response.cost_usd
+        signal.finish_reason = response.finish_reason
+        signal.success = True
+
+    @staticmethod
+    async def _log_signal(signal: LLMSignal) -> None:
+        from barnabeenet.services.llm.signals import get_signal_logger
+
+        await get_signal_logger().log_signal(signal)
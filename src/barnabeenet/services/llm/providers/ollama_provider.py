@@ -8,13 +8,17 @@ from __future__ import annotations
 
 import logging
 import time
+from collections.abc import AsyncIterator
 from typing import Any
 
 import httpx
 
+from barnabeenet.services.llm.streaming import StreamResult, stream_ollama_chat
+
 from .base import (
     BaseLLMProvider,
     ChatResponse,
+    ChatStreamChunk,
     ProviderConfig,
     ProviderType,
 )
@@ -130,6 +134,46 @@ class OllamaProvider(BaseLLMProvider):
             raw_response=data,
         )
 
+    async def _do_chat_stream(
+        self,
+        messages: list[dict[str, str]],
+        model: str,
+        temperature: float,
+        max_tokens: int,
+        **kwargs: Any,
+    ) -> AsyncIterator[ChatStreamChunk]:
+        """Stream Ollama chat completion (newline-delimited JSON)."""
+        if self._client is None:
+            await self.init()
+
+        clean_model = model.replace("ollama/", "").replace("local/", "")
+        payload: dict[str, Any] = {
+            "model": clean_model,
+            "messages": messages,
+            "options": {
+                "temperature": temperature,
+                "num_predict": max_tokens,
+            },
+        }
+
+        result = StreamResult()
+        async for delta in stream_ollama_chat(self._client, payload, result):
+            yield ChatStreamChunk(text=delta)
+
+        yield ChatStreamChunk(
+            response=ChatResponse(
+                text=result.text,
+                model=result.model or clean_model,
+                provider="ollama",
+                input_tokens=result.input_tokens,
+                output_tokens=result.output_tokens,
+                total_tokens=result.input_tokens + result.output_tokens,
+                finish_reason=result.finish_reason,
+                cost_usd=0.0,  # Local inference has no API cost
+                latency_ms=result.elapsed_ms,
+            )
+        )
+
     async def list_models(self) -> list[str]:
         """List available models in Ollama."""
         if self._client is None:
@@ -8,13 +8,17 @@ from __future__ import annotations
 
 import logging
 import time
+from collections.abc import AsyncIterator
 from typing import Any
 
 import httpx
 
+from barnabeenet.services.llm.streaming import StreamResult, stream_openai_chat
+
 from .base import (
     BaseLLMProvider,
     ChatResponse,
+    ChatStreamChunk,
     ProviderConfig,
     ProviderType,
 )
@@ -109,18 +113,7 @@ class OpenRouterProvider(BaseLLMProvider):
         if self._client is None:
             await self.init()
 
-        # Build request payload
-        payload: dict[str, Any] = {
-            "model": model,
-            "messages": messages,
-            "temperature": temperature,
-            "max_tokens": max_tokens,
-        }
-
-        # Add optional parameters
-        for key in ["top_p", "frequency_penalty", "presence_penalty", "stop"]:
-            if key in kwargs and kwargs[key] is not None:
-                payload[key] = kwargs[key]
+        payload = self._build_payload(messages, model, temperature, max_tokens, **kwargs)
 
         start_time = time.perf_counter()
 
@@ -148,3 +141,55 @@ class OpenRouterProvider(BaseLLMProvider):
             latency_ms=latency_ms,
             raw_response=data,
         )
+
+    async def _do_chat_stream(
+        self,
+        messages: list[dict[str, str]],
+        model: str,
+        temperature: float,
+        max_tokens: int,
+        **kwargs: Any,
+    ) -> AsyncIterator[ChatStreamChunk]:
+        """Stream OpenRouter chat completion via SSE."""
+        if self._client is None:
+            await self.init()
+
+        payload = self._build_payload(messages, model, temperature, max_tokens, **kwargs)
+        result = StreamResult()
+        async for delta in stream_openai_chat(self._client, "/chat/completions", payload, result):
+            yield ChatStreamChunk(text=delta)
+
+        yield ChatStreamChunk(
+            response=ChatResponse(
+                text=result.text,
+                model=result.model or model,
+                provider="openrouter",
+                input_tokens=result.input_tokens,
+                output_tokens=result.output_tokens,
+                total_tokens=result.input_tokens + result.output_tokens,
+                finish_reason=result.finish_reason,
+                cost_usd=self._estimate_cost(model, result.input_tokens, result.output_tokens),
+                latency_ms=result.elapsed_ms,
+            )
+        )
+
+    @staticmethod
+    def _build_payload(
+        messages: list[dict[str, str]],
+        model: str,
+        temperature: float,
+        max_tokens: int,
+        **kwargs: Any,
+    ) -> dict[str, Any]:
+        payload: dict[str, Any] = {
+            "model": model,
+            "messages": messages,
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+        }
+
+        # Add optional parameters
+        for key in ["top_p", "frequency_penalty", "presence_penalty", "stop"]:
+            if key in kwargs and kwargs[key] is not None:
+                payload[key] = kwargs[key]
+        return payload
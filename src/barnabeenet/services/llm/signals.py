@@ -13,6 +13,8 @@ from typing import TYPE_CHECKING, Any
 
 from pydantic import BaseModel, Field
 
+from barnabeenet.services.telemetry_writer import get_telemetry_writer, op
+
 if TYPE_CHECKING:
     import redis.asyncio as redis
 
@@ -37,6 +39,8 @@ class LLMSignal(BaseModel):
     started_at: datetime | None = None
     completed_at: datetime | None = None
     latency_ms: float | None = None
+    time_to_first_token_ms: float | None = None  # Streamed responses only
+    streamed: bool = False
 
     # Agent context
     agent_type: str  # meta, instant, action, interaction, memory
@@ -140,37 +144,33 @@ class SignalLogger:
                 self._fallback_logs.pop(0)
             return
 
-        try:
-            # Store full signal details
-            signal_key = f"{self.SIGNAL_PREFIX}{signal.signal_id}"
-            signal_json = signal.model_dump_json()
-            await self._redis.setex(signal_key, self.SIGNAL_TTL_SECONDS, signal_json)
-
-            # Add to stream for real-time dashboard feed
-            # Stream entry contains summary; full details via signal_id lookup
-            stream_data = {
-                "signal_id": signal.signal_id,
-                "timestamp": signal.timestamp.isoformat(),
-                "agent_type": signal.agent_type,
-                "model": signal.model,
-                "success": str(signal.success),
-                "latency_ms": str(signal.latency_ms or 0),
-                "input_tokens": str(signal.input_tokens or 0),
-                "output_tokens": str(signal.output_tokens or 0),
-                "cost_usd": str(signal.cost_usd or 0),
-                "user_input": (signal.user_input or "")[:100],
-                "response_preview": (signal.response_text or "")[:200],
-                "error": signal.error or "",
-            }
-            await self._redis.xadd(
-                self.STREAM_KEY,
-                stream_data,
-                maxlen=10000,  # Keep last 10k signals in stream
-            )
-
-        except Exception as e:
-            logger.error("Failed to log signal to Redis: %s", e)
-            self._fallback_logs.append(signal)
+        # Store full signal details
+        signal_key = f"{self.SIGNAL_PREFIX}{signal.signal_id}"
+        signal_json = signal.model_dump_json()
+
+        # Add to stream for real-time dashboard feed
+        # Stream entry contains summary; full details via signal_id lookup
+        stream_data = {
+            "signal_id": signal.signal_id,
+            "timestamp": signal.timestamp.isoformat(),
+            "agent_type": signal.agent_type,
+            "model": signal.model,
+            "success": str(signal.success),
+            "latency_ms": str(signal.latency_ms or 0),
+            "time_to_first_token_ms": str(signal.time_to_first_token_ms or ""),
+            "input_tokens": str(signal.input_tokens or 0),
+            "output_tokens": str(signal.output_tokens or 0),
+            "cost_usd": str(signal.cost_usd or 0),
+            "user_input": (signal.user_input or "")[:100],
+            "response_preview": (signal.response_text or "")[:200],
+            "error": signal.error or "",
+        }
+
+        # Both writes go out in the next batched telemetry flush
+        get_telemetry_writer(self._redis).submit(
+            op("setex", signal_key, self.SIGNAL_TTL_SECONDS, signal_json),
+            op("xadd", self.STREAM_KEY, stream_data, maxlen=10000),  # Keep last 10k signals
+        )
 
     async def get_signal(self, signal_id: str) -> LLMSignal | None:
         """Retrieve full signal details by ID."""
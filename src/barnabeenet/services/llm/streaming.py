@@ -0,0 +1,195 @@
+"""Streaming response parsing for LLM APIs.
+
+Parses the incremental wire formats used by the supported backends and
+yields text deltas as they arrive:
+- OpenAI-compatible SSE (OpenRouter, OpenAI, Azure, Grok)
+- Anthropic Messages SSE
+- Ollama newline-delimited JSON
+
+Each ``stream_*`` helper fills a StreamResult with the accumulated text,
+token usage, finish reason and time to first token, so callers can build
+their usual ChatResponse and LLMSignal once the stream ends.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import time
+from collections.abc import AsyncIterator
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    import httpx
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class StreamResult:
+    """Accumulated state of a streamed completion."""
+
+    started_at: float = field(default_factory=time.perf_counter)
+    parts: list[str] = field(default_factory=list)
+    model: str | None = None
+    finish_reason: str = "unknown"
+    input_tokens: int = 0
+    output_tokens: int = 0
+    first_token_ms: float | None = None
+
+    @property
+    def text(self) -> str:
+        return "".join(self.parts)
+
+    @property
+    def elapsed_ms(self) -> float:
+        return (time.perf_counter() - self.started_at) * 1000
+
+    def add(self, delta: str) -> None:
+        if self.first_token_ms is None:
+            self.first_token_ms = self.elapsed_ms
+        self.parts.append(delta)
+
+
+# =============================================================================
+# Wire formats
+# =============================================================================
+
+
+async def iter_sse_json(response: httpx.Response) -> AsyncIterator[dict[str, Any]]:
+    """Yield the JSON payload of each server-sent event.
+
+    Comment lines (keep-alives such as ``: OPENROUTER PROCESSING``) and
+    non-data fields are skipped; a ``[DONE]`` payload ends the stream.
+    """
+    data_lines: list[str] = []
+    async for line in response.aiter_lines():
+        if line.startswith(":"):
+            continue
+        if line.startswith("data:"):
+            data = line[5:].lstrip()
+            if data == "[DONE]":
+                return
+            data_lines.append(data)
+        elif not line and data_lines:
+            event = _decode_json("\n".join(data_lines))
+            data_lines.clear()
+            if event is not None:
+                yield event
+    if data_lines:
+        event = _decode_json("\n".join(data_lines))
+        if event is not None:
+            yield event
+
+
+async def iter_ndjson(response: httpx.Response) -> AsyncIterator[dict[str, Any]]:
+    """Yield each JSON object from a newline-delimited JSON response."""
+    async for line in response.aiter_lines():
+        if not line.strip():
+            continue
+        event = _decode_json(line)
+        if event is not None:
+            yield event
+
+
+def _decode_json(payload: str) -> dict[str, Any] | None:
+    try:
+        return json.loads(payload)
+    except json.JSONDecodeError:
+        logger.debug("Skipping malformed stream payload: %s", payload[:100])
+        return None
+
+
+# =============================================================================
+# API-specific streams
+# =============================================================================
+
+
+async def stream_openai_chat(
+    client: httpx.AsyncClient,
+    path: str,
+    payload: dict[str, Any],
+    result: StreamResult,
+) -> AsyncIterator[str]:
+    """Stream an OpenAI-compatible chat completion, yielding content deltas.
+
+    Args:
+        client: HTTP client with base URL and auth headers.
+        path: Completions path (e.g. ``/chat/completions``).
+        payload: Request body without streaming flags.
+        result: Filled with text, usage and finish reason.
+    """
+    body = {**payload, "stream": True, "stream_options": {"include_usage": True}}
+    async with client.stream("POST", path, json=body) as response:
+        response.raise_for_status()
+        async for event in iter_sse_json(response):
+            if "error" in event:
+                raise RuntimeError(f"Stream error: {event['error']}")
+            result.model = event.get("model") or result.model
+            usage = event.get("usage")
+            if usage:
+                result.input_tokens = usage.get("prompt_tokens", 0)
+                result.output_tokens = usage.get("completion_tokens", 0)
+            choices = event.get("choices") or []
+            if not choices:
+                continue
+            choice = choices[0]
+            if choice.get("finish_reason"):
+                result.finish_reason = choice["finish_reason"]
+            delta = (choice.get("delta") or {}).get("content")
+            if delta:
+                result.add(delta)
+                yield delta
+
+
+async def stream_anthropic_messages(
+    client: httpx.AsyncClient,
+    payload: dict[str, Any],
+    result: StreamResult,
+) -> AsyncIterator[str]:
+    """Stream an Anthropic Messages API call, yielding text deltas."""
+    async with client.stream("POST", "/messages", json={**payload, "stream": True}) as response:
+        response.raise_for_status()
+        async for event in iter_sse_json(response):
+            event_type = event.get("type")
+            if event_type == "message_start":
+                message = event.get("message", {})
+                result.model = message.get("model") or result.model
+                result.input_tokens = message.get("usage", {}).get("input_tokens", 0)
+            elif event_type == "content_block_delta":
+                delta = event.get("delta", {})
+                if delta.get("type") == "text_delta" and delta.get("text"):
+                    result.add(delta["text"])
+                    yield delta["text"]
+            elif event_type == "message_delta":
+                stop_reason = event.get("delta", {}).get("stop_reason")
+                if stop_reason:
+                    result.finish_reason = stop_reason
+                result.output_tokens = event.get("usage", {}).get(
+                    "output_tokens", result.output_tokens
+                )
+            elif event_type == "error":
+                raise RuntimeError(f"Stream error: {event.get('error')}")
+
+
+async def stream_ollama_chat(
+    client: httpx.AsyncClient,
+    payload: dict[str, Any],
+    result: StreamResult,
+) -> AsyncIterator[str]:
+    """Stream an Ollama /api/chat call, yielding content deltas."""
+    async with client.stream("POST", "/api/chat", json={**payload, "stream": True}) as response:
+        response.raise_for_status()
+        async for event in iter_ndjson(response):
+            if event.get("error"):
+                raise RuntimeError(f"Ollama error: {event['error']}")
+            result.model = event.get("model") or result.model
+            delta = event.get("message", {}).get("content")
+            if delta:
+                result.add(delta)
+                yield delta
+            if event.get("done"):
+                result.finish_reason = event.get("done_reason", "stop")
+                result.input_tokens = event.get("prompt_eval_count", 0)
+                result.output_tokens = event.get("eval_count", 0)
@@ -6,12 +6,26 @@ It captures:
 2. Why specific patterns did or didn't match
 3. Alternative patterns that came close to matching
 4. Suggestions for improving pattern coverage
+
+Full diagnosis checks every pattern with difflib similarity, so it is too
+slow for the classification path. In background mode, classifiers call
+``submit()`` after matching. Misses, plus a sampled fraction of hits, are
+diagnosed later by a worker task that runs each diagnosis in a thread, so
+the event loop keeps serving requests; results are stored back on the
+loop. Each pattern's literal skeleton, keywords and SequenceMatcher are
+precomputed once and reused (diagnoses are serialized, since the cached
+matchers are stateful).
 """
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import random
 import re
+import threading
+import time
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from difflib import SequenceMatcher
@@ -20,6 +34,14 @@ from typing import Any
 
 logger = logging.getLogger(__name__)
 
+# Default share of matched inputs that still get a background diagnosis
+DEFAULT_HIT_SAMPLE_RATE = 0.05
+
+# Background diagnoses waiting beyond this are dropped
+DEFAULT_MAX_PENDING = 100
+
+_REGEX_SPECIALS = re.compile(r"[\^\$\.\*\+\?\(\)\[\]\{\}\|\\]")
+
 
 class MatchFailureReason(Enum):
     """Reasons why a pattern didn't match."""
@@ -101,6 +123,27 @@ class PatternDiagnostics:
         }
 
 
+@dataclass
+class _PatternSkeleton:
+    """Precomputed literal view of a regex, reused across diagnoses."""
+
+    skeleton: str  # Pattern with regex syntax stripped, for similarity
+    keywords: list[str]
+    matcher: SequenceMatcher | None  # seq2 is the skeleton (b2j built once)
+    without_start_anchor: re.Pattern[str] | None
+    without_end_anchor: re.Pattern[str] | None
+
+
+@dataclass
+class _DiagnosisJob:
+    """A classification queued for background diagnosis."""
+
+    text: str
+    compiled_patterns: dict[str, list[tuple[re.Pattern[str], str]]]
+    pattern_priority: list[tuple[str, Any, float]]
+    matched: bool
+
+
 class LogicDiagnosticsService:
     """Service for diagnosing pattern matching and routing logic."""
 
@@ -122,9 +165,47 @@ class LogicDiagnosticsService:
         "remember": ["remeber", "remmeber", "remembr"],
     }
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        hit_sample_rate: float = DEFAULT_HIT_SAMPLE_RATE,
+        max_pending: int = DEFAULT_MAX_PENDING,
+    ) -> None:
         self._diagnostics_history: list[PatternDiagnostics] = []
         self._max_history = 1000
+        self._skeletons: dict[tuple[str, int], _PatternSkeleton] = {}
+        # Held for a whole diagnosis: the cached SequenceMatchers are stateful
+        self._diagnose_lock = threading.Lock()
+
+        # Background mode
+        self._hit_sample_rate = hit_sample_rate
+        self._max_pending = max_pending
+        self._pending: deque[_DiagnosisJob] = deque()
+        self._wakeup: asyncio.Event | None = None
+        self._idle: asyncio.Event | None = None
+        self._worker: asyncio.Task[None] | None = None
+        self._background_stats: dict[str, float] = dict.fromkeys(
+            (
+                "submitted",
+                "queued",
+                "sampled_out",
+                "dropped",
+                "completed",
+                "diagnosis_ms",
+                "submit_ms",
+            ),
+            0,
+        )
+
+    def configure_background(
+        self,
+        hit_sample_rate: float | None = None,
+        max_pending: int | None = None,
+    ) -> None:
+        """Adjust background mode sampling and queue size."""
+        if hit_sample_rate is not None:
+            self._hit_sample_rate = min(max(hit_sample_rate, 0.0), 1.0)
+        if max_pending is not None:
+            self._max_pending = max(1, max_pending)
 
     def diagnose_pattern_match(
         self,
@@ -142,8 +223,29 @@ class LogicDiagnosticsService:
         Returns:
             PatternDiagnostics with full analysis
         """
-        import time
+        diag = self._diagnose(text, compiled_patterns, pattern_priority)
+
+        # Store in history
+        self._store_diagnostics(diag)
+
+        return diag
 
+    def _diagnose(
+        self,
+        text: str,
+        compiled_patterns: dict[str, list[tuple[re.Pattern[str], str]]],
+        pattern_priority: list[tuple[str, Any, float]],
+    ) -> PatternDiagnostics:
+        """Run the diagnosis without touching history (safe to call from a thread)."""
+        with self._diagnose_lock:
+            return self._diagnose_locked(text, compiled_patterns, pattern_priority)
+
+    def _diagnose_locked(
+        self,
+        text: str,
+        compiled_patterns: dict[str, list[tuple[re.Pattern[str], str]]],
+        pattern_priority: list[tuple[str, Any, float]],
+    ) -> PatternDiagnostics:
         start = time.perf_counter()
 
         normalized = text.lower().strip()
@@ -185,11 +287,142 @@ class LogicDiagnosticsService:
             diag.classification_method = "pattern"
 
         diag.processing_time_ms = (time.perf_counter() - start) * 1000
+        return diag
 
-        # Store in history
-        self._store_diagnostics(diag)
+    # =========================================================================
+    # Background mode
+    # =========================================================================
 
-        return diag
+    def submit(
+        self,
+        text: str,
+        compiled_patterns: dict[str, list[tuple[re.Pattern[str], str]]],
+        pattern_priority: list[tuple[str, Any, float]],
+        matched: bool,
+    ) -> bool:
+        """Queue a classification for background diagnosis without blocking.
+
+        Misses are always queued; hits are queued at the hit sample rate.
+        Must be called from the event loop that runs the worker.
+
+        Args:
+            text: The input text that was classified
+            compiled_patterns: Dict of pattern_group -> [(compiled_pattern, sub_category)]
+            pattern_priority: List of (group_name, intent_category, confidence) in order
+            matched: Whether the classifier found a matching pattern
+
+        Returns:
+            True if the diagnosis was queued
+        """
+        start = time.perf_counter()
+        stats = self._background_stats
+        stats["submitted"] += 1
+        try:
+            if matched and random.random() >= self._hit_sample_rate:
+                stats["sampled_out"] += 1
+                return False
+
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                stats["dropped"] += 1
+                return False
+
+            if len(self._pending) >= self._max_pending:
+                stats["dropped"] += 1
+                return False
+
+            self._pending.append(
+                _DiagnosisJob(
+                    text=text,
+                    compiled_patterns=compiled_patterns,
+                    pattern_priority=pattern_priority,
+                    matched=matched,
+                )
+            )
+            stats["queued"] += 1
+            self._ensure_worker(loop).set()
+            if self._idle is not None:
+                self._idle.clear()
+            return True
+        finally:
+            stats["submit_ms"] += (time.perf_counter() - start) * 1000
+
+    def _ensure_worker(self, loop: asyncio.AbstractEventLoop) -> asyncio.Event:
+        """Start the worker on this loop if needed and return its wakeup event."""
+        if (
+            self._wakeup is None
+            or self._worker is None
+            or self._worker.done()
+            or self._worker.get_loop() is not loop
+        ):
+            self._wakeup = asyncio.Event()
+            self._idle = asyncio.Event()
+            self._worker = loop.create_task(self._run_worker(self._wakeup, self._idle))
+        return self._wakeup
+
+    async def _run_worker(self, wakeup: asyncio.Event, idle: asyncio.Event) -> None:
+        while True:
+            await wakeup.wait()
+            wakeup.clear()
+            while self._pending:
+                job = self._pending.popleft()
+                try:
+                    # CPU-bound difflib work runs off the event loop
+                    diag = await asyncio.to_thread(
+                        self._diagnose, job.text, job.compiled_patterns, job.pattern_priority
+                    )
+                except Exception as e:
+                    logger.warning("Background pattern diagnosis failed: %s", e)
+                else:
+                    self._store_diagnostics(diag)
+                    self._background_stats["completed"] += 1
+                    self._background_stats["diagnosis_ms"] += diag.processing_time_ms
+            idle.set()
+
+    async def drain(self) -> None:
+        """Wait until every queued background diagnosis has run."""
+        if self._worker is not None and not self._worker.done() and self._idle is not None:
+            await self._idle.wait()
+
+    async def shutdown(self) -> None:
+        """Stop the background worker, dropping queued diagnoses."""
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+        self._background_stats["dropped"] += len(self._pending)
+        self._pending.clear()
+
+    def get_background_stats(self) -> dict[str, Any]:
+        """Background mode counters and timings.
+
+        ``worker_time_ms`` is the time diagnoses took on the worker thread;
+        ``avg_submit_ms`` is what each classification pays on the request path.
+        ``est_latency_saved_ms`` estimates the latency kept off the request
+        path: every submitted classification would have been diagnosed inline
+        at ``avg_diagnosis_ms``, minus the submit overhead actually paid.
+        """
+        stats = self._background_stats
+        completed = int(stats["completed"])
+        avg_ms = stats["diagnosis_ms"] / completed if completed else 0.0
+        submitted = int(stats["submitted"])
+        return {
+            "hit_sample_rate": self._hit_sample_rate,
+            "submitted": submitted,
+            "queued": int(stats["queued"]),
+            "sampled_out": int(stats["sampled_out"]),
+            "dropped": int(stats["dropped"]),
+            "completed": completed,
+            "pending": len(self._pending),
+            "avg_diagnosis_ms": avg_ms,
+            "avg_submit_ms": stats["submit_ms"] / submitted if submitted else 0.0,
+            "worker_time_ms": stats["diagnosis_ms"],
+            "est_latency_saved_ms": max(0.0, submitted * avg_ms - stats["submit_ms"]),
+        }
 
     def _check_pattern(
         self,
@@ -222,28 +455,57 @@ class LogicDiagnosticsService:
 
         return result
 
+    def _skeleton(self, pattern: re.Pattern[str]) -> _PatternSkeleton:
+        """Get (building on first use) the literal skeleton for a pattern."""
+        key = (pattern.pattern, pattern.flags)
+        skeleton = self._skeletons.get(key)
+        if skeleton is not None:
+            return skeleton
+
+        pattern_str = pattern.pattern
+        clean = re.sub(r"\s+", " ", _REGEX_SPECIALS.sub("", pattern_str)).strip().lower()
+        matcher = None
+        if clean:
+            matcher = SequenceMatcher(None)
+            matcher.set_seq2(clean)
+
+        def compile_or_none(source: str) -> re.Pattern[str] | None:
+            try:
+                return re.compile(source, re.IGNORECASE)
+            except re.error:
+                return None
+
+        skeleton = _PatternSkeleton(
+            skeleton=clean,
+            keywords=self._extract_keywords(pattern_str),
+            matcher=matcher,
+            without_start_anchor=(
+                compile_or_none(pattern_str[1:]) if pattern_str.startswith("^") else None
+            ),
+            without_end_anchor=(
+                compile_or_none(pattern_str[:-1]) if pattern_str.endswith("$") else None
+            ),
+        )
+        self._skeletons[key] = skeleton
+        return skeleton
+
     def _diagnose_failure(self, text: str, pattern: re.Pattern[str]) -> MatchFailureReason:
         """Diagnose why a pattern didn't match."""
-        pattern_str = pattern.pattern
+        skeleton = self._skeleton(pattern)
 
-        # Check if it's an anchor issue
-        if pattern_str.startswith("^"):
-            # Would it match without the anchor?
-            test_pattern = re.compile(pattern_str[1:], re.IGNORECASE)
-            if test_pattern.search(text):
-                return MatchFailureReason.ANCHOR_FAIL
+        # Check if it's an anchor issue (would it match without the anchor?)
+        if skeleton.without_start_anchor and skeleton.without_start_anchor.search(text):
+            return MatchFailureReason.ANCHOR_FAIL
 
-        if pattern_str.endswith("$"):
-            test_pattern = re.compile(pattern_str[:-1], re.IGNORECASE)
-            if test_pattern.search(text):
-                return MatchFailureReason.ANCHOR_FAIL
+        if skeleton.without_end_anchor and skeleton.without_end_anchor.search(text):
+            return MatchFailureReason.ANCHOR_FAIL
 
         # Check for partial match
         if pattern.search(text):
             return MatchFailureReason.PARTIAL_MATCH
 
-        # Extract keywords from pattern and check presence
-        keywords = self._extract_keywords(pattern_str)
+        # Check keyword presence
+        keywords = skeleton.keywords
         text_words = set(text.lower().split())
         missing = [kw for kw in keywords if kw not in text_words]
 
@@ -307,24 +569,20 @@ class LogicDiagnosticsService:
         return previous_row[-1]
 
     def _calculate_similarity(self, text: str, pattern: re.Pattern[str]) -> float:
-        """Calculate how similar the text is to the pattern."""
-        # Extract the most representative string from the pattern
-        clean_pattern = re.sub(r"[\^\$\.\*\+\?\(\)\[\]\{\}\|\\]", "", pattern.pattern)
-        clean_pattern = re.sub(r"\s+", " ", clean_pattern).strip()
-
-        if not clean_pattern:
+        """Calculate how similar the text is to the pattern's literal skeleton."""
+        matcher = self._skeleton(pattern).matcher
+        if matcher is None:
             return 0.0
 
-        return SequenceMatcher(None, text.lower(), clean_pattern.lower()).ratio()
+        matcher.set_seq1(text.lower())
+        return matcher.ratio()
 
     def _find_partial_matches(self, text: str, pattern: re.Pattern[str]) -> list[str]:
         """Find parts of the text that partially match the pattern."""
         partial = []
 
-        # Extract groups from pattern if any
-        # Also try to find literal strings that do match
-        keywords = self._extract_keywords(pattern.pattern)
-        for kw in keywords:
+        # Find literal keywords that do appear in the text
+        for kw in self._skeleton(pattern).keywords:
             if kw in text.lower():
                 partial.append(f"'{kw}' found")
 
@@ -346,7 +604,7 @@ class LogicDiagnosticsService:
         elif failure_reason == MatchFailureReason.TYPO:
             suggestions.append("Input appears to have typos - add typo variations to pattern")
             # Find the likely typo
-            keywords = self._extract_keywords(pattern.pattern)
+            keywords = self._skeleton(pattern).keywords
             text_words = text.lower().split()
             for kw in keywords:
                 for word in text_words:
@@ -354,7 +612,7 @@ class LogicDiagnosticsService:
                         suggestions.append(f"Add typo variant: {word} → {kw}")
 
         elif failure_reason == MatchFailureReason.MISSING_KEYWORD:
-            keywords = self._extract_keywords(pattern.pattern)
+            keywords = self._skeleton(pattern).keywords
             text_words = set(text.lower().split())
             missing = [kw for kw in keywords if kw not in text_words]
             suggestions.append(f"Input missing keywords: {', '.join(missing)}")
@@ -464,7 +722,7 @@ class LogicDiagnosticsService:
         """Get diagnostic statistics."""
         total = len(self._diagnostics_history)
         if total == 0:
-            return {"total_diagnoses": 0}
+            return {"total_diagnoses": 0, "background": self.get_background_stats()}
 
         failures = sum(1 for d in self._diagnostics_history if d.winner is None)
         pattern_matches = sum(
@@ -484,6 +742,7 @@ class LogicDiagnosticsService:
             "failure_rate": failures / total if total else 0,
             "failure_reasons": failure_reasons,
             "common_near_misses": self.get_common_near_misses(),
+            "background": self.get_background_stats(),
         }
 
 
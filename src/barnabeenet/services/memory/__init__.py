@@ -1,6 +1,6 @@
 """Memory storage services."""
 
-from barnabeenet.services.memory.embedding import EmbeddingService
+from barnabeenet.services.memory.embedding import EmbeddingMemo, EmbeddingService
 from barnabeenet.services.memory.storage import MemoryStorage, MemoryStorageConfig
 
-__all__ = ["EmbeddingService", "MemoryStorage", "MemoryStorageConfig"]
+__all__ = ["EmbeddingMemo", "EmbeddingService", "MemoryStorage", "MemoryStorageConfig"]
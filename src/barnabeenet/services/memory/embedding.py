@@ -2,16 +2,29 @@
 
 Provides 384-dimensional embeddings for semantic memory search.
 Uses all-MiniLM-L6-v2 for fast, accurate embeddings.
+
+The same utterance is typically embedded several times per request (LLM
+response cache lookup and store, memory search), so embeddings are memoized
+by model and normalized text: per request via ``embedding_request_scope()`` and
+process-wide in a byte-bounded LRU shared by every caller.
 """
 
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Any
 
 import numpy as np
 
+from barnabeenet.services.inference_executor import EMBEDDING_LANE, get_inference_executor
+from barnabeenet.services.metrics import record_cache_lookup, update_embedding_memo_size
+
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
     from numpy.typing import NDArray
 
 logger = logging.getLogger(__name__)
@@ -20,6 +33,143 @@ logger = logging.getLogger(__name__)
 DEFAULT_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
 EMBEDDING_DIM = 384
 
+# Process-wide memo budget (~5,000 384-dim vectors)
+DEFAULT_MEMO_MAX_BYTES = 8 * 1024 * 1024
+
+# Embeddings computed during the current request, keyed like EmbeddingMemo
+_request_memo: ContextVar[dict[tuple[str, str], NDArray[np.float32]] | None] = ContextVar(
+    "embedding_request_memo", default=None
+)
+
+
+def normalize_query_text(text: str) -> str:
+    """Normalize text for memo and exact-match keys (case and whitespace)."""
+    return " ".join(text.lower().split())
+
+
+@contextmanager
+def embedding_request_scope() -> Iterator[None]:
+    """Memoize embeddings for the duration of one request.
+
+    Embeddings looked up or computed inside the scope stay available to the
+    rest of the request even if the process-wide LRU evicts them. Tasks
+    created inside the scope share it.
+    """
+    token = _request_memo.set({})
+    try:
+        yield
+    finally:
+        _request_memo.reset(token)
+
+
+class EmbeddingMemo:
+    """Bounded LRU of embeddings keyed by model name and normalized text.
+
+    Stored vectors are read-only so one array can be handed to every caller.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_MEMO_MAX_BYTES) -> None:
+        """Initialize the memo.
+
+        Args:
+            max_bytes: Budget for stored vectors plus their keys.
+        """
+        self._max_bytes = max_bytes
+        self._entries: OrderedDict[tuple[str, str], NDArray[np.float32]] = OrderedDict()
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes currently held."""
+        return self._bytes
+
+    @staticmethod
+    def _key(text: str, model: str) -> tuple[str, str]:
+        # The model name is shared by reference; only the text costs memory per entry
+        return (model, normalize_query_text(text))
+
+    def get(self, text: str, model: str = DEFAULT_MODEL) -> NDArray[np.float32] | None:
+        """Get the memoized ``model`` embedding for ``text``, if any."""
+        key = self._key(text, model)
+        scope = _request_memo.get()
+        embedding = scope.get(key) if scope is not None else None
+
+        if embedding is None:
+            embedding = self._entries.get(key)
+            if embedding is not None:
+                self._entries.move_to_end(key)
+                if scope is not None:
+                    scope[key] = embedding
+
+        if embedding is None:
+            self._misses += 1
+            record_cache_lookup("embedding_memo", "miss")
+            return None
+
+        self._hits += 1
+        record_cache_lookup("embedding_memo", "hit")
+        return embedding
+
+    def put(
+        self, text: str, embedding: NDArray[np.float32], model: str = DEFAULT_MODEL
+    ) -> NDArray[np.float32]:
+        """Memoize an embedding, evicting least-recently used entries over budget.
+
+        Args:
+            text: Text that was embedded.
+            embedding: Its embedding vector.
+            model: Name of the model that produced the embedding.
+
+        Returns:
+            The stored (read-only) vector.
+        """
+        key = self._key(text, model)
+        vector = np.array(embedding, dtype=np.float32)
+        vector.setflags(write=False)
+
+        scope = _request_memo.get()
+        if scope is not None:
+            scope[key] = vector
+
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self._bytes -= old.nbytes + len(key[1])
+        self._entries[key] = vector
+        self._bytes += vector.nbytes + len(key[1])
+
+        while self._bytes > self._max_bytes and len(self._entries) > 1:
+            old_key, old = self._entries.popitem(last=False)
+            self._bytes -= old.nbytes + len(old_key[1])
+            self._evictions += 1
+
+        update_embedding_memo_size(self._bytes)
+        return vector
+
+    def clear(self) -> None:
+        """Drop all memoized embeddings."""
+        self._entries.clear()
+        self._bytes = 0
+        update_embedding_memo_size(0)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get hit/miss and size counters."""
+        lookups = self._hits + self._misses
+        return {
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "max_bytes": self._max_bytes,
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_rate": self._hits / lookups if lookups else 0.0,
+            "evictions": self._evictions,
+        }
+
 
 class EmbeddingService:
     """Service for generating text embeddings.
@@ -29,17 +179,22 @@ class EmbeddingService:
     - Good semantic similarity performance
     - Small model size (~80MB)
     - 384-dimensional output vectors
+
+    Encoding runs on the inference executor's embedding lane so it never
+    blocks the event loop.
     """
 
-    def __init__(self, model_name: str = DEFAULT_MODEL) -> None:
+    def __init__(self, model_name: str = DEFAULT_MODEL, memo: EmbeddingMemo | None = None) -> None:
         """Initialize the embedding service.
 
         Args:
             model_name: Hugging Face model name for embeddings.
+            memo: Embedding memo to consult first (default: the shared memo).
         """
         self._model_name = model_name
         self._model = None
         self._initialized = False
+        self._memo = memo if memo is not None else get_embedding_memo()
 
     async def init(self) -> None:
         """Initialize the embedding model."""
@@ -50,7 +205,9 @@ class EmbeddingService:
             from sentence_transformers import SentenceTransformer
 
             logger.info(f"Loading embedding model: {self._model_name}")
-            self._model = SentenceTransformer(self._model_name)
+            self._model = await get_inference_executor().run(
+                EMBEDDING_LANE, SentenceTransformer, self._model_name
+            )
             self._initialized = True
             logger.info(
                 f"Embedding model loaded: {self._model_name} "
@@ -72,6 +229,11 @@ class EmbeddingService:
         self._initialized = False
         logger.info("EmbeddingService shutdown")
 
+    @property
+    def model_name(self) -> str:
+        """Name of the embedding model."""
+        return self._model_name
+
     def is_available(self) -> bool:
         """Check if embedding model is available."""
         return self._initialized and self._model is not None
@@ -83,21 +245,26 @@ class EmbeddingService:
             text: Text to embed.
 
         Returns:
-            384-dimensional embedding vector as numpy array.
+            384-dimensional embedding vector as numpy array (read-only).
         """
+        memoized = self._memo.get(text, self._model_name)
+        if memoized is not None:
+            return memoized
+
         if not self._initialized:
             await self.init()
 
         if self._model is None:
             raise RuntimeError("Embedding model not available")
 
-        # sentence-transformers encode is sync but fast
-        embedding = self._model.encode(
+        embedding = await get_inference_executor().run(
+            EMBEDDING_LANE,
+            self._model.encode,
             text,
             convert_to_numpy=True,
             normalize_embeddings=True,  # Normalize for cosine similarity
         )
-        return embedding.astype(np.float32)
+        return self._memo.put(text, embedding.astype(np.float32), self._model_name)
 
     async def embed_batch(self, texts: list[str]) -> NDArray[np.float32]:
         """Generate embeddings for multiple texts.
@@ -108,20 +275,34 @@ class EmbeddingService:
         Returns:
             Array of shape (n_texts, 384) with embedding vectors.
         """
-        if not self._initialized:
-            await self.init()
-
-        if self._model is None:
-            raise RuntimeError("Embedding model not available")
+        vectors = [self._memo.get(text, self._model_name) for text in texts]
+        missing = list(dict.fromkeys(t for t, v in zip(texts, vectors, strict=True) if v is None))
+
+        if missing:
+            if not self._initialized:
+                await self.init()
+
+            if self._model is None:
+                raise RuntimeError("Embedding model not available")
+
+            embeddings = await get_inference_executor().run(
+                EMBEDDING_LANE,
+                self._model.encode,
+                missing,
+                convert_to_numpy=True,
+                normalize_embeddings=True,
+                batch_size=32,
+                show_progress_bar=False,
+            )
+            fresh = {
+                text: self._memo.put(text, embedding, self._model_name)
+                for text, embedding in zip(missing, embeddings.astype(np.float32), strict=True)
+            }
+            vectors = [fresh[t] if v is None else v for t, v in zip(texts, vectors, strict=True)]
 
-        embeddings = self._model.encode(
-            texts,
-            convert_to_numpy=True,
-            normalize_embeddings=True,
-            batch_size=32,
-            show_progress_bar=False,
-        )
-        return embeddings.astype(np.float32)
+        if not vectors:
+            return np.empty((0, EMBEDDING_DIM), dtype=np.float32)
+        return np.stack(vectors)
 
     @staticmethod
     def cosine_similarity(
@@ -151,8 +332,17 @@ class EmbeddingService:
         return EMBEDDING_DIM
 
 
-# Global singleton
+# Global singletons
 _embedding_service: EmbeddingService | None = None
+_embedding_memo: EmbeddingMemo | None = None
+
+
+def get_embedding_memo() -> EmbeddingMemo:
+    """Get the process-wide embedding memo."""
+    global _embedding_memo
+    if _embedding_memo is None:
+        _embedding_memo = EmbeddingMemo()
+    return _embedding_memo
 
 
 def get_embedding_service() -> EmbeddingService:
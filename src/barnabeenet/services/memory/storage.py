@@ -8,6 +8,7 @@ Provides:
 
 from __future__ import annotations
 
+import asyncio
 import hashlib
 import json
 import logging
@@ -20,9 +21,12 @@ from typing import TYPE_CHECKING, Any
 import numpy as np
 
 from barnabeenet.services.memory.embedding import (
+    DEFAULT_MODEL,
     EmbeddingService,
+    get_embedding_memo,
     get_embedding_service,
 )
+from barnabeenet.services.memory.vector_index import MemoryVectorIndex
 
 if TYPE_CHECKING:
     import redis.asyncio as redis
@@ -42,6 +46,8 @@ class MemoryStorageConfig:
     # Long-term memory
     memory_prefix: str = "barnabeenet:memory:"
     memory_index_name: str = "barnabeenet:memory:idx"
+    # Bumped on every indexed write so other instances know to reload
+    index_version_key: str = "barnabeenet:memory:index_version"
     embedding_prefix: str = "barnabeenet:embedding:"
     embedding_cache_prefix: str = "barnabeenet:embedding_cache:"
     embedding_cache_ttl: int = 86400 * 7  # 7 days
@@ -53,6 +59,9 @@ class MemoryStorageConfig:
     # Storage limits
     max_memories: int = 10000
 
+    # Vector index hydration
+    index_load_batch_size: int = 500  # Keys per MGET when loading from Redis
+
 
 @dataclass
 class StoredMemory:
@@ -113,7 +122,7 @@ class MemoryStorage:
     Features:
     - Working memory: Redis with TTL for short-term session context
     - Long-term memory: Redis hashes with separate embedding storage
-    - Vector search: Cosine similarity over embeddings
+    - Vector search: Resident in-process index (one matrix product per query)
     - Fallback: In-memory storage when Redis unavailable
     """
 
@@ -140,6 +149,14 @@ class MemoryStorage:
         self._working_memory_fallback: dict[str, dict[str, Any]] = {}
         self._embedding_cache_fallback: dict[str, NDArray[np.float32]] = {}
 
+        # Resident vector index, loaded from Redis on first search and kept
+        # in sync by store/delete afterwards; reloaded when the Redis index
+        # version shows a write made by another instance or worker
+        self._vector_index = MemoryVectorIndex()
+        self._index_loaded = False
+        self._index_version = 0
+        self._index_lock = asyncio.Lock()
+
         self._initialized = False
         self._use_redis = False
 
@@ -175,6 +192,8 @@ class MemoryStorage:
         self._memory_fallback.clear()
         self._embedding_fallback.clear()
         self._working_memory_fallback.clear()
+        self._vector_index.clear()
+        self._index_loaded = False
         self._initialized = False
         logger.info("MemoryStorage shutdown")
 
@@ -316,8 +335,6 @@ class MemoryStorage:
                 self._store_memory_fallback(memory, None)
 
             # Generate embedding in background
-            import asyncio
-
             asyncio.create_task(self._generate_and_store_embedding(memory.id, content))
             logger.debug(f"Stored memory (embedding generating in background): {memory.id} ({memory_type})")
         else:
@@ -346,15 +363,31 @@ class MemoryStorage:
         normalized = text.lower().strip()
         return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
 
+    def _embedding_model_name(self) -> str:
+        if self._embedding_service is None:
+            return DEFAULT_MODEL
+        return self._embedding_service.model_name
+
     async def _get_cached_embedding(self, text: str) -> NDArray[np.float32] | None:
-        """Get cached embedding for text if available."""
+        """Get cached embedding for text if available.
+
+        The process-wide embedding memo is checked before Redis, so text that
+        was already embedded this request (e.g. by the LLM cache) costs no
+        round-trip.
+        """
+        memo = get_embedding_memo()
+        model = self._embedding_model_name()
+        embedding = memo.get(text, model)
+        if embedding is not None:
+            return embedding
+
         text_hash = self._get_text_hash(text)
         cache_key = f"{self.config.embedding_cache_prefix}{text_hash}"
 
         if self._use_redis and self._redis:
             emb_bytes = await self._redis.get(cache_key)
             if emb_bytes:
-                return np.frombuffer(emb_bytes, dtype=np.float32)
+                return memo.put(text, np.frombuffer(emb_bytes, dtype=np.float32), model)
         else:
             return self._embedding_cache_fallback.get(text_hash)
 
@@ -362,6 +395,7 @@ class MemoryStorage:
 
     async def _cache_embedding(self, text: str, embedding: NDArray[np.float32]) -> None:
         """Cache embedding for text."""
+        get_embedding_memo().put(text, embedding, self._embedding_model_name())
         text_hash = self._get_text_hash(text)
         cache_key = f"{self.config.embedding_cache_prefix}{text_hash}"
 
@@ -397,10 +431,13 @@ class MemoryStorage:
                     # Update memory record
                     memory_key = f"{self.config.memory_prefix}{memory_id}"
                     await self._redis.set(memory_key, json.dumps(memory.to_dict()))
+                    self._index_memory(memory, embedding)
+                    await self._bump_index_version()
                 else:
                     # Update fallback storage
                     self._memory_fallback[memory_id] = memory
                     self._embedding_fallback[memory_id] = embedding
+                    self._index_memory(memory, embedding)
 
                 logger.debug(f"Generated and stored embedding for memory: {memory_id}")
             else:
@@ -442,6 +479,10 @@ class MemoryStorage:
             memory.id,
         )
 
+        if embedding is not None:
+            self._index_memory(memory, embedding)
+            await self._bump_index_version()
+
     def _store_memory_fallback(
         self, memory: StoredMemory, embedding: NDArray[np.float32] | None
     ) -> None:
@@ -449,6 +490,14 @@ class MemoryStorage:
         self._memory_fallback[memory.id] = memory
         if embedding is not None:
             self._embedding_fallback[memory.id] = embedding
+            self._index_memory(memory, embedding)
+
+    def _index_memory(self, memory: StoredMemory, embedding: NDArray[np.float32]) -> None:
+        """Add or refresh a memory in the resident vector index."""
+        try:
+            self._vector_index.add(memory.id, embedding, memory.memory_type, memory.participants)
+        except ValueError as e:
+            logger.warning(f"Not indexing memory {memory.id}: {e}")
 
     async def get_memory(self, memory_id: str) -> StoredMemory | None:
         """Get a specific memory by ID.
@@ -514,11 +563,14 @@ class MemoryStorage:
 
             # Delete memory and embedding
             await self._redis.delete(memory_key, embedding_key)
+            self._vector_index.remove(memory_id)
+            await self._bump_index_version()
             return True
         else:
             if memory_id in self._memory_fallback:
                 del self._memory_fallback[memory_id]
                 self._embedding_fallback.pop(memory_id, None)
+                self._vector_index.remove(memory_id)
                 return True
             return False
 
@@ -573,65 +625,17 @@ class MemoryStorage:
         max_results: int,
         min_score: float,
     ) -> list[tuple[StoredMemory, float]]:
-        """Search memories in Redis."""
-        # Get candidate memory IDs
-        candidate_ids: set[str] | None = None
-
-        # Filter by type
-        if memory_type:
-            type_key = f"{self.config.memory_prefix}type:{memory_type}"
-            type_ids = await self._redis.smembers(type_key)
-            # Handle bytes from binary client
-            candidate_ids = {
-                mid.decode("utf-8") if isinstance(mid, bytes) else mid for mid in type_ids
-            }
-
-        # Filter by participants
-        if participants:
-            participant_ids: set[str] = set()
-            for p in participants:
-                p_key = f"{self.config.memory_prefix}participant:{p}"
-                p_ids = await self._redis.smembers(p_key)
-                # Handle bytes from binary client
-                participant_ids.update(
-                    mid.decode("utf-8") if isinstance(mid, bytes) else mid for mid in p_ids
-                )
-            if candidate_ids is not None:
-                candidate_ids &= participant_ids
-            else:
-                candidate_ids = participant_ids
-
-        # If no filters, get all memory IDs
-        if candidate_ids is None:
-            all_ids = await self._redis.zrange(f"{self.config.memory_prefix}index", 0, -1)
-            # Handle bytes from binary client
-            candidate_ids = {
-                mid.decode("utf-8") if isinstance(mid, bytes) else mid for mid in all_ids
-            }
+        """Search memories in Redis via the resident vector index."""
+        await self._ensure_vector_index()
 
-        if not candidate_ids:
+        hits = self._vector_index.search(
+            query_embedding, max_results, min_score, memory_type, participants
+        )
+        if not hits:
             return []
 
-        # Load embeddings and compute similarities
-        results: list[tuple[StoredMemory, float]] = []
-
-        for memory_id in candidate_ids:
-            embedding_key = f"{self.config.embedding_prefix}{memory_id}"
-            emb_bytes = await self._redis.get(embedding_key)
-            if not emb_bytes:
-                continue
-
-            embedding = np.frombuffer(emb_bytes, dtype=np.float32)
-            similarity = float(np.dot(query_embedding, embedding))
-
-            if similarity >= min_score:
-                memory = await self.get_memory(memory_id)
-                if memory:
-                    results.append((memory, similarity))
-
-        # Sort by similarity and limit
-        results.sort(key=lambda x: x[1], reverse=True)
-        return results[:max_results]
+        memories = await self._hydrate_memories([memory_id for memory_id, _ in hits])
+        return [(memories[memory_id], score) for memory_id, score in hits if memory_id in memories]
 
     def _search_memories_fallback(
         self,
@@ -641,31 +645,117 @@ class MemoryStorage:
         max_results: int,
         min_score: float,
     ) -> list[tuple[StoredMemory, float]]:
-        """Search memories in fallback storage."""
-        results: list[tuple[StoredMemory, float]] = []
+        """Search memories in fallback storage via the resident vector index."""
+        hits = self._vector_index.search(
+            query_embedding, max_results, min_score, memory_type, participants
+        )
+        return [
+            (self._memory_fallback[memory_id], score)
+            for memory_id, score in hits
+            if memory_id in self._memory_fallback
+        ]
 
-        for memory_id, memory in self._memory_fallback.items():
-            # Apply filters
-            if memory_type and memory.memory_type != memory_type:
-                continue
-            if participants:
-                if not any(p in memory.participants for p in participants):
-                    continue
+    async def _read_index_version(self) -> int:
+        value = await self._redis.get(self.config.index_version_key)
+        return int(value) if value else 0
 
-            # Get embedding
-            embedding = self._embedding_fallback.get(memory_id)
-            if embedding is None:
-                continue
+    async def _bump_index_version(self) -> None:
+        """Record an indexed write in Redis.
+
+        If nobody else wrote since our last look, the local index already
+        reflects this write; otherwise reload it on the next search.
+        """
+        try:
+            version = await self._redis.incr(self.config.index_version_key)
+        except Exception as e:
+            logger.warning(f"Could not bump memory index version: {e}")
+            return
+        if version == self._index_version + 1:
+            self._index_version = version
+        else:
+            self._index_loaded = False
+
+    async def _ensure_vector_index(self) -> None:
+        """Load the vector index from Redis on first use, or when stale.
+
+        Writes made through this instance keep the index in sync. Each search
+        reads the Redis index version (one GET); if another instance or
+        worker has written since, the index is reloaded.
+        """
+        if self._index_loaded:
+            try:
+                if await self._read_index_version() == self._index_version:
+                    return
+            except Exception as e:
+                logger.debug(f"Could not read memory index version: {e}")
+                return
+            self._index_loaded = False
+
+        async with self._index_lock:
+            if self._index_loaded:
+                return
+
+            start = time.perf_counter()
+            # Read the version first: a write that lands during the load
+            # bumps it again and triggers another reload
+            self._index_version = await self._read_index_version()
+            # Clear first so writes that land while we await Redis are kept
+            self._vector_index.clear()
+
+            all_ids = await self._redis.zrange(f"{self.config.memory_prefix}index", 0, -1)
+            memory_ids = [mid.decode("utf-8") if isinstance(mid, bytes) else mid for mid in all_ids]
+
+            batch_size = self.config.index_load_batch_size
+            for i in range(0, len(memory_ids), batch_size):
+                batch = memory_ids[i : i + batch_size]
+                pipe = self._redis.pipeline()
+                pipe.mget([f"{self.config.embedding_prefix}{mid}" for mid in batch])
+                pipe.mget([f"{self.config.memory_prefix}{mid}" for mid in batch])
+                emb_values, mem_values = await pipe.execute()
+
+                for memory_id, emb_bytes, data in zip(batch, emb_values, mem_values, strict=True):
+                    if not emb_bytes or not data or memory_id in self._vector_index:
+                        continue
+                    memory = self._parse_memory(memory_id, data)
+                    if memory:
+                        self._index_memory(memory, np.frombuffer(emb_bytes, dtype=np.float32))
+
+            self._index_loaded = True
+            logger.info(
+                f"Memory vector index loaded: {len(self._vector_index)} vectors "
+                f"in {(time.perf_counter() - start) * 1000:.1f}ms"
+            )
 
-            # Compute similarity
-            similarity = float(np.dot(query_embedding, embedding))
+    async def _hydrate_memories(self, memory_ids: list[str]) -> dict[str, StoredMemory]:
+        """Load memory records for search hits with a single MGET.
 
-            if similarity >= min_score:
-                results.append((memory, similarity))
+        Embeddings are taken from the resident index rather than re-fetched.
+        Hits whose record has vanished (deleted elsewhere) are dropped from
+        the index.
+        """
+        values = await self._redis.mget([f"{self.config.memory_prefix}{mid}" for mid in memory_ids])
 
-        # Sort by similarity and limit
-        results.sort(key=lambda x: x[1], reverse=True)
-        return results[:max_results]
+        memories: dict[str, StoredMemory] = {}
+        for memory_id, data in zip(memory_ids, values, strict=True):
+            if not data:
+                self._vector_index.remove(memory_id)
+                continue
+            memory = self._parse_memory(memory_id, data)
+            if memory:
+                memory.embedding = self._vector_index.get_vector(memory_id)
+                memories[memory_id] = memory
+        return memories
+
+    @staticmethod
+    def _parse_memory(memory_id: str, data: bytes | str) -> StoredMemory | None:
+        """Decode a stored memory record, tolerating bytes or str clients."""
+        if isinstance(data, bytes):
+            data = data.decode("utf-8")
+        try:
+            return StoredMemory.from_dict(json.loads(data))
+        except Exception as e:
+            logger.debug(f"Failed to parse memory {memory_id}: {e}")
+            return None
 
     async def get_recent_memories(
         self,
@@ -901,6 +991,13 @@ class MemoryStorage:
                     )
 
             await pipe.execute()
+            indexed = False
+            for memory, embedding in zip(memories, embeddings, strict=True):
+                if embedding is not None:
+                    self._index_memory(memory, embedding)
+                    indexed = True
+            if indexed:
+                await self._bump_index_version()
             logger.debug(f"Batch stored {len(memories)} memories")
         else:
             # Fallback: individual storage
@@ -916,6 +1013,9 @@ class MemoryStorage:
     ) -> list[list[tuple[StoredMemory, float]]]:
         """Search multiple queries efficiently.
 
+        All queries are scored against the vector index in a single matrix
+        product and the union of hits is hydrated once.
+
         Args:
             queries: List of search queries.
             memory_type: Optional type filter.
@@ -925,35 +1025,107 @@ class MemoryStorage:
         Returns:
             List of result lists (one per query).
         """
-        # Generate embeddings for all queries in batch
+        if not queries:
+            return []
         if not self._embedding_service:
             logger.warning("No embedding service available for batch search")
             return [[] for _ in queries]
 
-        query_embeddings = await self._embedding_service.embed_batch(queries)
+        query_embeddings = await self._embed_queries(queries)
+        if self._use_redis and self._redis:
+            await self._ensure_vector_index()
+
+        hits_per_query = self._vector_index.search_batch(
+            query_embeddings,
+            max_results_per_query,
+            self.config.min_similarity_score,
+            memory_type,
+            participants,
+        )
 
-        # Search for each query (can be parallelized in future)
-        results = []
-        for query_embedding in query_embeddings:
-            if self._use_redis and self._redis:
-                query_results = await self._search_memories_redis(
-                    query_embedding,
-                    memory_type,
-                    participants,
-                    max_results_per_query,
-                    self.config.min_similarity_score,
-                )
-            else:
-                query_results = self._search_memories_fallback(
-                    query_embedding,
-                    memory_type,
-                    participants,
-                    max_results_per_query,
-                    self.config.min_similarity_score,
-                )
-            results.append(query_results)
+        unique_ids = list(dict.fromkeys(mid for hits in hits_per_query for mid, _ in hits))
+        memories = await self._load_hits(unique_ids)
+        return [
+            [(memories[mid], score) for mid, score in hits if mid in memories]
+            for hits in hits_per_query
+        ]
 
-        return results
+    async def search_memories_multi(
+        self,
+        queries: list[str],
+        weights: list[float] | None = None,
+        memory_type: str | None = None,
+        participants: list[str] | None = None,
+        max_results: int | None = None,
+        min_score: float | None = None,
+    ) -> list[tuple[StoredMemory, float]]:
+        """Search several related queries and merge the results.
+
+        Used for a MetaAgent query set (primary plus secondary queries): every
+        query is scored in one matrix product, each memory keeps its best
+        weighted score, and duplicates across queries collapse to one hit.
+
+        Args:
+            queries: Search query texts.
+            weights: Per-query weights (default 1.0 each).
+            memory_type: Optional filter by memory type.
+            participants: Optional filter by participants.
+            max_results: Maximum merged results to return.
+            min_score: Minimum weighted similarity score threshold.
+
+        Returns:
+            List of (memory, weighted_score) tuples sorted by relevance.
+        """
+        if not queries:
+            return []
+
+        max_results = max_results or self.config.max_retrieval_results
+        min_score = min_score or self.config.min_similarity_score
+        if weights is None:
+            weights = [1.0] * len(queries)
+
+        query_embeddings = await self._embed_queries(queries)
+        if self._use_redis and self._redis:
+            await self._ensure_vector_index()
+
+        hits = self._vector_index.search_weighted(
+            query_embeddings,
+            np.asarray(weights, dtype=np.float32),
+            max_results,
+            min_score,
+            memory_type,
+            participants,
+        )
+        memories = await self._load_hits([mid for mid, _ in hits])
+        return [(memories[mid], score) for mid, score in hits if mid in memories]
+
+    async def _embed_queries(self, queries: list[str]) -> NDArray[np.float32]:
+        """Embed queries, using the embedding cache and one batch call for misses."""
+        cached = [await self._get_cached_embedding(q) for q in queries]
+        missing = list(
+            dict.fromkeys(q for q, emb in zip(queries, cached, strict=True) if emb is None)
+        )
+
+        if missing:
+            embeddings = await self._embedding_service.embed_batch(missing)
+            fresh = dict(zip(missing, embeddings, strict=True))
+            for text, embedding in fresh.items():
+                await self._cache_embedding(text, embedding)
+            cached = [
+                fresh[q] if emb is None else emb for q, emb in zip(queries, cached, strict=True)
+            ]
+
+        return np.stack(cached).astype(np.float32, copy=False)
+
+    async def _load_hits(self, memory_ids: list[str]) -> dict[str, StoredMemory]:
+        """Resolve indexed memory IDs to memory objects for either backend."""
+        if not memory_ids:
+            return {}
+        if self._use_redis and self._redis:
+            return await self._hydrate_memories(memory_ids)
+        return {
+            mid: self._memory_fallback[mid] for mid in memory_ids if mid in self._memory_fallback
+        }
 
     async def update_memory_access(self, memory_id: str) -> None:
         """Update memory access metadata.
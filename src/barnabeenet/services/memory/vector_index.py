@@ -0,0 +1,345 @@
+"""In-process vector index for long-term memory search.
+
+Keeps every memory embedding resident in one contiguous float32 matrix so a
+search is a single matrix-vector product plus ``argpartition`` instead of a
+Redis round-trip and a Python-level dot product per memory.
+
+Memory type and participant filters are boolean row masks applied before
+ranking, mirroring the ``type:`` and ``participant:`` Redis set indices.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
+logger = logging.getLogger(__name__)
+
+
+class MemoryVectorIndex:
+    """Flat (exact) cosine-similarity index over memory embeddings.
+
+    Embeddings are expected to be L2-normalized (EmbeddingService does this),
+    so the dot product is the cosine similarity. Rows are kept dense: removing
+    a memory moves the last row into the freed slot, so the live rows are
+    always ``matrix[:len(index)]``.
+    """
+
+    def __init__(self, dim: int | None = None, initial_capacity: int = 1024) -> None:
+        """Initialize the index.
+
+        Args:
+            dim: Embedding dimension. Inferred from the first vector if None.
+            initial_capacity: Rows to preallocate; grows by doubling.
+        """
+        self._dim = dim
+        self._capacity = max(1, initial_capacity)
+        self._matrix: NDArray[np.float32] | None = None
+        self._ids: list[str] = []
+        self._rows: dict[str, int] = {}
+        self._type_masks: dict[str, NDArray[np.bool_]] = {}
+        self._participant_masks: dict[str, NDArray[np.bool_]] = {}
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __contains__(self, memory_id: object) -> bool:
+        return memory_id in self._rows
+
+    @property
+    def dim(self) -> int | None:
+        """Embedding dimension, once known."""
+        return self._dim
+
+    def clear(self) -> None:
+        """Drop all vectors (keeps the allocated matrix)."""
+        self._ids.clear()
+        self._rows.clear()
+        self._type_masks.clear()
+        self._participant_masks.clear()
+        if self._matrix is not None:
+            self._matrix.fill(0.0)
+
+    # =========================================================================
+    # Mutation
+    # =========================================================================
+
+    def add(
+        self,
+        memory_id: str,
+        embedding: NDArray[np.float32],
+        memory_type: str,
+        participants: list[str] | None = None,
+    ) -> None:
+        """Add or replace a memory's vector and filter labels.
+
+        Args:
+            memory_id: Memory identifier.
+            embedding: Normalized embedding vector.
+            memory_type: Memory type used for type filtering.
+            participants: Participants used for participant filtering.
+
+        Raises:
+            ValueError: If the embedding dimension does not match the index.
+        """
+        vector = np.asarray(embedding, dtype=np.float32).reshape(-1)
+        if self._dim is None:
+            self._dim = int(vector.shape[0])
+        elif vector.shape[0] != self._dim:
+            raise ValueError(
+                f"Embedding dimension {vector.shape[0]} does not match index dimension {self._dim}"
+            )
+
+        if memory_id in self._rows:
+            self.remove(memory_id)
+
+        self._ensure_capacity(len(self._ids) + 1)
+        assert self._matrix is not None
+
+        row = len(self._ids)
+        self._matrix[row] = vector
+        self._ids.append(memory_id)
+        self._rows[memory_id] = row
+
+        self._label_mask(self._type_masks, memory_type)[row] = True
+        for participant in participants or []:
+            self._label_mask(self._participant_masks, participant)[row] = True
+
+    def remove(self, memory_id: str) -> bool:
+        """Remove a memory from the index.
+
+        Args:
+            memory_id: Memory identifier.
+
+        Returns:
+            True if removed, False if not indexed.
+        """
+        row = self._rows.pop(memory_id, None)
+        if row is None:
+            return False
+        assert self._matrix is not None
+
+        last = len(self._ids) - 1
+        if row != last:
+            moved_id = self._ids[last]
+            self._matrix[row] = self._matrix[last]
+            self._ids[row] = moved_id
+            self._rows[moved_id] = row
+            for mask in self._iter_masks():
+                mask[row] = mask[last]
+
+        self._matrix[last] = 0.0
+        for mask in self._iter_masks():
+            mask[last] = False
+        self._ids.pop()
+        return True
+
+    def get_vector(self, memory_id: str) -> NDArray[np.float32] | None:
+        """Get a copy of a memory's indexed vector."""
+        row = self._rows.get(memory_id)
+        if row is None or self._matrix is None:
+            return None
+        return self._matrix[row].copy()
+
+    # =========================================================================
+    # Search
+    # =========================================================================
+
+    def search(
+        self,
+        query_embedding: NDArray[np.float32],
+        max_results: int,
+        min_score: float,
+        memory_type: str | None = None,
+        participants: list[str] | None = None,
+    ) -> list[tuple[str, float]]:
+        """Find the most similar memories to a query.
+
+        Args:
+            query_embedding: Normalized query vector.
+            max_results: Maximum results to return.
+            min_score: Minimum similarity score threshold.
+            memory_type: Optional filter by memory type.
+            participants: Optional filter; matches memories with any of them.
+
+        Returns:
+            List of (memory_id, similarity_score) sorted by score descending.
+        """
+        candidates = self._candidate_rows(memory_type, participants)
+        if candidates is None or max_results <= 0:
+            return []
+        assert self._matrix is not None
+
+        query = np.asarray(query_embedding, dtype=np.float32).reshape(-1)
+        scores = self._matrix[candidates] @ query
+        top = self._top_k(scores, max_results, min_score)
+        return [(self._ids[self._row_at(candidates, i)], float(scores[i])) for i in top]
+
+    def search_batch(
+        self,
+        query_embeddings: NDArray[np.float32],
+        max_results: int,
+        min_score: float,
+        memory_type: str | None = None,
+        participants: list[str] | None = None,
+    ) -> list[list[tuple[str, float]]]:
+        """Search several queries with one (memories x queries) matrix product.
+
+        Args:
+            query_embeddings: Normalized query vectors, shape (n_queries, dim).
+            max_results: Maximum results per query.
+            min_score: Minimum similarity score threshold.
+            memory_type: Optional filter by memory type.
+            participants: Optional filter; matches memories with any of them.
+
+        Returns:
+            One result list per query, each sorted by score descending.
+        """
+        queries = np.atleast_2d(np.asarray(query_embeddings, dtype=np.float32))
+        candidates = self._candidate_rows(memory_type, participants)
+        if candidates is None or max_results <= 0:
+            return [[] for _ in range(queries.shape[0])]
+        assert self._matrix is not None
+
+        scores = self._matrix[candidates] @ queries.T
+        results = []
+        for q in range(queries.shape[0]):
+            column = scores[:, q]
+            top = self._top_k(column, max_results, min_score)
+            results.append(
+                [(self._ids[self._row_at(candidates, i)], float(column[i])) for i in top]
+            )
+        return results
+
+    def search_weighted(
+        self,
+        query_embeddings: NDArray[np.float32],
+        weights: NDArray[np.float32],
+        max_results: int,
+        min_score: float,
+        memory_type: str | None = None,
+        participants: list[str] | None = None,
+    ) -> list[tuple[str, float]]:
+        """Search several queries and merge them into one ranked list.
+
+        Each memory is scored by its best weighted similarity across the
+        queries, so a memory matched by several queries appears once.
+
+        Args:
+            query_embeddings: Normalized query vectors, shape (n_queries, dim).
+            weights: Per-query weight applied to its similarities.
+            max_results: Maximum merged results.
+            min_score: Minimum weighted score threshold.
+            memory_type: Optional filter by memory type.
+            participants: Optional filter; matches memories with any of them.
+
+        Returns:
+            List of (memory_id, weighted_score) sorted by score descending.
+        """
+        queries = np.atleast_2d(np.asarray(query_embeddings, dtype=np.float32))
+        candidates = self._candidate_rows(memory_type, participants)
+        if candidates is None or max_results <= 0 or queries.shape[0] == 0:
+            return []
+        assert self._matrix is not None
+
+        scores = self._matrix[candidates] @ queries.T
+        scores *= np.asarray(weights, dtype=np.float32)[np.newaxis, :]
+        best = scores.max(axis=1)
+        top = self._top_k(best, max_results, min_score)
+        return [(self._ids[self._row_at(candidates, i)], float(best[i])) for i in top]
+
+    @staticmethod
+    def _row_at(candidates: slice | NDArray[np.intp], position: int) -> int:
+        """Map a position in the scored candidates back to a matrix row."""
+        if isinstance(candidates, slice):
+            return int(position)
+        return int(candidates[position])
+
+    @staticmethod
+    def _top_k(scores: NDArray[np.float32], k: int, min_score: float) -> NDArray[np.intp]:
+        """Indices of the k best scores at or above min_score, best first."""
+        if scores.shape[0] > k:
+            top = np.argpartition(-scores, k - 1)[:k]
+        else:
+            top = np.arange(scores.shape[0])
+        top = top[scores[top] >= min_score]
+        return top[np.argsort(-scores[top], kind="stable")]
+
+    def _candidate_rows(
+        self,
+        memory_type: str | None,
+        participants: list[str] | None,
+    ) -> slice | NDArray[np.intp] | None:
+        """Resolve filters to the rows worth scoring.
+
+        Returns a slice over all live rows when unfiltered, an array of row
+        indices when filtered, or None when nothing can match.
+        """
+        n = len(self._ids)
+        if n == 0:
+            return None
+        if not memory_type and not participants:
+            return slice(0, n)
+
+        mask: NDArray[np.bool_] | None = None
+        if memory_type:
+            type_mask = self._type_masks.get(memory_type)
+            if type_mask is None:
+                return None
+            mask = type_mask[:n].copy()
+
+        if participants:
+            participant_mask = np.zeros(n, dtype=np.bool_)
+            for participant in participants:
+                p_mask = self._participant_masks.get(participant)
+                if p_mask is not None:
+                    participant_mask |= p_mask[:n]
+            mask = participant_mask if mask is None else mask & participant_mask
+
+        assert mask is not None
+        rows = np.flatnonzero(mask)
+        return rows if rows.size else None
+
+    # =========================================================================
+    # Storage
+    # =========================================================================
+
+    def _iter_masks(self) -> list[NDArray[np.bool_]]:
+        return [*self._type_masks.values(), *self._participant_masks.values()]
+
+    def _label_mask(self, masks: dict[str, NDArray[np.bool_]], label: str) -> NDArray[np.bool_]:
+        mask = masks.get(label)
+        if mask is None:
+            mask = np.zeros(self._capacity, dtype=np.bool_)
+            masks[label] = mask
+        return mask
+
+    def _ensure_capacity(self, rows: int) -> None:
+        if self._matrix is None:
+            self._capacity = max(self._capacity, rows)
+            self._matrix = np.zeros((self._capacity, self._dim or 0), dtype=np.float32)
+            return
+        if rows <= self._capacity:
+            return
+
+        new_capacity = self._capacity
+        while new_capacity < rows:
+            new_capacity *= 2
+
+        matrix = np.zeros((new_capacity, self._matrix.shape[1]), dtype=np.float32)
+        matrix[: self._capacity] = self._matrix
+        self._matrix = matrix
+
+        for masks in (self._type_masks, self._participant_masks):
+            for label, mask in masks.items():
+                grown = np.zeros(new_capacity, dtype=np.bool_)
+                grown[: self._capacity] = mask
+                masks[label] = grown
+
+        logger.debug(f"MemoryVectorIndex grown to {new_capacity} rows")
+        self._capacity = new_capacity
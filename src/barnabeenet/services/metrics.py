@@ -128,6 +128,63 @@ tts_duration_seconds = Histogram(
     registry=REGISTRY,
 )
 
+model_pool_loaded_models = Gauge(
+    "barnabeenet_model_pool_loaded_models",
+    "Voice models currently resident in the model pool",
+    registry=REGISTRY,
+)
+
+model_pool_memory_mb = Gauge(
+    "barnabeenet_model_pool_memory_mb",
+    "Estimated memory held by resident voice models",
+    registry=REGISTRY,
+)
+
+model_load_duration_seconds = Histogram(
+    "barnabeenet_model_load_duration_seconds",
+    "Voice model load time (including warm-up)",
+    ["model"],
+    buckets=[0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0],
+    registry=REGISTRY,
+)
+
+model_pool_requests_total = Counter(
+    "barnabeenet_model_pool_requests_total",
+    "Model pool acquisitions",
+    ["model", "result"],  # result: warm/cold
+    registry=REGISTRY,
+)
+
+inference_queue_wait_seconds = Histogram(
+    "barnabeenet_inference_queue_wait_seconds",
+    "Time inference calls wait for a worker thread",
+    ["model"],
+    buckets=[0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5],
+    registry=REGISTRY,
+)
+
+inference_compute_seconds = Histogram(
+    "barnabeenet_inference_compute_seconds",
+    "Time spent in model inference on a worker thread",
+    ["model"],
+    buckets=[0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0],
+    registry=REGISTRY,
+)
+
+inference_queue_depth = Gauge(
+    "barnabeenet_inference_queue_depth",
+    "Inference calls running or queued",
+    ["model"],
+    registry=REGISTRY,
+)
+
+inference_rejected_total = Counter(
+    "barnabeenet_inference_rejected_total",
+    "Inference calls rejected because the model queue was full",
+    ["model"],
+    registry=REGISTRY,
+)
+
 # =============================================================================
 # Agent Metrics
 # =============================================================================
@@ -163,6 +220,79 @@ memory_stored_total = Gauge(
     registry=REGISTRY,
 )
 
+# =============================================================================
+# Cache Metrics
+# =============================================================================
+
+cache_lookups_total = Counter(
+    "barnabeenet_cache_lookups_total",
+    "Cache lookups by outcome",
+    ["cache", "result"],  # cache: embedding_memo/llm_response, result: hit/exact_hit/semantic_hit/miss
+    registry=REGISTRY,
+)
+
+embedding_memo_bytes = Gauge(
+    "barnabeenet_embedding_memo_bytes",
+    "Bytes held by the process-wide query embedding memo",
+    registry=REGISTRY,
+)
+
+# =============================================================================
+# Post-Response Queue Metrics
+# =============================================================================
+
+post_response_jobs_total = Counter(
+    "barnabeenet_post_response_jobs_total",
+    "Deferred post-response jobs by outcome",
+    ["kind", "result"],  # result: ok/retry/failed/spilled/dropped/rejected
+    registry=REGISTRY,
+)
+
+post_response_backlog = Gauge(
+    "barnabeenet_post_response_backlog",
+    "Deferred post-response jobs waiting to run",
+    ["tier"],  # memory/stream
+    registry=REGISTRY,
+)
+
+post_response_lag_seconds = Histogram(
+    "barnabeenet_post_response_lag_seconds",
+    "Time from submitting a post-response job to starting it",
+    buckets=[0.001, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 30.0, 120.0, 600.0],
+    registry=REGISTRY,
+)
+
+# =============================================================================
+# Telemetry Writer Metrics
+# =============================================================================
+
+telemetry_flush_seconds = Histogram(
+    "barnabeenet_telemetry_flush_seconds",
+    "Time to write one pipelined batch of telemetry to Redis",
+    buckets=[0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25],
+    registry=REGISTRY,
+)
+
+telemetry_batch_size = Histogram(
+    "barnabeenet_telemetry_batch_size",
+    "Redis commands per telemetry flush",
+    buckets=[1, 2, 5, 10, 25, 50, 100, 200],
+    registry=REGISTRY,
+)
+
+telemetry_dropped_total = Counter(
+    "barnabeenet_telemetry_dropped_total",
+    "Telemetry writes dropped instead of slowing requests",
+    ["reason"],  # sampled/overflow/error
+    registry=REGISTRY,
+)
+
+telemetry_buffered = Gauge(
+    "barnabeenet_telemetry_buffered",
+    "Telemetry writes waiting to be flushed",
+    registry=REGISTRY,
+)
+
 # =============================================================================
 # Home Assistant Metrics
 # =============================================================================
@@ -233,6 +363,79 @@ def record_tts_request(voice: str, success: bool, latency_seconds: float) -> Non
     tts_duration_seconds.labels(voice=voice).observe(latency_seconds)
 
 
+def record_model_load(model: str, latency_seconds: float) -> None:
+    """Record a voice model load into the model pool."""
+    model_load_duration_seconds.labels(model=model).observe(latency_seconds)
+
+
+def record_model_pool_hit(model: str, warm: bool) -> None:
+    """Record a model pool acquisition as warm (resident) or cold (loaded)."""
+    model_pool_requests_total.labels(model=model, result="warm" if warm else "cold").inc()
+
+
+def update_model_pool_occupancy(loaded_models: int, memory_mb: float) -> None:
+    """Update model pool occupancy gauges."""
+    model_pool_loaded_models.set(loaded_models)
+    model_pool_memory_mb.set(memory_mb)
+
+
+def record_inference(model: str, wait_seconds: float, compute_seconds: float) -> None:
+    """Record queue wait and compute time for an off-loop inference call."""
+    inference_queue_wait_seconds.labels(model=model).observe(wait_seconds)
+    inference_compute_seconds.labels(model=model).observe(compute_seconds)
+
+
+def record_inference_rejected(model: str) -> None:
+    """Record an inference call rejected by backpressure."""
+    inference_rejected_total.labels(model=model).inc()
+
+
+def update_inference_queue_depth(model: str, depth: int) -> None:
+    """Update the in-flight inference gauge for a model."""
+    inference_queue_depth.labels(model=model).set(depth)
+
+
+def record_cache_lookup(cache: str, result: str) -> None:
+    """Record the outcome of a cache lookup."""
+    cache_lookups_total.labels(cache=cache, result=result).inc()
+
+
+def update_embedding_memo_size(size_bytes: int) -> None:
+    """Update the embedding memo occupancy gauge."""
+    embedding_memo_bytes.set(size_bytes)
+
+
+def record_post_response_job(kind: str, result: str) -> None:
+    """Record the outcome of a deferred post-response job."""
+    post_response_jobs_total.labels(kind=kind, result=result).inc()
+
+
+def update_post_response_backlog(tier: str, depth: int) -> None:
+    """Update the post-response backlog gauge for a tier (memory/stream)."""
+    post_response_backlog.labels(tier=tier).set(depth)
+
+
+def observe_post_response_lag(lag_seconds: float) -> None:
+    """Record how long a post-response job waited before starting."""
+    post_response_lag_seconds.observe(lag_seconds)
+
+
+def observe_telemetry_flush(flush_seconds: float, batch_size: int) -> None:
+    """Record one telemetry flush."""
+    telemetry_flush_seconds.observe(flush_seconds)
+    telemetry_batch_size.observe(batch_size)
+
+
+def record_telemetry_dropped(reason: str, count: int = 1) -> None:
+    """Record telemetry writes dropped under backpressure or on error."""
+    telemetry_dropped_total.labels(reason=reason).inc(count)
+
+
+def update_telemetry_buffered(count: int) -> None:
+    """Update the buffered telemetry gauge."""
+    telemetry_buffered.set(count)
+
+
 def record_homeassistant_call(domain: str, service: str, success: bool) -> None:
     """Record metrics for a Home Assistant service call."""
     status = "success" if success else "error"
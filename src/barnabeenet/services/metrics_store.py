@@ -3,6 +3,7 @@
 Stores latency measurements for:
 - STT (speech-to-text)
 - TTS (text-to-speech)
+- TTS time to first audio (streaming synthesis)
 - LLM (language model calls)
 - Total pipeline
 
@@ -10,17 +11,26 @@ Supports:
 - Rolling windows (last 1 hour, 24 hours)
 - Aggregation (p50, p95, p99, avg)
 - Time-series for graphing
+
+Raw samples are not kept. Each measurement is folded into a mergeable
+LatencySketch for its component and minute, so recording is O(1) and a
+query merges at most one sketch per minute in the window. Minute sketches
+are persisted to a Redis hash per component, so 24h history survives
+restarts.
 """
 
 from __future__ import annotations
 
+import json
 import logging
+import math
 import time
-from collections import deque
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Any
 
+from barnabeenet.services.telemetry_writer import get_telemetry_writer, op
+
 if TYPE_CHECKING:
     import redis.asyncio as redis
 
@@ -32,15 +42,6 @@ logger = logging.getLogger(__name__)
 # =============================================================================
 
 
-@dataclass
-class LatencyMeasurement:
-    """Single latency measurement."""
-
-    timestamp: float  # Unix timestamp
-    latency_ms: float
-    metadata: dict[str, Any] = field(default_factory=dict)
-
-
 @dataclass
 class LatencyStats:
     """Computed statistics for latency measurements."""
@@ -55,6 +56,101 @@ class LatencyStats:
     sample_count: int
 
 
+class LatencySketch:
+    """Mergeable streaming latency histogram (DDSketch-style).
+
+    Values are counted in logarithmic bins whose width grows with their
+    magnitude, so any quantile is within ``RELATIVE_ACCURACY`` of the exact
+    value no matter how many samples were added. Two sketches merge by
+    adding bin counts.
+    """
+
+    RELATIVE_ACCURACY = 0.01
+    MIN_TRACKED_MS = 0.01  # Values at or below this are counted as zero
+
+    _GAMMA = (1 + RELATIVE_ACCURACY) / (1 - RELATIVE_ACCURACY)
+    _LOG_GAMMA = math.log(_GAMMA)
+
+    __slots__ = ("bins", "zero_count", "count", "total", "min", "max")
+
+    def __init__(self) -> None:
+        self.bins: dict[int, int] = {}
+        self.zero_count = 0
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def add(self, value: float) -> None:
+        """Record one value."""
+        if value <= self.MIN_TRACKED_MS:
+            self.zero_count += 1
+        else:
+            index = math.ceil(math.log(value) / self._LOG_GAMMA)
+            self.bins[index] = self.bins.get(index, 0) + 1
+        self.count += 1
+        self.total += value
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+    def merge(self, other: LatencySketch) -> None:
+        """Add another sketch's counts into this one."""
+        for index, count in other.bins.items():
+            self.bins[index] = self.bins.get(index, 0) + count
+        self.zero_count += other.zero_count
+        self.count += other.count
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def quantile(self, q: float) -> float:
+        """Estimate the value at quantile ``q`` (0.0 - 1.0)."""
+        if self.count == 0:
+            return 0.0
+
+        rank = min(int(self.count * q), self.count - 1)
+        if rank < self.zero_count:
+            return self.min
+
+        seen = self.zero_count
+        for index in sorted(self.bins):
+            seen += self.bins[index]
+            if seen > rank:
+                value = 2 * self._GAMMA**index / (self._GAMMA + 1)
+                return min(max(value, self.min), self.max)
+        return self.max
+
+    @property
+    def avg(self) -> float:
+        """Mean of all recorded values."""
+        return self.total / self.count if self.count else 0.0
+
+    def to_payload(self) -> str:
+        """Encode as compact JSON: totals plus a dense run of bin counts."""
+        if self.bins:
+            low = min(self.bins)
+            counts = [self.bins.get(i, 0) for i in range(low, max(self.bins) + 1)]
+        else:
+            low, counts = 0, []
+        return json.dumps(
+            [self.count, self.total, self.min, self.max, self.zero_count, low, counts],
+            separators=(",", ":"),
+        )
+
+    @classmethod
+    def from_payload(cls, payload: str | bytes) -> LatencySketch:
+        """Decode a sketch written by ``to_payload``."""
+        count, total, low_value, high_value, zero_count, low, counts = json.loads(payload)
+        sketch = cls()
+        sketch.bins = {low + i: c for i, c in enumerate(counts) if c}
+        sketch.zero_count = zero_count
+        sketch.count = count
+        sketch.total = total
+        sketch.min = low_value
+        sketch.max = high_value
+        return sketch
+
+
 # =============================================================================
 # Metrics Store
 # =============================================================================
@@ -63,48 +159,97 @@ class LatencyStats:
 class MetricsStore:
     """In-memory and Redis-backed metrics storage.
 
-    Maintains rolling windows of latency measurements for
-    performance monitoring and graphing.
+    Keeps one LatencySketch per component per minute for the last 24 hours,
+    for performance monitoring and graphing.
     """
 
     # Time windows in seconds
     WINDOW_1H = 3600
     WINDOW_24H = 86400
 
+    # Sketch granularity; windows and history buckets are resolved to this
+    BUCKET_SECONDS = 60
+
     # Components to track
-    COMPONENTS = ["stt", "tts", "llm", "pipeline", "memory", "action"]
+    COMPONENTS = ["stt", "tts", "tts_first_audio", "llm", "pipeline", "memory", "action"]
 
     def __init__(self, redis_client: redis.Redis | None = None) -> None:
         self._redis = redis_client
 
-        # In-memory deques for fast access (1 hour window)
-        self._measurements: dict[str, deque[LatencyMeasurement]] = {
-            component: deque(maxlen=10000) for component in self.COMPONENTS
+        # Minute sketches per component, oldest first
+        self._sketches: dict[str, dict[int, LatencySketch]] = {
+            component: {} for component in self.COMPONENTS
         }
+        # Minute buckets changed since they were last written to Redis
+        self._dirty: dict[str, set[int]] = {component: set() for component in self.COMPONENTS}
 
         # Counters
         self._total_counts: dict[str, int] = dict.fromkeys(self.COMPONENTS, 0)
 
+    @staticmethod
+    def _count_key(component: str) -> str:
+        return f"barnabeenet:metrics:{component}:count"
+
+    @staticmethod
+    def _sketch_key(component: str) -> str:
+        return f"barnabeenet:metrics:{component}:sketches"
+
+    def _bucket_start(self, timestamp: float) -> int:
+        return int(timestamp // self.BUCKET_SECONDS) * self.BUCKET_SECONDS
+
+    def _retention_cutoff(self, now: float) -> int:
+        return self._bucket_start(now - self.WINDOW_24H)
+
     async def init(self) -> None:
         """Initialize the metrics store."""
-        # Load recent measurements from Redis if available
+        # Load counts and the last 24h of sketches from Redis if available
         if self._redis:
+            cutoff = self._retention_cutoff(time.time())
             for component in self.COMPONENTS:
                 try:
-                    count = await self._redis.get(f"barnabeenet:metrics:{component}:count")
+                    count = await self._redis.get(self._count_key(component))
                     if count:
                         self._total_counts[component] = int(count)
+                    stored = await self._redis.hgetall(self._sketch_key(component))
                 except Exception as e:
-                    logger.warning("Failed to load metric count for %s: %s", component, e)
+                    logger.warning("Failed to load metrics for %s: %s", component, e)
+                    continue
+
+                loaded: dict[int, LatencySketch] = {}
+                stale: list[str] = []
+                for field_name, payload in stored.items():
+                    bucket_ts = int(field_name)
+                    if bucket_ts < cutoff:
+                        stale.append(field_name)
+                        continue
+                    try:
+                        loaded[bucket_ts] = LatencySketch.from_payload(payload)
+                    except (ValueError, TypeError) as e:
+                        logger.warning("Dropping bad %s sketch %s: %s", component, field_name, e)
+                        stale.append(field_name)
+                self._sketches[component] = dict(sorted(loaded.items()))
+
+                if stale:
+                    try:
+                        await self._redis.hdel(self._sketch_key(component), *stale)
+                    except Exception as e:
+                        logger.warning("Failed to prune metric sketches for %s: %s", component, e)
 
         logger.info("Metrics store initialized")
 
     async def shutdown(self) -> None:
         """Shutdown and persist final state."""
         if self._redis:
+            for component in self._sketches:
+                self._persist_sketches(component)
+            try:
+                await get_telemetry_writer(self._redis).flush()
+            except Exception as e:
+                logger.warning("Failed to persist metric sketches: %s", e)
+
             for component, count in self._total_counts.items():
                 try:
-                    await self._redis.set(f"barnabeenet:metrics:{component}:count", count)
+                    await self._redis.set(self._count_key(component), count)
                 except Exception as e:
                     logger.warning("Failed to persist metric count for %s: %s", component, e)
 
@@ -121,34 +266,73 @@ class MetricsStore:
         Args:
             component: Component name (stt, tts, llm, pipeline, etc.)
             latency_ms: Latency in milliseconds
-            metadata: Optional metadata (model name, speaker, etc.)
+            metadata: Optional metadata (model name, speaker, etc.). Only
+                the latency is aggregated; metadata is not retained.
         """
-        if component not in self._measurements:
-            self._measurements[component] = deque(maxlen=10000)
+        if component not in self._sketches:
+            self._sketches[component] = {}
+            self._dirty[component] = set()
             self._total_counts[component] = 0
 
-        measurement = LatencyMeasurement(
-            timestamp=time.time(),
-            latency_ms=latency_ms,
-            metadata=metadata or {},
-        )
-
-        self._measurements[component].append(measurement)
+        now = time.time()
+        bucket_ts = self._bucket_start(now)
+        buckets = self._sketches[component]
+        sketch = buckets.get(bucket_ts)
+        if sketch is None:
+            # A new minute: write out the finished ones and drop expired ones
+            pruned = self._prune(component, now)
+            self._persist_sketches(component, pruned)
+            sketch = buckets[bucket_ts] = LatencySketch()
+
+        sketch.add(latency_ms)
+        self._dirty[component].add(bucket_ts)
         self._total_counts[component] += 1
 
-        # Also persist to Redis for longer history
-        if self._redis:
-            try:
-                await self._redis.xadd(
-                    f"barnabeenet:metrics:{component}:stream",
-                    {
-                        "latency_ms": str(latency_ms),
-                        "metadata": str(metadata or {}),
-                    },
-                    maxlen=50000,  # Keep 24h worth at ~2/sec
-                )
-            except Exception as e:
-                logger.warning("Failed to persist latency to Redis: %s", e)
+    def _prune(self, component: str, now: float) -> list[int]:
+        """Drop sketches older than 24h, returning their bucket timestamps."""
+        buckets = self._sketches[component]
+        cutoff = self._retention_cutoff(now)
+        pruned: list[int] = []
+        while buckets:
+            oldest = next(iter(buckets))
+            if oldest >= cutoff:
+                break
+            del buckets[oldest]
+            self._dirty[component].discard(oldest)
+            pruned.append(oldest)
+        return pruned
+
+    def _persist_sketches(self, component: str, pruned: list[int] | None = None) -> None:
+        """Queue changed (and pruned) minute sketches for Redis (batched)."""
+        dirty = self._dirty[component]
+        if not self._redis or not (dirty or pruned):
+            return
+
+        key = self._sketch_key(component)
+        buckets = self._sketches[component]
+        ops = []
+        if dirty:
+            mapping = {str(ts): buckets[ts].to_payload() for ts in dirty if ts in buckets}
+            if mapping:
+                ops.append(op("hset", key, mapping=mapping))
+        if pruned:
+            ops.append(op("hdel", key, *(str(ts) for ts in pruned)))
+        ops.append(op("expire", key, self.WINDOW_24H + self.BUCKET_SECONDS))
+        get_telemetry_writer(self._redis).submit(*ops, droppable=False)
+        dirty.clear()
+
+    def _merged(self, component: str, window_seconds: int) -> LatencySketch | None:
+        """Merge the minute sketches overlapping the window."""
+        buckets = self._sketches.get(component)
+        if not buckets:
+            return None
+
+        cutoff = self._bucket_start(time.time() - window_seconds)
+        merged = LatencySketch()
+        for bucket_ts, sketch in buckets.items():
+            if bucket_ts >= cutoff:
+                merged.merge(sketch)
+        return merged if merged.count else None
 
     async def get_latency_stats(
         self,
@@ -157,6 +341,9 @@ class MetricsStore:
     ) -> LatencyStats | None:
         """Get latency statistics for a component.
 
+        Percentiles are estimates within LatencySketch.RELATIVE_ACCURACY, and
+        the window is resolved to whole minutes.
+
         Args:
             component: Component name
             window_seconds: Time window (default: 1 hour)
@@ -165,35 +352,19 @@ class MetricsStore:
             LatencyStats or None if no data
         """
         window_seconds = window_seconds or self.WINDOW_1H
-        cutoff = time.time() - window_seconds
-
-        if component not in self._measurements:
-            return None
-
-        # Filter by time window
-        values = [m.latency_ms for m in self._measurements[component] if m.timestamp >= cutoff]
-
-        if not values:
+        sketch = self._merged(component, window_seconds)
+        if sketch is None:
             return None
 
-        # Sort for percentiles
-        sorted_values = sorted(values)
-        n = len(sorted_values)
-
-        def percentile(p: float) -> float:
-            idx = int(n * p / 100)
-            idx = min(idx, n - 1)
-            return sorted_values[idx]
-
         return LatencyStats(
             component=component,
-            p50_ms=percentile(50),
-            p95_ms=percentile(95),
-            p99_ms=percentile(99),
-            avg_ms=sum(values) / n,
-            min_ms=min(values),
-            max_ms=max(values),
-            sample_count=n,
+            p50_ms=sketch.quantile(0.50),
+            p95_ms=sketch.quantile(0.95),
+            p99_ms=sketch.quantile(0.99),
+            avg_ms=sketch.avg,
+            min_ms=sketch.min,
+            max_ms=sketch.max,
+            sample_count=sketch.count,
         )
 
     async def get_latency_history(
@@ -207,47 +378,41 @@ class MetricsStore:
         Args:
             component: Component name
             window_minutes: How far back to look
-            bucket_seconds: Bucket size for aggregation
+            bucket_seconds: Bucket size for aggregation (rounded up to a
+                whole number of minutes)
 
         Returns:
             List of {timestamp, avg_ms, p95_ms, count} buckets
         """
-        window_seconds = window_minutes * 60
-        cutoff = time.time() - window_seconds
-
-        if component not in self._measurements:
+        buckets = self._sketches.get(component)
+        if not buckets:
             return []
 
-        # Bucket measurements
-        buckets: dict[int, list[float]] = {}
-        for m in self._measurements[component]:
-            if m.timestamp < cutoff:
+        step = max(1, math.ceil(bucket_seconds / self.BUCKET_SECONDS)) * self.BUCKET_SECONDS
+        cutoff = self._bucket_start(time.time() - window_minutes * 60)
+
+        # Merge minute sketches into graph buckets
+        merged: dict[int, LatencySketch] = {}
+        for bucket_ts, sketch in buckets.items():
+            if bucket_ts < cutoff:
                 continue
-            bucket_ts = int(m.timestamp / bucket_seconds) * bucket_seconds
-            if bucket_ts not in buckets:
-                buckets[bucket_ts] = []
-            buckets[bucket_ts].append(m.latency_ms)
-
-        # Compute stats per bucket
-        result = []
-        for ts in sorted(buckets.keys()):
-            values = sorted(buckets[ts])
-            n = len(values)
-            p95_idx = min(int(n * 0.95), n - 1)
-
-            result.append(
-                {
-                    "timestamp": datetime.fromtimestamp(ts, tz=UTC).isoformat(),
-                    "unix_ts": ts,
-                    "avg_ms": sum(values) / n,
-                    "p95_ms": values[p95_idx],
-                    "min_ms": min(values),
-                    "max_ms": max(values),
-                    "count": n,
-                }
-            )
-
-        return result
+            ts = bucket_ts // step * step
+            if ts not in merged:
+                merged[ts] = LatencySketch()
+            merged[ts].merge(sketch)
+
+        return [
+            {
+                "timestamp": datetime.fromtimestamp(ts, tz=UTC).isoformat(),
+                "unix_ts": ts,
+                "avg_ms": sketch.avg,
+                "p95_ms": sketch.quantile(0.95),
+                "min_ms": sketch.min,
+                "max_ms": sketch.max,
+                "count": sketch.count,
+            }
+            for ts, sketch in sorted(merged.items())
+        ]
 
     async def get_component_comparison(
         self,
@@ -266,14 +431,17 @@ class MetricsStore:
 
     async def clear_component(self, component: str) -> None:
         """Clear all measurements for a component."""
-        if component in self._measurements:
-            self._measurements[component].clear()
+        if component in self._sketches:
+            self._sketches[component].clear()
+            self._dirty[component].clear()
             self._total_counts[component] = 0
 
         if self._redis:
             try:
+                await self._redis.delete(self._sketch_key(component))
+                await self._redis.delete(self._count_key(component))
+                # Raw sample stream written by earlier versions
                 await self._redis.delete(f"barnabeenet:metrics:{component}:stream")
-                await self._redis.delete(f"barnabeenet:metrics:{component}:count")
             except Exception as e:
                 logger.warning("Failed to clear Redis metrics for %s: %s", component, e)
 
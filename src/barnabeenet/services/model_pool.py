@@ -0,0 +1,322 @@
+"""Model Pool - Process-wide resident STT/TTS engines.
+
+Loads Distil-Whisper and Kokoro once (with a warm-up inference) and hands the
+same instances to every consumer: the voice pipeline, the /transcribe and
+/synthesize routes and the STT router. Also owns the shared HTTP client used
+for GPU worker calls so requests reuse pooled connections.
+
+Memory is budgeted from per-model footprint estimates: loading a model that
+would exceed the budget evicts the least recently used resident model first.
+Occupancy, load time and warm/cold acquisitions are exported via
+services/metrics.py.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import io
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+import httpx
+import structlog
+
+from barnabeenet.config import get_settings
+from barnabeenet.services.metrics import (
+    record_model_load,
+    record_model_pool_hit,
+    update_model_pool_occupancy,
+)
+
+if TYPE_CHECKING:
+    from barnabeenet.services.stt.distil_whisper import DistilWhisperSTT
+    from barnabeenet.services.tts.kokoro_tts import KokoroTTS
+
+logger = structlog.get_logger()
+
+STT_MODEL = "distil_whisper"
+TTS_MODEL = "kokoro"
+
+
+@dataclass
+class PooledModel:
+    """A model slot in the pool."""
+
+    name: str
+    memory_mb: int
+    factory: Callable[[], Any]
+    warm_up: Callable[[Any], Awaitable[None]] | None = None
+    instance: Any = None
+    load_time_ms: float = 0.0
+    last_used: float = 0.0
+    warm_hits: int = 0
+    cold_hits: int = 0
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+
+    @property
+    def loaded(self) -> bool:
+        return self.instance is not None and self.instance.is_available()
+
+
+class ModelPool:
+    """Process-wide pool of resident voice models.
+
+    Each model is created lazily by its factory, initialized, warmed up and
+    kept resident. Concurrent first requests share one load.
+    """
+
+    def __init__(self, memory_budget_mb: int | None = None) -> None:
+        """Initialize the pool.
+
+        Args:
+            memory_budget_mb: Total resident budget (default from settings).
+        """
+        settings = get_settings()
+        self.memory_budget_mb = memory_budget_mb or settings.performance.model_pool_budget_mb
+        self._models: dict[str, PooledModel] = {}
+        self._http_client: httpx.AsyncClient | None = None
+        self._http_loop: asyncio.AbstractEventLoop | None = None
+
+        self.register(
+            STT_MODEL,
+            memory_mb=settings.stt.whisper_memory_mb,
+            factory=_create_stt,
+            warm_up=_warm_up_stt,
+        )
+        self.register(
+            TTS_MODEL,
+            memory_mb=settings.tts.kokoro_memory_mb,
+            factory=_create_tts,
+            warm_up=_warm_up_tts,
+        )
+
+    def register(
+        self,
+        name: str,
+        memory_mb: int,
+        factory: Callable[[], Any],
+        warm_up: Callable[[Any], Awaitable[None]] | None = None,
+    ) -> None:
+        """Register a model slot.
+
+        Args:
+            name: Pool key for the model.
+            memory_mb: Estimated resident footprint in MB.
+            factory: Creates an uninitialized engine exposing
+                ``initialize()``, ``is_available()`` and ``shutdown()``.
+            warm_up: Optional coroutine run once after loading.
+        """
+        self._models[name] = PooledModel(
+            name=name, memory_mb=memory_mb, factory=factory, warm_up=warm_up
+        )
+
+    # =========================================================================
+    # Acquisition
+    # =========================================================================
+
+    async def get_stt(self) -> DistilWhisperSTT:
+        """Get the resident Distil-Whisper engine."""
+        return await self.acquire(STT_MODEL)
+
+    async def get_tts(self) -> KokoroTTS:
+        """Get the resident Kokoro engine."""
+        return await self.acquire(TTS_MODEL)
+
+    async def acquire(self, name: str) -> Any:
+        """Get a loaded model, loading it on first use.
+
+        Raises:
+            KeyError: If no model is registered under ``name``.
+        """
+        slot = self._models[name]
+        slot.last_used = time.monotonic()
+
+        if slot.loaded:
+            slot.warm_hits += 1
+            record_model_pool_hit(name, warm=True)
+            return slot.instance
+
+        async with slot.lock:
+            if not slot.loaded:
+                slot.cold_hits += 1
+                record_model_pool_hit(name, warm=False)
+                await self._load(slot)
+            else:
+                slot.warm_hits += 1
+                record_model_pool_hit(name, warm=True)
+        return slot.instance
+
+    async def preload(self, names: list[str] | None = None) -> None:
+        """Load and warm up models ahead of the first request.
+
+        Failures are logged, not raised, so startup continues without the
+        model (it will be retried on first use).
+        """
+        for name in names or list(self._models):
+            slot = self._models[name]
+            try:
+                async with slot.lock:
+                    if not slot.loaded:
+                        await self._load(slot)
+            except Exception as e:
+                logger.warning("Model preload failed", model=name, error=str(e))
+
+    async def _load(self, slot: PooledModel) -> None:
+        """Load, initialize and warm up a model within the memory budget."""
+        await self._make_room(slot)
+
+        start = time.perf_counter()
+        instance = slot.factory()
+        await instance.initialize()
+        if slot.warm_up is not None:
+            try:
+                await slot.warm_up(instance)
+            except Exception as e:
+                logger.warning("Model warm-up failed", model=slot.name, error=str(e))
+        slot.instance = instance
+        slot.load_time_ms = (time.perf_counter() - start) * 1000
+
+        record_model_load(slot.name, slot.load_time_ms / 1000)
+        self._report_occupancy()
+        logger.info(
+            "Model loaded into pool",
+            model=slot.name,
+            load_time_ms=f"{slot.load_time_ms:.0f}",
+            pool_memory_mb=self.memory_used_mb,
+            budget_mb=self.memory_budget_mb,
+        )
+
+    async def _make_room(self, slot: PooledModel) -> None:
+        """Evict least recently used models until ``slot`` fits the budget."""
+        if slot.memory_mb > self.memory_budget_mb:
+            logger.warning(
+                "Model exceeds pool budget on its own",
+                model=slot.name,
+                memory_mb=slot.memory_mb,
+                budget_mb=self.memory_budget_mb,
+            )
+
+        resident = sorted(
+            (m for m in self._models.values() if m is not slot and m.loaded),
+            key=lambda m: m.last_used,
+        )
+        for victim in resident:
+            if self.memory_used_mb + slot.memory_mb <= self.memory_budget_mb:
+                break
+            logger.info("Evicting model from pool", model=victim.name, for_model=slot.name)
+            await self._unload(victim)
+
+    async def _unload(self, slot: PooledModel) -> None:
+        if slot.instance is not None:
+            await slot.instance.shutdown()
+        slot.instance = None
+        self._report_occupancy()
+
+    # =========================================================================
+    # Shared HTTP client
+    # =========================================================================
+
+    @property
+    def http_client(self) -> httpx.AsyncClient:
+        """Shared HTTP client for GPU worker calls (keeps connections alive)."""
+        loop = asyncio.get_running_loop()
+        if self._http_client is None or self._http_client.is_closed or self._http_loop is not loop:
+            self._http_loop = loop
+            self._http_client = httpx.AsyncClient(
+                timeout=httpx.Timeout(get_settings().performance.stt_timeout_ms / 1000),
+            )
+        return self._http_client
+
+    # =========================================================================
+    # Status
+    # =========================================================================
+
+    @property
+    def memory_used_mb(self) -> int:
+        """Estimated memory held by resident models."""
+        return sum(m.memory_mb for m in self._models.values() if m.loaded)
+
+    def _report_occupancy(self) -> None:
+        loaded = [m for m in self._models.values() if m.loaded]
+        update_model_pool_occupancy(len(loaded), float(self.memory_used_mb))
+
+    def get_status(self) -> dict[str, Any]:
+        """Get pool occupancy and per-model load/hit statistics."""
+        return {
+            "budget_mb": self.memory_budget_mb,
+            "used_mb": self.memory_used_mb,
+            "models": {
+                m.name: {
+                    "loaded": m.loaded,
+                    "memory_mb": m.memory_mb,
+                    "load_time_ms": m.load_time_ms,
+                    "warm_hits": m.warm_hits,
+                    "cold_hits": m.cold_hits,
+                }
+                for m in self._models.values()
+            },
+        }
+
+    async def shutdown(self) -> None:
+        """Unload all models and close the shared HTTP client."""
+        for slot in self._models.values():
+            try:
+                await self._unload(slot)
+            except Exception as e:
+                logger.warning("Model shutdown failed", model=slot.name, error=str(e))
+        if self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
+        logger.info("Model pool shut down")
+
+
+# =============================================================================
+# Model factories and warm-ups
+# =============================================================================
+
+
+def _create_stt() -> DistilWhisperSTT:
+    from barnabeenet.services.stt.distil_whisper import DistilWhisperSTT
+
+    settings = get_settings()
+    return DistilWhisperSTT(
+        model_size=settings.stt.whisper_model,
+        device=settings.stt.whisper_device,
+        compute_type=settings.stt.whisper_compute_type,
+    )
+
+
+def _create_tts() -> KokoroTTS:
+    from barnabeenet.services.tts.kokoro_tts import KokoroTTS
+
+    settings = get_settings()
+    return KokoroTTS(voice=settings.tts.voice, speed=settings.tts.speed)
+
+
+async def _warm_up_stt(stt: DistilWhisperSTT) -> None:
+    """Run one transcription of silence so the first real request is warm."""
+    import numpy as np
+    import soundfile as sf
+
+    buffer = io.BytesIO()
+    sf.write(buffer, np.zeros(8000, dtype=np.float32), 16000, format="WAV")
+    await stt.transcribe(buffer.getvalue())
+
+
+async def _warm_up_tts(tts: KokoroTTS) -> None:
+    """Synthesize a short phrase so the first real request is warm."""
+    await tts.synthesize("Ready.")
+
+
+# Global singleton
+_model_pool: ModelPool | None = None
+
+
+def get_model_pool() -> ModelPool:
+    """Get the global model pool instance."""
+    global _model_pool
+    if _model_pool is None:
+        _model_pool = ModelPool()
+    return _model_pool
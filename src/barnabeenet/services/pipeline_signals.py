@@ -16,6 +16,8 @@ from typing import TYPE_CHECKING, Any
 
 from pydantic import BaseModel, Field
 
+from barnabeenet.services.telemetry_writer import get_telemetry_writer, op
+
 if TYPE_CHECKING:
     import redis.asyncio as redis
 
@@ -316,33 +318,25 @@ class PipelineLogger:
                 self._fallback_signals.pop(0)
             return
 
-        try:
-            # Add to stream for real-time updates
-            stream_data = {
-                "signal_id": sig.signal_id,
-                "trace_id": sig.trace_id,
-                "signal_type": sig.signal_type.value,
-                "stage": sig.stage,
-                "component": sig.component,
-                "timestamp": sig.timestamp.isoformat(),
-                "success": str(sig.success),
-                "latency_ms": str(sig.latency_ms or 0),
-                "summary": sig.summary[:200],
-                "speaker": sig.speaker or "",
-                "room": sig.room or "",
-                "model": sig.model_used or "",
-                "error": sig.error or "",
-            }
-
-            await self._redis.xadd(
-                self.STREAM_KEY,
-                stream_data,
-                maxlen=5000,
-            )
-
-        except Exception as e:
-            logger.error("Failed to log signal to Redis: %s", e)
-            self._fallback_signals.append(sig)
+        # Add to stream for real-time updates (batched with other telemetry)
+        stream_data = {
+            "signal_id": sig.signal_id,
+            "trace_id": sig.trace_id,
+            "signal_type": sig.signal_type.value,
+            "stage": sig.stage,
+            "component": sig.component,
+            "timestamp": sig.timestamp.isoformat(),
+            "success": str(sig.success),
+            "latency_ms": str(sig.latency_ms or 0),
+            "summary": sig.summary[:200],
+            "speaker": sig.speaker or "",
+            "room": sig.room or "",
+            "model": sig.model_used or "",
+            "error": sig.error or "",
+        }
+        get_telemetry_writer(self._redis).submit(
+            op("xadd", self.STREAM_KEY, stream_data, maxlen=5000)
+        )
 
     def _log_signal_sync(self, signal: PipelineSignal) -> None:
         """Synchronous signal logging (for start_trace)."""
@@ -444,19 +438,17 @@ class PipelineLogger:
         if self._redis is None:
             return
 
-        try:
-            trace_key = f"{self.TRACE_PREFIX}{trace.trace_id}"
-            trace_json = trace.model_dump_json()
-
-            # Store full trace
-            await self._redis.setex(trace_key, self.SIGNAL_TTL_SECONDS, trace_json)
+        trace_key = f"{self.TRACE_PREFIX}{trace.trace_id}"
+        trace_json = trace.model_dump_json()
 
-            # Add to recent traces list
-            await self._redis.lpush(self.RECENT_TRACES_KEY, trace.trace_id)
-            await self._redis.ltrim(self.RECENT_TRACES_KEY, 0, self.MAX_RECENT_TRACES - 1)
-
-        except Exception as e:
-            logger.error("Failed to store trace: %s", e)
+        # Store full trace and add it to the recent list in one batched write.
+        # Traces back the dashboard detail views, so they are not sampled away.
+        get_telemetry_writer(self._redis).submit(
+            op("setex", trace_key, self.SIGNAL_TTL_SECONDS, trace_json),
+            op("lpush", self.RECENT_TRACES_KEY, trace.trace_id),
+            op("ltrim", self.RECENT_TRACES_KEY, 0, self.MAX_RECENT_TRACES - 1),
+            droppable=False,
+        )
 
     async def get_recent_traces(self, limit: int = 50) -> list[RequestTrace]:
         """Get recent completed traces."""
@@ -0,0 +1,435 @@
+"""Post-response work queue.
+
+Work that only needs to happen *after* a reply has been produced (memory
+generation, trace completion, latency metrics, audit logging) is submitted
+here instead of being awaited on the request path.
+
+Jobs are named by ``kind`` and carry a JSON payload; handlers are
+registered per kind. Payloads are encoded when submitted and handlers
+always receive the decoded copy, so a job run in-process sees exactly what
+it would see after a replay from the stream. In-memory jobs run on a
+bounded set of asyncio tasks. When the in-memory queue is full, when a job
+fails and should be retried, or when the process shuts down with work
+outstanding, jobs are spilled to a Redis Stream. Stream entries are read through a consumer
+group and acknowledged only after their handler succeeds (or finally
+gives up), so spilled work is processed at least once, including across
+restarts. Handlers should therefore tolerate the occasional duplicate.
+
+``submit`` never waits: spills to the stream happen in background tasks,
+and without Redis a job that does not fit is dropped (and counted).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import socket
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from barnabeenet.services.metrics import (
+    observe_post_response_lag,
+    record_post_response_job,
+    update_post_response_backlog,
+)
+
+if TYPE_CHECKING:
+    import redis.asyncio as redis
+
+logger = logging.getLogger(__name__)
+
+STREAM_KEY = "barnabeenet:post_response"
+CONSUMER_GROUP = "post_response"
+DEFAULT_MAX_CONCURRENCY = 4
+DEFAULT_MAX_PENDING = 256
+DEFAULT_MAX_ATTEMPTS = 3
+STREAM_MAXLEN = 10000  # Approximate cap on retained stream entries
+STREAM_READ_COUNT = 32
+STREAM_BLOCK_MS = 1000
+SHUTDOWN_GRACE_SEC = 5.0
+
+JobHandler = Callable[[dict[str, Any]], Awaitable[None]]
+
+
+@dataclass
+class PostResponseJob:
+    """A unit of deferred work."""
+
+    kind: str
+    payload: dict[str, Any]
+    enqueued_at: float = field(default_factory=time.time)
+    attempts: int = 0
+    stream_id: str | None = None  # Set when the job came from the Redis Stream
+
+    def to_fields(self) -> dict[str, str]:
+        """Encode for XADD."""
+        return {
+            "kind": self.kind,
+            "payload": json.dumps(self.payload),
+            "enqueued_at": str(self.enqueued_at),
+            "attempts": str(self.attempts),
+        }
+
+    @classmethod
+    def from_fields(cls, stream_id: str, fields: dict[Any, Any]) -> PostResponseJob:
+        """Decode a stream entry (keys and values may be bytes)."""
+        data = {
+            (k.decode() if isinstance(k, bytes) else k): (v.decode() if isinstance(v, bytes) else v)
+            for k, v in fields.items()
+        }
+        return cls(
+            kind=data["kind"],
+            payload=json.loads(data["payload"]),
+            enqueued_at=float(data.get("enqueued_at", time.time())),
+            attempts=int(data.get("attempts", 0)),
+            stream_id=stream_id,
+        )
+
+
+class PostResponseQueue:
+    """Bounded queue of deferred post-response jobs with Redis Stream spill."""
+
+    def __init__(
+        self,
+        redis_client: redis.Redis | None = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        max_pending: int = DEFAULT_MAX_PENDING,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+        stream_key: str = STREAM_KEY,
+        consumer_name: str | None = None,
+    ) -> None:
+        """Initialize the queue.
+
+        Args:
+            redis_client: Redis client for the durable spill stream (optional).
+            max_concurrency: Jobs run concurrently.
+            max_pending: Jobs held in memory before spilling (or waiting).
+            max_attempts: Attempts per job before it is dropped.
+            stream_key: Redis Stream key for spilled jobs.
+            consumer_name: Consumer name in the group. Keep it stable across
+                restarts so unacknowledged entries are picked up again.
+        """
+        self._redis = redis_client
+        self._max_concurrency = max(1, max_concurrency)
+        self._max_pending = max(1, max_pending)
+        self._max_attempts = max(1, max_attempts)
+        self._stream_key = stream_key
+        self._consumer = consumer_name or socket.gethostname()
+
+        self._handlers: dict[str, JobHandler] = {}
+        self._pending: deque[PostResponseJob] = deque()
+        self._running: set[asyncio.Task[None]] = set()
+        self._spilling: set[asyncio.Task[None]] = set()
+        self._changed = asyncio.Condition()
+        self._drain_task: asyncio.Task[None] | None = None
+        self._accepting = True
+
+        self._processed = 0
+        self._failed = 0
+        self._spilled = 0
+        self._dropped = 0
+        self._rejected = 0
+        self._stream_backlog = 0
+
+    def register(self, kind: str, handler: JobHandler) -> None:
+        """Register (or replace) the handler for a job kind."""
+        self._handlers[kind] = handler
+
+    @property
+    def use_stream(self) -> bool:
+        """Whether spilled jobs go to Redis."""
+        return self._redis is not None
+
+    # =========================================================================
+    # Lifecycle
+    # =========================================================================
+
+    async def start(self) -> None:
+        """Create the consumer group and start draining the spill stream.
+
+        Register handlers before starting, so recovered entries can run.
+        """
+        if not self.use_stream or self._drain_task is not None:
+            return
+        try:
+            await self._redis.xgroup_create(self._stream_key, CONSUMER_GROUP, id="0", mkstream=True)
+        except Exception as e:
+            if "BUSYGROUP" not in str(e):
+                logger.warning(f"Post-response stream unavailable, running in-memory only: {e}")
+                self._redis = None
+                return
+        self._drain_task = asyncio.create_task(self._drain_stream())
+        logger.info(f"Post-response queue draining {self._stream_key} as {self._consumer}")
+
+    async def shutdown(self, grace: float = SHUTDOWN_GRACE_SEC) -> None:
+        """Stop accepting work, finish what we can, and spill the rest.
+
+        Jobs already in the stream stay unacknowledged and are picked up on
+        the next start.
+        """
+        self._accepting = False
+        if self._drain_task is not None:
+            self._drain_task.cancel()
+            try:
+                await self._drain_task
+            except asyncio.CancelledError:
+                pass
+            self._drain_task = None
+
+        try:
+            await asyncio.wait_for(self.drain(), timeout=grace)
+        except TimeoutError:
+            logger.warning(
+                f"Post-response queue shutdown with {len(self._pending)} queued, "
+                f"{len(self._running)} running"
+            )
+
+        leftovers = [job for job in self._pending if job.stream_id is None]
+        self._pending.clear()
+        for task in list(self._running):
+            task.cancel()
+        if leftovers and self.use_stream:
+            for job in leftovers:
+                await self._spill(job)
+        elif leftovers:
+            self._dropped += len(leftovers)
+            logger.warning(f"Dropped {len(leftovers)} post-response jobs at shutdown")
+        if self._spilling:
+            await asyncio.gather(*self._spilling, return_exceptions=True)
+
+    async def drain(self) -> None:
+        """Wait until no in-memory jobs are queued or running, and spills are written."""
+        async with self._changed:
+            await self._changed.wait_for(lambda: not self._pending and not self._running)
+        if self._spilling:
+            await asyncio.gather(*self._spilling, return_exceptions=True)
+
+    # =========================================================================
+    # Submission
+    # =========================================================================
+
+    def submit(self, kind: str, payload: dict[str, Any]) -> bool:
+        """Queue a job to run after the response. Never waits.
+
+        If the in-memory queue is full (or stopped) the job is spilled to
+        Redis in the background; without Redis it is dropped.
+
+        Args:
+            kind: Registered job kind.
+            payload: JSON-serializable job data. Anything else (datetimes,
+                models) is rejected; convert it before submitting.
+
+        Returns:
+            False if the job was rejected or dropped.
+        """
+        try:
+            encoded = json.dumps(payload)
+        except (TypeError, ValueError) as e:
+            logger.error(f"Rejected post-response job {kind}: payload is not JSON: {e}")
+            self._rejected += 1
+            record_post_response_job(kind, "rejected")
+            return False
+        job = PostResponseJob(kind=kind, payload=json.loads(encoded))
+
+        if self._accepting and len(self._pending) < self._max_pending:
+            self._enqueue(job)
+            return True
+        if self.use_stream:
+            self._spill_in_background(job)
+            return True
+
+        reason = "full" if self._accepting else "stopped"
+        logger.warning(f"Post-response queue {reason}, dropping {kind} job")
+        self._dropped += 1
+        record_post_response_job(kind, "dropped")
+        return False
+
+    def _enqueue(self, job: PostResponseJob) -> None:
+        self._pending.append(job)
+        update_post_response_backlog("memory", len(self._pending))
+        self._start_jobs()
+
+    def _start_jobs(self) -> None:
+        while self._pending and len(self._running) < self._max_concurrency:
+            job = self._pending.popleft()
+            task = asyncio.create_task(self._run(job))
+            self._running.add(task)
+            task.add_done_callback(self._running.discard)
+        update_post_response_backlog("memory", len(self._pending))
+
+    def _spill_in_background(self, job: PostResponseJob) -> None:
+        task = asyncio.create_task(self._spill(job))
+        self._spilling.add(task)
+        task.add_done_callback(self._spilling.discard)
+
+    # =========================================================================
+    # Execution
+    # =========================================================================
+
+    async def _run(self, job: PostResponseJob) -> None:
+        try:
+            await self._execute(job)
+        finally:
+            # Free the slot and wake drain()/the stream reader from here, so
+            # no untracked notifier task is needed
+            self._running.discard(asyncio.current_task())
+            self._start_jobs()
+            async with self._changed:
+                self._changed.notify_all()
+
+    async def _execute(self, job: PostResponseJob) -> None:
+        observe_post_response_lag(max(0.0, time.time() - job.enqueued_at))
+        handler = self._handlers.get(job.kind)
+        if handler is None:
+            logger.warning(f"No handler for post-response job kind: {job.kind}")
+            self._failed += 1
+            record_post_response_job(job.kind, "failed")
+            await self._ack(job)
+            return
+
+        try:
+            await handler(job.payload)
+        except Exception as e:
+            job.attempts += 1
+            if job.attempts < self._max_attempts and self.use_stream:
+                logger.warning(f"Post-response job {job.kind} failed, retrying: {e}")
+                record_post_response_job(job.kind, "retry")
+                await self._spill(job)
+            else:
+                logger.error(f"Post-response job {job.kind} failed: {e}")
+                self._failed += 1
+                record_post_response_job(job.kind, "failed")
+            await self._ack(job)
+            return
+
+        self._processed += 1
+        record_post_response_job(job.kind, "ok")
+        await self._ack(job)
+
+    async def _spill(self, job: PostResponseJob) -> None:
+        """Append a job to the Redis Stream (new entry; the caller acks the old one)."""
+        try:
+            await self._redis.xadd(
+                self._stream_key, job.to_fields(), maxlen=STREAM_MAXLEN, approximate=True
+            )
+            self._spilled += 1
+            self._stream_backlog += 1
+            record_post_response_job(job.kind, "spilled")
+        except Exception as e:
+            logger.error(f"Failed to spill post-response job {job.kind}: {e}")
+            self._failed += 1
+            record_post_response_job(job.kind, "failed")
+
+    async def _ack(self, job: PostResponseJob) -> None:
+        if job.stream_id is None or not self.use_stream:
+            return
+        try:
+            await self._redis.xack(self._stream_key, CONSUMER_GROUP, job.stream_id)
+        except Exception as e:
+            logger.warning(f"Failed to ack post-response job {job.stream_id}: {e}")
+
+    # =========================================================================
+    # Stream drain
+    # =========================================================================
+
+    async def _drain_stream(self) -> None:
+        """Feed spilled jobs back into the in-memory queue as room allows.
+
+        Entries this consumer read but never acknowledged (e.g. before a
+        crash) are replayed first.
+        """
+        replaying = True
+        cursor = "0"
+        while True:
+            try:
+                await self._refresh_stream_backlog()
+                room = self._max_pending - len(self._pending)
+                if room <= 0:
+                    async with self._changed:
+                        await self._changed.wait_for(
+                            lambda: len(self._pending) < self._max_pending
+                        )
+                    continue
+
+                result = await self._redis.xreadgroup(
+                    CONSUMER_GROUP,
+                    self._consumer,
+                    {self._stream_key: cursor if replaying else ">"},
+                    count=min(room, STREAM_READ_COUNT),
+                    block=None if replaying else STREAM_BLOCK_MS,
+                )
+                entries = result[0][1] if result else []
+                if replaying and not entries:
+                    replaying = False  # Own backlog replayed; now read new entries
+                    continue
+
+                for stream_id, fields in entries:
+                    sid = stream_id.decode() if isinstance(stream_id, bytes) else stream_id
+                    if replaying:
+                        cursor = sid
+                    try:
+                        self._enqueue(PostResponseJob.from_fields(sid, fields or {}))
+                    except Exception as e:
+                        logger.warning(f"Discarding malformed post-response entry {sid}: {e}")
+                        await self._redis.xack(self._stream_key, CONSUMER_GROUP, sid)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Post-response stream read failed: {e}")
+                await asyncio.sleep(STREAM_BLOCK_MS / 1000)
+
+    async def _refresh_stream_backlog(self) -> None:
+        """Update the stream backlog (unread + unacknowledged entries)."""
+        try:
+            groups = await self._redis.xinfo_groups(self._stream_key)
+        except Exception:
+            return
+        for group in groups:
+            name = group.get("name")
+            if name in (CONSUMER_GROUP, CONSUMER_GROUP.encode()):
+                self._stream_backlog = int(group.get("pending") or 0) + int(group.get("lag") or 0)
+                break
+        update_post_response_backlog("stream", self._stream_backlog)
+
+    # =========================================================================
+    # Stats
+    # =========================================================================
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get queue depth, lag and outcome counters."""
+        oldest = self._pending[0].enqueued_at if self._pending else None
+        return {
+            "backend": "redis" if self.use_stream else "memory",
+            "queued": len(self._pending),
+            "running": len(self._running),
+            "stream_backlog": self._stream_backlog,
+            "oldest_queued_sec": time.time() - oldest if oldest is not None else 0.0,
+            "processed": self._processed,
+            "failed": self._failed,
+            "spilled": self._spilled,
+            "dropped": self._dropped,
+            "rejected": self._rejected,
+        }
+
+
+# Global queue instance
+_post_response_queue: PostResponseQueue | None = None
+
+
+def get_post_response_queue() -> PostResponseQueue:
+    """Get the global post-response queue (in-memory only until initialized)."""
+    global _post_response_queue
+    if _post_response_queue is None:
+        _post_response_queue = PostResponseQueue()
+    return _post_response_queue
+
+
+def init_post_response_queue(redis_client: redis.Redis | None = None) -> PostResponseQueue:
+    """Create the global post-response queue. Call ``start()`` once handlers are registered."""
+    global _post_response_queue
+    _post_response_queue = PostResponseQueue(redis_client=redis_client)
+    return _post_response_queue
@@ -6,14 +6,22 @@ Provides CRUD operations for family profiles with:
 - Version history management
 - Profile context injection for agents
 - Home Assistant person entity integration for real-time location
+
+All profiles are kept in memory together with a name index, so lookups and
+mention detection never touch Redis. Writes go to Redis and are announced
+on a pub/sub channel so other workers refresh their copy.
 """
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
+import re
+from collections.abc import Iterable
 from datetime import UTC, datetime, timedelta
 from typing import TYPE_CHECKING, Any
+from uuid import uuid4
 
 from barnabeenet.models.profiles import (
     EVENT_SIGNIFICANCE_SCORES,
@@ -38,6 +46,72 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Pub/sub channel announcing profile writes: {"origin": ..., "member_id": ...}
+PROFILE_CHANGES_CHANNEL = "barnabeenet:profiles:changed"
+
+_WORD_RE = re.compile(r"[a-z0-9_]+")
+_MGET_BATCH = 200
+
+
+def _default_redis_client() -> redis.Redis | None:
+    """The application's shared (pooled) Redis client, if it is connected."""
+    try:
+        from barnabeenet.main import app_state
+
+        return app_state.redis_client
+    except Exception:
+        return None
+
+
+class ProfileNameIndex:
+    """Word-phrase index of member IDs and names for mention detection.
+
+    Each profile is indexed under its member ID ("thom_fife"), the ID and
+    display name as words ("thom fife"), and the first word of each
+    ("thom"). Matching is on whole words, so "thomas" does not match "thom".
+    """
+
+    def __init__(self) -> None:
+        self._phrases: dict[tuple[str, ...], set[str]] = {}
+        self._max_words = 1
+
+    @staticmethod
+    def _phrases_for(profile: FamilyMemberProfile) -> set[tuple[str, ...]]:
+        member_id = profile.member_id.lower()
+        phrases = {(member_id,)}
+        for words in (
+            tuple(_WORD_RE.findall(member_id.replace("_", " "))),
+            tuple(_WORD_RE.findall(profile.name.lower())),
+        ):
+            if words:
+                phrases.add(words)
+                phrases.add(words[:1])
+        return phrases
+
+    def rebuild(self, profiles: Iterable[FamilyMemberProfile]) -> None:
+        """Replace the index with one built from ``profiles``."""
+        phrases: dict[tuple[str, ...], set[str]] = {}
+        for profile in profiles:
+            for phrase in self._phrases_for(profile):
+                phrases.setdefault(phrase, set()).add(profile.member_id)
+        self._phrases = phrases
+        self._max_words = max((len(p) for p in phrases), default=1)
+
+    def lookup(self, name: str) -> list[str]:
+        """Member IDs indexed under exactly this name or ID."""
+        return sorted(self._phrases.get(tuple(_WORD_RE.findall(name.lower())), ()))
+
+    def find(self, text: str) -> list[str]:
+        """Member IDs mentioned in ``text``, in order of first mention."""
+        words = _WORD_RE.findall(text.lower())
+        found: list[str] = []
+        for i in range(len(words)):
+            for n in range(min(self._max_words, len(words) - i), 0, -1):
+                for member_id in sorted(self._phrases.get(tuple(words[i : i + n]), ())):
+                    if member_id not in found:
+                        found.append(member_id)
+        return found
+
 
 class ProfileService:
     """Service for managing family member profiles.
@@ -72,6 +146,10 @@ class ProfileService:
         self._events: dict[str, list[ProfileEvent]] = {}  # In-memory fallback
         self._history: dict[str, list[dict]] = {}  # In-memory fallback
         self._guests: dict[str, GuestProfile] = {}  # In-memory fallback
+        self._name_index = ProfileNameIndex()
+        self._loaded = False  # Whether _profiles mirrors Redis
+        self._instance_id = uuid4().hex
+        self._listener: asyncio.Task[None] | None = None
 
     def set_ha_client(self, ha_client: HomeAssistantClient | None) -> None:
         """Set or update the Home Assistant client.
@@ -84,21 +162,113 @@ class ProfileService:
     async def init(self) -> None:
         """Initialize the service and load existing profiles."""
         if self._redis:
-            # Load existing profiles from Redis
-            try:
-                keys = await self._redis.keys(f"{self.PROFILE_PREFIX}*")
-                for key in keys:
-                    if isinstance(key, bytes):
-                        key = key.decode()
-                    data = await self._redis.get(key)
+            await self._load_all()
+            self._start_listener()
+        else:
+            self._name_index.rebuild(self._profiles.values())
+
+    async def _load_all(self) -> None:
+        """Load every profile from Redis (SCAN + batched MGET)."""
+        if not self._redis:
+            return
+        try:
+            keys = [
+                key.decode() if isinstance(key, bytes) else key
+                async for key in self._redis.scan_iter(match=f"{self.PROFILE_PREFIX}*", count=500)
+            ]
+            profiles: dict[str, FamilyMemberProfile] = {}
+            for start in range(0, len(keys), _MGET_BATCH):
+                batch = keys[start : start + _MGET_BATCH]
+                for key, data in zip(batch, await self._redis.mget(batch), strict=True):
                     if data:
-                        if isinstance(data, bytes):
-                            data = data.decode()
                         member_id = key.replace(self.PROFILE_PREFIX, "")
-                        self._profiles[member_id] = FamilyMemberProfile.model_validate_json(data)
-                logger.info(f"Loaded {len(self._profiles)} profiles from Redis")
+                        profiles[member_id] = FamilyMemberProfile.model_validate_json(data)
+        except Exception as e:
+            logger.warning(f"Could not load profiles from Redis: {e}")
+            return
+
+        self._profiles = profiles
+        self._name_index.rebuild(profiles.values())
+        self._loaded = True
+        logger.info(f"Loaded {len(profiles)} profiles from Redis")
+
+    async def _ensure_loaded(self) -> None:
+        if self._redis and not self._loaded:
+            await self._load_all()
+
+    def _start_listener(self) -> None:
+        if self._listener is None or self._listener.done():
+            try:
+                self._listener = asyncio.get_running_loop().create_task(self._listen())
+            except RuntimeError:
+                self._listener = None
+
+    async def _listen(self) -> None:
+        """Apply profile writes announced by other workers."""
+        backoff = 1.0
+        resubscribe = False
+        while self._redis:
+            pubsub = self._redis.pubsub()
+            try:
+                await pubsub.subscribe(PROFILE_CHANGES_CHANNEL)
+                if resubscribe:
+                    await self._load_all()  # Catch up on anything missed while away
+                backoff = 1.0
+                async for message in pubsub.listen():
+                    if message.get("type") == "message":
+                        await self._apply_remote_change(message["data"])
+            except asyncio.CancelledError:
+                raise
             except Exception as e:
-                logger.warning(f"Could not load profiles from Redis: {e}")
+                logger.warning(f"Profile change listener error, retrying in {backoff:.0f}s: {e}")
+            finally:
+                try:
+                    await pubsub.reset()
+                except Exception:
+                    pass
+            resubscribe = True
+            await asyncio.sleep(backoff)
+            backoff = min(backoff * 2, 30.0)
+
+    async def _apply_remote_change(self, raw: str | bytes) -> None:
+        try:
+            change = json.loads(raw)
+            if change.get("origin") == self._instance_id:
+                return
+            member_id = change["member_id"]
+            data = None
+            if self._redis:
+                data = await self._redis.get(f"{self.PROFILE_PREFIX}{member_id}")
+        except Exception as e:
+            logger.warning(f"Could not apply profile change: {e}")
+            return
+
+        if data:
+            self._profiles[member_id] = FamilyMemberProfile.model_validate_json(data)
+        else:
+            self._profiles.pop(member_id, None)
+        self._name_index.rebuild(self._profiles.values())
+
+    async def _announce_change(self, member_id: str) -> None:
+        if not self._redis:
+            return
+        try:
+            await self._redis.publish(
+                PROFILE_CHANGES_CHANNEL,
+                json.dumps({"origin": self._instance_id, "member_id": member_id}),
+            )
+        except Exception as e:
+            logger.warning(f"Could not announce profile change: {e}")
+
+    async def close(self) -> None:
+        """Stop listening for profile changes from other workers."""
+        if self._listener is not None:
+            self._listener.cancel()
+            try:
+                await self._listener
+            except asyncio.CancelledError:
+                pass
+            self._listener = None
 
     # =========================================================================
     # Profile CRUD
@@ -142,50 +312,16 @@ class ProfileService:
         Returns:
             The profile or None if not found
         """
-        member_id_lower = member_id.lower()
+        await self._ensure_loaded()
 
-        # Check in-memory cache first (exact match)
+        # Exact match
         if member_id in self._profiles:
             return self._profiles[member_id]
 
-        # Try Redis (exact match)
-        if self._redis:
-            try:
-                data = await self._redis.get(f"{self.PROFILE_PREFIX}{member_id}")
-                if data:
-                    if isinstance(data, bytes):
-                        data = data.decode()
-                    profile = FamilyMemberProfile.model_validate_json(data)
-                    self._profiles[member_id] = profile
-                    return profile
-            except Exception as e:
-                logger.warning(f"Could not get profile from Redis: {e}")
-
-        # Try fuzzy match by first name (e.g., "thom" -> "thom_fife")
-        # First check in-memory profiles
-        for profile_id, profile in self._profiles.items():
-            name_parts = profile.name.lower().split()
-            if name_parts and name_parts[0] == member_id_lower:
-                return profile
-
-        # Then check Redis for all profiles
-        if self._redis:
-            try:
-                keys = await self._redis.keys(f"{self.PROFILE_PREFIX}*")
-                for key in keys:
-                    if isinstance(key, bytes):
-                        key = key.decode()
-                    data = await self._redis.get(key)
-                    if data:
-                        if isinstance(data, bytes):
-                            data = data.decode()
-                        profile = FamilyMemberProfile.model_validate_json(data)
-                        name_parts = profile.name.lower().split()
-                        if name_parts and name_parts[0] == member_id_lower:
-                            self._profiles[profile.member_id] = profile
-                            return profile
-            except Exception as e:
-                logger.warning(f"Could not search profiles by first name: {e}")
+        # Match by first name or ID word (e.g., "thom" -> "thom_fife")
+        for match in self._name_index.lookup(member_id):
+            if match in self._profiles:
+                return self._profiles[match]
 
         return None
 
@@ -195,24 +331,29 @@ class ProfileService:
         Returns:
             List of all profiles
         """
-        if self._redis:
-            try:
-                keys = await self._redis.keys(f"{self.PROFILE_PREFIX}*")
-                profiles = []
-                for key in keys:
-                    if isinstance(key, bytes):
-                        key = key.decode()
-                    data = await self._redis.get(key)
-                    if data:
-                        if isinstance(data, bytes):
-                            data = data.decode()
-                        profiles.append(FamilyMemberProfile.model_validate_json(data))
-                return profiles
-            except Exception as e:
-                logger.warning(f"Could not get profiles from Redis: {e}")
-
+        await self._ensure_loaded()
         return list(self._profiles.values())
 
+    async def find_mentioned_profiles(
+        self, text: str, exclude: str | None = None
+    ) -> list[FamilyMemberProfile]:
+        """Find family members mentioned in text by ID, full name, or first name.
+
+        Args:
+            text: Text to scan (e.g., "where is Elizabeth?")
+            exclude: Member ID to leave out (usually the speaker)
+
+        Returns:
+            Mentioned profiles, in order of first mention
+        """
+        await self._ensure_loaded()
+        exclude_lower = exclude.lower() if exclude else None
+        return [
+            self._profiles[member_id]
+            for member_id in self._name_index.find(text)
+            if member_id in self._profiles and member_id.lower() != exclude_lower
+        ]
+
     async def update_profile(
         self,
         member_id: str,
@@ -270,19 +411,23 @@ class ProfileService:
         """
         if member_id in self._profiles:
             del self._profiles[member_id]
+            self._name_index.rebuild(self._profiles.values())
 
         if self._redis:
             try:
                 result = await self._redis.delete(f"{self.PROFILE_PREFIX}{member_id}")
-                return result > 0
             except Exception as e:
                 logger.warning(f"Could not delete profile from Redis: {e}")
+                return False
+            await self._announce_change(member_id)
+            return result > 0
 
         return False
 
     async def _save_profile(self, profile: FamilyMemberProfile) -> None:
         """Save a profile to storage."""
         self._profiles[profile.member_id] = profile
+        self._name_index.rebuild(self._profiles.values())
 
         if self._redis:
             try:
@@ -292,6 +437,8 @@ class ProfileService:
                 )
             except Exception as e:
                 logger.warning(f"Could not save profile to Redis: {e}")
+                return
+            await self._announce_change(profile.member_id)
 
     # =========================================================================
     # Version History
@@ -900,6 +1047,7 @@ async def get_profile_service(
         The profile service instance
     """
     global _profile_service
+    redis_client = redis_client or _default_redis_client()
     if _profile_service is None:
         _profile_service = ProfileService(redis_client, ha_client)
         await _profile_service.init()
@@ -907,8 +1055,15 @@ async def get_profile_service(
         # Update clients if provided and not already set
         if redis_client and _profile_service._redis is None:
             _profile_service._redis = redis_client
+            await _profile_service.init()
             logger.info("ProfileService: Redis client updated")
         if ha_client:
             # Always update HA client if provided
             _profile_service.set_ha_client(ha_client)
     return _profile_service
+
+
+async def shutdown_profile_service() -> None:
+    """Stop the profile service's change listener."""
+    if _profile_service is not None:
+        await _profile_service.close()
@@ -5,12 +5,24 @@ from __future__ import annotations
 import base64
 import io
 import time
+from collections.abc import AsyncIterator
 from typing import TYPE_CHECKING
 
 import numpy as np
 import soundfile as sf
 import structlog
 
+from barnabeenet.services.inference_executor import (
+    STT_LANE,
+    InferenceBusyError,
+    get_inference_executor,
+)
+from barnabeenet.services.stt.segmenter import (
+    SpeechSegment,
+    UtteranceSegmenter,
+    latest_segments,
+)
+
 if TYPE_CHECKING:
     from faster_whisper import WhisperModel
 
@@ -21,7 +33,8 @@ class DistilWhisperSTT:
     """Speech-to-text using Distil-Whisper via faster-whisper.
 
     Optimized for CPU inference on resource-constrained devices.
-    Used as fallback when GPU worker is unavailable.
+    Used as fallback when GPU worker is unavailable. Model loading and
+    inference run on the inference executor's STT lane, off the event loop.
     """
 
     def __init__(
@@ -60,15 +73,7 @@ class DistilWhisperSTT:
 
         start = time.perf_counter()
 
-        # Import here to avoid slow startup if not used
-        from faster_whisper import WhisperModel
-
-        self._model = WhisperModel(
-            self.model_size,
-            device=self.device,
-            compute_type=self.compute_type,
-            cpu_threads=self.cpu_threads,
-        )
+        self._model = await get_inference_executor().run(STT_LANE, self._load_model)
 
         load_time = (time.perf_counter() - start) * 1000
         self._initialized = True
@@ -78,6 +83,17 @@ class DistilWhisperSTT:
             load_time_ms=f"{load_time:.0f}",
         )
 
+    def _load_model(self) -> WhisperModel:
+        # Import here to avoid slow startup if not used
+        from faster_whisper import WhisperModel
+
+        return WhisperModel(
+            self.model_size,
+            device=self.device,
+            compute_type=self.compute_type,
+            cpu_threads=self.cpu_threads,
+        )
+
     async def transcribe(
         self,
         audio_data: bytes,
@@ -93,12 +109,40 @@ class DistilWhisperSTT:
 
         Returns:
             dict with keys: text, confidence, language, latency_ms
+
+        Raises:
+            InferenceBusyError: If the STT lane is saturated.
         """
         if not self._initialized:
             await self.initialize()
 
         start = time.perf_counter()
+        text, info = await get_inference_executor().run(
+            STT_LANE, self._transcribe_sync, audio_data, sample_rate, language
+        )
+        latency_ms = (time.perf_counter() - start) * 1000
+
+        logger.info(
+            "Transcription complete",
+            text_length=len(text),
+            latency_ms=f"{latency_ms:.1f}",
+            language=info.language,
+            language_probability=f"{info.language_probability:.2f}",
+        )
+
+        return {
+            "text": text,
+            "confidence": info.language_probability,
+            "language": info.language,
+            "latency_ms": latency_ms,
+        }
+
+    def _transcribe_sync(self, audio_data: bytes, sample_rate: int, language: str) -> tuple:
+        """Decode and transcribe audio (blocking; runs on an inference thread).
 
+        Returns:
+            Tuple of (text, faster-whisper TranscriptionInfo).
+        """
         # Try to decode audio - support both raw PCM and encoded formats (WebM, WAV, etc.)
         try:
             # Try soundfile first (handles WAV, FLAC, OGG, etc.)
@@ -174,6 +218,12 @@ class DistilWhisperSTT:
                     )
                     raise ValueError(f"Could not decode audio data: {sf_error}") from pcm_error
 
+        return self._transcribe_array_sync(audio_array, sample_rate, language)
+
+    def _transcribe_array_sync(
+        self, audio_array: np.ndarray, sample_rate: int, language: str
+    ) -> tuple:
+        """Transcribe decoded mono samples (blocking; runs on an inference thread)."""
         # Ensure float32
         audio_array = audio_array.astype(np.float32)
 
@@ -204,21 +254,81 @@ class DistilWhisperSTT:
         for segment in segments:
             text_parts.append(segment.text.strip())
 
-        full_text = " ".join(text_parts).strip()
-        latency_ms = (time.perf_counter() - start) * 1000
+        return " ".join(text_parts).strip(), info
 
-        logger.info(
-            "Transcription complete",
-            text_length=len(full_text),
-            latency_ms=f"{latency_ms:.1f}",
-            language=info.language,
-            language_probability=f"{info.language_probability:.2f}",
-        )
+    async def transcribe_stream(
+        self,
+        audio_stream: AsyncIterator[bytes],
+        sample_rate: int = 16000,
+        language: str = "en",
+        segmenter: UtteranceSegmenter | None = None,
+    ) -> AsyncIterator[dict]:
+        """Incrementally transcribe a live stream of raw PCM.
 
+        Audio is split into utterances by VAD. While an utterance is in
+        progress the audio so far is re-decoded every partial interval to
+        produce a partial hypothesis; after trailing silence the utterance
+        is decoded once more and yielded as final, without waiting for the
+        stream to end.
+
+        Args:
+            audio_stream: Async iterator of PCM 16-bit mono chunks
+            sample_rate: Audio sample rate in Hz
+            language: Language code
+            segmenter: Segmenter to use (default: configured from settings)
+
+        Yields:
+            dict with keys: text, is_final, confidence, latency_ms (decode time)
+
+        Raises:
+            InferenceBusyError: If the STT lane is saturated for a final decode.
+        """
+        if not self._initialized:
+            await self.initialize()
+
+        segmenter = segmenter or UtteranceSegmenter.from_settings(sample_rate)
+
+        async for chunk in audio_stream:
+            for segment in latest_segments(segmenter.feed(chunk)):
+                result = await self._decode_segment(segment, segmenter.sample_rate, language)
+                if result is not None:
+                    yield result
+
+        segment = segmenter.flush()
+        if segment is not None:
+            result = await self._decode_segment(segment, segmenter.sample_rate, language)
+            if result is not None:
+                yield result
+
+    async def _decode_segment(
+        self, segment: SpeechSegment, sample_rate: int, language: str
+    ) -> dict | None:
+        start = time.perf_counter()
+        try:
+            text, info = await get_inference_executor().run(
+                STT_LANE, self._transcribe_array_sync, segment.audio, sample_rate, language
+            )
+        except InferenceBusyError:
+            if segment.is_final:
+                raise
+            # Partials are best-effort: shed them rather than queue behind other work
+            logger.debug("STT lane busy, skipping partial hypothesis")
+            return None
+        latency_ms = (time.perf_counter() - start) * 1000
+
+        if not text and not segment.is_final:
+            return None
+        if segment.is_final:
+            logger.info(
+                "Streaming utterance transcribed",
+                text_length=len(text),
+                audio_ms=f"{segment.audio.size / sample_rate * 1000:.0f}",
+                latency_ms=f"{latency_ms:.1f}",
+            )
         return {
-            "text": full_text,
+            "text": text,
+            "is_final": segment.is_final,
             "confidence": info.language_probability,
-            "language": info.language,
             "latency_ms": latency_ms,
         }
 
@@ -14,6 +14,7 @@ from __future__ import annotations
 
 import asyncio
 import base64
+import json
 from collections.abc import AsyncGenerator
 from dataclasses import dataclass
 from enum import Enum
@@ -21,6 +22,8 @@ from typing import TYPE_CHECKING
 
 import httpx
 import structlog
+import websockets
+from websockets.exceptions import WebSocketException
 
 from barnabeenet.models.stt_modes import STTEngine, STTMode
 
@@ -62,6 +65,10 @@ class StreamingSTTResult:
     latency_ms: float = 0.0
 
 
+class _GPUStreamUnavailableError(RuntimeError):
+    """The GPU worker's streaming endpoint could not be reached."""
+
+
 class STTRouter:
     """Routes STT requests to GPU worker, Azure, or CPU fallback.
 
@@ -199,13 +206,11 @@ class STTRouter:
         return self._azure_backend
 
     async def _ensure_cpu_backend(self) -> DistilWhisperSTT:
-        """Lazily initialize CPU backend when needed."""
-        if self._cpu_backend is None:
-            from barnabeenet.services.stt.distil_whisper import DistilWhisperSTT
+        """Get the CPU backend from the shared model pool when needed."""
+        if self._cpu_backend is None or not self._cpu_backend.is_available():
+            from barnabeenet.services.model_pool import get_model_pool
 
-            logger.info("Initializing CPU STT backend (fallback)")
-            self._cpu_backend = DistilWhisperSTT()
-            await self._cpu_backend.initialize()
+            self._cpu_backend = await get_model_pool().get_stt()
 
         return self._cpu_backend
 
@@ -455,13 +460,13 @@ class STTRouter:
             engine: STT engine to use
 
         Yields:
-            StreamingSTTResult with partial and final transcriptions.
+            StreamingSTTResult with partial and final transcriptions. GPU and
+            CPU backends segment the audio by VAD and yield a final result as
+            soon as each utterance ends on silence.
         """
         if not self._initialized:
             await self.initialize()
 
-        # For streaming, prefer Azure if available (native streaming support)
-        # GPU worker doesn't support streaming yet, so fall back to batch mode
         selected_engine = await self._select_engine(engine)
 
         if selected_engine == STTEngine.AZURE and self._azure_available:
@@ -478,27 +483,96 @@ class STTRouter:
                     confidence=result.confidence,
                     backend=STTBackend.AZURE,
                 )
+        elif selected_engine == STTEngine.PARAKEET:
+            try:
+                async for result in self._transcribe_streaming_gpu(
+                    audio_stream, sample_rate, language
+                ):
+                    yield result
+                return
+            except _GPUStreamUnavailableError as e:
+                # Nothing was read from audio_stream yet, so CPU can take over
+                if engine != STTEngine.AUTO:
+                    raise RuntimeError("GPU STT unavailable") from e
+            async for result in self._transcribe_streaming_cpu(audio_stream, sample_rate, language):
+                yield result
         else:
-            # For non-Azure engines, collect audio and transcribe in batch
-            # This is a fallback for engines that don't support streaming
-            audio_chunks = []
-            async for chunk in audio_stream:
-                audio_chunks.append(chunk)
-
-            audio_data = b"".join(audio_chunks)
-            result = await self.transcribe(
-                audio_data=audio_data,
-                sample_rate=sample_rate,
-                language=language,
-                engine=engine,
-            )
+            async for result in self._transcribe_streaming_cpu(audio_stream, sample_rate, language):
+                yield result
+
+    async def _transcribe_streaming_gpu(
+        self,
+        audio_stream: AsyncGenerator[bytes, None],
+        sample_rate: int,
+        language: str,
+    ) -> AsyncGenerator[StreamingSTTResult, None]:
+        """Stream audio to the GPU worker's incremental endpoint.
+
+        Raises:
+            _GPUStreamUnavailableError: If the worker cannot be reached.
+        """
+        url = self.gpu_worker_url.replace("http", "ws", 1) + "/transcribe/stream"
+        try:
+            ws = await websockets.connect(url, open_timeout=self.request_timeout)
+        except (OSError, TimeoutError, WebSocketException) as e:
+            logger.warning("GPU streaming unavailable", error=str(e))
+            self._gpu_healthy = False
+            raise _GPUStreamUnavailableError(str(e)) from e
 
+        async def send_audio() -> None:
+            try:
+                await ws.send(
+                    json.dumps({"type": "config", "sample_rate": sample_rate, "language": language})
+                )
+                async for chunk in audio_stream:
+                    await ws.send(chunk)
+                await ws.send(json.dumps({"type": "end"}))
+            except Exception:
+                await ws.close()  # Unblocks the receive loop below
+                raise
+
+        sender = asyncio.create_task(send_audio())
+        try:
+            async for message in ws:
+                data = json.loads(message)
+                msg_type = data.get("type")
+                if msg_type in ("partial", "final"):
+                    yield StreamingSTTResult(
+                        text=data.get("text", ""),
+                        is_final=msg_type == "final",
+                        confidence=data.get("confidence", 1.0),
+                        backend=STTBackend.GPU,
+                        latency_ms=data.get("latency_ms", 0.0),
+                    )
+                elif msg_type == "complete":
+                    break
+                elif msg_type == "error":
+                    raise RuntimeError(f"GPU worker error: {data.get('message')}")
+            if sender.done() and sender.exception() is not None:
+                raise RuntimeError("GPU streaming failed") from sender.exception()
+        finally:
+            sender.cancel()
+            await ws.close()
+
+    async def _transcribe_streaming_cpu(
+        self,
+        audio_stream: AsyncGenerator[bytes, None],
+        sample_rate: int,
+        language: str,
+    ) -> AsyncGenerator[StreamingSTTResult, None]:
+        """Incrementally transcribe with the local Distil-Whisper backend."""
+        cpu_backend = await self._ensure_cpu_backend()
+        async for result in cpu_backend.transcribe_stream(
+            audio_stream=audio_stream,
+            sample_rate=sample_rate,
+            language=language,
+        ):
             yield StreamingSTTResult(
-                text=result.text,
-                is_final=True,
-                confidence=result.confidence,
-                backend=STTBackend(result.backend.value),
-                latency_ms=result.latency_ms,
+                text=result["text"],
+                is_final=result["is_final"],
+                confidence=result.get("confidence", 0.0),
+                backend=STTBackend.CPU,
+                latency_ms=result["latency_ms"],
             )
 
     async def transcribe_base64(
@@ -555,11 +629,48 @@ class STTRouter:
         if self._http_client is not None:
             await self._http_client.aclose()
 
-        if self._cpu_backend is not None:
-            await self._cpu_backend.shutdown()
+        # CPU backend is owned by the model pool; just drop our reference
+        self._cpu_backend = None
 
         if self._azure_backend is not None:
             await self._azure_backend.shutdown()
 
         self._initialized = False
         logger.info("STT Router shut down")
+
+
+# Global singleton
+_stt_router: STTRouter | None = None
+_stt_router_loop: asyncio.AbstractEventLoop | None = None
+
+
+async def get_stt_router() -> STTRouter:
+    """Get the shared, initialized STT router.
+
+    Routes share one router (and its GPU health checker, HTTP client and
+    pooled CPU backend) instead of building one per request.
+    """
+    global _stt_router, _stt_router_loop
+    loop = asyncio.get_running_loop()
+    if _stt_router is not None and _stt_router_loop is not loop:
+        # Health task and HTTP client are bound to the loop that created them
+        _stt_router = None
+    if _stt_router is None:
+        from barnabeenet.config import get_settings
+
+        settings = get_settings()
+        _stt_router = STTRouter(
+            gpu_worker_url=f"http://{settings.stt.gpu_worker_host}:{settings.stt.gpu_worker_port}",
+        )
+        _stt_router_loop = loop
+    if not _stt_router._initialized:
+        await _stt_router.initialize()
+    return _stt_router
+
+
+async def shutdown_stt_router() -> None:
+    """Shut down the shared STT router if it was created."""
+    global _stt_router
+    if _stt_router is not None:
+        await _stt_router.shutdown()
+        _stt_router = None
@@ -0,0 +1,209 @@
+"""VAD segmentation for incremental (streaming) transcription.
+
+Splits a live 16-bit PCM stream into utterances with voice activity
+detection. While speech is ongoing the segmenter periodically hands back the
+utterance so far for a partial hypothesis; once enough trailing silence is
+seen it ends the utterance, so the final transcript (and whatever consumes
+it) can start immediately instead of waiting for the client to stop sending.
+
+webrtcvad is used when installed; otherwise frames are classified by RMS
+energy.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass
+
+import numpy as np
+import structlog
+
+logger = structlog.get_logger()
+
+# webrtcvad only accepts these rates and frame lengths
+_WEBRTC_SAMPLE_RATES = (8000, 16000, 32000, 48000)
+_WEBRTC_FRAME_MS = (10, 20, 30)
+
+# Speech kept from before the VAD triggers so word onsets are not clipped
+PRE_ROLL_MS = 300
+
+
+@dataclass
+class SpeechSegment:
+    """Audio of the current utterance, ready to decode."""
+
+    audio: np.ndarray  # float32 mono in [-1, 1] at the segmenter's sample rate
+    is_final: bool
+
+
+class UtteranceSegmenter:
+    """Incrementally segment PCM audio into utterances.
+
+    Feed raw 16-bit little-endian mono PCM as it arrives. ``feed`` returns
+    the segments it produced: partial snapshots of the growing utterance
+    every ``partial_interval_ms`` of audio, and a final segment when the
+    utterance ends on silence (or reaches ``max_utterance_ms``).
+    """
+
+    def __init__(
+        self,
+        sample_rate: int = 16000,
+        frame_ms: int = 30,
+        vad_aggressiveness: int = 2,
+        endpoint_silence_ms: int = 600,
+        partial_interval_ms: int = 500,
+        min_speech_ms: int = 200,
+        max_utterance_ms: int = 15000,
+        energy_threshold: float = 0.015,
+    ) -> None:
+        """Initialize the segmenter.
+
+        Args:
+            sample_rate: PCM sample rate in Hz
+            frame_ms: VAD frame length (10, 20 or 30 for webrtcvad)
+            vad_aggressiveness: webrtcvad mode, 0 (least) to 3 (most aggressive)
+            endpoint_silence_ms: Trailing silence that ends an utterance
+            partial_interval_ms: Audio between partial snapshots
+            min_speech_ms: Voiced audio required before anything is emitted
+            max_utterance_ms: Utterances are finalized at this length
+            energy_threshold: RMS level treated as speech without webrtcvad
+        """
+        self.sample_rate = sample_rate
+        self.frame_ms = frame_ms
+        self.endpoint_silence_ms = endpoint_silence_ms
+        self.partial_interval_ms = partial_interval_ms
+        self.min_speech_ms = min_speech_ms
+        self.max_utterance_ms = max_utterance_ms
+        self.energy_threshold = energy_threshold
+
+        self._frame_bytes = sample_rate * frame_ms // 1000 * 2
+        self._is_speech = self._load_vad(vad_aggressiveness)
+        self._pending = b""
+        self._pre_roll: deque[bytes] = deque(maxlen=max(1, PRE_ROLL_MS // frame_ms))
+        self._frames: list[bytes] = []
+        self._speech_ms = 0
+        self._silence_ms = 0
+        self._since_partial_ms = 0
+
+    @classmethod
+    def from_settings(cls, sample_rate: int | None = None) -> UtteranceSegmenter:
+        """Create a segmenter configured from STT and audio settings."""
+        from barnabeenet.config import get_settings
+
+        settings = get_settings()
+        return cls(
+            sample_rate=sample_rate or settings.audio.input_sample_rate,
+            frame_ms=settings.audio.vad_frame_duration_ms,
+            vad_aggressiveness=settings.audio.vad_aggressiveness,
+            endpoint_silence_ms=settings.stt.streaming_endpoint_silence_ms,
+            partial_interval_ms=settings.stt.streaming_partial_interval_ms,
+            min_speech_ms=settings.stt.streaming_min_speech_ms,
+            max_utterance_ms=settings.stt.streaming_max_utterance_ms,
+        )
+
+    def _load_vad(self, aggressiveness: int) -> Callable[[bytes], bool]:
+        if self.sample_rate in _WEBRTC_SAMPLE_RATES and self.frame_ms in _WEBRTC_FRAME_MS:
+            try:
+                import webrtcvad
+
+                vad = webrtcvad.Vad(aggressiveness)
+                return lambda frame: vad.is_speech(frame, self.sample_rate)
+            except ImportError:
+                logger.debug("webrtcvad not installed, using energy VAD")
+        return self._energy_is_speech
+
+    def _energy_is_speech(self, frame: bytes) -> bool:
+        samples = np.frombuffer(frame, dtype="<i2").astype(np.float32) / 32768.0
+        return float(np.sqrt(np.mean(samples**2))) >= self.energy_threshold
+
+    @property
+    def in_utterance(self) -> bool:
+        """Whether speech has started and not yet been finalized."""
+        return bool(self._frames)
+
+    def feed(self, pcm: bytes) -> list[SpeechSegment]:
+        """Add PCM audio and return any segments it completes."""
+        self._pending += pcm
+        segments: list[SpeechSegment] = []
+        usable = len(self._pending) - len(self._pending) % self._frame_bytes
+        for offset in range(0, usable, self._frame_bytes):
+            segment = self._process_frame(self._pending[offset : offset + self._frame_bytes])
+            if segment is not None:
+                segments.append(segment)
+        self._pending = self._pending[usable:]
+        return segments
+
+    def flush(self) -> SpeechSegment | None:
+        """End the stream, returning the last utterance if it had enough speech."""
+        segment = None
+        if self._frames and self._speech_ms >= self.min_speech_ms:
+            segment = self._emit(is_final=True)
+        self._reset()
+        self._pending = b""
+        return segment
+
+    def _process_frame(self, frame: bytes) -> SpeechSegment | None:
+        speech = self._is_speech(frame)
+
+        if not self._frames:
+            if not speech:
+                self._pre_roll.append(frame)
+                return None
+            # Utterance starts: keep the pre-roll so the first word is intact
+            self._frames = [*self._pre_roll, frame]
+            self._pre_roll.clear()
+            self._speech_ms = self.frame_ms
+            self._silence_ms = 0
+            self._since_partial_ms = 0
+            return None
+
+        self._frames.append(frame)
+        self._since_partial_ms += self.frame_ms
+        if speech:
+            self._speech_ms += self.frame_ms
+            self._silence_ms = 0
+        else:
+            self._silence_ms += self.frame_ms
+
+        if self._silence_ms >= self.endpoint_silence_ms:
+            segment = None
+            if self._speech_ms >= self.min_speech_ms:
+                segment = self._emit(is_final=True)
+            self._reset()  # Too little speech: a click or cough, drop it
+            return segment
+
+        if len(self._frames) * self.frame_ms >= self.max_utterance_ms:
+            segment = self._emit(is_final=True)
+            self._reset()
+            return segment
+
+        # Partials only while voiced: trailing silence adds nothing to decode
+        if (
+            speech
+            and self._speech_ms >= self.min_speech_ms
+            and self._since_partial_ms >= self.partial_interval_ms
+        ):
+            self._since_partial_ms = 0
+            return self._emit(is_final=False)
+        return None
+
+    def _emit(self, is_final: bool) -> SpeechSegment:
+        pcm = b"".join(self._frames)
+        audio = np.frombuffer(pcm, dtype="<i2").astype(np.float32) / 32768.0
+        return SpeechSegment(audio=audio, is_final=is_final)
+
+    def _reset(self) -> None:
+        self._frames = []
+        self._speech_ms = 0
+        self._silence_ms = 0
+        self._since_partial_ms = 0
+
+
+def latest_segments(segments: list[SpeechSegment]) -> list[SpeechSegment]:
+    """Drop partials that a later segment in the same batch supersedes.
+
+    When decoding falls behind, only finals and the newest partial are
+    worth transcribing.
+    """
+    return [s for i, s in enumerate(segments) if s.is_final or i == len(segments) - 1]
@@ -0,0 +1,224 @@
+"""Batched Redis writer for dashboard telemetry.
+
+Pipeline signals, request traces, LLM signals and latency measurements are
+written a few at a time on every request. Instead of one round-trip per
+XADD/SETEX/LPUSH, callers hand their commands to a shared TelemetryWriter,
+which buffers them and flushes them as a single non-transactional pipeline
+``flush_interval`` seconds after the first buffered write, or as soon as
+``max_batch`` commands are waiting. An idle writer sleeps until the next
+write instead of polling.
+
+Submitting never waits on Redis. Under backpressure the writer sheds load
+instead of slowing requests: past the high-water mark only one in
+``BACKPRESSURE_SAMPLE_EVERY`` droppable writes is kept, and once the buffer
+is full new writes are dropped. Dropped writes and flush latency are
+exported as Prometheus metrics.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import TYPE_CHECKING, Any
+
+from barnabeenet.services.metrics import (
+    observe_telemetry_flush,
+    record_telemetry_dropped,
+    update_telemetry_buffered,
+)
+
+if TYPE_CHECKING:
+    import redis.asyncio as redis
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_FLUSH_INTERVAL_SEC = 0.05
+DEFAULT_MAX_BATCH = 200
+DEFAULT_MAX_BUFFER = 5000
+BACKPRESSURE_SAMPLE_EVERY = 4  # Keep 1 in N droppable writes past high water
+
+# A Redis command: (pipeline method name, args, kwargs)
+TelemetryOp = tuple[str, tuple[Any, ...], dict[str, Any]]
+
+
+def op(method: str, *args: Any, **kwargs: Any) -> TelemetryOp:
+    """Build a telemetry command, e.g. ``op("xadd", key, fields, maxlen=5000)``."""
+    return (method, args, kwargs)
+
+
+class TelemetryWriter:
+    """Coalesces telemetry writes into pipelined Redis batches."""
+
+    def __init__(
+        self,
+        redis_client: redis.Redis,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL_SEC,
+        max_batch: int = DEFAULT_MAX_BATCH,
+        max_buffer: int = DEFAULT_MAX_BUFFER,
+    ) -> None:
+        """Initialize the writer (the flush task starts on first write).
+
+        Args:
+            redis_client: Redis client to write through.
+            flush_interval: Seconds a write may wait before it is flushed.
+            max_batch: Buffered commands that trigger an immediate flush, and
+                the most commands sent in one pipeline.
+            max_buffer: Buffered commands beyond which writes are dropped.
+        """
+        self._redis = redis_client
+        self._flush_interval = flush_interval
+        self._max_batch = max(1, max_batch)
+        self._max_buffer = max(1, max_buffer)
+        self._high_water = self._max_buffer // 2
+
+        # Groups of commands that must land in the same pipeline, in order
+        self._buffer: deque[list[TelemetryOp]] = deque()
+        self._buffered_ops = 0
+        self._sample_counter = 0
+        self._pending = asyncio.Event()  # Something is buffered
+        self._wakeup = asyncio.Event()  # A full batch is buffered
+        self._flush_lock = asyncio.Lock()
+        self._task: asyncio.Task[None] | None = None
+
+        self._flushed = 0
+        self._dropped = 0
+        self._last_flush_ms = 0.0
+
+    @property
+    def buffered(self) -> int:
+        """Commands waiting to be flushed."""
+        return self._buffered_ops
+
+    def submit(self, *ops: TelemetryOp, droppable: bool = True) -> bool:
+        """Queue commands to be written together in the next flush.
+
+        Args:
+            *ops: Commands built with ``op()``.
+            droppable: Whether the write may be sampled away under
+                backpressure. Non-droppable writes are only dropped when the
+                buffer is completely full.
+
+        Returns:
+            True if queued, False if dropped.
+        """
+        if not ops:
+            return True
+
+        if self._buffered_ops + len(ops) > self._max_buffer:
+            self._drop(len(ops), "overflow")
+            return False
+
+        if droppable and self._buffered_ops >= self._high_water:
+            self._sample_counter += 1
+            if self._sample_counter % BACKPRESSURE_SAMPLE_EVERY:
+                self._drop(len(ops), "sampled")
+                return False
+
+        self._buffer.append(list(ops))
+        self._buffered_ops += len(ops)
+        update_telemetry_buffered(self._buffered_ops)
+
+        self._ensure_task()
+        self._pending.set()
+        if self._buffered_ops >= self._max_batch:
+            self._wakeup.set()
+        return True
+
+    def _drop(self, count: int, reason: str) -> None:
+        self._dropped += count
+        record_telemetry_dropped(reason, count)
+
+    def _ensure_task(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def _run(self) -> None:
+        while True:
+            await self._pending.wait()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self._flush_interval)
+            except TimeoutError:
+                pass
+            self._wakeup.clear()
+            # Writes made during the flush are drained by it or set this again
+            self._pending.clear()
+            try:
+                await self.flush()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error("Telemetry flush failed: %s", e)
+
+    async def flush(self) -> None:
+        """Write everything buffered so far, one pipeline per ``max_batch`` commands."""
+        async with self._flush_lock:
+            while self._buffer:
+                batch: list[TelemetryOp] = []
+                while self._buffer and (
+                    not batch or len(batch) + len(self._buffer[0]) <= self._max_batch
+                ):
+                    batch.extend(self._buffer.popleft())
+                self._buffered_ops -= len(batch)
+                update_telemetry_buffered(self._buffered_ops)
+                await self._write(batch)
+
+    async def _write(self, batch: list[TelemetryOp]) -> None:
+        start = time.perf_counter()
+        try:
+            pipe = self._redis.pipeline(transaction=False)
+            for method, args, kwargs in batch:
+                getattr(pipe, method)(*args, **kwargs)
+            await pipe.execute()
+        except Exception as e:
+            logger.error("Failed to write %d telemetry commands to Redis: %s", len(batch), e)
+            self._drop(len(batch), "error")
+            return
+
+        elapsed = time.perf_counter() - start
+        self._flushed += len(batch)
+        self._last_flush_ms = elapsed * 1000
+        observe_telemetry_flush(elapsed, len(batch))
+
+    async def shutdown(self) -> None:
+        """Stop the flush task and write whatever is still buffered."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.flush()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get buffer, flush and drop counters."""
+        return {
+            "buffered": self._buffered_ops,
+            "flushed": self._flushed,
+            "dropped": self._dropped,
+            "last_flush_ms": self._last_flush_ms,
+        }
+
+
+# Shared writers, one per Redis client
+_writers: dict[int, TelemetryWriter] = {}
+
+
+def get_telemetry_writer(redis_client: redis.Redis) -> TelemetryWriter:
+    """Get the shared telemetry writer for a Redis client."""
+    writer = _writers.get(id(redis_client))
+    if writer is None:
+        writer = _writers[id(redis_client)] = TelemetryWriter(redis_client)
+    return writer
+
+
+async def shutdown_telemetry_writers() -> None:
+    """Flush and stop every shared telemetry writer."""
+    for writer in list(_writers.values()):
+        try:
+            await writer.shutdown()
+        except Exception as e:
+            logger.warning("Telemetry writer shutdown failed: %s", e)
+    _writers.clear()
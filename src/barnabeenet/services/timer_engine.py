@@ -0,0 +1,152 @@
+"""Event-loop timer scheduler for BarnabeeNet timers.
+
+TimerEngine keeps every pending deadline in one binary heap and runs a
+single task that sleeps until the earliest one, so thousands of timers cost
+one task and O(log n) per schedule/cancel instead of a task (or an HA
+helper entity) each.
+
+Deadlines are kept on the event loop's monotonic clock, so wall-clock
+jumps (NTP corrections, DST) never fire a timer early or late. Cancelled
+and rescheduled entries are left in the heap and skipped when popped; the
+heap is rebuilt once stale entries outnumber live ones.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import logging
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+DueCallback = Callable[[str], Awaitable[Any]]
+
+
+class TimerEngine:
+    """Heap-scheduled deadlines that call ``on_due(key)`` when reached."""
+
+    def __init__(self, on_due: DueCallback) -> None:
+        """Initialize the engine (the scheduler task starts on first use).
+
+        Args:
+            on_due: Coroutine called with the key of each deadline reached.
+                Each call runs as its own task, so a slow action never
+                delays other timers.
+        """
+        self._on_due = on_due
+        self._heap: list[tuple[float, int, str]] = []
+        self._entries: dict[str, tuple[float, int]] = {}  # key -> (when, seq)
+        self._seq = itertools.count()
+        self._wakeup: asyncio.Event | None = None
+        self._task: asyncio.Task[None] | None = None
+        self._running: set[asyncio.Task[Any]] = set()
+
+        self._fired = 0
+        self._max_late_ms = 0.0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    def schedule(self, key: str, delay: float) -> None:
+        """Fire ``key`` after ``delay`` seconds, replacing any earlier deadline."""
+        loop = asyncio.get_running_loop()
+        when = loop.time() + max(0.0, delay)
+        seq = next(self._seq)
+        self._entries[key] = (when, seq)
+        heapq.heappush(self._heap, (when, seq, key))
+        self._compact()
+
+        wakeup = self._ensure_task(loop)
+        if self._heap[0][2] == key:
+            wakeup.set()  # New earliest deadline
+
+    def cancel(self, key: str) -> bool:
+        """Forget a deadline; returns False if it was not scheduled."""
+        if self._entries.pop(key, None) is None:
+            return False
+        self._compact()
+        return True
+
+    def remaining(self, key: str) -> float | None:
+        """Seconds until ``key`` fires, or None if not scheduled."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        return max(0.0, entry[0] - asyncio.get_running_loop().time())
+
+    def _compact(self) -> None:
+        if len(self._heap) > 64 and len(self._heap) > 2 * len(self._entries):
+            self._heap = [(when, seq, key) for key, (when, seq) in self._entries.items()]
+            heapq.heapify(self._heap)
+
+    def _ensure_task(self, loop: asyncio.AbstractEventLoop) -> asyncio.Event:
+        if self._wakeup is None or self._task is None or self._task.done():
+            self._wakeup = asyncio.Event()
+            self._task = loop.create_task(self._run(self._wakeup))
+        return self._wakeup
+
+    def _pop_due(self, now: float) -> list[tuple[str, float]]:
+        due: list[tuple[str, float]] = []
+        while self._heap and self._heap[0][0] <= now:
+            when, seq, key = heapq.heappop(self._heap)
+            if self._entries.get(key) == (when, seq):
+                del self._entries[key]
+                due.append((key, when))
+        return due
+
+    async def _run(self, wakeup: asyncio.Event) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            now = loop.time()
+            for key, when in self._pop_due(now):
+                late_ms = (now - when) * 1000
+                self._max_late_ms = max(self._max_late_ms, late_ms)
+                self._fired += 1
+                task = loop.create_task(self._fire(key))
+                self._running.add(task)
+                task.add_done_callback(self._running.discard)
+
+            # Drop stale heads so the sleep targets a live deadline
+            while self._heap and self._entries.get(self._heap[0][2]) != self._heap[0][:2]:
+                heapq.heappop(self._heap)
+
+            wakeup.clear()
+            timeout = self._heap[0][0] - loop.time() if self._heap else None
+            try:
+                await asyncio.wait_for(wakeup.wait(), timeout=timeout)
+            except TimeoutError:
+                pass
+
+    async def _fire(self, key: str) -> None:
+        try:
+            await self._on_due(key)
+        except Exception as e:
+            logger.error("Timer %s action failed: %s", key, e, exc_info=True)
+
+    async def shutdown(self) -> None:
+        """Stop scheduling (pending deadlines are kept) and wait for running actions."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._running:
+            await asyncio.gather(*self._running, return_exceptions=True)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Scheduled/fired counts and worst firing delay."""
+        return {
+            "scheduled": len(self._entries),
+            "heap_size": len(self._heap),
+            "fired": self._fired,
+            "running_actions": len(self._running),
+            "max_late_ms": self._max_late_ms,
+        }
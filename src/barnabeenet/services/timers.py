@@ -1,30 +1,43 @@
 """Timer Manager for BarnabeeNet.
 
-Manages three types of timers using Home Assistant's timer helper entities:
+Manages three types of timers:
 1. Alarm Timer - "Set a timer for 5 minutes" → announce when done
 2. Device Duration Timer - "Turn on the porch light for 10 minutes" → turn off when done
 3. Delayed Action Timer - "In 3 minutes, turn off the fan" → execute action when done
 
-Pre-requisite: Create 5-10 timer helper entities in HA named timer.barnabee_1
-through timer.barnabee_10. These form a pool that BarnabeeNet allocates from.
+Timers run on a native TimerEngine (one heap-scheduled task for all timers)
+and are persisted to Redis, so they survive restarts and are not limited by
+the number of HA helpers. Chained actions and pauses are scheduled the same
+way.
+
+Optional: timer helper entities in HA named timer.barnabee_1 through
+timer.barnabee_10 mirror active timers for display on HA dashboards.
 """
 
 from __future__ import annotations
 
 import asyncio
+import json
 import logging
 import re
 import uuid
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta
+from datetime import UTC, datetime, timedelta
 from enum import Enum
 from typing import TYPE_CHECKING, Any
 
+from barnabeenet.services.timer_engine import TimerEngine
+
 if TYPE_CHECKING:
+    import redis.asyncio as redis
+
     from barnabeenet.services.homeassistant.client import HomeAssistantClient
 
 logger = logging.getLogger(__name__)
 
+# Redis hash of persisted timers: timer_id -> JSON state
+TIMERS_REDIS_KEY = "barnabeenet:timers:active"
+
 
 class TimerType(str, Enum):
     """Types of timers."""
@@ -34,25 +47,39 @@ class TimerType(str, Enum):
     DELAYED_ACTION = "delayed_action"  # Execute action after delay
 
 
+def _parse_utc(value: str) -> datetime:
+    """Parse a persisted timestamp as UTC.
+
+    States written before timestamps were stored in UTC are naive local
+    time and are converted on load.
+    """
+    parsed = datetime.fromisoformat(value)
+    if parsed.tzinfo is None:
+        parsed = parsed.astimezone()
+    return parsed.astimezone(UTC)
+
+
 @dataclass
 class ActiveTimer:
     """An active timer managed by BarnabeeNet."""
 
     id: str  # UUID
     timer_type: TimerType
-    ha_timer_entity: str  # e.g., "timer.barnabee_1"
+    ha_timer_entity: str | None  # HA display mirror, e.g. "timer.barnabee_1"
     label: str  # Human-friendly label (e.g., "pizza timer", "porch light")
     duration: timedelta
-    started_at: datetime
-    ends_at: datetime
+    started_at: datetime  # UTC
+    ends_at: datetime  # UTC
     speaker: str | None = None  # Who created it
     room: str | None = None  # Where it was created
     # For device_duration and delayed_action
     on_complete: dict[str, Any] | None = None  # Service call to execute
     # For chained actions
     chained_actions: list[dict[str, Any]] = field(default_factory=list)  # List of {delay, action}
-    paused_at: datetime | None = None  # When timer was paused
+    paused_at: datetime | None = None  # When timer was paused (UTC)
     paused_duration: timedelta = field(default_factory=lambda: timedelta(0))  # Total paused time
+    # -1 while counting down; then the index of the next chained action
+    chain_index: int = -1
 
     @property
     def remaining(self) -> timedelta:
@@ -62,7 +89,7 @@ class ActiveTimer:
             paused_remaining = self.ends_at - self.paused_at
             return paused_remaining if paused_remaining > timedelta(0) else timedelta(0)
 
-        now = datetime.now()
+        now = datetime.now(UTC)
         if now >= self.ends_at:
             return timedelta(0)
         return self.ends_at - now
@@ -75,7 +102,7 @@ class ActiveTimer:
     @property
     def is_expired(self) -> bool:
         """Check if timer has expired."""
-        return datetime.now() >= self.ends_at
+        return datetime.now(UTC) >= self.ends_at
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for API responses."""
@@ -94,10 +121,55 @@ class ActiveTimer:
             "is_paused": self.is_paused,
         }
 
+    def to_state(self) -> dict[str, Any]:
+        """Serialize everything needed to restore the timer after a restart."""
+        return {
+            "id": self.id,
+            "timer_type": self.timer_type.value,
+            "ha_timer_entity": self.ha_timer_entity,
+            "label": self.label,
+            "duration": self.duration.total_seconds(),
+            "started_at": self.started_at.isoformat(),
+            "ends_at": self.ends_at.isoformat(),
+            "speaker": self.speaker,
+            "room": self.room,
+            "on_complete": self.on_complete,
+            "chained_actions": [
+                {"delay": c["delay"].total_seconds(), "action": c["action"]}
+                for c in self.chained_actions
+            ],
+            "paused_at": self.paused_at.isoformat() if self.paused_at else None,
+            "paused_duration": self.paused_duration.total_seconds(),
+            "chain_index": self.chain_index,
+        }
+
+    @classmethod
+    def from_state(cls, data: dict[str, Any]) -> ActiveTimer:
+        """Rebuild a timer from ``to_state()`` output."""
+        return cls(
+            id=data["id"],
+            timer_type=TimerType(data["timer_type"]),
+            ha_timer_entity=data.get("ha_timer_entity"),
+            label=data["label"],
+            duration=timedelta(seconds=data["duration"]),
+            started_at=_parse_utc(data["started_at"]),
+            ends_at=_parse_utc(data["ends_at"]),
+            speaker=data.get("speaker"),
+            room=data.get("room"),
+            on_complete=data.get("on_complete"),
+            chained_actions=[
+                {"delay": timedelta(seconds=c["delay"]), "action": c["action"]}
+                for c in data.get("chained_actions", [])
+            ],
+            paused_at=_parse_utc(data["paused_at"]) if data.get("paused_at") else None,
+            paused_duration=timedelta(seconds=data.get("paused_duration", 0)),
+            chain_index=data.get("chain_index", -1),
+        )
+
 
 @dataclass
 class TimerPoolConfig:
-    """Configuration for the timer entity pool."""
+    """Configuration for timers and the optional HA timer entity mirror."""
 
     # Pattern for timer entities in HA
     entity_pattern: str = "timer.barnabee_{n}"
@@ -105,6 +177,10 @@ class TimerPoolConfig:
     pool_size: int = 10
     # Prefix for entity IDs
     prefix: str = "timer.barnabee_"
+    # Mirror active timers onto the HA entities (display only)
+    mirror_to_ha: bool = True
+    # Alarms that expired longer ago than this while offline are not announced
+    stale_alarm_seconds: float = 300.0
 
 
 @dataclass
@@ -595,35 +671,36 @@ def parse_timer_command(text: str) -> TimerParseResult:
 
 
 class TimerManager:
-    """Manages BarnabeeNet timers using HA timer entities.
+    """Manages BarnabeeNet timers on a native event-loop timer engine.
 
     Responsibilities:
-    - Pool management (allocate/release timer entities)
-    - Active timer registry
-    - Subscribe to HA events: timer.finished, timer.cancelled
+    - Active timer registry, persisted to Redis so timers survive restarts
+    - Scheduling deadlines, pauses and chained actions on the TimerEngine
     - Execute on_complete actions when timers finish
-    - Publish events to message bus for TTS announcements
+    - Optionally mirror timers onto HA timer helpers for display
     """
 
     def __init__(
         self,
         ha_client: HomeAssistantClient,
         config: TimerPoolConfig | None = None,
+        redis_client: redis.Redis | None = None,
     ) -> None:
         """Initialize the timer manager.
 
         Args:
             ha_client: Home Assistant client
             config: Pool configuration
+            redis_client: Redis client (decode_responses=True) for persistence
         """
         self._ha = ha_client
         self._config = config or TimerPoolConfig()
+        self._redis = redis_client
         self._pool = TimerPool()
         self._active_timers: dict[str, ActiveTimer] = {}
-        self._event_task: asyncio.Task[None] | None = None
+        self._engine = TimerEngine(self._on_timer_due)
         self._callbacks: list[Any] = []
         self._initialized = False
-        self._callback_registered = False
 
     @property
     def is_initialized(self) -> bool:
@@ -633,69 +710,153 @@ class TimerManager:
     async def init(self) -> None:
         """Initialize the timer manager.
 
-        Discovers available timer entities in HA and sets up event subscription.
+        Restores persisted timers and, if mirroring is enabled, discovers the
+        HA timer helpers used to display them.
         """
         if self._initialized:
             logger.debug("TimerManager already initialized")
             return
 
-        # Ensure HA client is connected
-        if not await self._ha.ensure_connected():
-            logger.warning("Home Assistant not connected, timer manager initialization deferred")
-            return
-
-        # Discover timer entities
-        await self._discover_timer_entities()
+        await self._restore_timers()
 
-        # Register state change callback (only once)
-        if not self._callback_registered:
-            self._ha.add_state_change_callback(self._on_state_change)
-            self._callback_registered = True
-            logger.info("Registered timer state change callback")
-
-        # Start WebSocket event subscription if not already running
-        if not self._ha.is_subscribed:
-            logger.info("Starting HA WebSocket event subscription for timer events")
-            await self._ha.subscribe_to_events()
+        if self._config.mirror_to_ha:
+            await self._discover_timer_entities()
 
         self._initialized = True
         logger.info(
-            "TimerManager initialized with %d available timer entities",
+            "TimerManager initialized (%d restored timers, %d HA mirror entities)",
+            len(self._active_timers),
             len(self._pool.available),
         )
 
+    async def shutdown(self) -> None:
+        """Stop the timer engine; persisted timers resume on next start."""
+        await self._engine.shutdown()
+
     async def _discover_timer_entities(self) -> None:
-        """Discover timer.barnabee_* entities in HA."""
+        """Discover timer.barnabee_* entities in HA (one batched state lookup)."""
         self._pool.available.clear()
 
-        # Ensure HA is connected
         if not await self._ha.ensure_connected():
-            logger.warning("Home Assistant not connected, cannot discover timer entities")
+            logger.info("Home Assistant not connected, timers will not be mirrored to HA")
             return
 
-        # Query HA directly for timer entities
-        logger.info("Discovering timer entities with prefix: %s (checking 1-%d)", self._config.prefix, self._config.pool_size)
-        for i in range(1, self._config.pool_size + 1):
-            entity_id = f"{self._config.prefix}{i}"
-            try:
-                # Try to get the state of this entity - if it exists, we can use it
-                state = await self._ha.get_state(entity_id)
-                if state:
-                    self._pool.available.append(entity_id)
-                    logger.info("Found timer entity: %s (state: %s)", entity_id, state.state)
-                else:
-                    logger.debug("Timer entity not found: %s (404 or None)", entity_id)
-            except Exception as e:
-                logger.warning("Error checking timer entity %s: %s", entity_id, e)
+        candidates = [f"{self._config.prefix}{i}" for i in range(1, self._config.pool_size + 1)]
+        try:
+            states = await self._ha.get_states(candidates)
+        except Exception as e:
+            logger.warning("Error discovering timer entities: %s", e)
+            return
 
-        if not self._pool.available:
-            logger.warning(
-                "No timer entities found matching pattern %s*. "
-                "Create timer helpers in Home Assistant named timer.barnabee_1 through timer.barnabee_10.",
+        in_use = {t.ha_timer_entity for t in self._active_timers.values() if t.ha_timer_entity}
+        self._pool.available.extend(e for e in candidates if e in states and e not in in_use)
+        for timer_id, timer in self._active_timers.items():
+            if timer.ha_timer_entity:
+                self._pool.in_use[timer_id] = timer.ha_timer_entity
+
+        if self._pool.available:
+            logger.info("Discovered %d timer mirror entities: %s", len(self._pool.available), self._pool.available)
+        else:
+            logger.info(
+                "No timer entities found matching %s*; timers run without an HA display mirror",
                 self._config.prefix,
             )
-        else:
-            logger.info("Discovered %d timer entities: %s", len(self._pool.available), self._pool.available)
+
+    # -------------------------------------------------------------------------
+    # Persistence
+    # -------------------------------------------------------------------------
+
+    async def _persist(self, timer: ActiveTimer) -> None:
+        if self._redis is None:
+            return
+        try:
+            await self._redis.hset(TIMERS_REDIS_KEY, timer.id, json.dumps(timer.to_state()))
+        except Exception as e:
+            logger.warning("Failed to persist timer '%s': %s", timer.label, e)
+
+    async def _forget(self, timer_id: str) -> None:
+        if self._redis is None:
+            return
+        try:
+            await self._redis.hdel(TIMERS_REDIS_KEY, timer_id)
+        except Exception as e:
+            logger.warning("Failed to remove persisted timer %s: %s", timer_id, e)
+
+    async def _restore_timers(self) -> None:
+        """Reload persisted timers and put them back on the engine."""
+        if self._redis is None:
+            return
+        try:
+            stored = await self._redis.hgetall(TIMERS_REDIS_KEY)
+        except Exception as e:
+            logger.warning("Failed to load persisted timers: %s", e)
+            return
+
+        now = datetime.now(UTC)
+        for timer_id, raw in stored.items():
+            try:
+                timer = ActiveTimer.from_state(json.loads(raw))
+            except Exception as e:
+                logger.warning("Dropping unreadable persisted timer %s: %s", timer_id, e)
+                await self._forget(timer_id)
+                continue
+
+            overdue = (now - timer.ends_at).total_seconds()
+            if (
+                not timer.is_paused
+                and timer.timer_type == TimerType.ALARM
+                and not timer.chained_actions
+                and overdue > self._config.stale_alarm_seconds
+            ):
+                # Announcing a long-gone alarm would only confuse; actions still run
+                logger.info("Dropping alarm '%s' that expired %.0fs ago while offline", timer.label, overdue)
+                await self._forget(timer_id)
+                continue
+
+            self._active_timers[timer.id] = timer
+            if not timer.is_paused:
+                self._engine.schedule(timer.id, max(0.0, -overdue))
+
+        if self._active_timers:
+            logger.info("Restored %d persisted timers", len(self._active_timers))
+
+    # -------------------------------------------------------------------------
+    # HA display mirror
+    # -------------------------------------------------------------------------
+
+    async def _mirror(self, timer: ActiveTimer, service: str, duration: timedelta | None = None) -> None:
+        """Reflect a timer change on its HA helper; failures never affect the timer."""
+        if not timer.ha_timer_entity:
+            return
+        data: dict[str, Any] = {}
+        if duration is not None:
+            total_secs = int(duration.total_seconds())
+            data["duration"] = f"{total_secs // 3600:02d}:{total_secs % 3600 // 60:02d}:{total_secs % 60:02d}"
+        try:
+            result = await self._ha.call_service(service, entity_id=timer.ha_timer_entity, **data)
+            if not result.success:
+                logger.debug("HA timer mirror %s failed: %s", service, result.message)
+        except Exception as e:
+            logger.debug("HA timer mirror %s failed: %s", service, e)
+
+    async def _attach_mirror(self, timer: ActiveTimer) -> None:
+        if not self._config.mirror_to_ha:
+            return
+        entity_id = self._pool.allocate()
+        if not entity_id:
+            return
+        timer.ha_timer_entity = entity_id
+        self._pool.in_use[timer.id] = entity_id
+        await self._mirror(timer, "timer.start", timer.remaining)
+
+    def _detach_mirror(self, timer: ActiveTimer) -> None:
+        if timer.ha_timer_entity:
+            self._pool.release(timer.ha_timer_entity)
+            timer.ha_timer_entity = None
+
+    # -------------------------------------------------------------------------
+    # Lifecycle
+    # -------------------------------------------------------------------------
 
     async def create_timer(
         self,
@@ -705,7 +866,7 @@ class TimerManager:
         speaker: str | None = None,
         room: str | None = None,
         on_complete: dict[str, Any] | None = None,
-    ) -> ActiveTimer | None:
+    ) -> ActiveTimer:
         """Create a new timer.
 
         Args:
@@ -717,38 +878,18 @@ class TimerManager:
             on_complete: Service call to execute when timer finishes
 
         Returns:
-            ActiveTimer if created, None if no entities available
+            The new ActiveTimer
         """
-        # Initialize if not yet done
         if not self._initialized:
-            logger.info("TimerManager not initialized, initializing now...")
             await self.init()
 
-        # If still no entities available, try to rediscover
-        if not self._pool.available:
-            logger.info("No timer entities in pool, attempting rediscovery...")
-            await self._discover_timer_entities()
-            logger.info("After rediscovery: %d entities available", len(self._pool.available))
-
-        # Allocate a timer entity
-        entity_id = self._pool.allocate()
-        if not entity_id:
-            logger.warning(
-                "No timer entities available in pool (available: %d, in_use: %d, active_timers: %d)",
-                len(self._pool.available),
-                len(self._pool.in_use),
-                len(self._active_timers),
-            )
-            return None
-
-        # Create timer record
         timer_id = str(uuid.uuid4())[:8]
-        now = datetime.now()
+        now = datetime.now(UTC)
 
         timer = ActiveTimer(
             id=timer_id,
             timer_type=timer_type,
-            ha_timer_entity=entity_id,
+            ha_timer_entity=None,
             label=label or f"timer_{timer_id}",
             duration=duration,
             started_at=now,
@@ -758,102 +899,54 @@ class TimerManager:
             on_complete=on_complete,
         )
 
-        # Start the HA timer
-        try:
-            # Format duration as HH:MM:SS for HA timer service
-            total_secs = int(duration.total_seconds())
-            hours = total_secs // 3600
-            minutes = (total_secs % 3600) // 60
-            seconds = total_secs % 60
-            duration_str = f"{hours:02d}:{minutes:02d}:{seconds:02d}"
-
-            logger.info(
-                "Starting HA timer %s with duration %s (%d seconds)",
-                entity_id, duration_str, total_secs
-            )
-
-            result = await self._ha.call_service(
-                "timer.start",
-                entity_id=entity_id,
-                duration=duration_str,
-            )
-
-            if not result.success:
-                logger.error("Failed to start HA timer: %s", result.message)
-                self._pool.release(entity_id)
-                return None
-
-        except Exception as e:
-            logger.error("Error starting HA timer: %s", e, exc_info=True)
-            self._pool.release(entity_id)
-            return None
-
-        # Register timer
         self._active_timers[timer_id] = timer
-        self._pool.in_use[timer_id] = entity_id
+        self._engine.schedule(timer_id, duration.total_seconds())
+        await self._attach_mirror(timer)
+        await self._persist(timer)
 
         logger.info(
-            "Created %s timer '%s' for %s (entity: %s, timer_id: %s)",
+            "Created %s timer '%s' for %s (timer_id: %s, mirror: %s, active timers: %d)",
             timer_type.value,
             timer.label,
             format_duration(duration),
-            entity_id,
             timer_id,
-        )
-        logger.info(
-            "Active timers count: %d, Pool available: %d, Pool in_use: %d",
+            timer.ha_timer_entity or "none",
             len(self._active_timers),
-            len(self._pool.available),
-            len(self._pool.in_use),
         )
 
         return timer
 
-    def _on_state_change(self, event: Any) -> None:
-        """Handle HA state change events.
-
-        Looks for timer.finished events on our managed timers.
-        """
-        # Check if this is one of our timer entities
-        entity_id = event.entity_id
-        if not entity_id.startswith(self._config.prefix):
+    async def _on_timer_due(self, timer_id: str) -> None:
+        """Handle a deadline from the engine: the timer itself or a chained step."""
+        timer = self._active_timers.get(timer_id)
+        if timer is None or timer.is_paused:
             return
 
-        # Check if timer became "idle" (finished)
-        new_state = event.new_state
-        old_state = event.old_state
+        if timer.chain_index < 0:
+            await self._handle_timer_finished(timer)
+            self._detach_mirror(timer)  # The HA helper has gone idle on its own
+            timer.chain_index = 0
+        else:
+            await self._execute_chained_action(timer, timer.chain_index)
+            timer.chain_index += 1
 
-        logger.debug(
-            "Timer state change: %s from '%s' to '%s'",
-            entity_id, old_state, new_state
-        )
+        if timer_id not in self._active_timers:
+            return  # Cancelled while its action ran
 
-        if old_state == "active" and new_state == "idle":
-            # Timer finished - find and handle it
-            logger.info("Timer %s finished (active -> idle)", entity_id)
-            asyncio.create_task(self._handle_timer_finished(entity_id))
-        elif old_state == "paused" and new_state == "idle":
-            # Timer was paused and then finished (resumed and completed)
-            logger.info("Timer %s finished from paused state", entity_id)
-            asyncio.create_task(self._handle_timer_finished(entity_id))
+        if timer.chain_index < len(timer.chained_actions):
+            delay: timedelta = timer.chained_actions[timer.chain_index]["delay"]
+            timer.ends_at = datetime.now(UTC) + delay
+            self._engine.schedule(timer_id, delay.total_seconds())
+            await self._persist(timer)
+        else:
+            await self._remove_timer(timer_id)
 
-    async def _handle_timer_finished(self, entity_id: str) -> None:
-        """Handle a timer finishing.
+    async def _handle_timer_finished(self, timer: ActiveTimer) -> None:
+        """Run a timer's completion action.
 
         Args:
-            entity_id: The HA timer entity that finished
+            timer: The timer whose countdown finished
         """
-        # Find the timer
-        timer = None
-        for _tid, t in self._active_timers.items():
-            if t.ha_timer_entity == entity_id:
-                timer = t
-                break
-
-        if not timer:
-            logger.debug("Timer finished but not in registry: %s", entity_id)
-            return
-
         logger.info(
             "Timer '%s' (%s) finished - executing completion action",
             timer.label,
@@ -876,58 +969,45 @@ class TimerManager:
             if timer.on_complete:
                 await self._execute_on_complete(timer)
 
-        # Handle chained actions
-        if timer.chained_actions:
-            await self._execute_chained_actions(timer)
-
-        # Clean up
-        await self._remove_timer(timer.id)
-
-    async def _execute_chained_actions(self, timer: ActiveTimer) -> None:
-        """Execute chained actions sequentially with delays.
+    async def _execute_chained_action(self, timer: ActiveTimer, index: int) -> None:
+        """Execute one chained action (its delay has already elapsed).
 
         Args:
             timer: Timer with chained actions
+            index: Position of the action in the chain
         """
-        for i, chained in enumerate(timer.chained_actions):
-            delay = chained["delay"]
-            action = chained["action"]
-
-            # Wait for the delay
-            if delay.total_seconds() > 0:
-                await asyncio.sleep(delay.total_seconds())
+        action = timer.chained_actions[index]["action"]
+        count = len(timer.chained_actions)
+        try:
+            service = action.get("service", "")
+            entity_id = action.get("entity_id")
+            service_data = action.get("data", {})
 
-            # Execute the action
-            try:
-                service = action.get("service", "")
-                entity_id = action.get("entity_id")
-                service_data = action.get("data", {})
+            result = await self._ha.call_service(
+                service,
+                entity_id=entity_id,
+                **service_data,
+            )
 
-                result = await self._ha.call_service(
+            if result.success:
+                logger.info(
+                    "Executed chained action %d/%d for timer '%s': %s for %s",
+                    index + 1,
+                    count,
+                    timer.label,
                     service,
-                    entity_id=entity_id,
-                    **service_data,
+                    entity_id,
                 )
-
-                if result.success:
-                    logger.info(
-                        "Executed chained action %d/%d for timer '%s': %s for %s",
-                        i + 1,
-                        len(timer.chained_actions),
-                        timer.label,
-                        service,
-                        entity_id,
-                    )
-                else:
-                    logger.error(
-                        "Failed to execute chained action %d/%d: %s - %s",
-                        i + 1,
-                        len(timer.chained_actions),
-                        service,
-                        result.message,
-                    )
-            except Exception as e:
-                logger.error("Error executing chained action %d/%d: %s", i + 1, len(timer.chained_actions), e)
+            else:
+                logger.error(
+                    "Failed to execute chained action %d/%d: %s - %s",
+                    index + 1,
+                    count,
+                    service,
+                    result.message,
+                )
+        except Exception as e:
+            logger.error("Error executing chained action %d/%d: %s", index + 1, count, e)
 
     async def _announce_timer_finished(self, timer: ActiveTimer) -> None:
         """Announce that a timer finished via message bus/TTS.
@@ -1029,15 +1109,16 @@ class TimerManager:
             logger.error("Error executing timer on_complete: %s", e, exc_info=True)
 
     async def _remove_timer(self, timer_id: str) -> None:
-        """Remove a timer from the registry and release its entity.
+        """Remove a timer from the registry, the engine and Redis.
 
         Args:
             timer_id: ID of the timer to remove
         """
         timer = self._active_timers.pop(timer_id, None)
+        self._engine.cancel(timer_id)
         if timer:
-            self._pool.release(timer.ha_timer_entity)
-            logger.info("Released timer entity %s back to pool", timer.ha_timer_entity)
+            self._detach_mirror(timer)
+            await self._forget(timer_id)
 
     async def pause_timer(self, timer_id: str) -> bool:
         """Pause an active timer.
@@ -1056,17 +1137,16 @@ class TimerManager:
             logger.debug("Timer '%s' is already paused", timer.label)
             return True
 
-        try:
-            await self._ha.call_service(
-                "timer.pause",
-                entity_id=timer.ha_timer_entity,
-            )
-            timer.paused_at = datetime.now()
-            logger.info("Paused timer '%s'", timer.label)
-            return True
-        except Exception as e:
-            logger.error("Error pausing HA timer: %s", e)
-            return False
+        remaining = self._engine.remaining(timer_id)
+        self._engine.cancel(timer_id)
+        now = datetime.now(UTC)
+        timer.paused_at = now
+        if remaining is not None:
+            timer.ends_at = now + timedelta(seconds=remaining)
+        await self._persist(timer)
+        await self._mirror(timer, "timer.pause")
+        logger.info("Paused timer '%s'", timer.label)
+        return True
 
     async def resume_timer(self, timer_id: str) -> bool:
         """Resume a paused timer.
@@ -1081,28 +1161,20 @@ class TimerManager:
         if not timer:
             return False
 
-        if not timer.is_paused:
+        if not timer.is_paused or timer.paused_at is None:
             logger.debug("Timer '%s' is not paused", timer.label)
             return True
 
-        try:
-            # Calculate how long it was paused
-            if timer.paused_at:
-                pause_duration = datetime.now() - timer.paused_at
-                timer.paused_duration += pause_duration
-                # Adjust ends_at to account for pause time
-                timer.ends_at += pause_duration
-                timer.paused_at = None
-
-            await self._ha.call_service(
-                "timer.start",
-                entity_id=timer.ha_timer_entity,
-            )
-            logger.info("Resumed timer '%s'", timer.label)
-            return True
-        except Exception as e:
-            logger.error("Error resuming HA timer: %s", e)
-            return False
+        remaining = timer.remaining
+        now = datetime.now(UTC)
+        timer.paused_duration += now - timer.paused_at
+        timer.ends_at = now + remaining
+        timer.paused_at = None
+        self._engine.schedule(timer_id, remaining.total_seconds())
+        await self._persist(timer)
+        await self._mirror(timer, "timer.start")
+        logger.info("Resumed timer '%s'", timer.label)
+        return True
 
     async def cancel_timer(self, timer_id: str) -> bool:
         """Cancel an active timer.
@@ -1117,14 +1189,7 @@ class TimerManager:
         if not timer:
             return False
 
-        try:
-            await self._ha.call_service(
-                "timer.cancel",
-                entity_id=timer.ha_timer_entity,
-            )
-        except Exception as e:
-            logger.error("Error cancelling HA timer: %s", e)
-
+        await self._mirror(timer, "timer.cancel")
         await self._remove_timer(timer_id)
         logger.info("Cancelled timer '%s'", timer.label)
         return True
@@ -1254,6 +1319,7 @@ class TimerManager:
             "delay": delay,
             "action": action,
         })
+        await self._persist(timer)
         logger.info("Added chained action to timer '%s': %s after %s", timer.label, action, format_duration(delay))
         return True
 
@@ -1261,15 +1327,17 @@ class TimerManager:
         """Get timer manager status for API/debugging.
 
         Returns:
-            Status dict with pool and timer info
+            Status dict with engine, mirror pool and timer info
         """
         return {
             "initialized": self._initialized,
-            "callback_registered": self._callback_registered,
+            "persistent": self._redis is not None,
+            "mirror_to_ha": self._config.mirror_to_ha,
             "pool_available": len(self._pool.available),
             "pool_in_use": len(self._pool.in_use),
             "active_timers": len(self._active_timers),
             "available_entities": self._pool.available,
+            "engine": self._engine.get_stats(),
             "timers": [t.to_dict() for t in self._active_timers.values()],
         }
 
@@ -1310,18 +1378,30 @@ async def get_timer_manager(
         logger.warning("No HA client available, timer manager cannot be created")
         return None
 
-    _timer_manager = TimerManager(ha_client)
+    redis_client = None
+    try:
+        from barnabeenet.main import app_state
+
+        redis_client = app_state.redis_client
+    except Exception:
+        pass
+
+    _timer_manager = TimerManager(ha_client, redis_client=redis_client)
     await _timer_manager.init()
     return _timer_manager
 
 
-async def init_timer_manager(ha_client: HomeAssistantClient) -> TimerManager | None:
+async def init_timer_manager(
+    ha_client: HomeAssistantClient,
+    redis_client: redis.Redis | None = None,
+) -> TimerManager | None:
     """Initialize the timer manager with a specific HA client.
 
     This should be called during application startup.
 
     Args:
         ha_client: Home Assistant client
+        redis_client: Redis client used to persist timers across restarts
 
     Returns:
         TimerManager instance
@@ -1332,7 +1412,7 @@ async def init_timer_manager(ha_client: HomeAssistantClient) -> TimerManager | N
         logger.info("Timer manager already initialized")
         return _timer_manager
 
-    _timer_manager = TimerManager(ha_client)
+    _timer_manager = TimerManager(ha_client, redis_client=redis_client)
     await _timer_manager.init()
     return _timer_manager
 
@@ -1,6 +1,15 @@
 """TTS (Text-to-Speech) services."""
 
-from barnabeenet.services.tts.kokoro_tts import KokoroTTS
+from barnabeenet.services.tts.chunking import SentenceChunker, split_sentences
+from barnabeenet.services.tts.kokoro_tts import KokoroTTS, TTSAudioChunk, pcm_to_wav
 from barnabeenet.services.tts.pronunciation import PRONUNCIATION_MAP, preprocess_text
 
-__all__ = ["KokoroTTS", "PRONUNCIATION_MAP", "preprocess_text"]
+__all__ = [
+    "KokoroTTS",
+    "PRONUNCIATION_MAP",
+    "SentenceChunker",
+    "TTSAudioChunk",
+    "pcm_to_wav",
+    "preprocess_text",
+    "split_sentences",
+]
@@ -0,0 +1,93 @@
+"""Sentence chunking for streaming TTS.
+
+Splits reply text at sentence boundaries so each sentence can be synthesized
+and played while the rest is still rendering. Overlong sentences are split
+again at clause punctuation to keep the first audio chunk short.
+"""
+
+from __future__ import annotations
+
+import re
+
+# Sentence end: terminal punctuation (optionally closed by quotes/brackets)
+# followed by whitespace, or a line break.
+_SENTENCE_END = re.compile(r"(?<=[.!?])[\"')\]]*\s+|\n+")
+_CLAUSE_END = re.compile(r"(?<=[,;:])\s+")
+
+# Abbreviations that end in a period but do not end a sentence
+_ABBREVIATIONS = frozenset({"mr.", "mrs.", "ms.", "dr.", "st.", "vs.", "etc.", "e.g.", "i.e."})
+
+DEFAULT_MAX_CHARS = 200
+
+
+class SentenceChunker:
+    """Incrementally split text into speakable sentences.
+
+    Feed text as it arrives (a whole reply, or LLM output piece by piece);
+    complete sentences are returned as soon as their boundary is seen.
+    """
+
+    def __init__(self, max_chars: int = DEFAULT_MAX_CHARS) -> None:
+        """Initialize the chunker.
+
+        Args:
+            max_chars: Sentences longer than this are split at clause punctuation.
+        """
+        self.max_chars = max_chars
+        self._buffer = ""
+
+    def feed(self, text: str) -> list[str]:
+        """Add text and return any sentences it completes."""
+        self._buffer += text
+        sentences: list[str] = []
+        start = 0
+        for match in _SENTENCE_END.finditer(self._buffer):
+            candidate = self._buffer[start : match.end()]
+            if _ends_with_abbreviation(candidate):
+                continue
+            sentences.extend(self._split_long(candidate.strip()))
+            start = match.end()
+        self._buffer = self._buffer[start:]
+        return sentences
+
+    def flush(self) -> list[str]:
+        """Return whatever text remains as final sentence(s)."""
+        remainder, self._buffer = self._buffer.strip(), ""
+        return self._split_long(remainder)
+
+    def _split_long(self, sentence: str) -> list[str]:
+        if not sentence:
+            return []
+        if len(sentence) <= self.max_chars:
+            return [sentence]
+
+        parts: list[str] = []
+        current = ""
+        for clause in _CLAUSE_END.split(sentence):
+            if current and len(current) + len(clause) + 1 > self.max_chars:
+                parts.append(current)
+                current = clause
+            else:
+                current = f"{current} {clause}" if current else clause
+        if current:
+            parts.append(current)
+        return parts
+
+
+def split_sentences(text: str, max_chars: int = DEFAULT_MAX_CHARS) -> list[str]:
+    """Split complete text into sentences for streaming synthesis.
+
+    Args:
+        text: Text to split.
+        max_chars: Sentences longer than this are split at clause punctuation.
+
+    Returns:
+        Non-empty sentences in order.
+    """
+    chunker = SentenceChunker(max_chars=max_chars)
+    return chunker.feed(text) + chunker.flush()
+
+
+def _ends_with_abbreviation(candidate: str) -> bool:
+    words = candidate.rstrip().split()
+    return bool(words) and words[-1].lower() in _ABBREVIATIONS
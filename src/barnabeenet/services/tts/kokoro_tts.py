@@ -5,12 +5,16 @@ from __future__ import annotations
 import base64
 import io
 import time
+from collections.abc import AsyncIterable, AsyncIterator
+from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
 import numpy as np
 import soundfile as sf
 import structlog
 
+from barnabeenet.services.inference_executor import TTS_LANE, get_inference_executor
+from barnabeenet.services.tts.chunking import SentenceChunker, split_sentences
 from barnabeenet.services.tts.pronunciation import preprocess_text
 
 if TYPE_CHECKING:
@@ -19,11 +23,46 @@ if TYPE_CHECKING:
 logger = structlog.get_logger()
 
 
+@dataclass
+class TTSAudioChunk:
+    """One sentence of streamed speech as 16-bit mono PCM."""
+
+    index: int
+    text: str
+    pcm: bytes
+    sample_rate: int
+    duration_ms: float
+    latency_ms: float  # Since the start of the stream
+
+
+def pcm_to_wav(pcm: bytes, sample_rate: int) -> bytes:
+    """Wrap 16-bit mono PCM (e.g. joined TTSAudioChunk.pcm) in a WAV container."""
+    buffer = io.BytesIO()
+    sf.write(buffer, np.frombuffer(pcm, dtype="<i2"), sample_rate, format="WAV", subtype="PCM_16")
+    return buffer.getvalue()
+
+
+async def _iter_sentences(text: str | AsyncIterable[str]) -> AsyncIterator[str]:
+    if isinstance(text, str):
+        for sentence in split_sentences(text):
+            yield sentence
+        return
+
+    chunker = SentenceChunker()
+    async for piece in text:
+        for sentence in chunker.feed(piece):
+            yield sentence
+    for sentence in chunker.flush():
+        yield sentence
+
+
 class KokoroTTS:
     """Text-to-speech using Kokoro-82M.
 
     Fast, high-quality local TTS with multiple voice options.
     Default voice: bm_fable (British male)
+
+    Pipeline loading and synthesis run on the inference executor's TTS lane.
     """
 
     VOICES = {
@@ -70,9 +109,7 @@ class KokoroTTS:
 
         start = time.perf_counter()
 
-        from kokoro import KPipeline
-
-        self._pipeline = KPipeline(lang_code=self.lang_code)
+        self._pipeline = await get_inference_executor().run(TTS_LANE, self._load_pipeline)
 
         load_time = (time.perf_counter() - start) * 1000
         self._initialized = True
@@ -82,6 +119,11 @@ class KokoroTTS:
             load_time_ms=f"{load_time:.0f}",
         )
 
+    def _load_pipeline(self) -> KPipeline:
+        from kokoro import KPipeline
+
+        return KPipeline(lang_code=self.lang_code)
+
     async def synthesize(
         self,
         text: str,
@@ -97,6 +139,9 @@ class KokoroTTS:
 
         Returns:
             dict with keys: audio_bytes, audio_base64, sample_rate, duration_ms, latency_ms
+
+        Raises:
+            InferenceBusyError: If the TTS lane is saturated.
         """
         if not self._initialized:
             await self.initialize()
@@ -116,12 +161,11 @@ class KokoroTTS:
                 processed=processed_text,
             )
 
-        # Generate audio chunks
-        audio_chunks = []
-        for _, _, audio in self._pipeline(processed_text, voice=voice, speed=speed):
-            audio_chunks.append(audio)
+        audio_bytes, full_audio = await get_inference_executor().run(
+            TTS_LANE, self._synthesize_sync, processed_text, voice, speed
+        )
 
-        if not audio_chunks:
+        if full_audio is None:
             logger.warning("No audio generated", text=text[:50])
             return {
                 "audio_bytes": b"",
@@ -131,12 +175,6 @@ class KokoroTTS:
                 "latency_ms": 0,
             }
 
-        full_audio = np.concatenate(audio_chunks)
-
-        buffer = io.BytesIO()
-        sf.write(buffer, full_audio, self.sample_rate, format="WAV")
-        audio_bytes = buffer.getvalue()
-
         duration_ms = (len(full_audio) / self.sample_rate) * 1000
         latency_ms = (time.perf_counter() - start) * 1000
 
@@ -156,6 +194,96 @@ class KokoroTTS:
             "latency_ms": latency_ms,
         }
 
+    async def synthesize_stream(
+        self,
+        text: str | AsyncIterable[str],
+        voice: str | None = None,
+        speed: float | None = None,
+    ) -> AsyncIterator[TTSAudioChunk]:
+        """Synthesize text sentence by sentence, yielding audio as it is ready.
+
+        The first chunk is available after one sentence has rendered instead
+        of the whole reply. ``text`` may also be an async iterable of text
+        pieces (e.g. LLM deltas); each sentence is rendered as soon as it is
+        complete, while the rest of the text is still being generated.
+
+        Args:
+            text: Text to synthesize, whole or as it arrives
+            voice: Override voice (or use default)
+            speed: Override speed (or use default)
+
+        Yields:
+            TTSAudioChunk per sentence, in order (empty sentences are skipped).
+
+        Raises:
+            InferenceBusyError: If the TTS lane is saturated.
+        """
+        if not self._initialized:
+            await self.initialize()
+
+        voice = voice or self.voice
+        speed = speed or self.speed
+        start = time.perf_counter()
+        executor = get_inference_executor()
+
+        index = 0
+        text_length = 0
+        async for sentence in _iter_sentences(text):
+            text_length += len(sentence)
+            pcm = await executor.run(
+                TTS_LANE, self._synthesize_pcm_sync, preprocess_text(sentence), voice, speed
+            )
+            if not pcm:
+                continue
+            yield TTSAudioChunk(
+                index=index,
+                text=sentence,
+                pcm=pcm,
+                sample_rate=self.sample_rate,
+                duration_ms=(len(pcm) // 2 / self.sample_rate) * 1000,
+                latency_ms=(time.perf_counter() - start) * 1000,
+            )
+            index += 1
+
+        logger.info(
+            "Speech streamed",
+            text_length=text_length,
+            chunks=index,
+            latency_ms=f"{(time.perf_counter() - start) * 1000:.0f}",
+            voice=voice,
+        )
+
+    def _synthesize_pcm_sync(self, text: str, voice: str, speed: float) -> bytes:
+        """Render one sentence to 16-bit PCM (blocking; runs on an inference thread)."""
+        audio_chunks = [
+            np.asarray(audio, dtype=np.float32)
+            for _, _, audio in self._pipeline(text, voice=voice, speed=speed)
+        ]
+        if not audio_chunks:
+            return b""
+        samples = np.clip(np.concatenate(audio_chunks), -1.0, 1.0)
+        return (samples * 32767).astype("<i2").tobytes()
+
+    def _synthesize_sync(
+        self, text: str, voice: str, speed: float
+    ) -> tuple[bytes, np.ndarray | None]:
+        """Generate and WAV-encode audio (blocking; runs on an inference thread).
+
+        Returns:
+            Tuple of (wav_bytes, samples), or (b"", None) if nothing was generated.
+        """
+        audio_chunks = []
+        for _, _, audio in self._pipeline(text, voice=voice, speed=speed):
+            audio_chunks.append(audio)
+
+        if not audio_chunks:
+            return b"", None
+
+        full_audio = np.concatenate(audio_chunks)
+        buffer = io.BytesIO()
+        sf.write(buffer, full_audio, self.sample_rate, format="WAV")
+        return buffer.getvalue(), full_audio
+
     def is_available(self) -> bool:
         """Check if the service is ready."""
         return self._initialized and self._pipeline is not None
@@ -2,9 +2,10 @@ from __future__ import annotations
 
 import asyncio
 import base64
+import contextlib
 import time
+from collections.abc import AsyncIterator
 
-import httpx
 import structlog
 
 from barnabeenet.agents.orchestrator import get_orchestrator
@@ -14,8 +15,9 @@ from barnabeenet.models.schemas import (
     VoicePipelineRequest,
     VoicePipelineResponse,
 )
-from barnabeenet.services.stt import DistilWhisperSTT
-from barnabeenet.services.tts import KokoroTTS
+from barnabeenet.services.metrics_store import get_metrics_store
+from barnabeenet.services.model_pool import get_model_pool
+from barnabeenet.services.tts.kokoro_tts import TTSAudioChunk, pcm_to_wav
 
 logger = structlog.get_logger()
 
@@ -45,26 +47,23 @@ class VoicePipelineService:
                 try:
                     settings = get_settings()
                     url = f"http://{settings.stt.gpu_worker_host}:{settings.stt.gpu_worker_port}/transcribe"
-                    async with httpx.AsyncClient() as client:
-                        resp = await client.post(
-                            url,
-                            json={
-                                "audio_base64": base64.b64encode(audio_bytes).decode(),
-                                "language": request.language,
-                            },
-                            timeout=settings.performance.stt_timeout_ms / 1000,
-                        )
-                        resp.raise_for_status()
-                        data = resp.json()
-                        return data.get("text", ""), STTEngine.PARAKEET
+                    resp = await get_model_pool().http_client.post(
+                        url,
+                        json={
+                            "audio_base64": base64.b64encode(audio_bytes).decode(),
+                            "language": request.language,
+                        },
+                        timeout=settings.performance.stt_timeout_ms / 1000,
+                    )
+                    resp.raise_for_status()
+                    data = resp.json()
+                    return data.get("text", ""), STTEngine.PARAKEET
                 except Exception as exc:  # pragma: no cover - best-effort fallback
                     logger.warning("GPU STT failed, falling back to CPU", error=str(exc))
                     use_gpu = False
 
             if not use_gpu:
-                stt = DistilWhisperSTT(model_size=get_settings().stt.whisper_model)
-                if not stt.is_available():
-                    await stt.initialize()
+                stt = await get_model_pool().get_stt()
                 res = await stt.transcribe(audio_bytes, language=request.language)
                 return res["text"], STTEngine.DISTIL_WHISPER
 
@@ -93,14 +92,48 @@ class VoicePipelineService:
         # Use identified speaker if available, otherwise fall back to request.speaker
         final_speaker = identified_speaker if identified_speaker != "unknown" else request.speaker
 
+        # Conversational replies stream from the LLM; synthesis starts on the
+        # first complete sentence while the rest is still being generated.
+        tts = await get_model_pool().get_tts()
+        deltas: asyncio.Queue[str | None] = asyncio.Queue()
+        streamed_parts: list[str] = []
+        speech_task: asyncio.Task[list[TTSAudioChunk]] | None = None
+
+        async def llm_text() -> AsyncIterator[str]:
+            while (piece := await deltas.get()) is not None:
+                yield piece
+
+        async def speak_streamed_text() -> list[TTSAudioChunk]:
+            return [
+                chunk
+                async for chunk in tts.synthesize_stream(
+                    llm_text(), voice=request.response_voice, speed=1.0
+                )
+            ]
+
+        async def on_partial_text(delta: str) -> None:
+            nonlocal speech_task
+            if speech_task is None:
+                speech_task = asyncio.create_task(speak_streamed_text())
+            streamed_parts.append(delta)
+            deltas.put_nowait(delta)
+
         # Process: dispatch to AgentOrchestrator (full multi-agent pipeline)
         orchestrator = get_orchestrator()
-        orchestrator_resp = await orchestrator.process(
-            text=input_text,
-            speaker=final_speaker,  # Use identified speaker
-            room=request.room,
-            conversation_id=request.conversation_id,
-        )
+        try:
+            orchestrator_resp = await orchestrator.process(
+                text=input_text,
+                speaker=final_speaker,  # Use identified speaker
+                room=request.room,
+                conversation_id=request.conversation_id,
+                on_partial_text=on_partial_text,
+            )
+        except BaseException:
+            if speech_task is not None:
+                speech_task.cancel()
+            raise
+        finally:
+            deltas.put_nowait(None)
 
         response_text = orchestrator_resp.get("response", f"You said: {input_text}")
         agent_used = orchestrator_resp.get("agent", "unknown")
@@ -114,14 +147,23 @@ class VoicePipelineService:
             response_text=response_text[:50],
         )
 
-        # TTS
-        tts = KokoroTTS(voice=request.response_voice or get_settings().tts.voice)
-        if not tts.is_available():
-            await tts.initialize()
+        # TTS: use the streamed audio only if it covers exactly the final reply
         synth_start = time.perf_counter()
-        synth_res = await tts.synthesize(
-            text=response_text, voice=request.response_voice, speed=1.0
+        streamed_audio = await VoicePipelineService._collect_streamed_speech(
+            speech_task, "".join(streamed_parts), response_text
         )
+        if streamed_audio:
+            sample_rate = streamed_audio[0].sample_rate
+            synth_res = {
+                "audio_bytes": pcm_to_wav(
+                    b"".join(chunk.pcm for chunk in streamed_audio), sample_rate
+                ),
+                "sample_rate": sample_rate,
+            }
+        else:
+            synth_res = await tts.synthesize(
+                text=response_text, voice=request.response_voice, speed=1.0
+            )
         tts_latency_ms = (time.perf_counter() - synth_start) * 1000
 
         total_latency_ms = (time.perf_counter() - total_start) * 1000
@@ -144,5 +186,44 @@ class VoicePipelineService:
             format=request.output_format,
         )
 
+    @staticmethod
+    async def _collect_streamed_speech(
+        speech_task: asyncio.Task[list[TTSAudioChunk]] | None,
+        streamed_text: str,
+        response_text: str,
+    ) -> list[TTSAudioChunk]:
+        """Wait for speech rendered from streamed LLM text.
+
+        Returns an empty list (and discards any audio) when nothing was
+        streamed, synthesis failed, or the final response was rewritten after
+        generation, so the caller falls back to synthesizing the full text.
+        """
+        if speech_task is None:
+            return []
+        if streamed_text.strip() != response_text.strip():
+            speech_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await speech_task
+            return []
+
+        try:
+            chunks = await speech_task
+        except Exception as exc:
+            logger.warning("Streamed synthesis failed, re-synthesizing", error=str(exc))
+            return []
+        if not chunks:
+            return []
+
+        try:
+            store = await get_metrics_store()
+            await store.record_latency(
+                "tts_first_audio",
+                chunks[0].latency_ms,
+                {"text_length": len(response_text), "source": "llm_stream"},
+            )
+        except Exception as exc:
+            logger.debug("Failed to record first-audio latency", error=str(exc))
+        return chunks
+
 
 __all__ = ["VoicePipelineService"]
@@ -338,7 +338,12 @@ function connectWebSocket() {
         ws.onmessage = (event) => {
             try {
                 const data = JSON.parse(event.data);
-                handleActivityMessage(data);
+                // Several queued messages may arrive as one batch frame
+                if (data.type === 'batch') {
+                    data.data.forEach(handleActivityMessage);
+                } else {
+                    handleActivityMessage(data);
+                }
             } catch (e) {
                 console.error('Error parsing WebSocket message:', e);
             }
@@ -4380,40 +4385,43 @@ function connectDashboardWebSocket() {
 
         dashboardWs.onmessage = (event) => {
             try {
-                const msg = JSON.parse(event.data);
-
-                if (msg.type === 'activity') {
-                    // Add to logs page
-                    addLogEntry({
-                        timestamp: msg.data.timestamp,
-                        level: msg.data.level,
-                        component: msg.data.source,
-                        message: msg.data.title + (msg.data.detail ? ': ' + msg.data.detail : '')
-                    });
-
-                    // Also add to main activity feed
-                    addActivityItem({
-                        type: msg.data.type,
-                        message: msg.data.title,
-                        timestamp: msg.data.timestamp,
-                        latency: msg.data.duration_ms
-                    });
-
-                    // Track trace if present
-                    if (msg.data.trace_id) {
-                        if (!activeTraces.has(msg.data.trace_id)) {
-                            activeTraces.set(msg.data.trace_id, {
-                                trace_id: msg.data.trace_id,
-                                signals: [],
-                                started_at: msg.data.timestamp
-                            });
+                const frame = JSON.parse(event.data);
+                // Several queued messages may arrive as one batch frame
+                const messages = frame.type === 'batch' ? frame.data : [frame];
+                messages.forEach((msg) => {
+                    if (msg.type === 'activity') {
+                        // Add to logs page
+                        addLogEntry({
+                            timestamp: msg.data.timestamp,
+                            level: msg.data.level,
+                            component: msg.data.source,
+                            message: msg.data.title + (msg.data.detail ? ': ' + msg.data.detail : '')
+                        });
+
+                        // Also add to main activity feed
+                        addActivityItem({
+                            type: msg.data.type,
+                            message: msg.data.title,
+                            timestamp: msg.data.timestamp,
+                            latency: msg.data.duration_ms
+                        });
+
+                        // Track trace if present
+                        if (msg.data.trace_id) {
+                            if (!activeTraces.has(msg.data.trace_id)) {
+                                activeTraces.set(msg.data.trace_id, {
+                                    trace_id: msg.data.trace_id,
+                                    signals: [],
+                                    started_at: msg.data.timestamp
+                                });
+                            }
+                            activeTraces.get(msg.data.trace_id).signals.push(msg.data);
                         }
-                        activeTraces.get(msg.data.trace_id).signals.push(msg.data);
+                    } else if (msg.type === 'metrics') {
+                        // Update metrics on the fly
+                        updateMetricsFromWs(msg.data);
                     }
-                } else if (msg.type === 'metrics') {
-                    // Update metrics on the fly
-                    updateMetricsFromWs(msg.data);
-                }
+                });
             } catch (e) {
                 console.error('Failed to parse dashboard message:', e);
             }
@@ -0,0 +1,117 @@
+"""Tests for the indexed activity ring buffer and its spill file."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from barnabeenet.services.activity_log import (
+    Activity,
+    ActivityLevel,
+    ActivityLogger,
+    ActivityType,
+)
+from barnabeenet.services.activity_store import ActivityRing, ActivitySpill
+
+
+def _activity(n: int, **fields: object) -> Activity:
+    defaults: dict[str, object] = {
+        "type": ActivityType.HA_STATE_CHANGE,
+        "source": "ha_client",
+        "title": f"event {n}",
+    }
+    defaults.update(fields)
+    return Activity(**defaults)
+
+
+class TestActivityRing:
+    """Tests for ActivityRing."""
+
+    def test_evicts_oldest_and_unindexes(self) -> None:
+        ring = ActivityRing(capacity=3)
+        for n in range(5):
+            ring.append(_activity(n, source="a" if n < 2 else "b"))
+
+        assert len(ring) == 3
+        assert [a.title for a in ring.recent()] == ["event 4", "event 3", "event 2"]
+        assert ring.recent(source="a") == []
+        assert ring.get_stats()["indexed_keys"]["source"] == 1
+
+    def test_filters_combine_newest_first(self) -> None:
+        ring = ActivityRing(capacity=100)
+        for n in range(30):
+            ring.append(
+                _activity(
+                    n,
+                    type=ActivityType.LLM_REQUEST if n % 2 else ActivityType.HA_STATE_CHANGE,
+                    level=ActivityLevel.ERROR if n % 3 == 0 else ActivityLevel.INFO,
+                    source="llm" if n % 2 else "ha_client",
+                )
+            )
+
+        errors = ring.recent(limit=2, types=[ActivityType.LLM_REQUEST], level=ActivityLevel.ERROR)
+
+        assert [a.title for a in errors] == ["event 27", "event 21"]
+        assert ring.recent(source="nobody") == []
+
+    def test_multiple_types_merge_in_order(self) -> None:
+        ring = ActivityRing(capacity=10)
+        kinds = [ActivityType.USER_INPUT, ActivityType.LLM_REQUEST, ActivityType.HA_SERVICE_CALL]
+        for n in range(9):
+            ring.append(_activity(n, type=kinds[n % 3]))
+
+        results = ring.recent(limit=4, types=[ActivityType.USER_INPUT, ActivityType.LLM_REQUEST])
+
+        assert [a.title for a in results] == ["event 7", "event 6", "event 4", "event 3"]
+
+    def test_trace_index(self) -> None:
+        logger = ActivityLogger(max_activities=50)
+        ring = logger._activities
+        for n in range(10):
+            ring.append(_activity(n, trace_id="t1" if n in (2, 5) else None))
+
+        results = logger.get_recent_activities(trace_id="t1")
+
+        assert [a.title for a in results] == ["event 5", "event 2"]
+
+
+class TestActivitySpill:
+    """Tests for the memory-mapped spill file."""
+
+    def test_history_survives_restart(self, tmp_path: Path) -> None:
+        path = tmp_path / "activity.ring"
+        ring = ActivityRing(3, spill=ActivitySpill(path, 3))
+        for n in range(5):
+            ring.append(_activity(n, trace_id=f"t{n}"))
+        ring.close()
+
+        restored = ActivityRing(3, spill=ActivitySpill(path, 3))
+        restored.append(_activity(5))
+
+        assert [a.title for a in restored.recent()] == ["event 5", "event 4", "event 3"]
+        assert [a.title for a in restored.recent(trace_id="t4")] == ["event 4"]
+        restored.close()
+
+    def test_oversized_activity_trimmed(self, tmp_path: Path) -> None:
+        path = tmp_path / "activity.ring"
+        spill = ActivitySpill(path, 2, slot_bytes=1024)
+        ring = ActivityRing(2, spill=spill)
+        ring.append(_activity(0, detail="x" * 5000, data={"blob": "y" * 5000}))
+        ring.close()
+
+        (restored,) = ActivityRing(2, spill=ActivitySpill(path, 2, slot_bytes=1024)).recent()
+
+        assert restored.title == "event 0"
+        assert restored.data == {}
+        assert restored.detail is not None and len(restored.detail) < 1024
+        assert spill.get_stats()["trimmed"] == 1
+
+    def test_layout_change_starts_empty(self, tmp_path: Path) -> None:
+        path = tmp_path / "activity.ring"
+        ring = ActivityRing(4, spill=ActivitySpill(path, 4))
+        ring.append(_activity(0))
+        ring.close()
+
+        resized = ActivityRing(8, spill=ActivitySpill(path, 8))
+
+        assert len(resized) == 0
+        resized.close()
@@ -0,0 +1,238 @@
+"""Tests for audit log search."""
+
+from __future__ import annotations
+
+import json
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+import pytest
+
+from barnabeenet.services.audit import log as audit_log_module
+from barnabeenet.services.audit.log import (
+    AUDIT_CHRONOLOGICAL_KEY,
+    AUDIT_LOG_PREFIX,
+    AUDIT_TEXT_INDEX_READY_KEY,
+    AuditLog,
+    AuditLogEntry,
+)
+
+START = datetime(2026, 3, 1, 18, 0, tzinfo=UTC)
+
+
+class FakePipeline:
+    """Queues FakeRedis calls and runs them on execute()."""
+
+    def __init__(self, client: FakeRedis) -> None:
+        self._client = client
+        self._calls: list[tuple[str, tuple[Any, ...], dict[str, Any]]] = []
+
+    def __getattr__(self, name: str) -> Any:
+        def queue(*args: Any, **kwargs: Any) -> FakePipeline:
+            self._calls.append((name, args, kwargs))
+            return self
+
+        return queue
+
+    async def execute(self) -> list[Any]:
+        return [await getattr(self._client, n)(*a, **kw) for n, a, kw in self._calls]
+
+
+class FakeRedis:
+    """Just enough of redis.asyncio for the audit log, with call counting."""
+
+    def __init__(self) -> None:
+        self.strings: dict[str, str] = {}
+        self.sets: dict[str, set[str]] = {}
+        self.zsets: dict[str, dict[str, float]] = {}
+        self.calls: dict[str, int] = {}
+        self.ttls: dict[str, int] = {}
+
+    def _count(self, name: str) -> None:
+        self.calls[name] = self.calls.get(name, 0) + 1
+
+    def pipeline(self, transaction: bool = True) -> FakePipeline:
+        self._count("pipeline")
+        return FakePipeline(self)
+
+    async def set(self, key: str, value: str) -> None:
+        self.strings[key] = value
+
+    async def get(self, key: str) -> str | None:
+        self._count("get")
+        return self.strings.get(key)
+
+    async def mget(self, keys: list[str]) -> list[str | None]:
+        self._count("mget")
+        return [self.strings.get(k) for k in keys]
+
+    async def exists(self, key: str) -> int:
+        return int(key in self.strings or key in self.sets or key in self.zsets)
+
+    async def sadd(self, key: str, *members: str) -> None:
+        self.sets.setdefault(key, set()).update(members)
+
+    async def zadd(self, key: str, mapping: dict[str, float]) -> None:
+        self.zsets.setdefault(key, {}).update(mapping)
+
+    async def delete(self, key: str) -> None:
+        for store in (self.strings, self.sets, self.zsets):
+            store.pop(key, None)
+
+    def _members(self, key: str) -> dict[str, float]:
+        if key in self.zsets:
+            return self.zsets[key]
+        return dict.fromkeys(self.sets.get(key, set()), 1.0)
+
+    async def expire(self, key: str, seconds: int) -> None:
+        self.ttls[key] = seconds
+
+    async def zinterstore(self, dest: str, weights: dict[str, float], aggregate: str) -> None:
+        self._count("zinterstore")
+        keys = list(weights)
+        common = set(self._members(keys[0]))
+        for key in keys[1:]:
+            common &= set(self._members(key))
+        self.zsets[dest] = {
+            m: sum(self._members(k)[m] * w for k, w in weights.items()) for m in common
+        }
+
+    def _ordered(self, key: str) -> list[tuple[str, float]]:
+        return sorted(self.zsets.get(key, {}).items(), key=lambda i: (i[1], i[0]))
+
+    async def zrange(self, key: str, start: int, end: int) -> list[str]:
+        return [m for m, _ in self._ordered(key)[start : end + 1]]
+
+    async def zrevrange(self, key: str, start: int, end: int) -> list[str]:
+        return [m for m, _ in self._ordered(key)[::-1][start : end + 1]]
+
+    async def zrevrangebyscore(
+        self, key: str, max: float, min: float, start: int, num: int, withscores: bool
+    ) -> list[tuple[str, float]]:
+        self._count("zrevrangebyscore")
+        rows = [(m, s) for m, s in self._ordered(key)[::-1] if min <= s <= max]
+        return rows[start : start + num]
+
+
+async def _log(audit_log: AuditLog, minutes: int, **fields: Any) -> AuditLogEntry:
+    entry = AuditLogEntry(timestamp=START + timedelta(minutes=minutes), **fields)
+    assert await audit_log.log_conversation(entry)
+    return entry
+
+
+class TestAuditLogSearch:
+    """Tests for AuditLog search."""
+
+    async def test_combined_filters_and_text(self) -> None:
+        redis = FakeRedis()
+        audit_log = AuditLog(redis)
+        match = await _log(
+            audit_log, 1, speaker="Emma", room="Kitchen", user_text="What's for dinner tonight?"
+        )
+        await _log(audit_log, 2, speaker="Emma", room="Office", user_text="What's for dinner?")
+        await _log(audit_log, 3, speaker="Jack", room="Kitchen", user_text="dinner please")
+        await _log(audit_log, 4, speaker="Emma", room="Kitchen", user_text="Lights off")
+
+        results = await audit_log.search("Dinner", speaker="emma", room="kitchen")
+
+        assert [e.entry_id for e in results] == [match.entry_id]
+        assert await audit_log.search("dinner breakfast") == []
+
+    async def test_text_matches_assistant_response(self) -> None:
+        audit_log = AuditLog(FakeRedis())
+        entry = await _log(audit_log, 1, user_text="hi", assistant_response="Pizza is ready")
+
+        results = await audit_log.search("pizza")
+
+        assert [e.entry_id for e in results] == [entry.entry_id]
+
+    async def test_time_range_newest_first(self) -> None:
+        audit_log = AuditLog(FakeRedis())
+        entries = [await _log(audit_log, m, user_text=f"turn {m}") for m in range(5)]
+
+        results = await audit_log.search(
+            since=START + timedelta(minutes=1), until=START + timedelta(minutes=3)
+        )
+
+        assert [e.entry_id for e in results] == [e.entry_id for e in entries[3:0:-1]]
+
+    async def test_cursor_pagination(self) -> None:
+        redis = FakeRedis()
+        audit_log = AuditLog(redis)
+        entries = [await _log(audit_log, m // 2, room="den") for m in range(7)]
+        expected = sorted(entries, key=lambda e: (e.timestamp, e.entry_id), reverse=True)
+
+        pages = []
+        cursor = None
+        while True:
+            page = await audit_log.search_page(room="den", limit=3, cursor=cursor)
+            pages.append([e.entry_id for e in page.entries])
+            cursor = page.next_cursor
+            if cursor is None:
+                break
+
+        assert [len(p) for p in pages] == [3, 3, 1]
+        assert [i for p in pages for i in p] == [e.entry_id for e in expected]
+
+    async def test_page_loaded_with_one_mget(self) -> None:
+        redis = FakeRedis()
+        audit_log = AuditLog(redis)
+        for m in range(10):
+            await _log(audit_log, m, room="den")
+
+        results = await audit_log.search(room="den", limit=5)
+
+        assert len(results) == 5
+        assert redis.calls["mget"] == 1
+        assert "get" not in redis.calls
+
+    async def test_deleted_entries_skipped_but_page_filled(self) -> None:
+        audit_log = AuditLog(FakeRedis())
+        entries = [await _log(audit_log, m, room="den") for m in range(4)]
+        await audit_log.mark_as_deleted(entries[3].entry_id)
+        await audit_log.mark_as_deleted(entries[2].entry_id)
+
+        results = await audit_log.search(room="den", limit=2)
+        everything = await audit_log.search(room="den", limit=2, include_deleted=True)
+
+        assert [e.entry_id for e in results] == [entries[1].entry_id, entries[0].entry_id]
+        assert [e.entry_id for e in everything] == [entries[3].entry_id, entries[2].entry_id]
+
+    async def test_text_index_backfilled_for_old_entries(self) -> None:
+        redis = FakeRedis()
+        old = AuditLogEntry(timestamp=START, user_text="Feed the goldfish")
+        await redis.set(f"{AUDIT_LOG_PREFIX}{old.entry_id}", json.dumps(old.to_dict()))
+        await redis.zadd(AUDIT_CHRONOLOGICAL_KEY, {old.entry_id: START.timestamp()})
+
+        results = await AuditLog(redis).search("goldfish")
+
+        assert [e.entry_id for e in results] == [old.entry_id]
+        assert AUDIT_TEXT_INDEX_READY_KEY in redis.strings
+
+    async def test_query_without_indexable_words_matches_substring(self) -> None:
+        audit_log = AuditLog(FakeRedis())
+        question = await _log(audit_log, 1, user_text="is it ready?")
+        await _log(audit_log, 2, user_text="it is ready")
+        single = await _log(audit_log, 3, user_text="plan b", assistant_response="ok")
+
+        assert [e.entry_id for e in await audit_log.search("?")] == [question.entry_id]
+        assert [e.entry_id for e in await audit_log.search(" b")] == [single.entry_id]
+        assert await audit_log.search("!") == []
+
+    async def test_filters_intersected_once_per_search(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(audit_log_module, "SEARCH_BATCH_SIZE", 2)
+        redis = FakeRedis()
+        audit_log = AuditLog(redis)
+        for m in range(7):
+            await _log(audit_log, m, room="den")
+
+        results = await audit_log.search(room="den", limit=5)
+
+        assert len(results) == 5
+        assert redis.calls["zrevrangebyscore"] == 3
+        assert redis.calls["zinterstore"] == 1
+        (temp_key,) = redis.ttls
+        assert redis.ttls[temp_key] > 0
+        assert temp_key not in redis.zsets
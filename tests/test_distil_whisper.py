@@ -9,6 +9,7 @@ import numpy as np
 import pytest
 
 from barnabeenet.services.stt.distil_whisper import DistilWhisperSTT
+from barnabeenet.services.stt.segmenter import UtteranceSegmenter
 
 
 @pytest.fixture
@@ -213,6 +214,46 @@ class TestDistilWhisperSTT:
 
         assert result["text"] == "base64 test"
 
+    @pytest.mark.asyncio
+    async def test_transcribe_stream_partials_and_endpoint(
+        self, stt_service: DistilWhisperSTT
+    ) -> None:
+        """Test incremental transcription yields partials, then a final on silence."""
+        hypotheses = iter(["hello", "hello world", "hello world"])
+
+        def transcribe(audio, **kwargs):
+            segment = MagicMock()
+            segment.text = next(hypotheses)
+            info = MagicMock(language="en", language_probability=0.9)
+            return [segment], info
+
+        stt_service._model = MagicMock()
+        stt_service._model.transcribe.side_effect = transcribe
+        stt_service._initialized = True
+
+        t = np.arange(16000 * 700 // 1000) / 16000
+        speech = (np.sin(2 * np.pi * 220 * t) * 0.3 * 32767).astype("<i2").tobytes()
+        silence = b"\x00\x00" * (16000 * 400 // 1000)
+
+        async def audio_stream():
+            for i in range(0, len(speech), 3200):  # 100ms chunks
+                yield speech[i : i + 3200]
+            yield silence
+
+        segmenter = UtteranceSegmenter(
+            endpoint_silence_ms=300, partial_interval_ms=300, min_speech_ms=90
+        )
+        segmenter._is_speech = segmenter._energy_is_speech
+
+        results = [
+            r async for r in stt_service.transcribe_stream(audio_stream(), segmenter=segmenter)
+        ]
+
+        assert [r["is_final"] for r in results] == [False, False, True]
+        assert results[0]["text"] == "hello"
+        assert results[-1]["text"] == "hello world"
+        assert results[-1]["confidence"] == 0.9
+
     @pytest.mark.asyncio
     async def test_shutdown(self, stt_service: DistilWhisperSTT) -> None:
         """Test shutdown cleans up resources."""
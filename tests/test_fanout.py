@@ -0,0 +1,144 @@
+"""Tests for the non-blocking WebSocket fan-out bus."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from typing import Any
+
+from barnabeenet.services.fanout import FanoutBus, FanoutSubscriber, encode
+
+
+class Recorder:
+    """Collects frames, optionally blocking until released."""
+
+    def __init__(self, blocked: bool = False) -> None:
+        self.frames: list[Any] = []
+        self.release = asyncio.Event()
+        if not blocked:
+            self.release.set()
+
+    async def send_text(self, frame: str) -> None:
+        await self.release.wait()
+        self.frames.append(json.loads(frame))
+
+    @property
+    def messages(self) -> list[Any]:
+        out: list[Any] = []
+        for frame in self.frames:
+            out.extend(frame["data"] if frame.get("type") == "batch" else [frame])
+        return out
+
+
+class TestFanoutSubscriber:
+    """Tests for FanoutSubscriber queueing policies."""
+
+    async def test_messages_in_one_tick_share_a_frame(self) -> None:
+        recorder = Recorder()
+        subscriber = FanoutSubscriber(recorder.send_text, tick=0.01)
+
+        for i in range(3):
+            subscriber.offer(encode({"n": i}))
+        await subscriber.flush()
+
+        assert len(recorder.frames) == 1
+        assert recorder.frames[0]["type"] == "batch"
+        assert recorder.messages == [{"n": 0}, {"n": 1}, {"n": 2}]
+        assert subscriber.get_stats()["sent"] == 3
+
+    async def test_single_message_frame_is_the_message(self) -> None:
+        recorder = Recorder()
+        subscriber = FanoutSubscriber(recorder.send_text, tick=0)
+
+        subscriber.offer(encode({"type": "activity", "data": {}}))
+        await subscriber.flush()
+
+        assert recorder.frames == [{"type": "activity", "data": {}}]
+
+    async def test_coalesced_message_keeps_latest(self) -> None:
+        recorder = Recorder()
+        subscriber = FanoutSubscriber(recorder.send_text, tick=0.01)
+
+        subscriber.offer(encode({"metrics": 1}), coalesce_key="metrics")
+        subscriber.offer(encode({"event": "a"}))
+        subscriber.offer(encode({"metrics": 2}), coalesce_key="metrics")
+        await subscriber.flush()
+
+        assert recorder.messages == [{"metrics": 2}, {"event": "a"}]
+        assert subscriber.get_stats()["coalesced"] == 1
+
+    async def test_full_queue_drops_oldest(self) -> None:
+        recorder = Recorder()
+        subscriber = FanoutSubscriber(recorder.send_text, tick=0.01, max_queue=3)
+
+        for i in range(5):
+            subscriber.offer(encode({"n": i}))
+        await subscriber.flush()
+
+        assert recorder.messages == [{"n": 2}, {"n": 3}, {"n": 4}]
+        assert subscriber.get_stats()["dropped"] == 2
+
+    async def test_send_failure_closes_and_notifies(self) -> None:
+        closed: list[FanoutSubscriber] = []
+
+        async def broken(_frame: str) -> None:
+            raise ConnectionError("gone")
+
+        subscriber = FanoutSubscriber(broken, tick=0, on_close=closed.append)
+        subscriber.offer(encode({"n": 1}))
+        await subscriber.flush()
+
+        assert closed == [subscriber]
+        assert subscriber.closed
+        assert subscriber.offer(encode({"n": 2})) is False
+
+
+class TestFanoutBus:
+    """Tests for FanoutBus."""
+
+    async def test_slow_subscriber_does_not_block_publish(self) -> None:
+        bus = FanoutBus(tick=0, max_queue=10)
+        fast, slow = Recorder(), Recorder(blocked=True)
+        bus.add(fast.send_text, name="fast")
+        bus.add(slow.send_text, name="slow")
+
+        bus.publish({"n": 0})
+        await asyncio.sleep(0.01)  # The slow subscriber's first frame is now stuck
+        for i in range(1, 21):
+            bus.publish({"n": i})
+            await asyncio.sleep(0)  # Producer yields; the fast subscriber keeps up
+        await asyncio.sleep(0.01)
+
+        assert len(fast.messages) == 21
+        assert slow.messages == []
+        stats = {s["name"]: s for s in bus.get_stats()["subscribers"]}
+        assert stats["slow"]["pending"] == 10
+        assert stats["slow"]["dropped"] == 10
+        assert stats["slow"]["lag_ms"] > 0
+
+        slow.release.set()
+        await bus.flush()
+        assert slow.messages == [{"n": i} for i in (0, *range(11, 21))]
+
+    async def test_filter_skips_subscriber(self) -> None:
+        bus = FanoutBus(tick=0)
+        everything, errors = Recorder(), Recorder()
+        bus.add(everything.send_text)
+        bus.add(errors.send_text, accepts=lambda m: not m.get("success", True))
+
+        bus.publish({"success": True})
+        bus.publish({"success": False})
+        await bus.flush()
+
+        assert len(everything.messages) == 2
+        assert errors.messages == [{"success": False}]
+
+    async def test_remove_stops_delivery(self) -> None:
+        bus = FanoutBus(tick=0)
+        recorder = Recorder()
+        subscriber = bus.add(recorder.send_text)
+
+        bus.remove(subscriber)
+
+        assert bus.publish({"n": 1}) == 0
+        assert bus.subscriber_count == 0
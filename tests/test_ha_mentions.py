@@ -0,0 +1,208 @@
+"""Tests for HA entity/area mention detection and its consumers."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from unittest.mock import MagicMock
+
+import pytest
+
+from barnabeenet.services.homeassistant.context import EntityMetadata, HAContextService
+from barnabeenet.services.homeassistant.entities import Entity, EntityRegistry
+from barnabeenet.services.homeassistant.mentions import (
+    MENTION_ALIAS,
+    MENTION_AREA,
+    MENTION_ENTITY,
+    MentionDetector,
+)
+from barnabeenet.services.homeassistant.models import Area
+from barnabeenet.services.homeassistant.smart_resolver import SmartEntityResolver
+
+# =============================================================================
+# MentionDetector Tests
+# =============================================================================
+
+
+class TestMentionDetector:
+    """Tests for the Aho-Corasick mention detector."""
+
+    def test_finds_overlapping_mentions_with_spans(self) -> None:
+        """Every occurrence is reported, including names inside longer ones."""
+        detector = MentionDetector(
+            [
+                ("Hallway Light", MENTION_ENTITY, "light.hallway"),
+                ("Hall", MENTION_AREA, "Hall"),
+                ("light", MENTION_ALIAS, "light.other"),
+            ]
+        )
+
+        mentions = detector.find_all("Turn on the HALLWAY light")
+
+        assert [(m.start, m.end, m.target) for m in mentions] == [
+            (12, 25, "light.hallway"),
+            (12, 16, "Hall"),
+            (20, 25, "light.other"),
+        ]
+        assert mentions[0].name == "Hallway Light"
+
+    def test_whole_words(self) -> None:
+        """whole_words skips names embedded in longer words."""
+        detector = MentionDetector([("Hall", MENTION_AREA, "Hall")])
+
+        assert detector.find_all("the hallway", whole_words=True) == []
+        assert len(detector.find_all("the hall, please", whole_words=True)) == 1
+
+    def test_shared_names_yield_each_target(self) -> None:
+        """A name registered for two entities produces two mentions."""
+        detector = MentionDetector(
+            [
+                ("Lamp", MENTION_ENTITY, "light.a"),
+                ("lamp", MENTION_ENTITY, "light.b"),
+            ]
+        )
+
+        assert {m.target for m in detector.find_all("lamp")} == {"light.a", "light.b"}
+        assert len(detector) == 1
+
+    def test_matches_naive_substring_scan(self) -> None:
+        """Results agree with checking every name against the text."""
+        names = ["a", "ab", "bab", "abab", "b b", "ba"]
+        detector = MentionDetector((name, MENTION_ENTITY, name) for name in names)
+        text = "abab b bab abba"
+
+        expected = sorted(
+            (i, i + len(name), name)
+            for name in names
+            for i in range(len(text))
+            if text.startswith(name, i)
+        )
+        found = sorted((m.start, m.end, m.target) for m in detector.find_all(text))
+        assert found == expected
+
+    def test_longest_filters_kinds(self) -> None:
+        """longest returns the longest mention of the requested kinds."""
+        detector = MentionDetector(
+            [
+                ("Kitchen", MENTION_AREA, "Kitchen"),
+                ("Kitchen Ceiling Light", MENTION_ENTITY, "light.kitchen_ceiling"),
+            ]
+        )
+
+        text = "dim the kitchen ceiling light"
+        assert detector.longest(text).target == "light.kitchen_ceiling"
+        assert detector.longest(text, kinds=(MENTION_AREA,)).target == "Kitchen"
+        assert MentionDetector().longest(text) is None
+
+
+# =============================================================================
+# HAContextService Tests
+# =============================================================================
+
+
+class TestContextServiceMentions:
+    """Tests for the detector and cached lists kept by HAContextService."""
+
+    @pytest.fixture
+    def service(self) -> HAContextService:
+        """Context service with cached metadata and a fresh refresh time."""
+        service = HAContextService(ha_client=MagicMock())
+        service._entity_metadata = {
+            "light.kitchen": EntityMetadata(
+                "light.kitchen", "light", "Kitchen Light", aliases=["Cooker Lamp"]
+            ),
+            "switch.fan": EntityMetadata("switch.fan", "switch", "Ceiling Fan"),
+        }
+        service._area_names = ["Kitchen"]
+        service._index_metadata()
+        service._last_refresh = datetime.now()
+        return service
+
+    @pytest.mark.asyncio
+    async def test_meta_context_is_cached(self, service: HAContextService) -> None:
+        """Meta Agent context reuses lists and detector until metadata changes."""
+        first = await service.get_context_for_meta_agent()
+        second = await service.get_context_for_meta_agent()
+
+        assert first.entity_names == ["Kitchen Light", "Ceiling Fan"]
+        assert first.entity_domains == {"light": ["light.kitchen"], "switch": ["switch.fan"]}
+        assert first.mention_detector is second.mention_detector
+        assert first.entity_names is second.entity_names
+
+        service._index_metadata()
+        assert service.mention_detector is first.mention_detector
+
+    def test_detector_rebuilt_on_change(self, service: HAContextService) -> None:
+        """Changed metadata produces a new detector."""
+        before = service.mention_detector
+        service._entity_metadata["light.kitchen"].aliases.append("Stove Light")
+        service._index_metadata()
+
+        assert service.mention_detector is not before
+        mention = service.mention_detector.longest("the stove light")
+        assert mention.target == "light.kitchen"
+
+    def test_new_metadata_indexed_lazily(self, service: HAContextService) -> None:
+        """Metadata added outside a refresh is picked up on next use."""
+        service._entity_metadata["lock.front"] = EntityMetadata("lock.front", "lock", "Front Door")
+
+        assert service.mention_detector.longest("the front door").target == "lock.front"
+        assert [m.entity_id for m in service.find_entities_by_name("front")] == ["lock.front"]
+
+    @pytest.mark.asyncio
+    async def test_interaction_context_mentions(self, service: HAContextService) -> None:
+        """Interaction context loads details for mentioned entities and aliases."""
+        service._ha_client.connected = True
+        service._ha_client._client = None
+
+        context = await service.get_context_for_interaction_agent("is the cooker lamp on?")
+
+        assert list(context.entity_details) == ["light.kitchen"]
+
+
+# =============================================================================
+# SmartEntityResolver Tests
+# =============================================================================
+
+
+class TestResolverMentions:
+    """Tests for mention-based resolution in SmartEntityResolver."""
+
+    @pytest.fixture
+    def resolver(self) -> SmartEntityResolver:
+        """Resolver over a mocked HA client with one area and one entity."""
+        registry = EntityRegistry()
+        registry.add(Entity("light.reading", "light", "Reading Lamp", area_id="study"))
+        study = Area(id="study", name="Study")
+
+        ha = MagicMock()
+        ha.entities = registry
+        ha.areas = {"study": study}
+        ha.find_area_by_name.side_effect = lambda name: study if name.lower() == "study" else None
+        ha.get_area.return_value = None
+        ha.resolve_entity.return_value = None
+
+        detector = MentionDetector(
+            [
+                ("Reading Lamp", MENTION_ENTITY, "light.reading"),
+                ("Study", MENTION_AREA, "Study"),
+            ]
+        )
+        return SmartEntityResolver(ha, mention_detector=detector)
+
+    def test_find_mentions(self, resolver: SmartEntityResolver) -> None:
+        """Mentions are whole-word matches over entities and areas."""
+        targets = [m.target for m in resolver.find_mentions("reading lamp in the study")]
+        assert targets == ["light.reading", "Study"]
+
+    def test_resolve_area_from_phrase(self, resolver: SmartEntityResolver) -> None:
+        """An area named inside a longer phrase resolves to that area."""
+        area = resolver.resolve_area("over in the study please")
+        assert area is not None
+        assert area.id == "study"
+
+    def test_resolve_single_from_phrase(self, resolver: SmartEntityResolver) -> None:
+        """An entity named inside a phrase resolves when fuzzy lookup finds nothing."""
+        result = resolver.resolve("that reading lamp by the window", domain="light")
+
+        assert [e.entity_id for e in result.entities] == ["light.reading"]
+        assert result.confidence == 1.0
@@ -0,0 +1,165 @@
+"""Tests for the multiplexed Home Assistant WebSocket session."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from typing import Any
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from barnabeenet.services.homeassistant.websocket import (
+    HAAuthenticationError,
+    HACommandError,
+    HAWebSocketSession,
+)
+
+
+class FakeHASocket:
+    """In-memory stand-in for a Home Assistant WebSocket connection.
+
+    Replies to commands in reverse order of arrival once ``hold`` commands
+    are queued, to prove results are matched by id rather than order.
+    """
+
+    def __init__(self, results: dict[str, Any], auth_ok: bool = True, hold: int = 1) -> None:
+        self.results = results
+        self.auth_ok = auth_ok
+        self.hold = hold
+        self.sent: list[dict[str, Any]] = []
+        self._held: list[dict[str, Any]] = []
+        self._inbox: asyncio.Queue[str | None] = asyncio.Queue()
+        self._handshake = [json.dumps({"type": "auth_required"})]
+        self.closed = False
+
+    async def recv(self) -> str:
+        return self._handshake.pop(0)
+
+    async def send(self, raw: str) -> None:
+        msg = json.loads(raw)
+        self.sent.append(msg)
+        if msg["type"] == "auth":
+            reply = {"type": "auth_ok" if self.auth_ok else "auth_invalid", "message": "bad"}
+            self._handshake.append(json.dumps(reply))
+            return
+        self._held.append(msg)
+        if len(self._held) >= self.hold:
+            for held in reversed(self._held):
+                self._reply(held)
+            self._held.clear()
+
+    def _reply(self, msg: dict[str, Any]) -> None:
+        if msg["type"] in self.results:
+            reply = {"id": msg["id"], "type": "result", "success": True, "result": self.results[msg["type"]]}
+        elif msg["type"] == "subscribe_events":
+            reply = {"id": msg["id"], "type": "result", "success": True, "result": None}
+        else:
+            reply = {"id": msg["id"], "type": "result", "success": False, "error": {"code": "unknown_command"}}
+        self._inbox.put_nowait(json.dumps(reply))
+
+    def push_event(self, sub_id: int, event: dict[str, Any]) -> None:
+        self._inbox.put_nowait(json.dumps({"id": sub_id, "type": "event", "event": event}))
+
+    async def close(self) -> None:
+        if not self.closed:
+            self.closed = True
+            self._inbox.put_nowait(None)
+
+    def __aiter__(self) -> FakeHASocket:
+        return self
+
+    async def __anext__(self) -> str:
+        raw = await self._inbox.get()
+        if raw is None:
+            raise StopAsyncIteration
+        return raw
+
+
+def _patch_connect(*sockets: FakeHASocket) -> Any:
+    return patch(
+        "barnabeenet.services.homeassistant.websocket.websockets.connect",
+        AsyncMock(side_effect=list(sockets)),
+    )
+
+
+class TestHAWebSocketSession:
+    """Tests for HAWebSocketSession."""
+
+    async def test_concurrent_commands_share_one_connection(self) -> None:
+        """In-flight commands are matched to results by id on one socket."""
+        ws = FakeHASocket(
+            {"config/area_registry/list": ["areas"], "config/device_registry/list": ["devices"]},
+            hold=2,
+        )
+        session = HAWebSocketSession("http://ha.local:8123", "token")
+
+        with _patch_connect(ws) as connect:
+            areas, devices = await asyncio.gather(
+                session.command("config/area_registry/list"),
+                session.command("config/device_registry/list"),
+            )
+
+        assert areas == ["areas"]
+        assert devices == ["devices"]
+        connect.assert_awaited_once()
+        assert connect.await_args.args[0] == "ws://ha.local:8123/api/websocket"
+        assert connect.await_args.kwargs["max_size"] > 1024 * 1024
+        await session.close()
+
+    async def test_failed_command_raises(self) -> None:
+        """An unsuccessful result is surfaced as HACommandError."""
+        session = HAWebSocketSession("http://ha.local:8123", "token")
+        with _patch_connect(FakeHASocket({})):
+            with pytest.raises(HACommandError):
+                await session.command("config/nope")
+        await session.close()
+
+    async def test_auth_invalid(self) -> None:
+        """A rejected token raises HAAuthenticationError."""
+        session = HAWebSocketSession("http://ha.local:8123", "bad")
+        with _patch_connect(FakeHASocket({}, auth_ok=False)):
+            with pytest.raises(HAAuthenticationError):
+                await session.connect()
+        assert session.connected is False
+
+    async def test_resubscribes_after_reconnect(self) -> None:
+        """Subscriptions are re-sent on a new connection and events routed."""
+        first = FakeHASocket({})
+        second = FakeHASocket({})
+        events: list[dict[str, Any]] = []
+
+        async def on_event(event: dict[str, Any]) -> None:
+            events.append(event)
+
+        session = HAWebSocketSession("http://ha.local:8123", "token")
+        await session.subscribe({"type": "subscribe_events", "event_type": "state_changed"}, on_event)
+
+        with _patch_connect(first, second):
+            await session.connect()
+            await first.close()
+            await session.wait_closed()
+            assert session.connected is False
+
+            await session.connect()
+
+        subscribe = [m for m in second.sent if m["type"] == "subscribe_events"]
+        assert len(subscribe) == 1
+
+        second.push_event(subscribe[0]["id"], {"event_type": "state_changed", "data": {}})
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        assert events == [{"event_type": "state_changed", "data": {}}]
+        await session.close()
+
+    async def test_pending_commands_fail_on_disconnect(self) -> None:
+        """Commands waiting for a result fail when the connection drops."""
+        ws = FakeHASocket({"config/area_registry/list": []}, hold=2)
+        session = HAWebSocketSession("http://ha.local:8123", "token")
+
+        with _patch_connect(ws):
+            task = asyncio.create_task(session.command("config/area_registry/list"))
+            await asyncio.sleep(0.01)
+            await ws.close()
+            with pytest.raises(ConnectionError):
+                await task
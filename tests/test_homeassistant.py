@@ -10,6 +10,7 @@ Tests cover:
 
 from __future__ import annotations
 
+import asyncio
 from datetime import datetime
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -32,6 +33,12 @@ from barnabeenet.services.homeassistant.models import (
     HADataSnapshot,
     Integration,
     LogEntry,
+    RegistryUpdate,
+)
+from barnabeenet.services.homeassistant.state_mirror import (
+    NUMERIC_BATTERY,
+    NumericIndex,
+    StateMirror,
 )
 
 # =============================================================================
@@ -209,6 +216,18 @@ class TestEntityRegistry:
             reg.add(entity)
         return reg
 
+    def test_replace_all(self, registry: EntityRegistry) -> None:
+        """replace_all should swap in new contents with fresh indexes."""
+        registry.replace_all(
+            [Entity(entity_id="fan.attic", domain="fan", friendly_name="Attic Fan", area_id="attic")]
+        )
+
+        assert len(registry) == 1
+        assert registry.get("light.living_room") is None
+        assert registry.get_by_domain("light") == []
+        assert [e.entity_id for e in registry.get_by_area("attic")] == ["fan.attic"]
+        assert registry.find_by_name("attic fan") is not None
+
     def test_add_and_get(self, sample_entities: list[Entity]) -> None:
         """Should add and retrieve entities by ID."""
         registry = EntityRegistry()
@@ -310,6 +329,84 @@ class TestEntityRegistry:
         assert "bedroom" in areas
         assert "hallway" in areas
 
+    def test_indexed_search_matches_full_scan(self, registry: EntityRegistry) -> None:
+        """Indexed lookups return exactly what scoring every entity would."""
+        for entity_id, name in [
+            ("switch.office_switch_light", "Office Switch Light"),
+            ("light.office_door_status_light", "Office Door Status Light"),
+            ("light.kitchen", "Kitchen Ceiling"),
+            ("fan.kitchen_fan", "Extractor"),
+            ("light.Porch_Light", "Front Porch"),
+            ("sensor.x", ""),
+        ]:
+            registry.add(
+                Entity(entity_id=entity_id, domain=entity_id.split(".")[0], friendly_name=name)
+            )
+
+        queries = [
+            "office light",
+            "office switch",
+            "kitchen",
+            "kitchen light please",
+            "fan",
+            "light.porch_light",
+            "porch light",
+            "front porch",
+            "extractor fan",
+            "status",
+            "room",
+            "tv",
+            "x",
+            "",
+            "main thermostat",
+            "thermo",
+            "living room lamp",
+            "nothing here",
+        ]
+        for query in queries:
+            expected = [
+                (entity.match_score(query), entity.entity_id)
+                for entity in registry.all()
+                if entity.match_score(query) > 0.0
+            ]
+            expected.sort(key=lambda x: x[0], reverse=True)
+            results = registry.search(query, limit=100)
+            assert [e.entity_id for e in results] == [eid for _, eid in expected], query
+
+            best = max(expected, key=lambda x: x[0], default=(0.0, None))
+            found = registry.find_by_name(query)
+            expected_best = best[1] if best[0] >= 0.5 else None
+            assert (found.entity_id if found else None) == expected_best, query
+
+    def test_index_follows_add_and_remove(self, registry: EntityRegistry) -> None:
+        """Re-adding or removing an entity updates name, domain and area lookups."""
+        registry.add(
+            Entity(
+                entity_id="light.bedroom",
+                domain="light",
+                friendly_name="Guest Lamp",
+                area_id="guest_room",
+            )
+        )
+        assert registry.find_by_name("guest lamp").entity_id == "light.bedroom"
+        assert registry.get_by_area("bedroom") == []
+        assert [e.entity_id for e in registry.search("lamp", area="guest_room")] == [
+            "light.bedroom"
+        ]
+
+        registry.remove("light.bedroom")
+        assert registry.find_by_name("guest lamp") is None
+        assert registry.search("guest") == []
+
+    def test_match_score_tracks_renamed_entity(self) -> None:
+        """Cached name forms are rebuilt when the friendly name changes."""
+        entity = Entity(entity_id="light.a", domain="light", friendly_name="Desk Lamp")
+        assert entity.match_score("desk lamp") == 1.0
+
+        entity.friendly_name = "Reading Lamp"
+        assert entity.match_score("desk") == 0.0
+        assert entity.match_score("reading lamp") == 1.0
+
 
 # =============================================================================
 # HomeAssistantClient Tests
@@ -1074,3 +1171,372 @@ class TestHomeAssistantClientExtended:
         devices = client.get_devices_in_area("living_room")
         assert len(devices) == 2
         assert all(d.area_id == "living_room" for d in devices)
+
+
+# =============================================================================
+# StateMirror Tests
+# =============================================================================
+
+
+def _ha_state(entity_id: str, state: str, last_updated: str = "2026-01-01T00:00:00+00:00") -> dict:
+    return {
+        "entity_id": entity_id,
+        "state": state,
+        "attributes": {},
+        "last_updated": last_updated,
+    }
+
+
+class TestStateMirror:
+    """Tests for the in-memory entity state mirror."""
+
+    def test_load_snapshot(self) -> None:
+        """Snapshot should populate the mirror and mark it fresh."""
+        mirror = StateMirror()
+        assert mirror.is_fresh() is False
+
+        count = mirror.load_snapshot(
+            [_ha_state("light.kitchen", "on"), _ha_state("light.office", "off")], 0
+        )
+
+        assert count == 2
+        assert mirror.get("light.kitchen").is_on
+        assert mirror.is_fresh() is True
+        assert mirror.live is False
+
+    def test_snapshot_goes_stale_without_stream(self) -> None:
+        """Without the event stream the snapshot expires after max_age."""
+        mirror = StateMirror(max_age=0.0)
+        mirror.load_snapshot([_ha_state("light.kitchen", "on")], 0)
+        assert mirror.is_fresh() is False
+
+    def test_live_after_snapshot_with_stream(self) -> None:
+        """Mirror becomes live only once a snapshot follows the subscription."""
+        mirror = StateMirror(max_age=0.0)
+        mirror.stream_connected()
+        assert mirror.live is False
+
+        mirror.load_snapshot([_ha_state("light.kitchen", "on")], 0)
+        assert mirror.live is True
+        assert mirror.is_fresh() is True
+
+        mirror.stream_disconnected()
+        assert mirror.live is False
+
+    def test_apply_event_updates_and_removes(self) -> None:
+        """state_changed events should update and remove entities."""
+        mirror = StateMirror()
+        mirror.load_snapshot([_ha_state("light.kitchen", "off")], 0)
+        version = mirror.version
+
+        changed = mirror.apply_event(
+            "light.kitchen", _ha_state("light.kitchen", "on", "2026-01-01T00:00:05+00:00")
+        )
+        assert changed is True
+        assert mirror.get("light.kitchen").is_on
+        assert mirror.version > version
+
+        assert mirror.apply_event("light.kitchen", None) is True
+        assert "light.kitchen" not in mirror
+
+    def test_older_snapshot_does_not_overwrite_event(self) -> None:
+        """A snapshot requested before an event must not roll it back."""
+        mirror = StateMirror()
+        since = mirror.version
+        mirror.apply_event(
+            "light.kitchen", _ha_state("light.kitchen", "on", "2026-01-01T00:00:05+00:00")
+        )
+        mirror.apply_event("light.new", _ha_state("light.new", "on"))
+
+        mirror.load_snapshot([_ha_state("light.kitchen", "off")], since)
+
+        assert mirror.get("light.kitchen").is_on
+        assert "light.new" in mirror
+
+    def test_snapshot_drops_removed_entities(self) -> None:
+        """Entities absent from a newer snapshot are removed."""
+        mirror = StateMirror()
+        mirror.load_snapshot([_ha_state("light.a", "on"), _ha_state("light.b", "on")], 0)
+        mirror.load_snapshot([_ha_state("light.a", "on")], mirror.version)
+        assert "light.b" not in mirror
+
+    def test_get_many_omits_unknown(self) -> None:
+        """get_many should return only mirrored entities."""
+        mirror = StateMirror()
+        mirror.load_snapshot([_ha_state("light.a", "on")], 0)
+        assert set(mirror.get_many(["light.a", "light.missing"])) == {"light.a"}
+
+    def test_domain_state_index_follows_events(self) -> None:
+        """(domain, state) index should move entities as their state changes."""
+        mirror = StateMirror()
+        mirror.load_snapshot([_ha_state("light.a", "on"), _ha_state("light.b", "off")], 0)
+        assert mirror.with_state("light", "on") == {"light.a"}
+        assert mirror.in_domain("light") == {"light.a", "light.b"}
+
+        mirror.apply_event("light.b", _ha_state("light.b", "ON", "2026-01-01T00:00:05+00:00"))
+        assert mirror.with_state("light", "on") == {"light.a", "light.b"}
+        assert mirror.with_state("light", "off") == set()
+
+        mirror.apply_event("light.a", None)
+        assert mirror.with_state("light", "on") == {"light.b"}
+        assert mirror.in_domain("light") == {"light.b"}
+
+    def test_device_class_and_area_indexes(self) -> None:
+        """device_class comes from state; areas and floors from the registries."""
+        door = _ha_state("binary_sensor.front", "on")
+        door["attributes"] = {"device_class": "door"}
+        mirror = StateMirror()
+        mirror.load_snapshot([door, _ha_state("light.hall", "on")], 0)
+        mirror.assign_areas({"binary_sensor.front": "hall", "light.hall": "hall"})
+        mirror.assign_floors({"hall": "ground"})
+
+        assert mirror.with_device_class("door") == {"binary_sensor.front"}
+        assert mirror.in_area("hall") == {"binary_sensor.front", "light.hall"}
+        assert mirror.in_floor("ground") == {"binary_sensor.front", "light.hall"}
+        assert mirror.in_floor("upstairs") == set()
+
+    def test_name_word_index(self) -> None:
+        """Object-id words index entities until they are removed."""
+        mirror = StateMirror()
+        mirror.load_snapshot(
+            [_ha_state("binary_sensor.front_door", "on"), _ha_state("binary_sensor.outdoor", "on")],
+            0,
+        )
+        assert mirror.named("Door") == {"binary_sensor.front_door"}
+
+        mirror.apply_event(
+            "binary_sensor.front_door",
+            _ha_state("binary_sensor.front_door", "off", "2026-01-01T00:00:05+00:00"),
+        )
+        assert mirror.named("door") == {"binary_sensor.front_door"}
+
+        mirror.apply_event("binary_sensor.front_door", None)
+        assert mirror.named("door") == set()
+
+    def test_battery_index(self) -> None:
+        """Battery sensors and battery_level attributes share one sorted index."""
+        sensor = _ha_state("sensor.remote_battery", "15")
+        phone = _ha_state("device_tracker.phone", "home")
+        phone["attributes"] = {"battery_level": 8}
+        full = _ha_state("sensor.lock_battery", "90")
+        mirror = StateMirror()
+        mirror.load_snapshot([sensor, phone, full, _ha_state("sensor.temp", "21")], 0)
+
+        low = mirror.numeric(NUMERIC_BATTERY).below(20)
+        assert low == [("device_tracker.phone", 8.0), ("sensor.remote_battery", 15.0)]
+
+        mirror.apply_event(
+            "sensor.remote_battery",
+            _ha_state("sensor.remote_battery", "unavailable", "2026-01-01T00:00:05+00:00"),
+        )
+        assert mirror.numeric(NUMERIC_BATTERY).below(20) == [("device_tracker.phone", 8.0)]
+
+
+class TestNumericIndex:
+    """Tests for the sorted numeric index."""
+
+    def test_range_queries(self) -> None:
+        """below/at_least should split at the threshold."""
+        index = NumericIndex()
+        index.set("a", 10.0)
+        index.set("b", 20.0)
+        index.set("c", 30.0)
+
+        assert index.below(20.0) == [("a", 10.0)]
+        assert index.at_least(20.0) == [("b", 20.0), ("c", 30.0)]
+
+    def test_update_and_remove(self) -> None:
+        """Re-setting a value should move the entry; None removes it."""
+        index = NumericIndex()
+        index.set("a", 10.0)
+        index.set("a", 40.0)
+        assert index.below(20.0) == []
+        assert index.get("a") == 40.0
+
+        index.set("a", None)
+        assert len(index) == 0
+
+
+class TestHomeAssistantClientStates:
+    """Tests for state reads served from the mirror."""
+
+    @pytest.fixture
+    def client(self) -> HomeAssistantClient:
+        """Create a HomeAssistantClient instance."""
+        return HomeAssistantClient(
+            url="http://homeassistant.local:8123",
+            token="test_token",
+        )
+
+    async def test_get_states_uses_one_bulk_request(self, client: HomeAssistantClient) -> None:
+        """get_states should snapshot /api/states once, not GET each entity."""
+        mock_response = MagicMock()
+        mock_response.json.return_value = [
+            _ha_state("light.a", "on"),
+            _ha_state("light.b", "off"),
+        ]
+        mock_response.raise_for_status = MagicMock()
+        mock_client = AsyncMock()
+        mock_client.get = AsyncMock(return_value=mock_response)
+        client._client = mock_client
+
+        states = await client.get_states(["light.a", "light.b"])
+        again = await client.get_states(["light.a"])
+
+        assert states["light.a"].is_on
+        assert states["light.b"].is_off
+        assert "light.a" in again
+        mock_client.get.assert_awaited_once_with("/api/states")
+
+    async def test_get_state_served_from_live_mirror(self, client: HomeAssistantClient) -> None:
+        """get_state should not hit REST while the mirror is live."""
+        mock_client = AsyncMock()
+        client._client = mock_client
+        client.state_mirror.stream_connected()
+        client.state_mirror.load_snapshot([_ha_state("light.a", "on")], 0)
+
+        await client._handle_state_change(
+            {
+                "entity_id": "light.a",
+                "old_state": _ha_state("light.a", "on"),
+                "new_state": _ha_state("light.a", "off", "2026-01-01T00:01:00+00:00"),
+            }
+        )
+        state = await client.get_state("light.a")
+
+        assert state is not None
+        assert state.is_off
+        mock_client.get.assert_not_called()
+
+
+# =============================================================================
+# Registry Sync Tests
+# =============================================================================
+
+
+class TestRegistrySync:
+    """Tests for applying *_registry_updated events in place."""
+
+    @pytest.fixture
+    def updates(self) -> list[RegistryUpdate]:
+        """Registry updates seen by the client's callback."""
+        return []
+
+    @pytest.fixture
+    def client(self, updates: list[RegistryUpdate]) -> HomeAssistantClient:
+        """Client with one known entity and a recording registry callback."""
+        client = HomeAssistantClient(url="http://homeassistant.local:8123", token="test_token")
+        client._entity_registry.add(
+            Entity(
+                entity_id="light.kitchen",
+                domain="light",
+                friendly_name="Kitchen Light",
+                device_class=None,
+                state=EntityState(state="on"),
+            )
+        )
+        client.add_registry_callback(updates.append)
+        return client
+
+    async def test_entity_update_applied_in_place(
+        self, client: HomeAssistantClient, updates: list[RegistryUpdate]
+    ) -> None:
+        """An entity update re-fetches only that entry and keeps its state."""
+        entry = {"entity_id": "light.kitchen", "name": None, "area_id": "kitchen"}
+        client._ws_session.command = AsyncMock(return_value=entry)
+
+        await client._apply_registry_event(
+            "entity", {"action": "update", "entity_id": "light.kitchen"}
+        )
+
+        client._ws_session.command.assert_awaited_once_with(
+            "config/entity_registry/get", entity_id="light.kitchen"
+        )
+        entity = client._entity_registry.get("light.kitchen")
+        assert entity is not None
+        assert entity.area_id == "kitchen"
+        assert entity.friendly_name == "Kitchen Light"
+        assert entity.state is not None and entity.state.is_on
+        assert client.state_mirror.area_of("light.kitchen") == "kitchen"
+        assert updates[-1].entry == entry
+
+    async def test_entity_rename(self, client: HomeAssistantClient) -> None:
+        """A renamed entity replaces its old entity_id."""
+        client._ws_session.command = AsyncMock(
+            return_value={"entity_id": "light.cooker", "name": "Cooker Light"}
+        )
+
+        await client._apply_registry_event(
+            "entity",
+            {"action": "update", "entity_id": "light.cooker", "old_entity_id": "light.kitchen"},
+        )
+
+        assert client._entity_registry.get("light.kitchen") is None
+        assert client._entity_registry.get("light.cooker").friendly_name == "Cooker Light"
+
+    async def test_entity_remove(
+        self, client: HomeAssistantClient, updates: list[RegistryUpdate]
+    ) -> None:
+        """Removal needs no command and notifies callbacks."""
+        client._ws_session.command = AsyncMock()
+
+        await client._apply_registry_event(
+            "entity", {"action": "remove", "entity_id": "light.kitchen"}
+        )
+
+        assert client._entity_registry.get("light.kitchen") is None
+        client._ws_session.command.assert_not_called()
+        assert updates == [RegistryUpdate("entity", "remove", "light.kitchen")]
+
+    async def test_area_remove(self, client: HomeAssistantClient) -> None:
+        """Area removal drops just that area."""
+        client._areas = {
+            "kitchen": Area(id="kitchen", name="Kitchen"),
+            "office": Area(id="office", name="Office"),
+        }
+
+        await client._apply_registry_event("area", {"action": "remove", "area_id": "kitchen"})
+
+        assert list(client.areas) == ["office"]
+
+    def test_context_applies_entity_delta(self) -> None:
+        """HAContextService upserts and removes metadata from updates."""
+        from barnabeenet.services.homeassistant.context import HAContextService
+
+        service = HAContextService(ha_client=MagicMock())
+        service._on_registry_update(
+            RegistryUpdate(
+                "entity",
+                "create",
+                "fan.attic",
+                entry={"entity_id": "fan.attic", "name": "Attic Fan", "aliases": ["Roof Fan"]},
+            )
+        )
+        assert service.get_entity_metadata("fan.attic").friendly_name == "Attic Fan"
+        assert [m.entity_id for m in service.find_entities_by_name("roof fan")] == ["fan.attic"]
+
+        service._on_registry_update(RegistryUpdate("entity", "remove", "fan.attic"))
+        assert service.get_entity_metadata("fan.attic") is None
+
+    async def test_failed_resync_is_retried(
+        self, client: HomeAssistantClient, updates: list[RegistryUpdate]
+    ) -> None:
+        """A resync whose registry commands fail is re-armed, not announced."""
+        states_response = MagicMock()
+        states_response.json.return_value = [{"entity_id": "light.kitchen", "state": "off"}]
+        states_response.raise_for_status = MagicMock()
+        not_found = MagicMock()
+        not_found.status_code = 404
+        client._client = AsyncMock()
+        client._client.get = AsyncMock(
+            side_effect=lambda path: states_response if path == "/api/states" else not_found
+        )
+        client._ws_command = AsyncMock(return_value=None)
+
+        client._schedule_registry_task(client._resync_registries())
+        await asyncio.gather(*client._registry_tasks)
+
+        assert client._registry_tasks == set()
+        assert client._registry_resync_needed
+        assert updates == []
+        assert client._entity_registry.get("light.kitchen").friendly_name == "Kitchen Light"
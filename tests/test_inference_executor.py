@@ -0,0 +1,130 @@
+"""Tests for the off-event-loop inference executor."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from barnabeenet.services.inference_executor import (
+    InferenceBusyError,
+    InferenceExecutor,
+)
+
+
+@pytest.fixture
+def executor() -> InferenceExecutor:
+    """Create an executor with a small test lane."""
+    executor = InferenceExecutor()
+    executor.add_lane("test", workers=1, max_pending=2)
+    yield executor
+    executor.shutdown()
+
+
+class TestInferenceExecutor:
+    """Tests for InferenceExecutor."""
+
+    def test_default_lanes(self) -> None:
+        """STT, TTS and embedding lanes are configured from settings."""
+        executor = InferenceExecutor()
+        status = executor.get_status()
+        assert set(status) == {"stt", "tts", "embedding"}
+        assert status["stt"]["workers"] >= 1
+
+    @pytest.mark.asyncio
+    async def test_run_off_event_loop(self, executor: InferenceExecutor) -> None:
+        """Calls run on a worker thread and return their result."""
+        loop_thread = threading.get_ident()
+
+        def work(a: int, b: int = 0) -> tuple[int, int]:
+            return a + b, threading.get_ident()
+
+        value, thread = await executor.run("test", work, 2, b=3)
+
+        assert value == 5
+        assert thread != loop_thread
+        assert executor.get_status()["test"]["completed"] == 1
+        assert executor.get_status()["test"]["pending"] == 0
+
+    @pytest.mark.asyncio
+    async def test_event_loop_stays_responsive(self, executor: InferenceExecutor) -> None:
+        """Blocking inference does not stall other coroutines."""
+        ticks = 0
+
+        async def ticker() -> None:
+            nonlocal ticks
+            for _ in range(5):
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        await asyncio.gather(executor.run("test", time.sleep, 0.1), ticker())
+
+        assert ticks == 5
+
+    @pytest.mark.asyncio
+    async def test_concurrency_cap(self, executor: InferenceExecutor) -> None:
+        """A one-worker lane runs calls one at a time and records queue wait."""
+        active = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def work() -> None:
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.05)
+            with lock:
+                active -= 1
+
+        await asyncio.gather(executor.run("test", work), executor.run("test", work))
+
+        assert peak == 1
+        assert executor.get_status()["test"]["avg_wait_ms"] > 0
+
+    @pytest.mark.asyncio
+    async def test_backpressure_rejects_when_full(self, executor: InferenceExecutor) -> None:
+        """Work beyond max_pending is rejected instead of queued."""
+        release = threading.Event()
+        running = [asyncio.ensure_future(executor.run("test", release.wait)) for _ in range(2)]
+        await asyncio.sleep(0)
+
+        with pytest.raises(InferenceBusyError) as exc_info:
+            await executor.run("test", lambda: None)
+
+        assert exc_info.value.lane == "test"
+        assert executor.get_status()["test"]["rejected"] == 1
+
+        release.set()
+        await asyncio.gather(*running)
+        assert await executor.run("test", lambda: "ok") == "ok"
+
+    @pytest.mark.asyncio
+    async def test_exception_propagates_and_releases_slot(
+        self, executor: InferenceExecutor
+    ) -> None:
+        """Errors from the model call reach the caller and free the slot."""
+
+        def fail() -> None:
+            raise ValueError("bad audio")
+
+        with pytest.raises(ValueError, match="bad audio"):
+            await executor.run("test", fail)
+
+        assert executor.get_status()["test"]["pending"] == 0
+
+    @pytest.mark.asyncio
+    async def test_unknown_lane(self, executor: InferenceExecutor) -> None:
+        """Unknown lanes raise KeyError."""
+        with pytest.raises(KeyError):
+            await executor.run("nope", lambda: None)
+
+    @pytest.mark.asyncio
+    async def test_usable_after_shutdown(self, executor: InferenceExecutor) -> None:
+        """Lanes restart their thread pool after shutdown."""
+        await executor.run("test", lambda: None)
+        executor.shutdown()
+
+        assert await executor.run("test", lambda: 42) == 42
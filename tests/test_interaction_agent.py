@@ -10,7 +10,7 @@ from barnabeenet.agents.interaction import (
     InteractionAgent,
     InteractionConfig,
 )
-from barnabeenet.services.llm.openrouter import ChatResponse
+from barnabeenet.services.llm.openrouter import ChatResponse, ChatStreamChunk
 
 
 @pytest.fixture
@@ -271,6 +271,65 @@ class TestChildMode:
         assert len(truncated.split()) <= initialized_agent.config.child_mode_max_words + 5
 
 
+class TestStreaming:
+    """Test streaming partial replies to a callback."""
+
+    @staticmethod
+    def _stream_client(mock_llm_client: MagicMock, response: ChatResponse) -> list[dict]:
+        calls: list[dict] = []
+
+        async def chat_stream(**kwargs):
+            calls.append(kwargs)
+            for piece in ["Hello! ", "How can I help you today?"]:
+                yield ChatStreamChunk(text=piece)
+            yield ChatStreamChunk(response=response)
+
+        mock_llm_client.chat_stream = chat_stream
+        return calls
+
+    @pytest.mark.asyncio
+    async def test_partial_text_streamed_to_callback(
+        self,
+        initialized_agent: InteractionAgent,
+        mock_llm_client: MagicMock,
+        mock_llm_response: ChatResponse,
+    ) -> None:
+        """With on_partial_text set, deltas reach the callback as they arrive."""
+        calls = self._stream_client(mock_llm_client, mock_llm_response)
+        partials: list[str] = []
+
+        async def on_partial_text(delta: str) -> None:
+            partials.append(delta)
+
+        result = await initialized_agent.handle_input(
+            "Hello", {"speaker": "thom", "on_partial_text": on_partial_text}
+        )
+
+        assert partials == ["Hello! ", "How can I help you today?"]
+        assert result["response"] == mock_llm_response.text
+        assert calls[0]["agent_type"] == "interaction"
+        mock_llm_client.chat.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_child_mode_not_streamed(
+        self,
+        initialized_agent: InteractionAgent,
+        mock_llm_client: MagicMock,
+        mock_llm_response: ChatResponse,
+    ) -> None:
+        """Child-mode replies are truncated after generation, so they are not streamed."""
+        calls = self._stream_client(mock_llm_client, mock_llm_response)
+        on_partial_text = AsyncMock()
+
+        await initialized_agent.handle_input(
+            "Hello", {"speaker": "penelope", "on_partial_text": on_partial_text}
+        )
+
+        assert calls == []
+        on_partial_text.assert_not_called()
+        mock_llm_client.chat.assert_called_once()
+
+
 class TestFallbackMode:
     """Test fallback responses when LLM unavailable."""
 
@@ -8,7 +8,7 @@ from unittest.mock import MagicMock, patch
 import numpy as np
 import pytest
 
-from barnabeenet.services.tts.kokoro_tts import KokoroTTS
+from barnabeenet.services.tts.kokoro_tts import KokoroTTS, pcm_to_wav
 
 
 @pytest.fixture
@@ -250,3 +250,60 @@ class TestKokoroTTS:
         # Can decode base64 back to same bytes
         decoded = base64.b64decode(result["audio_base64"])
         assert decoded == result["audio_bytes"]
+
+    @pytest.mark.asyncio
+    async def test_synthesize_stream_yields_per_sentence(self, tts_service: KokoroTTS) -> None:
+        """Test streaming synthesis yields one PCM chunk per sentence."""
+        mock_pipeline = MagicMock()
+        mock_pipeline.side_effect = lambda text, voice, speed: iter(
+            [("g", "p", np.full(2400, 0.5, dtype=np.float32))]
+        )
+
+        tts_service._pipeline = mock_pipeline
+        tts_service._initialized = True
+
+        chunks = [c async for c in tts_service.synthesize_stream("Hello there. How are you?")]
+
+        assert [c.text for c in chunks] == ["Hello there.", "How are you?"]
+        assert [c.index for c in chunks] == [0, 1]
+        assert mock_pipeline.call_count == 2
+        first = chunks[0]
+        assert first.sample_rate == 24000
+        assert len(first.pcm) == 2400 * 2  # 16-bit mono
+        assert first.duration_ms == pytest.approx(100.0)
+        assert np.frombuffer(first.pcm, dtype="<i2")[0] == int(0.5 * 32767)
+
+    @pytest.mark.asyncio
+    async def test_synthesize_stream_skips_empty_sentences(self, tts_service: KokoroTTS) -> None:
+        """Test sentences that render no audio are skipped without gaps in indices."""
+        outputs = iter([[], [("g", "p", np.zeros(240, dtype=np.float32))]])
+        mock_pipeline = MagicMock()
+        mock_pipeline.side_effect = lambda text, voice, speed: iter(next(outputs))
+
+        tts_service._pipeline = mock_pipeline
+        tts_service._initialized = True
+
+        chunks = [c async for c in tts_service.synthesize_stream("Hmm. Done.")]
+
+        assert [(c.index, c.text) for c in chunks] == [(0, "Done.")]
+
+    @pytest.mark.asyncio
+    async def test_synthesize_stream_from_incremental_text(self, tts_service: KokoroTTS) -> None:
+        """Test text arriving in pieces is rendered once each sentence completes."""
+        mock_pipeline = MagicMock()
+        mock_pipeline.side_effect = lambda text, voice, speed: iter(
+            [("g", "p", np.zeros(240, dtype=np.float32))]
+        )
+
+        tts_service._pipeline = mock_pipeline
+        tts_service._initialized = True
+
+        async def deltas():
+            for piece in ["Hel", "lo there. How ", "are you?"]:
+                yield piece
+
+        chunks = [c async for c in tts_service.synthesize_stream(deltas())]
+
+        assert [c.text for c in chunks] == ["Hello there.", "How are you?"]
+        wav = pcm_to_wav(b"".join(c.pcm for c in chunks), 24000)
+        assert wav[:4] == b"RIFF"
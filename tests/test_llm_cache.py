@@ -0,0 +1,171 @@
+"""Tests for the semantic LLM response cache."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+
+import numpy as np
+import pytest
+
+from barnabeenet.services.llm import cache as cache_module
+from barnabeenet.services.llm.cache import LLMCacheEntry, LLMResponseCache
+
+
+class FakeEmbeddingService:
+    """Maps each query text to a fixed normalized vector."""
+
+    def __init__(self, vectors: dict[str, list[float]]) -> None:
+        self.vectors = vectors
+        self.calls = 0
+
+    async def init(self) -> None:
+        pass
+
+    async def embed(self, text: str) -> np.ndarray:
+        self.calls += 1
+        vector = np.asarray(self.vectors[text], dtype=np.float32)
+        return vector / np.linalg.norm(vector)
+
+
+VECTORS = {
+    "what time is it": [1.0, 0.0, 0.0],
+    "What time is it ": [1.0, 0.0, 0.0],
+    "what's the time": [0.99, 0.05, 0.0],
+    "tell me a joke": [0.0, 1.0, 0.0],
+    "sing a song": [0.0, 0.0, 1.0],
+}
+
+
+@pytest.fixture
+async def llm_cache() -> LLMResponseCache:
+    cache = LLMResponseCache(embedding_service=FakeEmbeddingService(VECTORS))
+    await cache.init()
+    return cache
+
+
+async def _store(cache: LLMResponseCache, query: str, temperature: float = 0.7) -> None:
+    await cache.set(
+        query_text=query,
+        response_text=f"answer to {query}",
+        agent_type="interaction",
+        model="test/model",
+        temperature=temperature,
+        input_tokens=10,
+        output_tokens=5,
+        cost_usd=0.001,
+    )
+
+
+async def _lookup(
+    cache: LLMResponseCache, query: str, temperature: float = 0.7
+) -> LLMCacheEntry | None:
+    return await cache.get(query, "interaction", "test/model", temperature)
+
+
+class TestLLMResponseCache:
+    """Tests for LLMResponseCache."""
+
+    async def test_similar_query_hits(self, llm_cache: LLMResponseCache) -> None:
+        """A semantically similar query returns the cached response."""
+        await _store(llm_cache, "what time is it")
+
+        entry = await _lookup(llm_cache, "what's the time")
+
+        assert entry is not None
+        assert entry.response_text == "answer to what time is it"
+        assert entry.hit_count == 1
+
+    async def test_exact_match_skips_embedding(self, llm_cache: LLMResponseCache) -> None:
+        """Repeated text (ignoring case and spacing) is served without embedding."""
+        await _store(llm_cache, "what time is it")
+        embedder = llm_cache._embedding_service
+        calls = embedder.calls
+
+        entry = await _lookup(llm_cache, "What time is it ")
+
+        assert entry is not None
+        assert embedder.calls == calls
+        assert llm_cache.get_stats()["exact_hits"] == 1
+
+    async def test_empty_partition_skips_embedding(self, llm_cache: LLMResponseCache) -> None:
+        assert await _lookup(llm_cache, "what time is it") is None
+        assert llm_cache._embedding_service.calls == 0
+
+    async def test_dissimilar_query_misses(self, llm_cache: LLMResponseCache) -> None:
+        await _store(llm_cache, "what time is it")
+        assert await _lookup(llm_cache, "tell me a joke") is None
+
+    async def test_partitions_by_temperature(self, llm_cache: LLMResponseCache) -> None:
+        """Entries are only matched within the same agent/model/temperature."""
+        await _store(llm_cache, "what time is it", temperature=0.7)
+        assert await _lookup(llm_cache, "what time is it", temperature=0.2) is None
+
+    async def test_expired_entry_misses(self, llm_cache: LLMResponseCache) -> None:
+        await _store(llm_cache, "what time is it")
+        partition = next(iter(llm_cache._partitions.values()))
+        for entry in partition.entries.values():
+            entry.expires_at = datetime.now(UTC) - timedelta(seconds=1)
+
+        assert await _lookup(llm_cache, "what time is it") is None
+        assert len(partition) == 0
+
+    async def test_eviction_enforces_limit(
+        self, llm_cache: LLMResponseCache, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A full partition evicts the least-hit of its least-recent entries."""
+        monkeypatch.setattr(cache_module, "EVICTION_SAMPLE_SIZE", 2)
+        llm_cache._max_entries = 2
+        await _store(llm_cache, "what time is it")
+        await _store(llm_cache, "tell me a joke")
+        # "what time is it" is older but has been hit, so the joke goes
+        assert await _lookup(llm_cache, "what time is it") is not None
+        await _lookup(llm_cache, "what time is it")
+        await _store(llm_cache, "sing a song")
+
+        assert llm_cache.get_stats()["entries"] == 2
+        assert llm_cache.get_stats()["evictions"] == 1
+        assert await _lookup(llm_cache, "tell me a joke") is None
+        assert await _lookup(llm_cache, "what time is it") is not None
+
+    async def test_stats(self, llm_cache: LLMResponseCache) -> None:
+        await _store(llm_cache, "what time is it")
+        await _lookup(llm_cache, "what time is it")
+        await _lookup(llm_cache, "tell me a joke")
+
+        stats = llm_cache.get_stats()
+
+        assert stats["backend"] == "memory"
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["hit_rate"] == 0.5
+        assert stats["partitions"] == 1
+
+    async def test_clear_by_agent_type(self, llm_cache: LLMResponseCache) -> None:
+        await _store(llm_cache, "what time is it")
+        await llm_cache.clear("interaction")
+        assert await _lookup(llm_cache, "what time is it") is None
+
+
+class TestLLMCacheEntry:
+    """Tests for LLMCacheEntry serialization."""
+
+    def test_to_dict_omits_embedding(self) -> None:
+        entry = LLMCacheEntry("hi", "m", 1, 2, 0.0, np.ones(3, dtype=np.float32))
+        data = entry.to_dict()
+
+        assert "embedding" not in data
+        restored = LLMCacheEntry.from_dict(data, np.ones(3, dtype=np.float32))
+        assert restored.response_text == "hi"
+
+    def test_from_dict_reads_legacy_json_embedding(self) -> None:
+        data = LLMCacheEntry("hi", "m", 1, 2, 0.0, np.ones(3, dtype=np.float32)).to_dict()
+        data["embedding"] = [1.0, 0.0, 0.0]
+
+        restored = LLMCacheEntry.from_dict(data)
+        assert restored.embedding.dtype == np.float32
+
+    def test_partition_key_from_cache_key_with_colon_in_model(self) -> None:
+        key = LLMResponseCache._partition_key_from_cache_key(
+            "meta:vendor/model:free:0.3:abcdef0123456789"
+        )
+        assert key == ("meta", "vendor/model:free", "0.3")
@@ -0,0 +1,134 @@
+"""Tests for streamed LLM response parsing."""
+
+from __future__ import annotations
+
+import json
+
+import httpx
+import pytest
+
+from barnabeenet.services.llm.streaming import (
+    StreamResult,
+    stream_anthropic_messages,
+    stream_ollama_chat,
+    stream_openai_chat,
+)
+
+
+def _client(body: str, captured: list[dict] | None = None) -> httpx.AsyncClient:
+    """HTTP client whose every request returns ``body``."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if captured is not None:
+            captured.append(json.loads(request.content))
+        return httpx.Response(200, content=body.encode())
+
+    return httpx.AsyncClient(base_url="http://test", transport=httpx.MockTransport(handler))
+
+
+def _sse(*events: dict | str) -> str:
+    return "".join(
+        f"data: {event if isinstance(event, str) else json.dumps(event)}\n\n" for event in events
+    )
+
+
+class TestOpenAIStream:
+    """Tests for OpenAI-compatible SSE streams."""
+
+    @pytest.mark.asyncio
+    async def test_yields_deltas_and_usage(self) -> None:
+        """Content deltas are yielded; usage and finish reason are collected."""
+        body = ": OPENROUTER PROCESSING\n\n" + _sse(
+            {"model": "m", "choices": [{"delta": {"role": "assistant"}}]},
+            {"choices": [{"delta": {"content": "Hello"}}]},
+            {"choices": [{"delta": {"content": " there."}, "finish_reason": "stop"}]},
+            {"choices": [], "usage": {"prompt_tokens": 12, "completion_tokens": 3}},
+            "[DONE]",
+        )
+        captured: list[dict] = []
+        result = StreamResult()
+
+        async with _client(body, captured) as client:
+            deltas = [
+                d
+                async for d in stream_openai_chat(
+                    client, "/chat/completions", {"model": "m"}, result
+                )
+            ]
+
+        assert deltas == ["Hello", " there."]
+        assert result.text == "Hello there."
+        assert result.model == "m"
+        assert result.finish_reason == "stop"
+        assert (result.input_tokens, result.output_tokens) == (12, 3)
+        assert result.first_token_ms is not None
+        assert captured[0]["stream"] is True
+
+    @pytest.mark.asyncio
+    async def test_error_event_raises(self) -> None:
+        """An error event mid-stream raises."""
+        body = _sse({"choices": [{"delta": {"content": "Hi"}}]}, {"error": {"message": "boom"}})
+
+        async with _client(body) as client:
+            with pytest.raises(RuntimeError, match="boom"):
+                async for _ in stream_openai_chat(client, "/chat/completions", {}, StreamResult()):
+                    pass
+
+
+class TestAnthropicStream:
+    """Tests for Anthropic Messages SSE streams."""
+
+    @pytest.mark.asyncio
+    async def test_yields_text_deltas(self) -> None:
+        """Text deltas are yielded and token counts read from start/delta events."""
+        body = "event: message_start\n" + _sse(
+            {"type": "message_start", "message": {"model": "claude", "usage": {"input_tokens": 9}}},
+            {"type": "content_block_start", "index": 0},
+            {"type": "content_block_delta", "delta": {"type": "text_delta", "text": "Hi"}},
+            {"type": "ping"},
+            {"type": "content_block_delta", "delta": {"type": "text_delta", "text": "!"}},
+            {
+                "type": "message_delta",
+                "delta": {"stop_reason": "end_turn"},
+                "usage": {"output_tokens": 2},
+            },
+            {"type": "message_stop"},
+        )
+        result = StreamResult()
+
+        async with _client(body) as client:
+            deltas = [d async for d in stream_anthropic_messages(client, {}, result)]
+
+        assert deltas == ["Hi", "!"]
+        assert result.model == "claude"
+        assert result.finish_reason == "end_turn"
+        assert (result.input_tokens, result.output_tokens) == (9, 2)
+
+
+class TestOllamaStream:
+    """Tests for Ollama NDJSON streams."""
+
+    @pytest.mark.asyncio
+    async def test_yields_content(self) -> None:
+        """Each line's message content is yielded; the done line carries counts."""
+        lines = [
+            {"model": "llama", "message": {"content": "Good"}, "done": False},
+            {"model": "llama", "message": {"content": " day"}, "done": False},
+            {
+                "model": "llama",
+                "message": {"content": ""},
+                "done": True,
+                "done_reason": "stop",
+                "prompt_eval_count": 7,
+                "eval_count": 2,
+            },
+        ]
+        body = "\n".join(json.dumps(line) for line in lines) + "\n"
+        result = StreamResult()
+
+        async with _client(body) as client:
+            deltas = [d async for d in stream_ollama_chat(client, {}, result)]
+
+        assert deltas == ["Good", " day"]
+        assert result.finish_reason == "stop"
+        assert (result.input_tokens, result.output_tokens) == (7, 2)
@@ -7,6 +7,7 @@ Tests the pattern matching diagnostics including:
 """
 
 import re
+import threading
 
 import pytest
 
@@ -336,3 +337,91 @@ class TestPatternSuggestions:
         assert len(suggestions) > 0
         # Should suggest a pattern with 'remember'
         assert any("remember" in s.lower() for s in suggestions)
+
+
+class TestBackgroundDiagnostics:
+    """Test background (non-blocking) diagnostics mode."""
+
+    PATTERNS = {
+        "action": [(re.compile(r"^turn\s+(on|off)\s+(the\s+)?(.+)$", re.IGNORECASE), "device")],
+    }
+    PRIORITY = [("action", "ACTION", 0.90)]
+
+    @pytest.fixture
+    def diagnostics_service(self) -> LogicDiagnosticsService:
+        return LogicDiagnosticsService()
+
+    async def test_misses_diagnosed_in_background(self):
+        """Test that a miss is queued, not diagnosed inline."""
+        service = LogicDiagnosticsService(hit_sample_rate=0.0)
+
+        queued = service.submit("trun on the light", self.PATTERNS, self.PRIORITY, matched=False)
+        assert queued is True
+        assert service.get_recent_failures() == []
+
+        await service.drain()
+
+        failures = service.get_recent_failures()
+        assert len(failures) == 1
+        assert failures[0].all_checks[0].failure_reason == MatchFailureReason.TYPO
+        stats = service.get_background_stats()
+        assert stats["completed"] == 1
+        assert stats["worker_time_ms"] > 0
+        assert stats["est_latency_saved_ms"] == pytest.approx(
+            max(0.0, stats["avg_diagnosis_ms"] - stats["avg_submit_ms"])
+        )
+        await service.shutdown()
+
+    async def test_hits_sampled(self):
+        """Test that hits are only diagnosed at the sample rate."""
+        service = LogicDiagnosticsService(hit_sample_rate=0.0)
+        assert not service.submit("turn on the light", self.PATTERNS, self.PRIORITY, matched=True)
+
+        service.configure_background(hit_sample_rate=1.0)
+        assert service.submit("turn on the light", self.PATTERNS, self.PRIORITY, matched=True)
+        await service.drain()
+
+        stats = service.get_background_stats()
+        assert stats["sampled_out"] == 1
+        assert stats["completed"] == 1
+        assert service.get_stats()["pattern_match_rate"] == 1.0
+        await service.shutdown()
+
+    async def test_diagnosis_runs_off_the_event_loop(self, monkeypatch):
+        """Test that the worker runs diagnoses in a thread, not on the loop."""
+        service = LogicDiagnosticsService()
+        diagnose = service._diagnose
+        threads: list[threading.Thread] = []
+
+        def record_thread(*args):
+            threads.append(threading.current_thread())
+            return diagnose(*args)
+
+        monkeypatch.setattr(service, "_diagnose", record_thread)
+        service.submit("trun on the light", self.PATTERNS, self.PRIORITY, matched=False)
+        await service.drain()
+
+        assert threads and threads[0] is not threading.main_thread()
+        assert len(service.get_recent_failures()) == 1
+        await service.shutdown()
+
+    async def test_queue_bounded(self):
+        """Test that diagnoses beyond max_pending are dropped."""
+        service = LogicDiagnosticsService(max_pending=1)
+
+        assert service.submit("a", self.PATTERNS, self.PRIORITY, matched=False)
+        assert not service.submit("b", self.PATTERNS, self.PRIORITY, matched=False)
+
+        assert service.get_background_stats()["dropped"] == 1
+        await service.shutdown()
+
+    def test_skeleton_reused(self, diagnostics_service: LogicDiagnosticsService):
+        """Test that pattern skeletons are built once and similarity is unchanged."""
+        pattern = re.compile(r"^turn on the light$", re.IGNORECASE)
+
+        first = diagnostics_service._calculate_similarity("turn on the light", pattern)
+        second = diagnostics_service._calculate_similarity("open the door", pattern)
+
+        assert first > 0.9
+        assert second < first
+        assert len(diagnostics_service._skeletons) == 1
@@ -377,6 +377,32 @@ class TestMemoryRetrieval:
         # Should have called update_memory_access for each retrieval
         assert mock_storage.update_memory_access.call_count >= 2
 
+    @pytest.mark.asyncio
+    async def test_retrieve_with_query_set_uses_batched_search(
+        self, initialized_agent: MemoryAgent, mock_storage
+    ) -> None:
+        """A MetaAgent query set is searched in one batched, weighted call."""
+        from barnabeenet.agents.meta import MemoryQuerySet
+
+        mock_storage.search_memories_multi = AsyncMock(return_value=[])
+        mock_storage.search_memories.reset_mock()
+
+        await initialized_agent.handle_input(
+            "ignored",
+            {
+                "operation": MemoryOperation.RETRIEVE,
+                "memory_queries": MemoryQuerySet(
+                    primary_query="coffee",
+                    secondary_queries=["morning routine", "coffee"],
+                ),
+            },
+        )
+
+        mock_storage.search_memories.assert_not_called()
+        kwargs = mock_storage.search_memories_multi.call_args.kwargs
+        assert kwargs["queries"] == ["coffee", "morning routine"]
+        assert kwargs["weights"] == [1.0, initialized_agent.config.secondary_query_weight]
+
 
 class TestMemoryGeneration:
     """Test memory generation from events."""
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import json
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import numpy as np
@@ -9,7 +10,10 @@ import pytest
 
 from barnabeenet.services.memory.embedding import (
     EMBEDDING_DIM,
+    EmbeddingMemo,
     EmbeddingService,
+    embedding_request_scope,
+    get_embedding_memo,
     get_embedding_service,
 )
 from barnabeenet.services.memory.storage import (
@@ -18,6 +22,86 @@ from barnabeenet.services.memory.storage import (
     StoredMemory,
     get_memory_storage,
 )
+from barnabeenet.services.memory.vector_index import MemoryVectorIndex
+
+
+@pytest.fixture(autouse=True)
+def clear_embedding_memo():
+    """Keep memoized embeddings from leaking between tests."""
+    get_embedding_memo().clear()
+    yield
+    get_embedding_memo().clear()
+
+
+class FakeRedis:
+    """In-memory stand-in for the Redis commands MemoryStorage uses."""
+
+    def __init__(self) -> None:
+        self.values: dict[str, bytes] = {}
+        self.zsets: dict[str, dict[str, float]] = {}
+        self.sets: dict[str, set[str]] = {}
+        self.zrange_calls = 0
+
+    @staticmethod
+    def _bytes(value: bytes | str | int) -> bytes:
+        return value if isinstance(value, bytes) else str(value).encode()
+
+    async def ping(self) -> bool:
+        return True
+
+    async def get(self, key: str) -> bytes | None:
+        return self.values.get(key)
+
+    async def set(self, key: str, value: bytes | str) -> None:
+        self.values[key] = self._bytes(value)
+
+    async def setex(self, key: str, ttl: int, value: bytes | str) -> None:
+        self.values[key] = self._bytes(value)
+
+    async def mget(self, keys: list[str]) -> list[bytes | None]:
+        return [self.values.get(k) for k in keys]
+
+    async def delete(self, *keys: str) -> int:
+        return sum(self.values.pop(k, None) is not None for k in keys)
+
+    async def incr(self, key: str) -> int:
+        value = int(self.values.get(key, b"0")) + 1
+        self.values[key] = self._bytes(value)
+        return value
+
+    async def zadd(self, key: str, mapping: dict[str, float]) -> None:
+        self.zsets.setdefault(key, {}).update(mapping)
+
+    async def zrem(self, key: str, member: str) -> None:
+        self.zsets.get(key, {}).pop(member, None)
+
+    async def zrange(self, key: str, start: int, end: int) -> list[bytes]:
+        self.zrange_calls += 1
+        return [m.encode() for m in self.zsets.get(key, {})]
+
+    async def sadd(self, key: str, member: str) -> None:
+        self.sets.setdefault(key, set()).add(member)
+
+    async def srem(self, key: str, member: str) -> None:
+        self.sets.get(key, set()).discard(member)
+
+    def pipeline(self) -> FakePipeline:
+        return FakePipeline(self)
+
+
+class FakePipeline:
+    """Queues FakeRedis calls and runs them on execute()."""
+
+    def __init__(self, redis_client: FakeRedis) -> None:
+        self._redis = redis_client
+        self._calls: list[tuple[str, tuple]] = []
+
+    def __getattr__(self, name: str):
+        return lambda *args: self._calls.append((name, args))
+
+    async def execute(self) -> list:
+        return [await getattr(self._redis, name)(*args) for name, args in self._calls]
+
 
 # ============================================================================
 # EmbeddingService Tests
@@ -140,6 +224,86 @@ class TestEmbeddingService:
 
             assert not service.is_available()
 
+    @pytest.mark.asyncio
+    async def test_embed_is_memoized_by_normalized_text(self, mock_model):
+        """Repeated text (ignoring case and spacing) should not re-run the model."""
+        with patch.dict(
+            "sys.modules",
+            {
+                "sentence_transformers": MagicMock(
+                    SentenceTransformer=MagicMock(return_value=mock_model)
+                )
+            },
+        ):
+            service = EmbeddingService(memo=EmbeddingMemo())
+            await service.init()
+
+            first = await service.embed("Turn on the lights")
+            second = await service.embed("  turn on   the LIGHTS ")
+
+            assert mock_model.encode.call_count == 1
+            assert np.array_equal(first, second)
+
+    @pytest.mark.asyncio
+    async def test_embed_batch_only_encodes_misses(self, mock_model):
+        """Batch embed should reuse memoized vectors and encode the rest once."""
+        with patch.dict(
+            "sys.modules",
+            {
+                "sentence_transformers": MagicMock(
+                    SentenceTransformer=MagicMock(return_value=mock_model)
+                )
+            },
+        ):
+            service = EmbeddingService(memo=EmbeddingMemo())
+            await service.init()
+            await service.embed("text1")
+            mock_model.encode.return_value = np.random.randn(1, EMBEDDING_DIM).astype(np.float32)
+
+            embeddings = await service.embed_batch(["text1", "text2", "text2"])
+
+            assert embeddings.shape == (3, EMBEDDING_DIM)
+            assert mock_model.encode.call_args.args[0] == ["text2"]
+
+
+class TestEmbeddingMemo:
+    """Tests for the bounded embedding memo."""
+
+    def test_evicts_least_recently_used_over_budget(self):
+        vector = np.ones(EMBEDDING_DIM, dtype=np.float32)
+        memo = EmbeddingMemo(max_bytes=2 * (vector.nbytes + 1))
+        memo.put("a", vector)
+        memo.put("b", vector)
+        memo.get("a")
+        memo.put("c", vector)
+
+        assert memo.get("b") is None
+        assert memo.get("a") is not None
+        assert memo.get_stats()["evictions"] == 1
+        assert memo.nbytes <= 2 * (vector.nbytes + 1)
+
+    def test_request_scope_keeps_evicted_vectors(self):
+        vector = np.ones(EMBEDDING_DIM, dtype=np.float32)
+        memo = EmbeddingMemo(max_bytes=vector.nbytes + 1)
+        with embedding_request_scope():
+            memo.put("a", vector)
+            memo.put("b", vector)
+            assert memo.get("a") is not None
+        assert memo.get("a") is None
+
+    def test_keyed_by_model(self):
+        memo = EmbeddingMemo()
+        memo.put("a", np.ones(3, dtype=np.float32), "model-a")
+
+        assert memo.get("A", "model-a") is not None
+        assert memo.get("a", "model-b") is None
+        assert memo.get("a") is None
+
+    def test_stored_vectors_are_read_only(self):
+        memo = EmbeddingMemo()
+        stored = memo.put("a", np.ones(3, dtype=np.float32))
+        assert not stored.flags.writeable
+
 
 # ============================================================================
 # StoredMemory Tests
@@ -357,6 +521,223 @@ class TestMemoryStorageFallback:
         assert episodic == 1
 
 
+# ============================================================================
+# MemoryVectorIndex Tests
+# ============================================================================
+
+
+def _unit(*values: float) -> np.ndarray:
+    """Build a normalized 3-dim test vector."""
+    vec = np.array(values, dtype=np.float32)
+    return vec / np.linalg.norm(vec)
+
+
+class TestMemoryVectorIndex:
+    """Tests for the resident vector index."""
+
+    @pytest.fixture
+    def index(self):
+        """Create index with a few labelled vectors."""
+        index = MemoryVectorIndex(initial_capacity=2)
+        index.add("coffee", _unit(1, 0, 0), "semantic", ["thom"])
+        index.add("tea", _unit(0.9, 0.1, 0), "semantic", ["viola"])
+        index.add("sleep", _unit(0, 1, 0), "procedural", ["thom"])
+        index.add("walk", _unit(0.7, 0.7, 0), "episodic", ["thom", "viola"])
+        return index
+
+    def test_search_ranks_by_similarity(self, index):
+        """Should return top-k ids sorted by score."""
+        results = index.search(_unit(1, 0, 0), max_results=2, min_score=0.0)
+
+        assert [mid for mid, _ in results] == ["coffee", "tea"]
+        assert results[0][1] == pytest.approx(1.0)
+
+    def test_search_applies_min_score(self, index):
+        """Should drop hits below the threshold."""
+        results = index.search(_unit(1, 0, 0), max_results=10, min_score=0.5)
+
+        assert {mid for mid, _ in results} == {"coffee", "tea", "walk"}
+
+    def test_search_filters_by_type_and_participants(self, index):
+        """Type and participant filters should intersect; participants match any."""
+        semantic = index.search(_unit(1, 0, 0), 10, 0.0, memory_type="semantic")
+        viola = index.search(_unit(1, 0, 0), 10, 0.0, participants=["viola"])
+        both = index.search(_unit(1, 0, 0), 10, 0.0, memory_type="semantic", participants=["thom"])
+
+        assert {mid for mid, _ in semantic} == {"coffee", "tea"}
+        assert {mid for mid, _ in viola} == {"tea", "walk"}
+        assert [mid for mid, _ in both] == ["coffee"]
+        assert index.search(_unit(1, 0, 0), 10, 0.0, memory_type="unknown") == []
+
+    def test_remove_keeps_rows_and_masks_consistent(self, index):
+        """Removing a row should move the last row and its labels into its slot."""
+        assert index.remove("coffee")
+        assert not index.remove("coffee")
+
+        assert len(index) == 3
+        assert "coffee" not in index
+        results = index.search(_unit(0.7, 0.7, 0), 10, 0.0, participants=["thom"])
+        assert {mid for mid, _ in results} == {"sleep", "walk"}
+
+    def test_add_replaces_existing_entry(self, index):
+        """Re-adding an id should update its vector and labels."""
+        index.add("coffee", _unit(0, 0, 1), "episodic", ["viola"])
+
+        assert len(index) == 4
+        assert index.search(_unit(0, 0, 1), 1, 0.0)[0][0] == "coffee"
+        thom = index.search(_unit(0, 0, 1), 10, 0.0, participants=["thom"])
+        assert "coffee" not in {mid for mid, _ in thom}
+
+    def test_search_batch_matches_single_searches(self, index):
+        """Batched search should equal one search per query."""
+        queries = np.stack([_unit(1, 0, 0), _unit(0, 1, 0)])
+
+        batched = index.search_batch(queries, 2, 0.0, participants=["thom"])
+
+        assert batched == [
+            index.search(queries[0], 2, 0.0, participants=["thom"]),
+            index.search(queries[1], 2, 0.0, participants=["thom"]),
+        ]
+
+    def test_search_weighted_merges_and_deduplicates(self, index):
+        """Each memory should appear once with its best weighted score."""
+        queries = np.stack([_unit(1, 0, 0), _unit(0, 1, 0)])
+
+        results = index.search_weighted(queries, np.array([1.0, 0.5]), 10, 0.0)
+        scores = dict(results)
+
+        assert len(results) == len(scores) == 4
+        assert results[0][0] == "coffee"
+        assert scores["sleep"] == pytest.approx(0.5)
+
+    def test_add_rejects_dimension_mismatch(self, index):
+        """Should refuse vectors of a different dimension."""
+        with pytest.raises(ValueError):
+            index.add("bad", np.ones(5, dtype=np.float32), "semantic")
+
+
+class TestMemoryStorageVectorIndex:
+    """Tests for MemoryStorage keeping its vector index in sync."""
+
+    @pytest.fixture
+    def embeddings(self):
+        """Map content to deterministic embeddings."""
+        return {
+            "Coffee preference": np.array([1.0] + [0.0] * (EMBEDDING_DIM - 1), dtype=np.float32),
+            "Sleep routine": np.array([0.0, 1.0] + [0.0] * (EMBEDDING_DIM - 2), dtype=np.float32),
+        }
+
+    @pytest.fixture
+    def storage(self, embeddings):
+        """Create fallback storage with a deterministic embedding service."""
+        service = AsyncMock()
+        service.embed = AsyncMock(side_effect=lambda text: embeddings[text])
+        return MemoryStorage(redis_client=None, embedding_service=service)
+
+    @pytest.mark.asyncio
+    async def test_store_search_delete(self, storage):
+        """Stored memories should be searchable until deleted."""
+        await storage.init()
+        coffee = await storage.store_memory(
+            "Coffee preference", "semantic", generate_embedding_async=False
+        )
+        await storage.store_memory("Sleep routine", "procedural", generate_embedding_async=False)
+
+        results = await storage.search_memories("Coffee preference", min_score=0.5)
+        assert [m.id for m, _ in results] == [coffee.id]
+
+        await storage.delete_memory(coffee.id)
+        assert await storage.search_memories("Coffee preference", min_score=0.5) == []
+
+    @pytest.mark.asyncio
+    async def test_multi_query_search_embeds_in_one_batch(self, storage, embeddings):
+        """Query sets should embed once and return merged, deduplicated hits."""
+        await storage.init()
+        await storage.store_memory("Coffee preference", "semantic", generate_embedding_async=False)
+        await storage.store_memory("Sleep routine", "procedural", generate_embedding_async=False)
+        storage._embedding_service.embed_batch = AsyncMock(
+            return_value=np.stack([embeddings["Coffee preference"], embeddings["Sleep routine"]])
+        )
+
+        results = await storage.search_memories_multi(
+            ["coffee", "bedtime", "coffee"], weights=[1.0, 0.8, 0.8], min_score=0.5
+        )
+
+        storage._embedding_service.embed_batch.assert_awaited_once_with(["coffee", "bedtime"])
+        assert [(m.content, round(s, 2)) for m, s in results] == [
+            ("Coffee preference", 1.0),
+            ("Sleep routine", 0.8),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_redis_search_loads_index_and_hydrates_with_mget(self, embeddings):
+        """Redis search should load vectors once and hydrate hits with one MGET."""
+        memory = StoredMemory(id="mem_1", content="Coffee preference", memory_type="semantic")
+        record = json.dumps(memory.to_dict()).encode()
+        emb = embeddings["Coffee preference"].tobytes()
+
+        pipe = MagicMock()
+        pipe.execute = AsyncMock(return_value=[[emb], [record]])
+        redis_client = MagicMock()
+        redis_client.ping = AsyncMock()
+        redis_client.get = AsyncMock(return_value=None)
+        redis_client.setex = AsyncMock()
+        redis_client.zrange = AsyncMock(return_value=[b"mem_1"])
+        redis_client.pipeline = MagicMock(return_value=pipe)
+        redis_client.mget = AsyncMock(return_value=[record])
+
+        service = AsyncMock()
+        service.embed = AsyncMock(return_value=embeddings["Coffee preference"])
+        storage = MemoryStorage(redis_client=redis_client, embedding_service=service)
+        await storage.init()
+
+        for _ in range(2):
+            results = await storage.search_memories("Coffee preference", min_score=0.5)
+            assert [m.id for m, _ in results] == ["mem_1"]
+            assert results[0][0].embedding is not None
+
+        redis_client.zrange.assert_awaited_once()
+        assert redis_client.mget.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_write_through_one_handle_visible_to_another(self, embeddings):
+        """A second instance (another worker) should see writes after they land."""
+        redis_client = FakeRedis()
+        service = AsyncMock()
+        service.embed = AsyncMock(side_effect=lambda text: embeddings[text])
+        writer = MemoryStorage(redis_client=redis_client, embedding_service=service)
+        reader = MemoryStorage(redis_client=redis_client, embedding_service=service)
+        await writer.init()
+        await reader.init()
+
+        assert await reader.search_memories("Coffee preference", min_score=0.5) == []
+        coffee = await writer.store_memory(
+            "Coffee preference", "semantic", generate_embedding_async=False
+        )
+
+        results = await reader.search_memories("Coffee preference", min_score=0.5)
+        assert [m.id for m, _ in results] == [coffee.id]
+
+        await writer.delete_memory(coffee.id)
+        assert await reader.search_memories("Coffee preference", min_score=0.5) == []
+
+    @pytest.mark.asyncio
+    async def test_own_writes_do_not_reload_index(self, embeddings):
+        """Writes through the same instance update the index in place."""
+        redis_client = FakeRedis()
+        service = AsyncMock()
+        service.embed = AsyncMock(side_effect=lambda text: embeddings[text])
+        storage = MemoryStorage(redis_client=redis_client, embedding_service=service)
+        await storage.init()
+
+        await storage.search_memories("Coffee preference", min_score=0.5)
+        await storage.store_memory("Coffee preference", "semantic", generate_embedding_async=False)
+        results = await storage.search_memories("Coffee preference", min_score=0.5)
+
+        assert len(results) == 1
+        assert redis_client.zrange_calls == 1
+
+
 # ============================================================================
 # Working Memory Tests
 # ============================================================================
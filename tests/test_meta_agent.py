@@ -11,6 +11,12 @@ from barnabeenet.agents.meta import (
     MetaAgentConfig,
     UrgencyLevel,
 )
+from barnabeenet.services.homeassistant.mentions import (
+    MENTION_ALIAS,
+    MENTION_AREA,
+    MENTION_ENTITY,
+    MentionDetector,
+)
 
 
 @pytest.fixture
@@ -491,3 +497,52 @@ class TestShutdown:
         await initialized_agent.init()
         result = await initialized_agent.classify("what time is it")
         assert result.intent == IntentCategory.INSTANT
+
+
+# =============================================================================
+# HA Entity Mention Tests
+# =============================================================================
+
+
+class TestEntityMentions:
+    """Test device detection from Home Assistant entity mentions."""
+
+    @pytest.fixture
+    def detector(self) -> MentionDetector:
+        """Detector over a couple of entities, an alias and an area."""
+        return MentionDetector(
+            [
+                ("Gnome Lamp", MENTION_ENTITY, "light.gnome_lamp"),
+                ("Garden Gnome", MENTION_ALIAS, "light.gnome_lamp"),
+                ("Garden", MENTION_AREA, "Garden"),
+            ]
+        )
+
+    def test_entity_mention_without_verb_is_query(
+        self, meta_agent: MetaAgent, detector: MentionDetector
+    ) -> None:
+        """A mentioned entity without a command verb is a device query."""
+        result = meta_agent._heuristic_classify(
+            "the gnome lamp tonight", {}, ha_context={"mention_detector": detector}
+        )
+        assert result.intent == IntentCategory.QUERY
+        assert "Gnome Lamp" in result.matched_pattern
+
+    def test_alias_mention_with_verb_is_action(
+        self, meta_agent: MetaAgent, detector: MentionDetector
+    ) -> None:
+        """Aliases count as entity mentions."""
+        result = meta_agent._heuristic_classify(
+            "turn the garden gnome green", {}, ha_context={"mention_detector": detector}
+        )
+        assert result.intent == IntentCategory.ACTION
+        assert "Garden Gnome" in result.matched_pattern
+
+    def test_area_alone_is_not_an_entity(
+        self, meta_agent: MetaAgent, detector: MentionDetector
+    ) -> None:
+        """Area names do not make a request a device command."""
+        result = meta_agent._heuristic_classify(
+            "I love the garden", {}, ha_context={"mention_detector": detector}
+        )
+        assert result.intent == IntentCategory.CONVERSATION
@@ -0,0 +1,192 @@
+"""Tests for the sketch-backed latency metrics store."""
+
+from __future__ import annotations
+
+import random
+from collections.abc import AsyncIterator
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from barnabeenet.services.metrics_store import LatencySketch, MetricsStore
+from barnabeenet.services.telemetry_writer import shutdown_telemetry_writers
+
+NOW = 1_700_000_000.0
+
+
+@pytest.fixture(autouse=True)
+async def telemetry_writers() -> AsyncIterator[None]:
+    """Stop the shared telemetry writers created for mock clients."""
+    yield
+    await shutdown_telemetry_writers()
+
+
+def _redis(stored: dict[str, dict[str, str]] | None = None) -> tuple[MagicMock, list[MagicMock]]:
+    pipes: list[MagicMock] = []
+
+    def pipeline(transaction: bool = True) -> MagicMock:
+        pipe = MagicMock()
+        pipe.execute = AsyncMock()
+        pipes.append(pipe)
+        return pipe
+
+    client = MagicMock()
+    client.pipeline.side_effect = pipeline
+    client.get = AsyncMock(return_value=None)
+    client.set = AsyncMock()
+    client.hdel = AsyncMock()
+    client.hgetall = AsyncMock(side_effect=lambda key: dict((stored or {}).get(key, {})))
+    return client, pipes
+
+
+def _at(timestamp: float):  # noqa: ANN202
+    return patch("barnabeenet.services.metrics_store.time.time", return_value=timestamp)
+
+
+def _exact(values: list[float], q: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(int(len(ordered) * q), len(ordered) - 1)]
+
+
+class TestLatencySketch:
+    """Tests for LatencySketch."""
+
+    def test_quantiles_within_relative_accuracy(self) -> None:
+        rng = random.Random(7)
+        values = [rng.lognormvariate(5, 1) for _ in range(5000)]
+        sketch = LatencySketch()
+        for value in values:
+            sketch.add(value)
+
+        for q in (0.5, 0.95, 0.99):
+            exact = _exact(values, q)
+            assert sketch.quantile(q) == pytest.approx(exact, rel=LatencySketch.RELATIVE_ACCURACY)
+        assert sketch.count == 5000
+        assert sketch.min == min(values)
+        assert sketch.max == max(values)
+        assert sketch.avg == pytest.approx(sum(values) / len(values))
+
+    def test_merge_matches_single_sketch(self) -> None:
+        values = [float(v) for v in range(1, 1001)]
+        whole, left, right = LatencySketch(), LatencySketch(), LatencySketch()
+        for value in values:
+            whole.add(value)
+            (left if value <= 500 else right).add(value)
+
+        left.merge(right)
+
+        assert left.bins == whole.bins
+        assert left.quantile(0.95) == whole.quantile(0.95)
+        assert (left.count, left.min, left.max) == (1000, 1.0, 1000.0)
+
+    def test_zero_values(self) -> None:
+        sketch = LatencySketch()
+        sketch.add(0.0)
+        sketch.add(0.0)
+        sketch.add(100.0)
+
+        assert sketch.quantile(0.5) == 0.0
+        assert sketch.quantile(0.99) == pytest.approx(100.0, rel=LatencySketch.RELATIVE_ACCURACY)
+
+    def test_payload_round_trip(self) -> None:
+        sketch = LatencySketch()
+        for value in (0.0, 3.0, 250.0, 251.0, 9000.0):
+            sketch.add(value)
+
+        restored = LatencySketch.from_payload(sketch.to_payload())
+
+        assert restored.bins == sketch.bins
+        assert restored.zero_count == 1
+        assert (restored.count, restored.total, restored.min, restored.max) == (
+            sketch.count,
+            sketch.total,
+            sketch.min,
+            sketch.max,
+        )
+
+
+class TestMetricsStore:
+    """Tests for MetricsStore."""
+
+    async def test_stats_within_window(self) -> None:
+        store = MetricsStore()
+        with _at(NOW - 2 * 3600):
+            await store.record_latency("llm", 5000.0)
+        with _at(NOW):
+            for value in (100.0, 200.0, 300.0, 400.0):
+                await store.record_latency("llm", value)
+
+            stats = await store.get_latency_stats("llm")
+            day = await store.get_latency_stats("llm", MetricsStore.WINDOW_24H)
+
+        assert stats is not None
+        assert stats.sample_count == 4
+        assert stats.min_ms == 100.0
+        assert stats.max_ms == 400.0
+        assert stats.avg_ms == pytest.approx(250.0)
+        assert stats.p50_ms == pytest.approx(300.0, rel=LatencySketch.RELATIVE_ACCURACY)
+        assert day is not None and day.sample_count == 5
+        assert await store.get_latency_stats("stt") is None
+
+    async def test_history_buckets(self) -> None:
+        store = MetricsStore()
+        start = NOW - NOW % 300
+        for offset, value in ((0, 10.0), (60, 30.0), (300, 50.0)):
+            with _at(start + offset):
+                await store.record_latency("tts", value)
+
+        with _at(start + 360):
+            minutes = await store.get_latency_history("tts", window_minutes=60)
+            five_minutes = await store.get_latency_history("tts", 60, bucket_seconds=300)
+
+        assert [h["count"] for h in minutes] == [1, 1, 1]
+        assert [h["unix_ts"] for h in five_minutes] == [int(start), int(start) + 300]
+        assert five_minutes[0]["count"] == 2
+        assert five_minutes[0]["avg_ms"] == pytest.approx(20.0)
+        assert five_minutes[0]["max_ms"] == 30.0
+
+    async def test_old_sketches_pruned(self) -> None:
+        store = MetricsStore()
+        with _at(NOW - MetricsStore.WINDOW_24H - 120):
+            await store.record_latency("stt", 80.0)
+        with _at(NOW):
+            await store.record_latency("stt", 90.0)
+            stats = await store.get_latency_stats("stt", MetricsStore.WINDOW_24H)
+
+        assert len(store._sketches["stt"]) == 1
+        assert stats is not None and stats.sample_count == 1
+        assert store.get_total_count("stt") == 2
+
+    async def test_sketches_survive_restart(self) -> None:
+        client, pipes = _redis()
+        store = MetricsStore(redis_client=client)
+        with _at(NOW):
+            await store.record_latency("pipeline", 120.0)
+            await store.record_latency("pipeline", 180.0)
+            await store.shutdown()
+
+        hset = pipes[-1].hset.call_args
+        assert hset.args[0] == "barnabeenet:metrics:pipeline:sketches"
+        stored = {hset.args[0]: hset.kwargs["mapping"]}
+
+        restarted_client, _ = _redis(stored)
+        restarted = MetricsStore(redis_client=restarted_client)
+        with _at(NOW + 30):
+            await restarted.init()
+            stats = await restarted.get_latency_stats("pipeline")
+
+        assert stats is not None
+        assert stats.sample_count == 2
+        assert (stats.min_ms, stats.max_ms) == (120.0, 180.0)
+
+    async def test_finished_minutes_are_written_on_rollover(self) -> None:
+        client, pipes = _redis()
+        store = MetricsStore(redis_client=client)
+        with _at(NOW):
+            await store.record_latency("memory", 12.0)
+        with _at(NOW + 60):
+            await store.record_latency("memory", 14.0)
+        await store.shutdown()
+
+        fields = {f for p in pipes for c in p.hset.call_args_list for f in c.kwargs["mapping"]}
+        assert fields == {str(store._bucket_start(NOW)), str(store._bucket_start(NOW + 60))}
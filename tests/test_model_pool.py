@@ -0,0 +1,108 @@
+"""Tests for the resident voice model pool."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from barnabeenet.services.model_pool import ModelPool
+
+
+def _fake_engine() -> MagicMock:
+    """Create a fake engine that becomes available once initialized."""
+    engine = MagicMock()
+    state = {"ready": False}
+
+    async def initialize() -> None:
+        await asyncio.sleep(0)
+        state["ready"] = True
+
+    async def shutdown() -> None:
+        state["ready"] = False
+
+    engine.initialize = AsyncMock(side_effect=initialize)
+    engine.shutdown = AsyncMock(side_effect=shutdown)
+    engine.is_available = MagicMock(side_effect=lambda: state["ready"])
+    return engine
+
+
+@pytest.fixture
+def pool() -> ModelPool:
+    """Create a pool with two small fake models and a tight budget."""
+    pool = ModelPool(memory_budget_mb=1000)
+    pool._models.clear()
+    pool.register("stt", memory_mb=600, factory=_fake_engine)
+    pool.register("tts", memory_mb=300, factory=_fake_engine)
+    return pool
+
+
+class TestModelPool:
+    """Tests for ModelPool."""
+
+    @pytest.mark.asyncio
+    async def test_acquire_loads_once_and_counts_hits(self, pool: ModelPool) -> None:
+        """First acquire is cold, later ones reuse the resident instance."""
+        first = await pool.acquire("stt")
+        second = await pool.acquire("stt")
+
+        assert first is second
+        first.initialize.assert_awaited_once()
+        status = pool.get_status()["models"]["stt"]
+        assert status["cold_hits"] == 1
+        assert status["warm_hits"] == 1
+        assert pool.memory_used_mb == 600
+
+    @pytest.mark.asyncio
+    async def test_concurrent_first_acquires_share_one_load(self, pool: ModelPool) -> None:
+        """Concurrent cold requests should not load the model twice."""
+        engines = await asyncio.gather(*(pool.acquire("tts") for _ in range(5)))
+
+        assert all(e is engines[0] for e in engines)
+        engines[0].initialize.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_warm_up_runs_after_load(self, pool: ModelPool) -> None:
+        """Registered warm-up should run once against the loaded engine."""
+        warm_up = AsyncMock()
+        pool.register("warm", memory_mb=10, factory=_fake_engine, warm_up=warm_up)
+
+        engine = await pool.acquire("warm")
+        await pool.acquire("warm")
+
+        warm_up.assert_awaited_once_with(engine)
+
+    @pytest.mark.asyncio
+    async def test_budget_evicts_least_recently_used(self, pool: ModelPool) -> None:
+        """Loading past the budget should evict the oldest resident model."""
+        pool.register("big", memory_mb=500, factory=_fake_engine)
+        stt = await pool.acquire("stt")
+        await pool.acquire("tts")
+
+        await pool.acquire("big")
+
+        stt.shutdown.assert_awaited_once()
+        assert pool.memory_used_mb == 800
+        assert not pool.get_status()["models"]["stt"]["loaded"]
+
+    @pytest.mark.asyncio
+    async def test_preload_swallows_failures(self, pool: ModelPool) -> None:
+        """A failing model should not stop the others from preloading."""
+        broken = MagicMock(side_effect=RuntimeError("no weights"))
+        pool.register("broken", memory_mb=10, factory=broken)
+
+        await pool.preload(["broken", "tts"])
+
+        assert pool.get_status()["models"]["tts"]["loaded"]
+        assert not pool.get_status()["models"]["broken"]["loaded"]
+
+    @pytest.mark.asyncio
+    async def test_shutdown_unloads_models(self, pool: ModelPool) -> None:
+        """Shutdown should release every resident model."""
+        await pool.acquire("stt")
+        await pool.acquire("tts")
+
+        await pool.shutdown()
+
+        assert pool.memory_used_mb == 0
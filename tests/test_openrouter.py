@@ -6,6 +6,7 @@ import json
 from datetime import UTC, datetime
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import httpx
 import pytest
 
 from barnabeenet.services.llm.openrouter import (
@@ -16,6 +17,7 @@ from barnabeenet.services.llm.openrouter import (
     OpenRouterClient,
 )
 from barnabeenet.services.llm.signals import LLMSignal, SignalLogger
+from barnabeenet.services.telemetry_writer import get_telemetry_writer
 
 
 class TestLLMSignal:
@@ -142,8 +144,11 @@ class TestSignalLogger:
 
     @pytest.mark.asyncio
     async def test_log_signal_with_redis(self) -> None:
-        """Test logging with Redis client."""
-        mock_redis = AsyncMock()
+        """Test logging with Redis client (writes are batched into one pipeline)."""
+        pipe = MagicMock()
+        pipe.execute = AsyncMock()
+        mock_redis = MagicMock()
+        mock_redis.pipeline.return_value = pipe
         logger = SignalLogger(redis_client=mock_redis)
 
         signal = LLMSignal(
@@ -154,10 +159,12 @@ class TestSignalLogger:
             success=True,
         )
         await logger.log_signal(signal)
+        await get_telemetry_writer(mock_redis).flush()
 
         # Should call setex for full signal and xadd for stream
-        mock_redis.setex.assert_called_once()
-        mock_redis.xadd.assert_called_once()
+        pipe.setex.assert_called_once()
+        pipe.xadd.assert_called_once()
+        pipe.execute.assert_awaited_once()
 
 
 class TestModelConfig:
@@ -327,6 +334,44 @@ class TestOpenRouterClient:
 
             assert text == "It's 72°F and sunny."
 
+    @pytest.mark.asyncio
+    async def test_chat_stream(self, client: OpenRouterClient) -> None:
+        """Streaming yields deltas, then the full response; the signal and cache see it."""
+        events = [
+            {"model": "anthropic/claude-3.5-sonnet", "choices": [{"delta": {"content": "Hi"}}]},
+            {"choices": [{"delta": {"content": " Thom."}, "finish_reason": "stop"}]},
+            {"choices": [], "usage": {"prompt_tokens": 40, "completion_tokens": 4}},
+        ]
+        body = "".join(f"data: {json.dumps(e)}\n\n" for e in events) + "data: [DONE]\n\n"
+        client._client = httpx.AsyncClient(
+            base_url="http://test",
+            transport=httpx.MockTransport(lambda _: httpx.Response(200, content=body.encode())),
+        )
+        client._signal_logger = MagicMock(log_signal=AsyncMock())
+        client._cache = MagicMock(get=AsyncMock(return_value=None), set=AsyncMock())
+
+        chunks = [
+            chunk
+            async for chunk in client.chat_stream(
+                messages=[{"role": "user", "content": "Hello"}],
+                agent_type="interaction",
+                user_input="Hello",
+            )
+        ]
+        await client._client.aclose()
+
+        assert [c.text for c in chunks[:-1]] == ["Hi", " Thom."]
+        response = chunks[-1].response
+        assert response is not None
+        assert response.text == "Hi Thom."
+        assert response.output_tokens == 4
+
+        signal = client._signal_logger.log_signal.call_args.args[0]
+        assert signal.streamed is True
+        assert signal.time_to_first_token_ms is not None
+        assert signal.response_text == "Hi Thom."
+        assert client._cache.set.call_args.kwargs["response_text"] == "Hi Thom."
+
     @pytest.mark.asyncio
     async def test_init_and_shutdown(self, client: OpenRouterClient) -> None:
         """Test client lifecycle."""
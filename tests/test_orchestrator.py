@@ -21,6 +21,7 @@ from barnabeenet.agents.orchestrator import (
     get_orchestrator,
     process_request,
 )
+from barnabeenet.services.post_response import PostResponseQueue, init_post_response_queue
 
 # ============================================================================
 # Fixtures
@@ -52,6 +53,12 @@ def config():
     )
 
 
+@pytest.fixture
+def post_response_queue() -> PostResponseQueue:
+    """Fresh global post-response queue bound to this test's event loop."""
+    return init_post_response_queue()
+
+
 @pytest.fixture
 def mock_classification():
     """Create a mock classification result."""
@@ -477,13 +484,14 @@ class TestMemoryIntegration:
         assert result["memories_used"] == 0
 
     @pytest.mark.asyncio
-    async def test_stores_memory_for_conversations(self):
+    async def test_stores_memory_for_conversations(self, post_response_queue):
         config = OrchestratorConfig(
             enable_memory_retrieval=False,
             enable_memory_storage=True,
         )
         orch = AgentOrchestrator(config=config)
         orch._initialized = True
+        orch.register_post_response_handlers()
 
         orch._meta_agent = AsyncMock()
         orch._meta_agent.classify = AsyncMock(
@@ -507,6 +515,8 @@ class TestMemoryIntegration:
         orch._memory_agent.handle_input = AsyncMock(return_value={})
 
         await orch.process("I got a promotion today!")
+        # Memory generation runs on the post-response queue
+        await post_response_queue.drain()
 
         # Memory agent should be called for storage
         calls = orch._memory_agent.handle_input.call_args_list
@@ -0,0 +1,187 @@
+"""Tests for the Meta Agent pattern classifier."""
+
+from __future__ import annotations
+
+import re
+from unittest.mock import MagicMock
+
+import pytest
+
+from barnabeenet.agents.meta import (
+    ACTION_PATTERNS,
+    CONVERSATION_PATTERNS,
+    EMERGENCY_PATTERNS,
+    GESTURE_PATTERNS,
+    INSTANT_PATTERNS,
+    MEMORY_PATTERNS,
+    QUERY_PATTERNS,
+    SELF_IMPROVEMENT_PATTERNS,
+    IntentCategory,
+    MetaAgent,
+)
+from barnabeenet.agents.pattern_classifier import PatternClassifier
+
+
+def _compile(patterns: list[tuple[str, str]]) -> list[tuple[re.Pattern[str], str]]:
+    return [(re.compile(p, re.IGNORECASE), c) for p, c in patterns]
+
+
+def _loop_match(groups, text: str):
+    """Reference implementation: the plain priority-ordered loop."""
+    for name, patterns in groups:
+        for pattern, sub_category in patterns:
+            if pattern.match(text):
+                return name, sub_category, pattern.pattern
+    return None
+
+
+def _classifier_match(classifier: PatternClassifier, text: str):
+    hit = classifier.match(text)
+    return (hit.group, hit.sub_category, hit.pattern.pattern) if hit else None
+
+
+@pytest.fixture
+def hardcoded_groups():
+    """All hardcoded MetaAgent pattern groups, in priority order."""
+    sources = {
+        "emergency": EMERGENCY_PATTERNS,
+        "instant": INSTANT_PATTERNS,
+        "gesture": GESTURE_PATTERNS,
+        "self_improvement": SELF_IMPROVEMENT_PATTERNS,
+        "conversation": CONVERSATION_PATTERNS,
+        "action": ACTION_PATTERNS,
+        "memory": MEMORY_PATTERNS,
+        "query": QUERY_PATTERNS,
+    }
+    return [(group, _compile(sources[group])) for group, _, _ in MetaAgent.PATTERN_PRIORITY]
+
+
+# =============================================================================
+# PatternClassifier Tests
+# =============================================================================
+
+
+class TestPatternClassifier:
+    """Tests for PatternClassifier."""
+
+    def test_matches_loop_on_hardcoded_patterns(self, hardcoded_groups) -> None:
+        """First hit agrees with the plain loop across a varied corpus."""
+        classifier = PatternClassifier(hardcoded_groups)
+        texts = [
+            "hello",
+            "what time is it",
+            "turn on the kitchen lights",
+            "Turn Off The Fan",
+            "help, there's a fire",
+            "I've fallen and can't get up",
+            "remember that I like tea",
+            "what's 12 plus 7",
+            "what's the weather like tomorrow",
+            "I had a great day at the park",
+            "  leading spaces",
+            "7 times 8",
+            "",
+            "¿qué hora es?",
+            "café lights on",
+        ]
+        for text in texts:
+            assert _classifier_match(classifier, text) == _loop_match(hardcoded_groups, text)
+
+    def test_priority_across_groups(self) -> None:
+        """Earlier groups win even when a later pattern is cheaper to reach."""
+        groups = [
+            ("first", _compile([(r".*(fire|smoke).*", "danger")])),
+            ("second", _compile([(r"^fire up (the )?grill$", "grill")])),
+        ]
+        hit = PatternClassifier(groups).match("fire up the grill")
+
+        assert hit is not None
+        assert (hit.group, hit.sub_category) == ("first", "danger")
+
+    def test_filters_never_skip_possible_matches(self) -> None:
+        """Patterns the analysis cannot reason about are still tried."""
+        groups = [
+            (
+                "g",
+                _compile(
+                    [
+                        (r"^(\w+) and \1$", "backref"),
+                        (r"^(?i:LOUD) noise$", "scoped_flags"),
+                        (r"^\d+ ?(plus|minus) ?\d+$", "math"),
+                        (r"^[^x]+ please$", "negated"),
+                    ]
+                ),
+            )
+        ]
+        classifier = PatternClassifier(groups)
+
+        for text, expected in [
+            ("this and this", "backref"),
+            ("loud noise", "scoped_flags"),
+            ("12 plus 4", "math"),
+            ("lights please", "negated"),
+        ]:
+            hit = classifier.match(text)
+            assert hit is not None and hit.sub_category == expected
+
+    def test_non_ascii_text_falls_back_to_full_scan(self) -> None:
+        """Case folding of non-ASCII text can reach ASCII patterns."""
+        # The Kelvin sign folds onto "k" under IGNORECASE
+        groups = [("g", _compile([(r"^kitchen$", "kitchen")]))]
+        hit = PatternClassifier(groups).match("\u212aitchen")
+
+        assert hit is not None
+
+    def test_search_group(self, hardcoded_groups) -> None:
+        """search_group finds a group's pattern anywhere in the text."""
+        classifier = PatternClassifier(hardcoded_groups)
+
+        assert classifier.search_group("emergency", "quick, I smell smoke in here")
+        assert not classifier.search_group("emergency", "turn on the lights")
+        assert not classifier.search_group("missing", "smoke")
+
+
+# =============================================================================
+# MetaAgent Integration Tests
+# =============================================================================
+
+
+class TestMetaAgentClassifier:
+    """Tests for MetaAgent's use of the compiled classifier."""
+
+    @pytest.fixture
+    async def agent(self) -> MetaAgent:
+        """MetaAgent initialized with hardcoded patterns."""
+        agent = MetaAgent(logic_registry=None)
+        agent._use_registry = False
+        agent._logic_registry = MagicMock()  # Prevent init() loading the real registry
+        await agent.init()
+        return agent
+
+    @pytest.mark.asyncio
+    async def test_rebuilds_when_patterns_replaced(self, agent: MetaAgent) -> None:
+        """Replacing a group's patterns takes effect on the next classification."""
+        assert agent._pattern_match("xyzzy").intent == IntentCategory.UNKNOWN
+
+        agent._compiled_patterns["instant"] = _compile([(r"^xyzzy$", "magic")])
+        result = agent._pattern_match("xyzzy")
+
+        assert result.intent == IntentCategory.INSTANT
+        assert result.sub_category == "magic"
+
+    @pytest.mark.asyncio
+    async def test_reload_patterns_resets_classifier(self, agent: MetaAgent) -> None:
+        """Hot-reload from the registry replaces the compiled classifier."""
+        agent._get_pattern_classifier()
+        registry = MagicMock()
+        registry.get_patterns_as_tuples.side_effect = lambda group: (
+            [(r"^plugh$", "cave")] if group == "query" else []
+        )
+        agent._logic_registry = registry
+        agent._use_registry = True
+
+        await agent.reload_patterns()
+        result = agent._pattern_match("plugh")
+
+        assert result.intent == IntentCategory.QUERY
+        assert result.sub_category == "cave"
@@ -0,0 +1,160 @@
+"""Tests for the deferred post-response work queue."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+from barnabeenet.services.post_response import (
+    CONSUMER_GROUP,
+    STREAM_KEY,
+    PostResponseJob,
+    PostResponseQueue,
+)
+
+
+def _redis() -> MagicMock:
+    client = MagicMock()
+    client.xadd = AsyncMock(return_value="1-0")
+    client.xack = AsyncMock(return_value=1)
+    return client
+
+
+class TestPostResponseQueue:
+    """Tests for PostResponseQueue."""
+
+    async def test_submit_returns_before_job_runs(self) -> None:
+        queue = PostResponseQueue()
+        started = asyncio.Event()
+        release = asyncio.Event()
+
+        async def handler(payload: dict[str, Any]) -> None:
+            started.set()
+            await release.wait()
+
+        queue.register("slow", handler)
+        queue.submit("slow", {})
+        assert queue.get_stats()["processed"] == 0
+
+        await started.wait()
+        release.set()
+        await queue.drain()
+        assert queue.get_stats()["processed"] == 1
+
+    async def test_concurrency_is_bounded(self) -> None:
+        queue = PostResponseQueue(max_concurrency=2)
+        active = 0
+        peak = 0
+
+        async def handler(payload: dict[str, Any]) -> None:
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+
+        queue.register("job", handler)
+        for i in range(6):
+            queue.submit("job", {"i": i})
+        await queue.drain()
+
+        assert peak == 2
+        assert queue.get_stats()["processed"] == 6
+
+    async def test_full_queue_spills_to_stream(self) -> None:
+        redis_client = _redis()
+        queue = PostResponseQueue(redis_client=redis_client, max_concurrency=1, max_pending=1)
+        release = asyncio.Event()
+
+        async def handler(payload: dict[str, Any]) -> None:
+            await release.wait()
+
+        queue.register("job", handler)
+        queue.submit("job", {"n": 1})  # Running
+        await asyncio.sleep(0)
+        queue.submit("job", {"n": 2})  # Queued in memory
+        assert queue.submit("job", {"n": 3})  # Spilled in the background
+        assert queue.get_stats()["queued"] == 1
+
+        release.set()
+        await queue.drain()
+        redis_client.xadd.assert_awaited_once()
+        assert redis_client.xadd.await_args.args[0] == STREAM_KEY
+        assert queue.get_stats()["spilled"] == 1
+
+    async def test_full_queue_without_stream_drops(self) -> None:
+        queue = PostResponseQueue(max_concurrency=1, max_pending=1)
+        release = asyncio.Event()
+
+        async def handler(payload: dict[str, Any]) -> None:
+            await release.wait()
+
+        queue.register("job", handler)
+        assert queue.submit("job", {"n": 1})
+        await asyncio.sleep(0)
+        assert queue.submit("job", {"n": 2})
+        assert not queue.submit("job", {"n": 3})  # Never waits for room
+
+        assert queue.get_stats()["dropped"] == 1
+        release.set()
+        await queue.drain()
+        assert queue.get_stats()["processed"] == 2
+
+    async def test_handlers_get_json_payload(self) -> None:
+        queue = PostResponseQueue()
+        received: list[dict[str, Any]] = []
+
+        async def handler(payload: dict[str, Any]) -> None:
+            received.append(payload)
+
+        queue.register("job", handler)
+        assert queue.submit("job", {"samples": [("llm", 1.5)]})
+        assert not queue.submit("job", {"when": datetime(2026, 1, 1)})
+        await queue.drain()
+
+        # Same shape a replay from the stream would produce
+        assert received == [{"samples": [["llm", 1.5]]}]
+        assert queue.get_stats()["rejected"] == 1
+
+    async def test_failed_stream_job_is_retried_then_acked(self) -> None:
+        redis_client = _redis()
+        queue = PostResponseQueue(redis_client=redis_client)
+        queue.register("job", AsyncMock(side_effect=RuntimeError("boom")))
+
+        queue._enqueue(PostResponseJob(kind="job", payload={}, stream_id="5-0"))
+        await queue.drain()
+
+        retry = PostResponseJob.from_fields("6-0", redis_client.xadd.await_args.args[1])
+        assert retry.attempts == 1
+        redis_client.xack.assert_awaited_once_with(STREAM_KEY, CONSUMER_GROUP, "5-0")
+
+    async def test_shutdown_spills_queued_jobs(self) -> None:
+        redis_client = _redis()
+        queue = PostResponseQueue(redis_client=redis_client, max_concurrency=1)
+        release = asyncio.Event()
+
+        async def handler(payload: dict[str, Any]) -> None:
+            await release.wait()
+
+        queue.register("job", handler)
+        queue.submit("job", {"n": 1})
+        queue.submit("job", {"n": 2})
+        await queue.shutdown(grace=0.01)
+
+        spilled = [
+            PostResponseJob.from_fields("x", c.args[1]) for c in redis_client.xadd.await_args_list
+        ]
+        assert [job.payload for job in spilled] == [{"n": 2}]
+
+    def test_job_fields_round_trip(self) -> None:
+        job = PostResponseJob(kind="audit", payload={"room": "kitchen"}, attempts=2)
+        fields = {k.encode(): v.encode() for k, v in job.to_fields().items()}
+
+        restored = PostResponseJob.from_fields("1-0", fields)
+
+        assert restored.kind == "audit"
+        assert restored.payload == {"room": "kitchen"}
+        assert restored.attempts == 2
+        assert restored.stream_id == "1-0"
@@ -0,0 +1,151 @@
+"""Tests for the in-memory profile directory and its name index."""
+
+from __future__ import annotations
+
+import json
+from datetime import datetime
+
+from barnabeenet.models.profiles import FamilyMemberProfile, ProfileRelationship
+from barnabeenet.services.profiles import (
+    PROFILE_CHANGES_CHANNEL,
+    ProfileNameIndex,
+    ProfileService,
+)
+
+PREFIX = ProfileService.PROFILE_PREFIX
+
+
+class FakeRedis:
+    """String and pub/sub commands used by the profile directory."""
+
+    def __init__(self) -> None:
+        self.data: dict[str, str] = {}
+        self.published: list[tuple[str, dict[str, str]]] = []
+        self.gets = 0
+
+    async def scan_iter(self, match: str, count: int = 10):
+        for key in list(self.data):
+            if key.startswith(match.rstrip("*")):
+                yield key
+
+    async def mget(self, keys: list[str]) -> list[str | None]:
+        return [self.data.get(k) for k in keys]
+
+    async def get(self, key: str) -> str | None:
+        self.gets += 1
+        return self.data.get(key)
+
+    async def set(self, key: str, value: str) -> None:
+        self.data[key] = value
+
+    async def delete(self, key: str) -> int:
+        return 1 if self.data.pop(key, None) is not None else 0
+
+    async def publish(self, channel: str, message: str) -> None:
+        self.published.append((channel, json.loads(message)))
+
+    async def keys(self, pattern: str) -> list[str]:
+        raise AssertionError("KEYS must not be used")
+
+
+def _profile(member_id: str, name: str) -> FamilyMemberProfile:
+    return FamilyMemberProfile(
+        member_id=member_id,
+        name=name,
+        relationship_to_primary=ProfileRelationship.CHILD,
+        enrollment_date=datetime(2026, 1, 1),
+    )
+
+
+def _redis_with(*profiles: FamilyMemberProfile) -> FakeRedis:
+    redis = FakeRedis()
+    for profile in profiles:
+        redis.data[f"{PREFIX}{profile.member_id}"] = profile.model_dump_json()
+    return redis
+
+
+class TestProfileNameIndex:
+    """Tests for ProfileNameIndex."""
+
+    def test_matches_whole_words_in_mention_order(self) -> None:
+        index = ProfileNameIndex()
+        index.rebuild(
+            [
+                _profile("thom_fife", "Thom Fife"),
+                _profile("elizabeth", "Elizabeth Fife"),
+                _profile("penelope", "Penelope"),
+            ]
+        )
+
+        assert index.find("Is Elizabeth's car home? Ask Thom.") == ["elizabeth", "thom_fife"]
+        assert index.find("thom_fife and penelope") == ["thom_fife", "penelope"]
+        assert index.find("Thomas is here") == []
+
+    def test_lookup_by_first_name(self) -> None:
+        index = ProfileNameIndex()
+        index.rebuild([_profile("thom_fife", "Thom Fife"), _profile("viola", "Viola Fife")])
+
+        assert index.lookup("Thom") == ["thom_fife"]
+        assert index.lookup("fife") == []
+        assert index.lookup("viola fife") == ["viola"]
+
+
+class TestProfileDirectory:
+    """Tests for ProfileService's cached directory."""
+
+    async def test_load_and_lookup_without_redis_reads(self) -> None:
+        redis = _redis_with(_profile("thom_fife", "Thom Fife"), _profile("penelope", "Penelope"))
+        service = ProfileService(redis)
+        await service._load_all()
+
+        profile = await service.get_profile("thom")
+        mentioned = await service.find_mentioned_profiles(
+            "where are thom and penelope?", exclude="thom_fife"
+        )
+
+        assert profile is not None and profile.member_id == "thom_fife"
+        assert [p.member_id for p in mentioned] == ["penelope"]
+        assert len(await service.get_all_profiles()) == 2
+        assert redis.gets == 0
+
+    async def test_writes_update_index_and_publish(self) -> None:
+        redis = FakeRedis()
+        service = ProfileService(redis)
+        await service._load_all()
+
+        await service._save_profile(_profile("viola", "Viola Fife"))
+        assert [p.member_id for p in await service.find_mentioned_profiles("is viola up")] == [
+            "viola"
+        ]
+
+        assert await service.delete_profile("viola")
+        assert await service.find_mentioned_profiles("is viola up") == []
+        assert [m["member_id"] for _, m in redis.published] == ["viola", "viola"]
+        assert {c for c, _ in redis.published} == {PROFILE_CHANGES_CHANNEL}
+
+    async def test_remote_change_refreshes_cache(self) -> None:
+        redis = _redis_with(_profile("penelope", "Penelope"))
+        service = ProfileService(redis)
+        await service._load_all()
+
+        # Another worker adds a profile and removes one
+        redis.data[f"{PREFIX}xander"] = _profile("xander", "Xander Fife").model_dump_json()
+        del redis.data[f"{PREFIX}penelope"]
+        for member_id in ("xander", "penelope"):
+            await service._apply_remote_change(
+                json.dumps({"origin": "other-worker", "member_id": member_id})
+            )
+
+        assert [p.member_id for p in await service.get_all_profiles()] == ["xander"]
+        assert (await service.get_profile("Xander")) is not None
+
+    async def test_own_changes_are_ignored(self) -> None:
+        redis = _redis_with()
+        service = ProfileService(redis)
+        await service._load_all()
+
+        await service._apply_remote_change(
+            json.dumps({"origin": service._instance_id, "member_id": "penelope"})
+        )
+
+        assert redis.gets == 0
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import httpx
 import pytest
 
 from barnabeenet.services.llm.providers import (
@@ -387,7 +388,7 @@ class TestProviderChat:
 
             # Mock signal logger at the point of import
             with patch("barnabeenet.services.llm.signals.get_signal_logger") as mock_logger:
-                mock_logger.return_value.log = AsyncMock()
+                mock_logger.return_value.log_signal = AsyncMock()
 
                 response = await provider.chat(
                     messages=[{"role": "user", "content": "Hi"}],
@@ -414,7 +415,7 @@ class TestProviderChat:
             provider._initialized = True
 
             with patch("barnabeenet.services.llm.signals.get_signal_logger") as mock_logger:
-                mock_logger.return_value.log = AsyncMock()
+                mock_logger.return_value.log_signal = AsyncMock()
 
                 ctx = SignalContext(
                     conversation_id="conv-123",
@@ -428,3 +429,36 @@ class TestProviderChat:
                 )
 
         assert response is not None
+
+    @pytest.mark.asyncio
+    async def test_chat_stream_records_time_to_first_token(self):
+        provider = create_provider("openrouter", api_key="test")
+
+        body = (
+            'data: {"choices": [{"delta": {"content": "Hel"}}]}\n\n'
+            'data: {"choices": [{"delta": {"content": "lo!"}, "finish_reason": "stop"}]}\n\n'
+            "data: [DONE]\n\n"
+        )
+        provider._client = httpx.AsyncClient(
+            base_url="http://test",
+            transport=httpx.MockTransport(lambda _: httpx.Response(200, content=body.encode())),
+        )
+        provider._initialized = True
+
+        with patch("barnabeenet.services.llm.signals.get_signal_logger") as mock_logger:
+            mock_logger.return_value.log_signal = AsyncMock()
+
+            chunks = [
+                chunk
+                async for chunk in provider.chat_stream(
+                    messages=[{"role": "user", "content": "Hi"}],
+                    agent_type="interaction",
+                )
+            ]
+            signal = mock_logger.return_value.log_signal.call_args.args[0]
+
+        assert "".join(c.text for c in chunks) == "Hello!"
+        assert chunks[-1].response.text == "Hello!"
+        assert chunks[-1].response.provider == "openrouter"
+        assert signal.streamed is True
+        assert signal.time_to_first_token_ms is not None
@@ -174,6 +174,63 @@ class TestSTTRouter:
         assert isinstance(result, STTResult)
         assert result.text == "test"
 
+    @pytest.mark.asyncio
+    async def test_streaming_cpu_yields_incremental_results(self, router: STTRouter) -> None:
+        """Test CPU streaming passes through partial and final hypotheses."""
+
+        async def transcribe_stream(audio_stream, sample_rate, language):
+            async for _ in audio_stream:
+                yield {"text": "turn on", "is_final": False, "latency_ms": 50.0}
+            yield {"text": "turn on the lights", "is_final": True, "latency_ms": 80.0}
+
+        mock_cpu_backend = MagicMock()
+        mock_cpu_backend.is_available.return_value = True
+        mock_cpu_backend.transcribe_stream = transcribe_stream
+
+        router._initialized = True
+        router._gpu_healthy = False
+        router._cpu_backend = mock_cpu_backend
+
+        async def audio_stream():
+            yield b"\x00\x00" * 1600
+
+        results = [r async for r in router.transcribe_streaming(audio_stream())]
+
+        assert [(r.text, r.is_final) for r in results] == [
+            ("turn on", False),
+            ("turn on the lights", True),
+        ]
+        assert all(r.backend == STTBackend.CPU for r in results)
+
+    @pytest.mark.asyncio
+    async def test_streaming_gpu_unreachable_falls_back_to_cpu(self, router: STTRouter) -> None:
+        """Test AUTO streaming uses CPU when the GPU stream cannot connect."""
+
+        async def transcribe_stream(audio_stream, sample_rate, language):
+            chunks = [chunk async for chunk in audio_stream]
+            yield {"text": f"{len(chunks)} chunks", "is_final": True, "latency_ms": 1.0}
+
+        mock_cpu_backend = MagicMock()
+        mock_cpu_backend.is_available.return_value = True
+        mock_cpu_backend.transcribe_stream = transcribe_stream
+
+        router._initialized = True
+        router._gpu_healthy = True
+        router._cpu_backend = mock_cpu_backend
+
+        async def audio_stream():
+            yield b"a"
+            yield b"b"
+
+        with patch(
+            "barnabeenet.services.stt.router.websockets.connect",
+            AsyncMock(side_effect=OSError("refused")),
+        ):
+            results = [r async for r in router.transcribe_streaming(audio_stream())]
+
+        assert [(r.text, r.backend) for r in results] == [("2 chunks", STTBackend.CPU)]
+        assert router._gpu_healthy is False
+
     @pytest.mark.asyncio
     async def test_shutdown(self, router: STTRouter) -> None:
         """Test router shutdown cleans up resources."""
@@ -187,7 +244,9 @@ class TestSTTRouter:
         await router.shutdown()
 
         mock_client.aclose.assert_called_once()
-        mock_cpu.shutdown.assert_called_once()
+        # CPU backend belongs to the shared model pool and stays loaded
+        mock_cpu.shutdown.assert_not_called()
+        assert router._cpu_backend is None
         assert router._initialized is False
 
 
@@ -0,0 +1,104 @@
+"""Tests for VAD utterance segmentation used by streaming STT."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from barnabeenet.services.stt.segmenter import (
+    SpeechSegment,
+    UtteranceSegmenter,
+    latest_segments,
+)
+
+SAMPLE_RATE = 16000
+
+
+def _tone(ms: int) -> bytes:
+    t = np.arange(SAMPLE_RATE * ms // 1000) / SAMPLE_RATE
+    return (np.sin(2 * np.pi * 220 * t) * 0.3 * 32767).astype("<i2").tobytes()
+
+
+def _silence(ms: int) -> bytes:
+    return b"\x00\x00" * (SAMPLE_RATE * ms // 1000)
+
+
+@pytest.fixture
+def segmenter() -> UtteranceSegmenter:
+    """Energy-VAD segmenter with short intervals for fast tests."""
+    segmenter = UtteranceSegmenter(
+        sample_rate=SAMPLE_RATE,
+        endpoint_silence_ms=300,
+        partial_interval_ms=300,
+        min_speech_ms=90,
+        max_utterance_ms=3000,
+    )
+    segmenter._is_speech = segmenter._energy_is_speech
+    return segmenter
+
+
+class TestUtteranceSegmenter:
+    """Tests for UtteranceSegmenter."""
+
+    def test_silence_emits_nothing(self, segmenter: UtteranceSegmenter) -> None:
+        """Silence alone never starts an utterance."""
+        assert segmenter.feed(_silence(1000)) == []
+        assert segmenter.flush() is None
+
+    def test_partials_then_final_on_silence(self, segmenter: UtteranceSegmenter) -> None:
+        """Partials are emitted during speech and a final once silence follows."""
+        segments = segmenter.feed(_tone(900))
+        assert segments and all(not s.is_final for s in segments)
+        # Each partial covers the utterance so far, so they grow
+        assert segments[-1].audio.size > segments[0].audio.size
+
+        segments = segmenter.feed(_silence(400))
+        assert [s.is_final for s in segments] == [True]
+        assert not segmenter.in_utterance
+        assert segmenter.flush() is None
+
+    def test_pre_roll_keeps_speech_onset(self, segmenter: UtteranceSegmenter) -> None:
+        """Audio just before the VAD triggers is included in the utterance."""
+        segments = segmenter.feed(_silence(300) + _tone(150) + _silence(400))
+
+        final = segments[-1]
+        assert final.is_final
+        # 300ms pre-roll + 150ms speech + 300ms trailing silence
+        assert final.audio.size == SAMPLE_RATE * 750 // 1000
+        assert np.abs(final.audio[: SAMPLE_RATE * 300 // 1000]).max() == 0
+
+    def test_short_noise_is_dropped(self, segmenter: UtteranceSegmenter) -> None:
+        """Voiced bursts shorter than min_speech_ms are discarded."""
+        assert segmenter.feed(_tone(30) + _silence(400)) == []
+
+    def test_max_utterance_forces_final(self, segmenter: UtteranceSegmenter) -> None:
+        """Long speech is finalized at max_utterance_ms."""
+        segments = segmenter.feed(_tone(3500))
+        assert any(s.is_final for s in segments)
+
+    def test_handles_unaligned_chunks(self, segmenter: UtteranceSegmenter) -> None:
+        """Chunks that split frames (or samples) are reassembled."""
+        audio = _tone(600) + _silence(400)
+        segments = []
+        for i in range(0, len(audio), 777):
+            segments.extend(segmenter.feed(audio[i : i + 777]))
+        assert segments[-1].is_final
+
+    def test_flush_returns_open_utterance(self, segmenter: UtteranceSegmenter) -> None:
+        """Ending the stream mid-utterance yields it as final."""
+        segmenter.feed(_tone(200))
+        final = segmenter.flush()
+        assert final is not None and final.is_final
+
+
+def test_latest_segments_drops_superseded_partials() -> None:
+    """Only finals and the newest partial survive."""
+    audio = np.zeros(1, dtype=np.float32)
+    p1, p2, f, p3 = (
+        SpeechSegment(audio, False),
+        SpeechSegment(audio, False),
+        SpeechSegment(audio, True),
+        SpeechSegment(audio, False),
+    )
+    assert latest_segments([p1, p2]) == [p2]
+    assert latest_segments([p1, f, p3]) == [f, p3]
@@ -0,0 +1,106 @@
+"""Tests for the batched telemetry writer."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+from barnabeenet.services import telemetry_writer as telemetry_module
+from barnabeenet.services.telemetry_writer import TelemetryWriter, op
+
+
+def _redis() -> tuple[MagicMock, list[MagicMock]]:
+    pipes: list[MagicMock] = []
+
+    def pipeline(transaction: bool = True) -> MagicMock:
+        pipe = MagicMock()
+        pipe.execute = AsyncMock()
+        pipes.append(pipe)
+        return pipe
+
+    client = MagicMock()
+    client.pipeline.side_effect = pipeline
+    return client, pipes
+
+
+class TestTelemetryWriter:
+    """Tests for TelemetryWriter."""
+
+    async def test_coalesces_writes_into_one_pipeline(self) -> None:
+        client, pipes = _redis()
+        writer = TelemetryWriter(client, flush_interval=60)
+
+        writer.submit(op("xadd", "stream", {"a": "1"}, maxlen=10))
+        writer.submit(op("setex", "key", 30, "v"), op("lpush", "list", "id"))
+        await writer.flush()
+
+        assert len(pipes) == 1
+        pipes[0].xadd.assert_called_once_with("stream", {"a": "1"}, maxlen=10)
+        pipes[0].setex.assert_called_once_with("key", 30, "v")
+        pipes[0].lpush.assert_called_once_with("list", "id")
+        assert writer.get_stats()["flushed"] == 3
+        await writer.shutdown()
+
+    async def test_flushes_on_interval(self) -> None:
+        client, pipes = _redis()
+        writer = TelemetryWriter(client, flush_interval=0.01)
+
+        writer.submit(op("xadd", "stream", {}))
+        await asyncio.sleep(0.05)
+
+        assert pipes and pipes[0].execute.await_count == 1
+        assert writer.buffered == 0
+        await writer.shutdown()
+
+    async def test_idle_writer_does_not_poll(self) -> None:
+        client, _ = _redis()
+        writer = TelemetryWriter(client, flush_interval=0.01)
+        flushes = 0
+        flush = writer.flush
+
+        async def counting_flush() -> None:
+            nonlocal flushes
+            flushes += 1
+            await flush()
+
+        writer.flush = counting_flush  # type: ignore[method-assign]
+        writer.submit(op("xadd", "stream", {}))
+        await asyncio.sleep(0.1)
+
+        assert flushes == 1
+        await writer.shutdown()
+
+    async def test_batches_are_capped(self) -> None:
+        client, pipes = _redis()
+        writer = TelemetryWriter(client, flush_interval=60, max_batch=2)
+
+        for i in range(5):
+            writer.submit(op("xadd", "stream", {"i": str(i)}))
+        await writer.shutdown()
+
+        assert [p.xadd.call_count for p in pipes] == [2, 2, 1]
+
+    async def test_sheds_load_under_backpressure(self, monkeypatch) -> None:
+        monkeypatch.setattr(telemetry_module, "BACKPRESSURE_SAMPLE_EVERY", 2)
+        client, _ = _redis()
+        writer = TelemetryWriter(client, flush_interval=60, max_batch=100, max_buffer=4)
+
+        accepted = [writer.submit(op("xadd", "s", {})) for _ in range(6)]
+        # Past high water (2) every other droppable write is kept until full
+        assert accepted == [True, True, False, True, False, True]
+        assert writer.submit(op("setex", "k", 1, "v"), droppable=False) is False
+        assert writer.get_stats()["dropped"] == 3
+        await writer.shutdown()
+
+    async def test_failed_flush_counts_drops(self) -> None:
+        client, pipes = _redis()
+        writer = TelemetryWriter(client, flush_interval=60)
+        writer.submit(op("xadd", "s", {}), op("xadd", "s", {}))
+        client.pipeline.side_effect = None
+        client.pipeline.return_value.execute = AsyncMock(side_effect=ConnectionError("down"))
+
+        await writer.flush()
+
+        assert writer.get_stats()["dropped"] == 2
+        assert writer.buffered == 0
+        await writer.shutdown()
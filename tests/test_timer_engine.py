@@ -0,0 +1,248 @@
+"""Tests for the native timer engine and the timer manager built on it."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock
+
+from barnabeenet.services.timer_engine import TimerEngine
+from barnabeenet.services.timers import (
+    TIMERS_REDIS_KEY,
+    ActiveTimer,
+    TimerManager,
+    TimerPoolConfig,
+    TimerType,
+)
+
+
+class FakeRedis:
+    """Hash commands used for timer persistence."""
+
+    def __init__(self) -> None:
+        self.hashes: dict[str, dict[str, str]] = {}
+
+    async def hset(self, key: str, field: str, value: str) -> None:
+        self.hashes.setdefault(key, {})[field] = value
+
+    async def hdel(self, key: str, field: str) -> None:
+        self.hashes.get(key, {}).pop(field, None)
+
+    async def hgetall(self, key: str) -> dict[str, str]:
+        return dict(self.hashes.get(key, {}))
+
+
+def _ha(entities: tuple[str, ...] = ()) -> MagicMock:
+    ha = MagicMock()
+    ha.ensure_connected = AsyncMock(return_value=True)
+    ha.get_states = AsyncMock(side_effect=lambda ids: {e: MagicMock() for e in ids if e in entities})
+    ha.get_state = AsyncMock(return_value=None)
+    ha.call_service = AsyncMock(return_value=MagicMock(success=True, response_data=None))
+    return ha
+
+
+def _services(ha: MagicMock) -> list[tuple[str, str | None]]:
+    return [(c.args[0], c.kwargs.get("entity_id")) for c in ha.call_service.call_args_list]
+
+
+class TestTimerEngine:
+    """Tests for TimerEngine."""
+
+    async def test_fires_in_deadline_order(self) -> None:
+        fired: list[str] = []
+
+        async def on_due(key: str) -> None:
+            fired.append(key)
+
+        engine = TimerEngine(on_due)
+        engine.schedule("late", 0.03)
+        engine.schedule("early", 0.01)
+        engine.schedule("cancelled", 0.02)
+        engine.cancel("cancelled")
+        await asyncio.sleep(0.06)
+
+        assert fired == ["early", "late"]
+        assert len(engine) == 0
+        await engine.shutdown()
+
+    async def test_reschedule_replaces_deadline(self) -> None:
+        fired: list[str] = []
+
+        async def on_due(key: str) -> None:
+            fired.append(key)
+
+        engine = TimerEngine(on_due)
+        engine.schedule("t", 0.01)
+        engine.schedule("t", 0.05)
+        await asyncio.sleep(0.03)
+        assert fired == []
+        assert 0 < (engine.remaining("t") or 0) <= 0.05
+
+        await asyncio.sleep(0.04)
+        assert fired == ["t"]
+        await engine.shutdown()
+
+    async def test_thousands_of_timers_one_task(self) -> None:
+        fired: set[str] = set()
+        done = asyncio.Event()
+
+        async def on_due(key: str) -> None:
+            fired.add(key)
+            if len(fired) == 2500:
+                done.set()
+
+        engine = TimerEngine(on_due)
+        for i in range(5000):
+            engine.schedule(f"t{i}", (i % 50) / 1000)
+        for i in range(0, 5000, 2):
+            engine.cancel(f"t{i}")
+        await asyncio.wait_for(done.wait(), timeout=5)
+
+        assert fired == {f"t{i}" for i in range(1, 5000, 2)}
+        assert engine.get_stats()["fired"] == 2500
+        await engine.shutdown()
+
+
+class TestTimerManager:
+    """Tests for TimerManager on the native engine."""
+
+    async def test_timer_runs_without_ha_entities(self) -> None:
+        ha = _ha()
+        manager = TimerManager(ha)
+
+        timer = await manager.create_timer(
+            TimerType.DELAYED_ACTION,
+            timedelta(seconds=0.02),
+            label="fan",
+            on_complete={"service": "fan.turn_off", "entity_id": "fan.office"},
+        )
+        assert timer.ha_timer_entity is None
+        await asyncio.sleep(0.6)  # on_complete waits 0.5s to verify state
+
+        assert ("fan.turn_off", "fan.office") in _services(ha)
+        assert manager.get_active_timers() == []
+        await manager.shutdown()
+
+    async def test_chained_actions_run_in_order(self) -> None:
+        ha = _ha()
+        manager = TimerManager(ha)
+        timer = await manager.create_timer(TimerType.ALARM, timedelta(seconds=0.01), label="chain")
+        await manager.add_chained_action(
+            timer.id, timedelta(seconds=0.01), {"service": "fan.turn_on", "entity_id": "fan.a"}
+        )
+        await manager.add_chained_action(
+            timer.id, timedelta(seconds=0.01), {"service": "fan.turn_off", "entity_id": "fan.a"}
+        )
+        await asyncio.sleep(0.1)
+
+        assert _services(ha) == [("fan.turn_on", "fan.a"), ("fan.turn_off", "fan.a")]
+        assert manager.get_timer(timer.id) is None
+        await manager.shutdown()
+
+    async def test_pause_and_resume(self) -> None:
+        manager = TimerManager(_ha())
+        timer = await manager.create_timer(TimerType.ALARM, timedelta(seconds=0.05), label="tea")
+
+        await manager.pause_timer(timer.id)
+        await asyncio.sleep(0.08)
+        assert manager.get_timer(timer.id) is timer
+        assert timer.is_paused
+
+        await manager.resume_timer(timer.id)
+        assert not timer.is_paused
+        await asyncio.sleep(0.08)
+        assert manager.get_timer(timer.id) is None
+        await manager.shutdown()
+
+    async def test_timers_survive_restart(self) -> None:
+        redis = FakeRedis()
+        manager = TimerManager(_ha(), redis_client=redis)
+        timer = await manager.create_timer(TimerType.ALARM, timedelta(minutes=10), label="roast")
+        paused = await manager.create_timer(TimerType.ALARM, timedelta(minutes=5), label="eggs")
+        await manager.pause_timer(paused.id)
+        await manager.shutdown()
+
+        restarted = TimerManager(_ha(), redis_client=redis)
+        await restarted.init()
+
+        restored = restarted.get_timer_by_label("roast")
+        assert restored is not None and restored.id == timer.id
+        assert timedelta(minutes=9) < restored.remaining <= timedelta(minutes=10)
+        assert restarted._engine.remaining(timer.id) is not None
+        eggs = restarted.get_timer_by_label("eggs")
+        assert eggs is not None and eggs.is_paused
+        assert paused.id not in restarted._engine
+        await restarted.shutdown()
+
+    async def test_stale_alarm_dropped_on_restore(self) -> None:
+        redis = FakeRedis()
+        now = datetime.now(UTC)
+        stale = ActiveTimer(
+            id="old",
+            timer_type=TimerType.ALARM,
+            ha_timer_entity=None,
+            label="yesterday",
+            duration=timedelta(minutes=5),
+            started_at=now - timedelta(days=1),
+            ends_at=now - timedelta(days=1) + timedelta(minutes=5),
+        )
+        await redis.hset(TIMERS_REDIS_KEY, stale.id, json.dumps(stale.to_state()))
+
+        manager = TimerManager(_ha(), redis_client=redis)
+        await manager.init()
+
+        assert manager.get_active_timers() == []
+        assert redis.hashes[TIMERS_REDIS_KEY] == {}
+
+    async def test_ha_entity_is_display_mirror_only(self) -> None:
+        ha = _ha(entities=("timer.barnabee_1",))
+        manager = TimerManager(ha, TimerPoolConfig(pool_size=3))
+        await manager.init()
+        ha.get_states.assert_awaited_once()
+
+        first = await manager.create_timer(TimerType.ALARM, timedelta(minutes=1), label="a")
+        second = await manager.create_timer(TimerType.ALARM, timedelta(minutes=1), label="b")
+
+        assert first.ha_timer_entity == "timer.barnabee_1"
+        assert second.ha_timer_entity is None  # Mirror pool exhausted; timer still runs
+        assert len(manager.get_active_timers()) == 2
+
+        await manager.cancel_timer(first.id)
+        assert ("timer.cancel", "timer.barnabee_1") in _services(ha)
+        assert manager.get_status()["pool_available"] == 1
+        await manager.shutdown()
+
+    async def test_state_round_trip(self) -> None:
+        timer = ActiveTimer(
+            id="x",
+            timer_type=TimerType.DEVICE_DURATION,
+            ha_timer_entity="timer.barnabee_2",
+            label="porch",
+            duration=timedelta(minutes=10),
+            started_at=datetime(2026, 1, 1, 20, 0, tzinfo=UTC),
+            ends_at=datetime(2026, 1, 1, 20, 10, tzinfo=UTC),
+            on_complete={"service": "light.turn_off", "entity_id": "light.porch"},
+            chained_actions=[{"delay": timedelta(seconds=30), "action": {"service": "x.y"}}],
+            chain_index=0,
+        )
+
+        restored = ActiveTimer.from_state(json.loads(json.dumps(timer.to_state())))
+
+        assert restored == timer
+
+    def test_naive_persisted_times_read_as_local(self) -> None:
+        local_end = datetime(2026, 3, 8, 1, 30)
+        state = {
+            "id": "legacy",
+            "timer_type": "alarm",
+            "label": "tea",
+            "duration": 300,
+            "started_at": (local_end - timedelta(minutes=5)).isoformat(),
+            "ends_at": local_end.isoformat(),
+        }
+
+        restored = ActiveTimer.from_state(state)
+
+        assert restored.ends_at.tzinfo is UTC
+        assert restored.ends_at == local_end.astimezone(UTC)
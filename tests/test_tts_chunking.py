@@ -0,0 +1,62 @@
+"""Tests for streaming TTS sentence chunking."""
+
+from __future__ import annotations
+
+from barnabeenet.services.tts.chunking import SentenceChunker, split_sentences
+
+
+class TestSplitSentences:
+    """Tests for split_sentences."""
+
+    def test_splits_on_terminal_punctuation(self) -> None:
+        """Test sentences split after . ! and ?"""
+        assert split_sentences("Lights on. Anything else? Great!") == [
+            "Lights on.",
+            "Anything else?",
+            "Great!",
+        ]
+
+    def test_splits_on_newlines(self) -> None:
+        """Test line breaks end a chunk."""
+        assert split_sentences("First line\nSecond line") == ["First line", "Second line"]
+
+    def test_keeps_abbreviations(self) -> None:
+        """Test common abbreviations do not end a sentence."""
+        assert split_sentences("Dr. Smith called. Bye.") == ["Dr. Smith called.", "Bye."]
+
+    def test_closing_quotes_stay_with_sentence(self) -> None:
+        """Test quotes after terminal punctuation stay attached."""
+        assert split_sentences('He said "hi." Then left.') == ['He said "hi."', "Then left."]
+
+    def test_long_sentence_split_at_clauses(self) -> None:
+        """Test sentences over max_chars split at clause punctuation."""
+        text = "one two three, four five six, seven eight nine."
+        parts = split_sentences(text, max_chars=20)
+        assert parts == ["one two three,", "four five six,", "seven eight nine."]
+        assert all(len(p) <= 20 for p in parts)
+
+    def test_empty_text(self) -> None:
+        """Test empty or whitespace text yields nothing."""
+        assert split_sentences("") == []
+        assert split_sentences("   \n ") == []
+
+
+class TestSentenceChunker:
+    """Tests for incremental SentenceChunker."""
+
+    def test_incremental_feed(self) -> None:
+        """Test sentences are emitted once their boundary arrives."""
+        chunker = SentenceChunker()
+
+        assert chunker.feed("The lights") == []
+        assert chunker.feed(" are on.") == []  # No whitespace after "." yet
+        assert chunker.feed(" Anything") == ["The lights are on."]
+        assert chunker.feed(" else?") == []
+        assert chunker.flush() == ["Anything else?"]
+
+    def test_flush_clears_buffer(self) -> None:
+        """Test flush returns the remainder once."""
+        chunker = SentenceChunker()
+        chunker.feed("Partial")
+        assert chunker.flush() == ["Partial"]
+        assert chunker.flush() == []
@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from unittest.mock import AsyncMock, MagicMock, patch
+import base64
+from unittest.mock import ANY, AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -42,6 +43,14 @@ def mock_tts():
     return tts
 
 
+def _mock_pool(stt, tts):
+    """Mock model pool handing out the given STT/TTS services."""
+    pool = MagicMock()
+    pool.get_stt = AsyncMock(return_value=stt)
+    pool.get_tts = AsyncMock(return_value=tts)
+    return pool
+
+
 @pytest.fixture
 def mock_orchestrator():
     """Mock orchestrator."""
@@ -67,12 +76,8 @@ class TestVoicePipelineOrchestratorIntegration:
         with (
             patch("barnabeenet.main.app_state", mock_app_state),
             patch(
-                "barnabeenet.services.voice_pipeline.DistilWhisperSTT",
-                return_value=mock_stt,
-            ),
-            patch(
-                "barnabeenet.services.voice_pipeline.KokoroTTS",
-                return_value=mock_tts,
+                "barnabeenet.services.voice_pipeline.get_model_pool",
+                return_value=_mock_pool(mock_stt, mock_tts),
             ),
             patch(
                 "barnabeenet.services.voice_pipeline.get_orchestrator",
@@ -97,6 +102,7 @@ class TestVoicePipelineOrchestratorIntegration:
                 speaker="thomas",
                 room="living_room",
                 conversation_id="conv_123",
+                on_partial_text=ANY,
             )
 
             # Response contains orchestrator output
@@ -122,12 +128,8 @@ class TestVoicePipelineOrchestratorIntegration:
         with (
             patch("barnabeenet.main.app_state", mock_app_state),
             patch(
-                "barnabeenet.services.voice_pipeline.DistilWhisperSTT",
-                return_value=mock_stt,
-            ),
-            patch(
-                "barnabeenet.services.voice_pipeline.KokoroTTS",
-                return_value=mock_tts,
+                "barnabeenet.services.voice_pipeline.get_model_pool",
+                return_value=_mock_pool(mock_stt, mock_tts),
             ),
             patch(
                 "barnabeenet.services.voice_pipeline.get_orchestrator",
@@ -155,12 +157,8 @@ class TestVoicePipelineOrchestratorIntegration:
         with (
             patch("barnabeenet.main.app_state", mock_app_state),
             patch(
-                "barnabeenet.services.voice_pipeline.DistilWhisperSTT",
-                return_value=mock_stt,
-            ),
-            patch(
-                "barnabeenet.services.voice_pipeline.KokoroTTS",
-                return_value=mock_tts,
+                "barnabeenet.services.voice_pipeline.get_model_pool",
+                return_value=_mock_pool(mock_stt, mock_tts),
             ),
             patch(
                 "barnabeenet.services.voice_pipeline.get_orchestrator",
@@ -195,12 +193,8 @@ class TestVoicePipelineOrchestratorIntegration:
         with (
             patch("barnabeenet.main.app_state", mock_app_state),
             patch(
-                "barnabeenet.services.voice_pipeline.DistilWhisperSTT",
-                return_value=mock_stt,
-            ),
-            patch(
-                "barnabeenet.services.voice_pipeline.KokoroTTS",
-                return_value=mock_tts,
+                "barnabeenet.services.voice_pipeline.get_model_pool",
+                return_value=_mock_pool(mock_stt, mock_tts),
             ),
             patch(
                 "barnabeenet.services.voice_pipeline.get_orchestrator",
@@ -221,6 +215,62 @@ class TestVoicePipelineOrchestratorIntegration:
             assert response.intent == "unknown"
             assert response.agent == "unknown"
 
+    @pytest.mark.asyncio
+    async def test_pipeline_speaks_streamed_llm_text(
+        self, mock_app_state, mock_stt, mock_tts, monkeypatch
+    ):
+        """Streamed LLM text is synthesized as it arrives instead of after the reply."""
+        from barnabeenet.services.tts.kokoro_tts import TTSAudioChunk
+
+        spoken: list[str] = []
+
+        async def synthesize_stream(text, voice=None, speed=None):
+            async for piece in text:
+                spoken.append(piece)
+            yield TTSAudioChunk(
+                index=0,
+                text="".join(spoken),
+                pcm=b"\x00\x00" * 240,
+                sample_rate=24000,
+                duration_ms=10.0,
+                latency_ms=5.0,
+            )
+
+        mock_tts.synthesize_stream = synthesize_stream
+
+        async def process(text, speaker, room, conversation_id, on_partial_text):
+            for delta in ["It is ", "sunny."]:
+                await on_partial_text(delta)
+            return {"response": "It is sunny.", "agent": "interaction"}
+
+        streaming_orchestrator = MagicMock()
+        streaming_orchestrator.process = process
+        store = MagicMock(record_latency=AsyncMock())
+        monkeypatch.setattr(
+            "barnabeenet.services.voice_pipeline.get_metrics_store", AsyncMock(return_value=store)
+        )
+
+        with (
+            patch("barnabeenet.main.app_state", mock_app_state),
+            patch(
+                "barnabeenet.services.voice_pipeline.get_model_pool",
+                return_value=_mock_pool(mock_stt, mock_tts),
+            ),
+            patch(
+                "barnabeenet.services.voice_pipeline.get_orchestrator",
+                return_value=streaming_orchestrator,
+            ),
+        ):
+            from barnabeenet.services.voice_pipeline import VoicePipelineService
+
+            request = VoicePipelineRequest(audio_base64="ZmFrZV9hdWRpb19kYXRh", language="en")
+            response = await VoicePipelineService.run(request)
+
+        assert spoken == ["It is ", "sunny."]
+        mock_tts.synthesize.assert_not_called()
+        assert base64.b64decode(response.audio_base64)[:4] == b"RIFF"
+        assert store.record_latency.call_args.args[0] == "tts_first_audio"
+
 
 class TestVoicePipelineRequestFields:
     """Tests for VoicePipelineRequest schema updates."""
@@ -0,0 +1,102 @@
+"""Tests for streaming voice endpoints."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+from barnabeenet.main import app
+from barnabeenet.services.inference_executor import InferenceBusyError
+from barnabeenet.services.metrics_store import MetricsStore
+from barnabeenet.services.tts.kokoro_tts import TTSAudioChunk
+
+
+def _chunk(index: int, text: str) -> TTSAudioChunk:
+    return TTSAudioChunk(
+        index=index,
+        text=text,
+        pcm=bytes([index + 1]) * 480,
+        sample_rate=24000,
+        duration_ms=10.0,
+        latency_ms=5.0,
+    )
+
+
+def _mock_tts(*chunks: TTSAudioChunk) -> MagicMock:
+    async def stream(text, voice=None, speed=None):
+        for chunk in chunks:
+            yield chunk
+
+    tts = MagicMock()
+    tts.voice = "bm_fable"
+    tts.synthesize_stream = stream
+    return tts
+
+
+@pytest.fixture
+def metrics_store() -> MetricsStore:
+    """In-memory metrics store patched into the voice routes."""
+    store = MetricsStore()
+    with patch("barnabeenet.api.routes.voice.get_metrics_store", AsyncMock(return_value=store)):
+        yield store
+
+
+class TestStreamingSynthesis:
+    """Tests for /synthesize/stream and /ws/synthesize."""
+
+    def test_http_stream_returns_pcm(self, metrics_store: MetricsStore) -> None:
+        """Test chunked HTTP streaming concatenates sentence PCM in order."""
+        tts = _mock_tts(_chunk(0, "Hello."), _chunk(1, "World."))
+        with patch("barnabeenet.api.routes.voice.get_tts_service", AsyncMock(return_value=tts)):
+            response = TestClient(app).post(
+                "/api/v1/synthesize/stream", json={"text": "Hello. World."}
+            )
+
+        assert response.status_code == 200
+        assert response.headers["x-sample-rate"] == "24000"
+        assert response.content == b"\x01" * 480 + b"\x02" * 480
+        assert metrics_store.get_total_count("tts_first_audio") == 1
+
+    def test_http_stream_busy_returns_503(self, metrics_store: MetricsStore) -> None:
+        """Test a saturated TTS lane maps to 503 before streaming starts."""
+
+        async def busy(text, voice=None, speed=None):
+            raise InferenceBusyError("tts", 4)
+            yield  # pragma: no cover
+
+        tts = MagicMock()
+        tts.synthesize_stream = busy
+        with patch("barnabeenet.api.routes.voice.get_tts_service", AsyncMock(return_value=tts)):
+            response = TestClient(app).post("/api/v1/synthesize/stream", json={"text": "Hi."})
+
+        assert response.status_code == 503
+        assert response.json()["error"]["code"] == "INFERENCE_BUSY"
+
+    def test_websocket_stream(self, metrics_store: MetricsStore) -> None:
+        """Test WebSocket streaming sends metadata then PCM per sentence."""
+        tts = _mock_tts(_chunk(0, "Hello."), _chunk(1, "World."))
+        with (
+            patch("barnabeenet.api.routes.voice.get_tts_service", AsyncMock(return_value=tts)),
+            TestClient(app).websocket_connect("/api/v1/ws/synthesize") as ws,
+        ):
+            assert ws.receive_json()["type"] == "ready"
+            ws.send_json({"type": "synthesize", "text": "Hello. World."})
+
+            meta = ws.receive_json()
+            assert meta["type"] == "audio"
+            assert meta["index"] == 0
+            assert meta["text"] == "Hello."
+            assert ws.receive_bytes() == b"\x01" * 480
+
+            assert ws.receive_json()["index"] == 1
+            assert ws.receive_bytes() == b"\x02" * 480
+
+            done = ws.receive_json()
+            assert done["type"] == "complete"
+            assert done["chunks"] == 2
+            assert done["time_to_first_audio_ms"] is not None
+            ws.send_json({"type": "end"})
+
+        assert metrics_store.get_total_count("tts_first_audio") == 1
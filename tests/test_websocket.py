@@ -13,6 +13,7 @@ from barnabeenet.api.routes.websocket import (
     get_signal_streamer,
 )
 from barnabeenet.main import app
+from barnabeenet.services.fanout import encode
 
 
 @pytest.fixture
@@ -26,8 +27,8 @@ class TestConnectionManager:
 
     @pytest.fixture
     def conn_manager(self):
-        """Create a fresh connection manager."""
-        return ConnectionManager()
+        """Create a fresh connection manager (no frame delay)."""
+        return ConnectionManager(tick=0)
 
     def test_initial_state(self, conn_manager):
         """Test manager starts with no connections."""
@@ -85,9 +86,10 @@ class TestConnectionManager:
 
         message = {"signal_id": "test", "agent_type": "meta", "success": True}
         await conn_manager.broadcast(message)
+        await conn_manager.flush()
 
-        ws1.send_json.assert_called_once_with(message)
-        ws2.send_json.assert_called_once_with(message)
+        ws1.send_text.assert_called_once_with(encode(message))
+        ws2.send_text.assert_called_once_with(encode(message))
 
     @pytest.mark.asyncio
     async def test_broadcast_filters_by_agent_type(self, conn_manager):
@@ -99,9 +101,10 @@ class TestConnectionManager:
 
         message = {"signal_id": "test", "agent_type": "meta", "success": True}
         await conn_manager.broadcast(message)
+        await conn_manager.flush()
 
-        ws1.send_json.assert_called_once()  # meta matches
-        ws2.send_json.assert_not_called()  # action doesn't match
+        ws1.send_text.assert_called_once()  # meta matches
+        ws2.send_text.assert_not_called()  # action doesn't match
 
     @pytest.mark.asyncio
     async def test_broadcast_filters_errors_only(self, conn_manager):
@@ -113,9 +116,10 @@ class TestConnectionManager:
 
         success_message = {"signal_id": "test", "success": True}
         await conn_manager.broadcast(success_message)
+        await conn_manager.flush()
 
-        ws1.send_json.assert_not_called()  # errors_only, but success=True
-        ws2.send_json.assert_called_once()  # no filter
+        ws1.send_text.assert_not_called()  # errors_only, but success=True
+        ws2.send_text.assert_called_once()  # no filter
 
     @pytest.mark.asyncio
     async def test_broadcast_filters_min_latency(self, conn_manager):
@@ -127,29 +131,32 @@ class TestConnectionManager:
 
         fast_message = {"signal_id": "test", "latency_ms": 100}
         await conn_manager.broadcast(fast_message)
+        await conn_manager.flush()
 
-        ws1.send_json.assert_not_called()  # latency too low
-        ws2.send_json.assert_called_once()  # no filter
+        ws1.send_text.assert_not_called()  # latency too low
+        ws2.send_text.assert_called_once()  # no filter
 
         ws2.reset_mock()
 
         slow_message = {"signal_id": "test2", "latency_ms": 1500}
         await conn_manager.broadcast(slow_message)
+        await conn_manager.flush()
 
-        ws1.send_json.assert_called_once()  # latency meets threshold
+        ws1.send_text.assert_called_once()  # latency meets threshold
 
     @pytest.mark.asyncio
     async def test_broadcast_removes_disconnected(self, conn_manager):
         """Test broadcast removes clients that fail to receive."""
         ws1 = AsyncMock()
         ws2 = AsyncMock()
-        ws2.send_json.side_effect = Exception("Connection closed")
+        ws2.send_text.side_effect = Exception("Connection closed")
 
         await conn_manager.connect(ws1)
         await conn_manager.connect(ws2)
         assert conn_manager.connection_count == 2
 
         await conn_manager.broadcast({"test": "data"})
+        await conn_manager.flush()
 
         # ws2 should be removed due to error
         assert conn_manager.connection_count == 1
@@ -12,6 +12,7 @@ from __future__ import annotations
 import asyncio
 import base64
 import io
+import json
 import logging
 import os
 import time
@@ -21,7 +22,7 @@ from typing import TYPE_CHECKING
 import numpy as np
 import soundfile as sf
 import torch
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, WebSocket, WebSocketDisconnect
 from pydantic import BaseModel
 
 if TYPE_CHECKING:
@@ -148,6 +149,57 @@ async def health_check() -> HealthResponse:
     )
 
 
+def _prepare_audio(audio_data: np.ndarray, sample_rate: int) -> np.ndarray:
+    """Convert decoded audio to mono float32 at 16kHz."""
+    # Convert to mono if stereo
+    if len(audio_data.shape) > 1:
+        audio_data = audio_data.mean(axis=1)
+
+    # Ensure float32
+    audio_data = audio_data.astype(np.float32)
+
+    # Resample to 16kHz if needed
+    if sample_rate != 16000:
+        import torchaudio.functional as F
+
+        audio_tensor = torch.from_numpy(audio_data).unsqueeze(0)
+        audio_tensor = F.resample(audio_tensor, sample_rate, 16000)
+        audio_data = audio_tensor.squeeze().numpy()
+
+    return audio_data
+
+
+async def _transcribe_array(audio_data: np.ndarray) -> str:
+    """Run Parakeet on 16kHz mono samples and return the text."""
+    # Save to temp file (NeMo requires file path)
+    temp_file = f"/tmp/stt_input_{time.time_ns()}.wav"
+    sf.write(temp_file, audio_data, 16000)
+
+    try:
+        async with _model_lock:
+            model = get_model()
+            # Run inference in thread pool to not block event loop
+            loop = asyncio.get_event_loop()
+            result = await loop.run_in_executor(None, lambda: model.transcribe([temp_file]))
+    finally:
+        # Cleanup temp file
+        try:
+            os.remove(temp_file)
+        except OSError:
+            pass
+
+    # Extract text from result
+    if not result:
+        return ""
+    # Handle different result formats from NeMo
+    first_result = result[0]
+    if hasattr(first_result, "text"):
+        return first_result.text
+    if isinstance(first_result, str):
+        return first_result
+    return str(first_result)
+
+
 @app.post("/transcribe", response_model=TranscribeResponse)
 async def transcribe(request: TranscribeRequest) -> TranscribeResponse:
     """Transcribe audio using Parakeet TDT."""
@@ -217,58 +269,15 @@ async def transcribe(request: TranscribeRequest) -> TranscribeResponse:
                 detail=f"Could not decode audio: soundfile={sf_error}, ffmpeg={ffmpeg_error}",
             ) from ffmpeg_error
 
-    # Convert to mono if stereo
-    if len(audio_data.shape) > 1:
-        audio_data = audio_data.mean(axis=1)
-
-    # Ensure float32
-    audio_data = audio_data.astype(np.float32)
-
-    # Resample to 16kHz if needed
-    if sample_rate != 16000:
-        import torchaudio.functional as F
-
-        audio_tensor = torch.from_numpy(audio_data).unsqueeze(0)
-        audio_tensor = F.resample(audio_tensor, sample_rate, 16000)
-        audio_data = audio_tensor.squeeze().numpy()
-        sample_rate = 16000
-
-    # Save to temp file (NeMo requires file path)
-    temp_file = f"/tmp/stt_input_{time.time_ns()}.wav"
-    sf.write(temp_file, audio_data, sample_rate)
+    audio_data = _prepare_audio(audio_data, sample_rate)
+    sample_rate = 16000
 
-    # Transcribe
     try:
-        async with _model_lock:
-            model = get_model()
-            # Run inference in thread pool to not block event loop
-            loop = asyncio.get_event_loop()
-            result = await loop.run_in_executor(None, lambda: model.transcribe([temp_file]))
-
-        # Extract text from result
-        if result and len(result) > 0:
-            # Handle different result formats from NeMo
-            first_result = result[0]
-            if hasattr(first_result, "text"):
-                text = first_result.text
-            elif isinstance(first_result, str):
-                text = first_result
-            else:
-                text = str(first_result)
-        else:
-            text = ""
-
+        text = await _transcribe_array(audio_data)
     except Exception as e:
         logger.error(f"Transcription failed: {e}")
         raise HTTPException(status_code=500, detail=f"Transcription failed: {e}") from e
 
-    finally:
-        # Cleanup temp file
-        try:
-            os.remove(temp_file)
-        except OSError:
-            pass
-
     latency_ms = (time.perf_counter() - start_time) * 1000
 
     logger.info(f"Transcribed {len(audio_data) / sample_rate:.2f}s audio in {latency_ms:.2f}ms")
@@ -280,6 +289,176 @@ async def transcribe(request: TranscribeRequest) -> TranscribeResponse:
     )
 
 
+# =============================================================================
+# Incremental (streaming) transcription
+# =============================================================================
+
+
+class StreamSegmenter:
+    """Energy-VAD utterance segmenter for the streaming endpoint.
+
+    Mirrors barnabeenet.services.stt.segmenter (the worker runs in its own
+    environment without the main package): partial snapshots of the growing
+    utterance every ``partial_interval_ms``, and a final segment once
+    ``endpoint_silence_ms`` of silence follows the speech.
+    """
+
+    def __init__(
+        self,
+        sample_rate: int = 16000,
+        frame_ms: int = 30,
+        endpoint_silence_ms: int = 600,
+        partial_interval_ms: int = 500,
+        min_speech_ms: int = 200,
+        max_utterance_ms: int = 15000,
+        energy_threshold: float = 0.015,
+    ) -> None:
+        self.sample_rate = sample_rate
+        self.frame_ms = frame_ms
+        self.endpoint_silence_ms = endpoint_silence_ms
+        self.partial_interval_ms = partial_interval_ms
+        self.min_speech_ms = min_speech_ms
+        self.max_utterance_ms = max_utterance_ms
+        self.energy_threshold = energy_threshold
+        self._frame_bytes = sample_rate * frame_ms // 1000 * 2
+        self._pending = b""
+        self._pre_roll: list[bytes] = []
+        self._frames: list[bytes] = []
+        self._speech_ms = self._silence_ms = self._since_partial_ms = 0
+
+    def feed(self, pcm: bytes) -> list[tuple[np.ndarray, bool]]:
+        """Add 16-bit PCM; return (audio, is_final) segments it completes."""
+        self._pending += pcm
+        segments = []
+        usable = len(self._pending) - len(self._pending) % self._frame_bytes
+        for offset in range(0, usable, self._frame_bytes):
+            segment = self._process_frame(self._pending[offset : offset + self._frame_bytes])
+            if segment is not None:
+                segments.append(segment)
+        self._pending = self._pending[usable:]
+        # Only finals and the newest partial are worth decoding
+        return [seg for i, seg in enumerate(segments) if seg[1] or i == len(segments) - 1]
+
+    def flush(self) -> tuple[np.ndarray, bool] | None:
+        """End the stream, returning the last utterance if it had enough speech."""
+        segment = self._emit(True) if self._speech_ms >= self.min_speech_ms else None
+        self._reset()
+        return segment
+
+    def _process_frame(self, frame: bytes) -> tuple[np.ndarray, bool] | None:
+        samples = np.frombuffer(frame, dtype="<i2").astype(np.float32) / 32768.0
+        speech = float(np.sqrt(np.mean(samples**2))) >= self.energy_threshold
+
+        if not self._frames:
+            if speech:
+                self._frames = [*self._pre_roll, frame]
+                self._speech_ms = self.frame_ms
+            else:
+                self._pre_roll = [*self._pre_roll, frame][-(300 // self.frame_ms) :]
+            return None
+
+        self._frames.append(frame)
+        self._since_partial_ms += self.frame_ms
+        if speech:
+            self._speech_ms += self.frame_ms
+            self._silence_ms = 0
+        else:
+            self._silence_ms += self.frame_ms
+
+        utterance_ms = len(self._frames) * self.frame_ms
+        if self._silence_ms >= self.endpoint_silence_ms or utterance_ms >= self.max_utterance_ms:
+            segment = self._emit(True) if self._speech_ms >= self.min_speech_ms else None
+            self._reset()
+            return segment
+        if (
+            speech
+            and self._speech_ms >= self.min_speech_ms
+            and self._since_partial_ms >= self.partial_interval_ms
+        ):
+            self._since_partial_ms = 0
+            return self._emit(False)
+        return None
+
+    def _emit(self, is_final: bool) -> tuple[np.ndarray, bool]:
+        audio = np.frombuffer(b"".join(self._frames), dtype="<i2").astype(np.float32) / 32768.0
+        return audio, is_final
+
+    def _reset(self) -> None:
+        self._frames = []
+        self._pre_roll = []
+        self._speech_ms = self._silence_ms = self._since_partial_ms = 0
+
+
+@app.websocket("/transcribe/stream")
+async def transcribe_stream(websocket: WebSocket) -> None:
+    """Incremental transcription over a WebSocket.
+
+    Messages from client:
+    - JSON config (optional, first): {"type": "config", "sample_rate": 16000}
+    - Binary audio: raw PCM 16-bit mono
+    - JSON end: {"type": "end"}
+
+    Messages from server:
+    - {"type": "partial", "text": "...", "is_final": false, "latency_ms": ...}
+    - {"type": "final", "text": "...", "is_final": true, "latency_ms": ...}
+      (sent as soon as an utterance ends on silence)
+    - {"type": "complete"} after the end message has been processed
+    - {"type": "error", "message": "..."}
+    """
+    await websocket.accept()
+    segmenter = StreamSegmenter()
+
+    async def send_segment(audio: np.ndarray, is_final: bool) -> None:
+        start = time.perf_counter()
+        text = await _transcribe_array(_prepare_audio(audio, segmenter.sample_rate))
+        if not text and not is_final:
+            return
+        latency_ms = (time.perf_counter() - start) * 1000
+        if is_final:
+            logger.info(
+                f"Streamed {len(audio) / segmenter.sample_rate:.2f}s utterance "
+                f"in {latency_ms:.2f}ms"
+            )
+        await websocket.send_json(
+            {
+                "type": "final" if is_final else "partial",
+                "text": text,
+                "is_final": is_final,
+                "confidence": 1.0,  # Parakeet doesn't return confidence scores
+                "latency_ms": latency_ms,
+            }
+        )
+
+    try:
+        while True:
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                return
+
+            if message.get("bytes") is not None:
+                for audio, is_final in segmenter.feed(message["bytes"]):
+                    await send_segment(audio, is_final)
+                continue
+
+            data = json.loads(message.get("text") or "{}")
+            if data.get("type") == "config":
+                segmenter = StreamSegmenter(sample_rate=int(data.get("sample_rate", 16000)))
+            elif data.get("type") == "end":
+                segment = segmenter.flush()
+                if segment is not None:
+                    await send_segment(*segment)
+                await websocket.send_json({"type": "complete"})
+                await websocket.close()
+                return
+
+    except WebSocketDisconnect:
+        return
+    except Exception as e:
+        logger.error(f"Streaming transcription failed: {e}")
+        await websocket.send_json({"type": "error", "message": str(e)})
+        await websocket.close()
+
+
 if __name__ == "__main__":
     import uvicorn
 